@@ -0,0 +1,18 @@
+"""Shared code for BitBar plugins and the tools that develop and measure them.
+
+Everything under the hidden .lib directory is skipped by BitBar and by
+.test.py.  Plugins that use a module from here put the directory on
+sys.path themselves and carry on without it when it can't be imported, so
+they keep working when copied into a plugin folder on their own.  Plugins
+built around a module, rather than sped up by one, say it is missing the
+way they would for any other dependency.
+
+Modules imported by plugins stay compatible with Python 2; the tools run
+with Python 3:
+
+    PYTHONPATH=.lib python3 -m bitbarlib.host --help
+
+Tests for these and for .test.py are in .lib/tests:
+
+    python3 -m unittest discover -s .lib/tests
+"""
@@ -0,0 +1,216 @@
+"""Keep plugin icons as image files instead of base64 strings in the source.
+
+Icons pasted into a plugin as base64 strings are read, tokenized and
+compiled on every run, and kept in memory, whether or not the run shows
+them.  A plugin's images can live instead in a hidden folder next to it,
+.assets/<plugin name>/, which BitBar and .test.py both skip.  An `Assets`
+object reads an image only when a render asks for it, and encodes it once
+per process:
+
+    icons = Assets(__file__)
+    print('Crypto20 | templateImage=%s' % icons.get('C20'))
+
+A missing image reads as '', so a plugin copied without its assets loses
+its icons and keeps working.
+
+To move a plugin's embedded images out, and to compare what compiling it
+costs before and after:
+
+    PYTHONPATH=.lib python3 -m bitbarlib.assets extract Cryptocurrency/Crypto20/c20.py
+    PYTHONPATH=.lib python3 -m bitbarlib.assets bench --python python2 Cryptocurrency/Crypto20/c20.py
+
+Stays compatible with Python 2; extract and bench need Python 3.
+"""
+import binascii
+import os
+
+# file signatures, and what the base64 of each starts with
+image_types = [('.png', b'\x89PNG', 'iVBORw0KGgo'), ('.gif', b'GIF8', 'R0lGOD'), ('.jpg', b'\xff\xd8\xff', '/9j/')]
+# base64 strings shorter than this are not worth a file
+min_embedded = 200
+
+
+def asset_dir(plugin_file):
+    """The folder holding a plugin's images: .assets/<name up to the first dot>/ beside it."""
+    path = os.path.realpath(plugin_file)
+    return os.path.join(os.path.dirname(path), '.assets', os.path.basename(path).split('.')[0])
+
+
+class Assets(object):
+    """A plugin's images, read and base64-encoded on first use."""
+
+    def __init__(self, plugin_file):
+        self.directory = asset_dir(plugin_file)
+        self.files = None
+        self.memo = {}
+
+    def path(self, name):
+        """The file for the image called name, whatever its extension, or None."""
+        if self.files is None:
+            try:
+                self.files = dict((os.path.splitext(f)[0], f) for f in os.listdir(self.directory))
+            except OSError:
+                self.files = {}
+        filename = self.files.get(name)
+        return os.path.join(self.directory, filename) if filename else None
+
+    def get(self, name, default=''):
+        """The image called name as base64 text, ready for image= or templateImage=."""
+        if name in self.memo:
+            return self.memo[name]
+        path = self.path(name)
+        if path is None:
+            return default
+        with open(path, 'rb') as fp:
+            encoded = binascii.b2a_base64(fp.read()).strip()
+        if not isinstance(encoded, str):  # Python 3
+            encoded = encoded.decode('ascii')
+        self.memo[name] = encoded
+        return encoded
+
+    def __getitem__(self, name):
+        encoded = self.get(name, None)
+        if encoded is None:
+            raise KeyError(name)
+        return encoded
+
+
+def embedded_images(source):
+    """Find base64 images in plugin source, as (line, name, extension, decoded bytes).
+
+    An image is named after the dict key or variable it is assigned to;
+    adjacent string literals are joined as Python would join them.
+    """
+    import ast
+    import io
+    import tokenize
+
+    tokens = [t for t in tokenize.generate_tokens(io.StringIO(source).readline)
+              if t.type not in (tokenize.NL, tokenize.COMMENT)]
+    found = []
+    i = 0
+    while i < len(tokens):
+        if tokens[i].type != tokenize.STRING:
+            i += 1
+            continue
+        start = i
+        parts = []
+        while i < len(tokens) and tokens[i].type == tokenize.STRING:
+            parts.append(ast.literal_eval(tokens[i].string))
+            i += 1
+        text = ''.join(parts)
+        kind = [t for t in image_types if text.startswith(t[2])]
+        if len(text) < min_embedded or not kind:
+            continue
+        before = tokens[max(start - 2, 0):start]
+        name = None
+        if len(before) == 2 and before[1].string in ('=', ':'):
+            name = ast.literal_eval(before[0].string) if before[0].type == tokenize.STRING else before[0].string
+        while start > 0 and tokens[start - 1].string == '(':
+            # a parenthesized run of literals: look past the parenthesis
+            start -= 1
+            before = tokens[max(start - 2, 0):start]
+            if len(before) == 2 and before[1].string == '=':
+                name = before[0].string
+        try:
+            data = binascii.a2b_base64(text)
+        except binascii.Error:
+            continue
+        found.append((tokens[start].start[0], name or 'line%i' % tokens[start].start[0], kind[0][0], data))
+    return found
+
+
+def extract(plugin):
+    """Write a plugin's embedded images into its asset folder; returns [(line, path, bytes)]."""
+    with open(plugin, encoding='utf-8') as fp:
+        source = fp.read()
+    directory = asset_dir(plugin)
+    written = []
+    used = set()
+    for line, name, extension, data in embedded_images(source):
+        stem = name
+        n = 2
+        while stem in used:
+            stem = '%s-%i' % (name, n)
+            n += 1
+        used.add(stem)
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+        path = os.path.join(directory, stem + extension)
+        with open(path, 'wb') as fp:
+            fp.write(data)
+        written.append((line, path, len(data)))
+    return written
+
+
+bench_child = '''
+import resource, sys, time
+def rss():
+    # resident KB now where /proc has it, else the peak (in bytes on macOS)
+    try:
+        return int(open('/proc/self/statm').read().split()[1]) * resource.getpagesize() // 1024
+    except IOError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
+path = sys.argv[1]
+base = rss()
+source = open(path, 'rb').read()
+code = compile(source, path, 'exec')
+del source
+grown = rss() - base
+best = None
+for _ in range(int(sys.argv[2])):
+    start = time.time()
+    compile(open(path, 'rb').read(), path, 'exec')
+    elapsed = time.time() - start
+    best = elapsed if best is None else min(best, elapsed)
+print('%d %f %d' % (len(open(path, 'rb').read()), best, grown))
+'''
+
+
+def bench(plugins, python, repeat=5):
+    """Read and compile each plugin in a fresh interpreter.
+
+    Returns [(plugin, bytes, best seconds, KB the process grew by)].
+    """
+    import subprocess
+
+    rows = []
+    for plugin in plugins:
+        output = subprocess.check_output([python, '-c', bench_child, plugin, str(repeat)])
+        size, seconds, rss = output.split()
+        rows.append((plugin, int(size), float(seconds), int(rss)))
+    return rows
+
+
+def main(argv=None):
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(prog='bitbarlib.assets', description='Move embedded icons out of plugins')
+    commands = parser.add_subparsers(dest='command')
+    extract_parser = commands.add_parser('extract', help="Write a plugin's base64 images into its asset folder")
+    extract_parser.add_argument('plugins', nargs='+')
+    bench_parser = commands.add_parser('bench', help='Time compiling plugins and the memory it takes')
+    bench_parser.add_argument('plugins', nargs='+')
+    bench_parser.add_argument('--python', default=sys.executable, help='Interpreter to compile with')
+    bench_parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.command == 'extract':
+        for plugin in args.plugins:
+            for line, path, size in extract(plugin):
+                print('%s:%i -> %s (%i bytes)' % (plugin, line, path, size))
+    elif args.command == 'bench':
+        print('%9s %10s %8s  %s' % ('bytes', 'compile ms', 'rss KB', 'plugin'))
+        for plugin, size, seconds, rss in bench(args.plugins, args.python, args.repeat):
+            print('%9i %10.2f %8i  %s' % (size, seconds * 1000, rss, plugin))
+    else:
+        parser.print_help()
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
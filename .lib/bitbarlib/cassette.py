@@ -0,0 +1,351 @@
+"""Record plugins' HTTP exchanges once and replay them offline.
+
+Network-bound plugins can't be timed reproducibly against live services.
+This module runs a plugin with its traffic pointed at a local server:
+
+- in record mode the server forwards each request to the real host and
+  writes the exchange into the plugin's cassette directory;
+- in replay mode it answers from the cassette alone, with a configurable
+  latency per request and bandwidth per response.
+
+    PYTHONPATH=.lib python3 -m bitbarlib.cassette record Sports/live_cricket.2m.py
+    PYTHONPATH=.lib python3 -m bitbarlib.cassette replay Sports/live_cricket.2m.py --latency 80
+    PYTHONPATH=.lib python3 -m bitbarlib.cassette bench --latency 80 --bandwidth 500 Sports Dev
+
+Python plugins are redirected by the sitecustomize in cassette_site, which
+covers urllib, urllib2, http.client and requests.  Anything else, such as
+curl in shell plugins, reaches the server through http_proxy for plain
+HTTP URLs.  HTTPS through a proxy can't be recorded, so replay refuses it
+rather than letting the plugin reach the network.
+
+Repeated requests for the same URL are recorded in order and replayed in
+order.  Once the recording runs out, the last answer is repeated.
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import ssl
+import subprocess
+import sys
+import threading
+import time
+from http.client import HTTPConnection, HTTPSConnection, HTTPException
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from bitbarlib.host import percentile, run_plugin
+from bitbarlib.plugins import discover
+
+cassette_root = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                             'bitbar-plugins', 'cassettes')
+site_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cassette_site')
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# not forwarded in either direction; the server sets its own framing
+hop_by_hop = {'connection', 'keep-alive', 'proxy-connection', 'proxy-authorization', 'te', 'trailer',
+              'transfer-encoding', 'upgrade', 'content-length', 'host', 'x-cassette-target'}
+
+
+def cassette_dir(plugin, root=cassette_root):
+    """Where the exchanges for plugin are kept, named after its path in the repository."""
+    path = os.path.abspath(plugin)
+    name = os.path.relpath(path, repo_root)
+    if name.startswith(os.pardir):
+        name = os.path.join('elsewhere', '%s-%s' % (hashlib.sha1(path.encode('utf-8')).hexdigest()[:12],
+                                                    os.path.basename(path)))
+    return os.path.join(root, name)
+
+
+class Exchange(BaseHTTPRequestHandler):
+    """Answers one proxied request, from the network or from the cassette."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def target(self):
+        if self.path.startswith(('http://', 'https://')):
+            return self.path
+        origin = self.headers.get('X-Cassette-Target')
+        if not origin:
+            return None
+        parts = urlsplit(origin)
+        default = {'http': 80, 'https': 443}[parts.scheme]
+        netloc = parts.hostname if parts.port in (None, default) else parts.netloc
+        return '%s://%s%s' % (parts.scheme, netloc, self.path)
+
+    def exchange(self):
+        url = self.target()
+        if url is None:
+            self.send_error(400, 'No X-Cassette-Target header and not a proxy request')
+            return
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length) if length else b''
+        name = self.server.next_name(self.command, url, body)
+        if self.server.mode == 'record':
+            recorded = self.forward(url, body)
+            if recorded is None:
+                return
+            self.server.save(name, *recorded)
+        else:
+            recorded = self.server.lookup(name)
+            if recorded is None:
+                self.server.count('misses')
+                self.send_error(504, 'Not in cassette: %s %s' % (self.command, url))
+                return
+            latency = self.server.latency
+            time.sleep(recorded[0]['elapsed'] if latency == 'recorded' else latency)
+        self.respond(*recorded)
+
+    def forward(self, url, body):
+        parts = urlsplit(url)
+        if parts.scheme == 'https':
+            conn = HTTPSConnection(parts.netloc, timeout=30, context=ssl.create_default_context())
+        else:
+            conn = HTTPConnection(parts.netloc, timeout=30)
+        headers = {k: v for k, v in self.headers.items() if k.lower() not in hop_by_hop}
+        path = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+        started = time.perf_counter()
+        try:
+            conn.request(self.command, path, body=body or None, headers=headers)
+            response = conn.getresponse()
+            data = response.read()
+        except (HTTPException, OSError) as e:
+            self.send_error(502, 'Recording %s failed: %s' % (url, e))
+            return None
+        finally:
+            conn.close()
+        meta = {
+            'method': self.command,
+            'url': url,
+            'status': response.status,
+            'reason': response.reason,
+            'headers': [(k, v) for k, v in response.getheaders() if k.lower() not in hop_by_hop],
+            'elapsed': time.perf_counter() - started,
+        }
+        return meta, data
+
+    def respond(self, meta, data):
+        self.send_response(meta['status'], meta['reason'])
+        for name, value in meta['headers']:
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        if self.command == 'HEAD':
+            return
+        bandwidth = self.server.bandwidth
+        if not bandwidth:
+            self.wfile.write(data)
+        else:
+            chunk = max(1024, int(bandwidth / 20))
+            for offset in range(0, len(data), chunk):
+                piece = data[offset:offset + chunk]
+                self.wfile.write(piece)
+                self.wfile.flush()
+                time.sleep(len(piece) / bandwidth)
+        self.server.count('requests')
+        self.server.count('bytes', len(data))
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = do_HEAD = do_OPTIONS = exchange
+
+    def do_CONNECT(self):
+        # a tunnel would be opaque to the cassette
+        self.server.count('refused')
+        self.send_error(502, 'HTTPS through a proxy is not recorded')
+
+
+class CassetteServer(ThreadingHTTPServer):
+    """Records or replays the exchanges in one cassette directory."""
+
+    daemon_threads = True
+
+    def __init__(self, cassette, mode='replay', latency=0.0, bandwidth=None):
+        ThreadingHTTPServer.__init__(self, ('127.0.0.1', 0), Exchange)
+        self.cassette = cassette
+        self.mode = mode
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.lock = threading.Lock()
+        self.seen = {}
+        self.stats = {}
+        self.thread = None
+
+    @property
+    def address(self):
+        return '%s:%i' % self.server_address[:2]
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def reset(self):
+        """Start counting and ordering requests afresh, as for a new run."""
+        with self.lock:
+            self.seen = {}
+            self.stats = {'requests': 0, 'bytes': 0, 'misses': 0, 'refused': 0}
+
+    def count(self, stat, n=1):
+        with self.lock:
+            self.stats[stat] = self.stats.get(stat, 0) + n
+
+    def next_name(self, method, url, body):
+        """The file name for this request: its key and how many times the run has made it."""
+        key = hashlib.sha1(('%s %s ' % (method, url)).encode('utf-8') + hashlib.sha1(body).digest()).hexdigest()[:20]
+        with self.lock:
+            n = self.seen[key] = self.seen.get(key, 0) + 1
+        return '%s-%i' % (key, n)
+
+    def save(self, name, meta, data):
+        if not os.path.isdir(self.cassette):
+            os.makedirs(self.cassette)
+        with open(os.path.join(self.cassette, name + '.body'), 'wb') as fp:
+            fp.write(data)
+        with open(os.path.join(self.cassette, name + '.json'), 'w') as fp:
+            json.dump(meta, fp, indent=1)
+
+    def lookup(self, name):
+        key, n = name.rsplit('-', 1)
+        for ordinal in range(int(n), 0, -1):
+            path = os.path.join(self.cassette, '%s-%i' % (key, ordinal))
+            try:
+                with open(path + '.json') as fp:
+                    meta = json.load(fp)
+                with open(path + '.body', 'rb') as fp:
+                    return meta, fp.read()
+            except (IOError, ValueError):
+                continue
+        return None
+
+
+def plugin_env(server):
+    """The environment a plugin runs in to have its traffic go through server."""
+    env = dict(os.environ, BitBar='1', BITBAR_STREAM='0', BITBAR_CASSETTE=server.address)
+    env['PYTHONPATH'] = os.pathsep.join(p for p in (site_dir, env.get('PYTHONPATH')) if p)
+    proxy = 'http://%s' % server.address
+    env['http_proxy'] = proxy
+    for name in ('no_proxy', 'NO_PROXY'):
+        env.pop(name, None)
+    if server.mode == 'replay':
+        env['https_proxy'] = env['HTTPS_PROXY'] = proxy
+    return env
+
+
+def run_recorded(plugin, args, mode, root, latency=0.0, bandwidth=None):
+    """Run plugin once with its output passed through; returns the server's counts."""
+    cassette = cassette_dir(plugin, root)
+    if mode == 'record' and os.path.isdir(cassette):
+        shutil.rmtree(cassette)
+    server = CassetteServer(cassette, mode, latency, bandwidth).start()
+    server.reset()
+    try:
+        subprocess.call([os.path.abspath(plugin)] + list(args), cwd=os.path.dirname(os.path.abspath(plugin)),
+                        env=plugin_env(server))
+    finally:
+        server.stop()
+    return server.stats
+
+
+def bench(paths, root, latency=0.0, bandwidth=None, repeat=3, timeout=60):
+    """Replay every plugin under paths that has a cassette, repeat times each; returns a row per plugin."""
+    rows = []
+    for plugin in discover(paths):
+        cassette = cassette_dir(plugin, root)
+        if not os.path.isdir(cassette):
+            continue
+        server = CassetteServer(cassette, 'replay', latency, bandwidth).start()
+        runs = []
+        try:
+            for _ in range(repeat):
+                server.reset()
+                record = run_plugin(plugin, timeout, plugin_env(server))
+                record.update(server.stats)
+                runs.append(record)
+        finally:
+            server.stop()
+        walls = [r['wall'] for r in runs]
+        rows.append({
+            'plugin': plugin,
+            'runs': repeat,
+            'wall_p50': percentile(walls, 50),
+            'wall_max': max(walls),
+            'cpu': sum(r['cpu_user'] + r['cpu_system'] for r in runs) / repeat,
+            'requests': runs[-1]['requests'],
+            'bytes': runs[-1]['bytes'],
+            'misses': runs[-1]['misses'] + runs[-1]['refused'],
+            'failed': sum(1 for r in runs if r['exit_status'] or r['timed_out']),
+        })
+    return rows
+
+
+def print_bench(rows, out=sys.stdout):
+    out.write('%9s %9s %8s %5s %10s %6s %6s  %s\n' % ('p50 ms', 'max ms', 'cpu ms', 'reqs', 'bytes', 'misses',
+                                                      'failed', 'plugin'))
+    for row in sorted(rows, key=lambda r: -r['wall_p50']):
+        out.write('%9.1f %9.1f %8.1f %5i %10i %6i %6i  %s\n' % (
+            row['wall_p50'] * 1000, row['wall_max'] * 1000, row['cpu'] * 1000, row['requests'], row['bytes'],
+            row['misses'], row['failed'], row['plugin']))
+
+
+def latency_value(text):
+    """--latency takes milliseconds, or 'recorded' to replay each exchange as slowly as it was recorded."""
+    return text if text == 'recorded' else float(text) / 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='bitbarlib.cassette',
+                                     description='Record plugins\' HTTP exchanges and replay them offline')
+    parser.add_argument('--cassettes', default=cassette_root, help='Directory holding one cassette per plugin')
+    commands = parser.add_subparsers(dest='command')
+    replay_options = argparse.ArgumentParser(add_help=False)
+    replay_options.add_argument('--latency', type=latency_value, default=0.0,
+                                help='Milliseconds before each response, or "recorded"')
+    replay_options.add_argument('--bandwidth', type=float, default=None, help='Response bandwidth in KB/s')
+    record_parser = commands.add_parser('record', help='Run a plugin against the network and record its exchanges')
+    record_parser.add_argument('plugin')
+    record_parser.add_argument('args', nargs=argparse.REMAINDER)
+    replay_parser = commands.add_parser('replay', parents=[replay_options],
+                                        help='Run a plugin against its cassette and show its output')
+    replay_parser.add_argument('plugin')
+    replay_parser.add_argument('args', nargs=argparse.REMAINDER)
+    bench_parser = commands.add_parser('bench', parents=[replay_options],
+                                       help='Time every plugin that has a cassette, offline')
+    bench_parser.add_argument('paths', nargs='*', default=['.'])
+    bench_parser.add_argument('--repeat', type=int, default=3)
+    bench_parser.add_argument('--timeout', type=float, default=60)
+    bench_parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    args = parser.parse_args(argv)
+
+    if args.command in ('replay', 'bench'):
+        bandwidth = args.bandwidth * 1024 if args.bandwidth else None
+    if args.command == 'record':
+        stats = run_recorded(args.plugin, args.args, 'record', args.cassettes)
+        sys.stderr.write('recorded %i exchanges, %i bytes, into %s\n' % (
+            stats['requests'], stats['bytes'], cassette_dir(args.plugin, args.cassettes)))
+    elif args.command == 'replay':
+        stats = run_recorded(args.plugin, args.args, 'replay', args.cassettes, args.latency, bandwidth)
+        sys.stderr.write('replayed %i exchanges, %i bytes; %i not in the cassette\n' % (
+            stats['requests'], stats['bytes'], stats['misses'] + stats['refused']))
+    elif args.command == 'bench':
+        rows = bench(args.paths, args.cassettes, args.latency, bandwidth, args.repeat, args.timeout)
+        if not rows:
+            parser.error('no plugins under %s have cassettes in %s' % (', '.join(args.paths), args.cassettes))
+        if args.json:
+            json.dump(rows, sys.stdout, indent=2)
+            sys.stdout.write('\n')
+        else:
+            print_bench(rows)
+    else:
+        parser.print_help()
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
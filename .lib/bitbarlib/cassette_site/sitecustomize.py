@@ -0,0 +1,81 @@
+"""Send a plugin's HTTP and HTTPS connections to a cassette server.
+
+bitbarlib.cassette puts this directory on PYTHONPATH, so Python imports it
+before the plugin starts.  Every http.client (httplib) connection, and the
+urllib3 ones under requests, then connects in plain text to the server
+named in BITBAR_CASSETTE.  Each request carries the scheme, host and port
+it was meant for in an X-Cassette-Target header.  Stays Python 2
+compatible.
+"""
+import os
+import socket
+import sys
+
+server = os.environ.get('BITBAR_CASSETTE')
+
+
+def connect(self):
+    host, _, port = server.rpartition(':')
+    timeout = self.timeout if isinstance(self.timeout, (int, float)) else None
+    self.sock = socket.create_connection((host, int(port)), timeout)
+
+
+def patch_putrequest(cls):
+    put_request = cls.putrequest
+
+    def putrequest(self, method, url, *args, **kwargs):
+        put_request(self, method, url, *args, **kwargs)
+        if not url.startswith(('http://', 'https://')):
+            scheme = 'https' if self.default_port == 443 else 'http'
+            self.putheader('X-Cassette-Target', '%s://%s:%s' % (scheme, self.host, self.port or self.default_port))
+
+    cls.putrequest = putrequest
+
+
+def patch_urllib3(module):
+    module.HTTPConnection.connect = connect
+    module.HTTPSConnection.connect = connect
+
+
+class Urllib3Finder(object):
+    """Patches urllib3 when the plugin imports it, so plugins that don't aren't slowed by importing it here."""
+
+    def find_spec(self, name, path=None, target=None):
+        if name != 'urllib3.connection':
+            return None
+        import importlib.util
+        sys.meta_path.remove(self)
+        spec = importlib.util.find_spec(name)
+        if spec is not None and spec.loader is not None:
+            exec_module = spec.loader.exec_module
+
+            def patched(module):
+                exec_module(module)
+                patch_urllib3(module)
+            spec.loader.exec_module = patched
+        return spec
+
+
+if server:
+    # the server stands in for the network; a proxy would get the requests instead
+    for name in ('http_proxy', 'https_proxy', 'HTTP_PROXY', 'HTTPS_PROXY', 'all_proxy', 'ALL_PROXY'):
+        os.environ.pop(name, None)
+
+    try:
+        import http.client as httplib
+    except ImportError:
+        import httplib
+    patch_putrequest(httplib.HTTPConnection)
+    httplib.HTTPConnection.connect = connect
+    if hasattr(httplib, 'HTTPSConnection'):
+        httplib.HTTPSConnection.connect = connect
+
+    if sys.version_info[0] >= 3:
+        sys.meta_path.insert(0, Urllib3Finder())
+    else:
+        try:
+            import urllib3.connection
+        except ImportError:
+            pass
+        else:
+            patch_urllib3(urllib3.connection)
@@ -0,0 +1,257 @@
+"""What a set of plugins costs per day, and which ones refresh too often.
+
+A plugin's cost is what one run costs times the runs a day its interval
+asks for.  So a 1s plugin that starts kubectl can cost more than a 7h one
+that runs for a minute.  Each plugin is run a few times to measure a
+run's wall time and CPU time, then once more to count the commands it
+starts.  Every run goes through a bitbarlib.cassette server, which counts
+HTTP requests.  Plugins with a cassette are replayed from it, offline.
+The rest go to the network and are recorded into a throwaway directory.
+
+    PYTHONPATH=.lib python3 -m bitbarlib.cost Dev/Kubernetes Time
+    PYTHONPATH=.lib python3 -m bitbarlib.cost --max-fraction 0.1 --json Web
+
+The budget table ranks plugins by CPU seconds per day.  The interval
+advisor lists the plugins whose typical run takes more than max-fraction
+of their interval, with the shortest interval that would bring them
+under it.
+
+Commands are counted by putting a stand-in for every command on PATH
+first.  Commands started by absolute path, and shell builtins, are not
+counted.  Streaming plugins are measured as one process per refresh.
+That is an upper bound, since they start once and render each tick.
+"""
+import argparse
+import json
+import os
+import shlex
+import shutil
+import sys
+import tempfile
+
+from bitbarlib.cassette import CassetteServer, cassette_dir, cassette_root, plugin_env
+from bitbarlib.host import max_timeout, min_timeout, percentile, plugin_timeout, run_plugin
+from bitbarlib.plugins import default_interval, discover, interval_pattern, parse_interval
+
+day = 86400
+# intervals the advisor suggests, in seconds
+suggested_intervals = [1, 2, 5, 10, 15, 30, 60, 120, 300, 600, 900, 1800, 3600, 7200, 10800, 21600,
+                       43200, 86400]
+
+
+def format_interval(seconds):
+    """seconds in BitBar's file name notation, in the largest unit that divides it."""
+    for unit, size in (('d', 86400), ('h', 3600), ('m', 60)):
+        if seconds % size == 0:
+            return '%i%s' % (seconds // size, unit)
+    return '%is' % seconds
+
+
+def streamable(path):
+    try:
+        with open(path, 'rb') as fp:
+            head = fp.read(4096)
+    except IOError:
+        return False
+    return b'<bitbar.type>streamable</bitbar.type>' in head
+
+
+def write_shims(directory, path):
+    """Fill directory with a stand-in for each command on path that logs itself and runs the command.
+
+    Each line logged is the process ID and the command name, to the file
+    named in BITBAR_COST_LOG.
+    """
+    seen = set()
+    for entry in path.split(os.pathsep):
+        try:
+            names = sorted(os.listdir(entry))
+        except OSError:
+            continue
+        for name in names:
+            real = os.path.join(entry, name)
+            if name in seen or not os.path.isfile(real) or not os.access(real, os.X_OK):
+                continue
+            seen.add(name)
+            shim = os.path.join(directory, name)
+            with open(shim, 'w') as fp:
+                fp.write('#!/bin/sh\nprintf "%%s %%s\\n" "$$" %s >> "$BITBAR_COST_LOG"\nexec %s "$@"\n' % (
+                    shlex.quote(name), shlex.quote(real)))
+            os.chmod(shim, 0o755)
+    return len(seen)
+
+
+def count_commands(log, root_pid):
+    """Commands started per name, from a shim log.
+
+    A shim running as the plugin's own process is the interpreter its
+    #!/usr/bin/env line looked up, so it isn't counted.
+    """
+    commands = {}
+    try:
+        with open(log) as fp:
+            lines = fp.read().splitlines()
+    except IOError:
+        return commands
+    for line in lines:
+        pid, _, name = line.partition(' ')
+        if pid != str(root_pid):
+            commands[name] = commands.get(name, 0) + 1
+    return commands
+
+
+def measure(plugin, interval, cassettes, shims, repeat=3, timeout=None):
+    """Run plugin repeat times and once more with shims on PATH; returns its row of the budget."""
+    timeout = timeout or plugin_timeout(interval)
+    cassette = cassette_dir(plugin, cassettes)
+    offline = os.path.isdir(cassette)
+    scratch = tempfile.mkdtemp(prefix='bitbar-cost-')
+    server = CassetteServer(cassette if offline else os.path.join(scratch, 'cassette'),
+                            'replay' if offline else 'record').start()
+    runs = []
+    try:
+        for _ in range(repeat):
+            server.reset()
+            record = run_plugin(plugin, timeout, plugin_env(server))
+            record.update(server.stats)
+            runs.append(record)
+        server.reset()
+        env = plugin_env(server)
+        env['PATH'] = shims + os.pathsep + env.get('PATH', os.defpath)
+        env['BITBAR_COST_LOG'] = os.path.join(scratch, 'commands.log')
+        counted = run_plugin(plugin, timeout, env)
+        commands = count_commands(env['BITBAR_COST_LOG'], counted['pid'])
+    finally:
+        server.stop()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+    walls = sorted(r['wall'] for r in runs)
+    wall = percentile(walls, 50)
+    cpu = sum(r['cpu_user'] + r['cpu_system'] for r in runs) / repeat
+    requests = sum(r['requests'] for r in runs) / float(repeat)
+    received = sum(r['bytes'] for r in runs) / float(repeat)
+    subprocesses = sum(commands.values())
+    runs_per_day = day / float(interval)
+    return {
+        'plugin': plugin,
+        'interval': interval,
+        'streams': streamable(plugin),
+        'network': 'cassette' if offline else 'live',
+        'runs_per_day': runs_per_day,
+        'wall': wall,
+        'wall_max': walls[-1],
+        'cpu': cpu,
+        'subprocesses': subprocesses,
+        'commands': commands,
+        'requests': requests,
+        'bytes': received,
+        'failed': sum(1 for r in runs if r['exit_status'] or r['timed_out']),
+        'cpu_per_day': cpu * runs_per_day,
+        'wall_per_day': wall * runs_per_day,
+        'subprocesses_per_day': subprocesses * runs_per_day,
+        'requests_per_day': requests * runs_per_day,
+        'bytes_per_day': received * runs_per_day,
+    }
+
+
+def advise(rows, max_fraction):
+    """The plugins whose typical run takes more than max_fraction of their interval, with a longer interval."""
+    advice = []
+    for row in rows:
+        fraction = row['wall'] / row['interval']
+        if fraction <= max_fraction:
+            continue
+        needed = row['wall'] / max_fraction
+        interval = next((i for i in suggested_intervals if i >= needed), suggested_intervals[-1])
+        text = format_interval(interval)
+        name = os.path.basename(row['plugin'])
+        match = interval_pattern.search(name)
+        if match:
+            renamed = name[:match.start('count')] + text + name[match.end('unit'):]
+        else:
+            stem, extension = os.path.splitext(name)
+            renamed = '%s.%s%s' % (stem, text, extension)
+        advice.append({'plugin': row['plugin'], 'fraction': fraction, 'interval': interval, 'rename': renamed})
+    advice.sort(key=lambda a: -a['fraction'])
+    return advice
+
+
+def print_budget(rows, out=sys.stdout):
+    out.write('%8s %8s %9s %8s %6s %6s %10s %10s %10s %10s  %s\n' % (
+        'interval', 'runs/d', 'wall ms', 'cpu ms', 'procs', 'reqs', 'cpu s/d', 'procs/d', 'reqs/d', 'MB/d',
+        'plugin'))
+    totals = {'cpu_per_day': 0, 'subprocesses_per_day': 0, 'requests_per_day': 0, 'bytes_per_day': 0}
+    for row in rows:
+        for key in totals:
+            totals[key] += row[key]
+        flags = ('*' if row['streams'] else '') + ('!' if row['failed'] else '')
+        out.write('%8s %8.0f %9.1f %8.1f %6i %6.1f %10.1f %10.0f %10.0f %10.2f  %s%s\n' % (
+            format_interval(row['interval']), row['runs_per_day'], row['wall'] * 1000, row['cpu'] * 1000,
+            row['subprocesses'], row['requests'], row['cpu_per_day'], row['subprocesses_per_day'],
+            row['requests_per_day'], row['bytes_per_day'] / 1e6, row['plugin'], flags))
+    out.write('%8s %8s %9s %8s %6s %6s %10.1f %10.0f %10.0f %10.2f  %s\n' % (
+        '', '', '', '', '', '', totals['cpu_per_day'], totals['subprocesses_per_day'], totals['requests_per_day'],
+        totals['bytes_per_day'] / 1e6, 'total'))
+    if any(row['streams'] for row in rows):
+        out.write('* streams; counted as a process per refresh, so an upper bound\n')
+    if any(row['failed'] for row in rows):
+        out.write('! failed or timed out in some runs\n')
+
+
+def print_advice(advice, max_fraction, out=sys.stdout):
+    if not advice:
+        out.write('\nEvery plugin runs in under %.0f%% of its interval.\n' % (max_fraction * 100))
+        return
+    out.write('\nRunning for more than %.0f%% of their interval:\n' % (max_fraction * 100))
+    for item in advice:
+        out.write('  %-50s %5.0f%%  refresh every %s: %s\n' % (
+            item['plugin'], item['fraction'] * 100, format_interval(item['interval']), item['rename']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='bitbarlib.cost', description=__doc__.split('\n\n')[0])
+    parser.add_argument('paths', nargs='*', default=['.'], help='Plugin files or directories (default: .)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed runs per plugin (default: %(default)s)')
+    parser.add_argument('--timeout', type=float,
+                        help='Kill runs after this many seconds (default: the plugin\'s interval, '
+                             'between %i and %i)' % (min_timeout, max_timeout))
+    parser.add_argument('--max-fraction', type=float, default=0.25,
+                        help='Flag plugins running longer than this fraction of their interval '
+                             '(default: %(default)s)')
+    parser.add_argument('--default-interval', type=int, default=default_interval,
+                        help='Interval for plugins without one in their name, in seconds (default: %(default)s)')
+    parser.add_argument('--cassettes', default=cassette_root, help='Directory holding one cassette per plugin')
+    parser.add_argument('--json', action='store_true', help='Print the budget and advice as JSON')
+    args = parser.parse_args(argv)
+
+    plugins = [p for p in discover(args.paths) if os.access(p, os.X_OK)]
+    if not plugins:
+        parser.error('no executable plugins found in %s' % ', '.join(args.paths))
+    shims = tempfile.mkdtemp(prefix='bitbar-shims-')
+    rows = []
+    try:
+        write_shims(shims, os.environ.get('PATH', os.defpath))
+        for plugin in plugins:
+            interval = parse_interval(plugin)[1] or args.default_interval
+            try:
+                rows.append(measure(plugin, interval, args.cassettes, shims, args.repeat, args.timeout))
+            except OSError as e:
+                sys.stderr.write('%s: not measured: %s\n' % (plugin, e))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        shutil.rmtree(shims, ignore_errors=True)
+
+    rows.sort(key=lambda row: -row['cpu_per_day'])
+    advice = advise(rows, args.max_fraction)
+    if args.json:
+        json.dump({'budget': rows, 'advice': advice}, sys.stdout, indent=1)
+        sys.stdout.write('\n')
+    else:
+        print_budget(rows)
+        print_advice(advice, args.max_fraction)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,471 @@
+"""A fake Sonos speaker, for timing SonosBar without a Sonos system.
+
+The speaker answers the UPnP requests SoCo makes on port 1400 after a set
+latency, and counts them by action.  It holds one saved playlist,
+"Bench", with as many songs as asked for.  It keeps a real queue, so a
+run can be checked as well as timed:
+
+    PYTHONPATH=.lib python3 -m bitbarlib.fakesonos serve --latency 20
+    PYTHONPATH=.lib python3 -m bitbarlib.fakesonos bench --latency 20 --songs 500
+
+bench plays the playlist through Music/sonosBar.py, which must be able to
+import soco under --python.  --no-container makes the speaker refuse to
+queue a playlist in one request, so the song by song path is timed.
+
+The speaker also takes event subscriptions and sends an event when its
+transport state or volume changes.  menu times drawing SonosBar's menu by
+asking the speaker, then from the snapshot kept by SonosBar's --daemon.
+It also checks that a click from the menu shows up in the next menu:
+
+    PYTHONPATH=.lib python3 -m bitbarlib.fakesonos menu --latency 20
+
+SoCo always talks to port 1400, so the speaker listens on
+127.0.0.1:1400.
+"""
+import argparse
+import http.client
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Queue
+from urllib.parse import urlsplit
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+default_plugin = os.path.join(repo_root, 'Music', 'sonosBar.py')
+port = 1400
+saved_queue = 'file:///jffs/settings/savedqueues.rsq#'
+didl_open = ('<DIDL-Lite xmlns:dc="http://purl.org/dc/elements/1.1/" '
+             'xmlns:upnp="urn:schemas-upnp-org:metadata-1-0/upnp/" '
+             'xmlns:r="urn:schemas-rinconnetworks-com:metadata-1-0/" '
+             'xmlns="urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/">')
+services = {
+    '/MediaRenderer/AVTransport/Control': 'AVTransport',
+    '/MediaRenderer/RenderingControl/Control': 'RenderingControl',
+    '/ZoneGroupTopology/Control': 'ZoneGroupTopology',
+    '/MediaServer/ContentDirectory/Control': 'ContentDirectory',
+    '/DeviceProperties/Control': 'DeviceProperties',
+}
+# event subscriptions are made at the service's control URL ending in /Event
+event_services = dict((path[:-len('Control')] + 'Event', service) for path, service in services.items()
+                      if service in ('AVTransport', 'RenderingControl', 'ZoneGroupTopology'))
+# SoCo reads a service's description for actions it calls without
+# arguments; these are the ones it calls, with their out arguments
+described_actions = {
+    'DeviceProperties': {'GetHouseholdID': ['CurrentHouseholdID']},
+    'ZoneGroupTopology': {'GetZoneGroupState': ['ZoneGroupState']},
+}
+
+
+class UPnPError(Exception):
+    def __init__(self, code):
+        Exception.__init__(self, code)
+        self.code = code
+
+
+class Speaker(object):
+    """The state of one fake speaker: its queue, transport and volume."""
+
+    def __init__(self, host, name, songs, container=True):
+        self.host = host
+        self.name = name
+        self.uid = 'RINCON_FAKE%s01400' % host.replace('.', '')
+        self.playlists = {1: ('Bench', ['x-file-cifs://nas/music/song%04i.mp3' % n for n in range(songs)])}
+        self.container = container
+        self.queue = []
+        self.state = 'STOPPED'
+        self.volume = 30
+        self.lock = threading.Lock()
+        self.requests = Counter()
+        # subscription ID: [service, callback URL, next event number]
+        self.subscribers = {}
+        # events waiting to be sent, as (callback URL, subscription ID, number, body)
+        self.events = Queue()
+
+    def act(self, service, action, args):
+        """Carry out one action; returns the response arguments as a list of pairs."""
+        handler = getattr(self, '%s_%s' % (service, action), None)
+        if handler is None:
+            if service == 'AVTransport' and action in ('SetAVTransportURI', 'Seek', 'Stop', 'Next', 'Previous',
+                                                       'SetPlayMode', 'BecomeCoordinatorOfStandaloneGroup'):
+                return []
+            raise UPnPError(401)
+        with self.lock:
+            return handler(args)
+
+    # AVTransport
+
+    def enqueue(self, uris):
+        first = len(self.queue) + 1
+        self.queue.extend(uris)
+        return [('FirstTrackNumberEnqueued', first), ('NumTracksAdded', len(uris)),
+                ('NewQueueLength', len(self.queue))]
+
+    def AVTransport_AddURIToQueue(self, args):
+        uri = args['EnqueuedURI']
+        if uri.startswith(saved_queue):
+            if not self.container:
+                raise UPnPError(800)
+            return self.enqueue(self.playlists[int(uri[len(saved_queue):])][1])
+        return self.enqueue([uri])
+
+    def AVTransport_AddMultipleURIsToQueue(self, args):
+        uris = args['EnqueuedURIs'].split()
+        if len(uris) != int(args['NumberOfURIs']) or len(uris) > 16:
+            raise UPnPError(402)
+        return self.enqueue(uris) + [('NewUpdateID', 0)]
+
+    def AVTransport_RemoveAllTracksFromQueue(self, args):
+        del self.queue[:]
+        return []
+
+    def AVTransport_Play(self, args):
+        self.state = 'PLAYING'
+        self.notify('AVTransport')
+        return []
+
+    def AVTransport_Pause(self, args):
+        self.state = 'PAUSED_PLAYBACK'
+        self.notify('AVTransport')
+        return []
+
+    def AVTransport_GetTransportInfo(self, args):
+        return [('CurrentTransportState', self.state), ('CurrentTransportStatus', 'OK'), ('CurrentSpeed', '1')]
+
+    # RenderingControl
+
+    def RenderingControl_GetVolume(self, args):
+        return [('CurrentVolume', self.volume)]
+
+    def RenderingControl_SetVolume(self, args):
+        self.volume = int(args['DesiredVolume'])
+        self.notify('RenderingControl')
+        return []
+
+    # ZoneGroupTopology
+
+    def zone_group_state(self):
+        member = ('<ZoneGroupMember UUID="%s" Location="http://%s:%i/xml/device_description.xml" '
+                  'ZoneName="%s" BootSeq="1" Configuration="1"/>' % (self.uid, self.host, port, escape(self.name)))
+        return ('<ZoneGroupState><ZoneGroups><ZoneGroup Coordinator="%s" ID="%s:1">%s</ZoneGroup></ZoneGroups>'
+                '<VanishedDevices/></ZoneGroupState>' % (self.uid, self.uid, member))
+
+    def ZoneGroupTopology_GetZoneGroupState(self, args):
+        return [('ZoneGroupState', self.zone_group_state())]
+
+    # DeviceProperties
+
+    def DeviceProperties_GetHouseholdID(self, args):
+        return [('CurrentHouseholdID', 'Sonos_Fake')]
+
+    # ContentDirectory
+
+    def ContentDirectory_Browse(self, args):
+        object_id = args['ObjectID']
+        if object_id == 'SQ:':
+            entries = ['<container id="SQ:%i" parentID="SQ:" restricted="true"><dc:title>%s</dc:title>'
+                       '<upnp:class>object.container.playlistContainer</upnp:class>'
+                       '<res protocolInfo="file:*:audio/mpegurl:*">%s%i</res></container>'
+                       % (number, escape(title), saved_queue, number)
+                       for number, (title, _) in sorted(self.playlists.items())]
+        elif object_id.startswith('SQ:') and int(object_id[3:]) in self.playlists:
+            entries = ['<item id="%s/%i" parentID="%s" restricted="true">'
+                       '<res protocolInfo="x-file-cifs:*:audio/mpeg:*">%s</res><dc:title>Song %i</dc:title>'
+                       '<upnp:class>object.item.audioItem.musicTrack</upnp:class></item>'
+                       % (object_id, n, object_id, escape(uri), n)
+                       for n, uri in enumerate(self.playlists[int(object_id[3:])][1])]
+        else:
+            entries = []
+        start = int(args.get('StartingIndex') or 0)
+        count = int(args.get('RequestedCount') or 100)
+        page = entries[start:start + min(count, 100)]
+        return [('Result', didl_open + ''.join(page) + '</DIDL-Lite>'), ('NumberReturned', len(page)),
+                ('TotalMatches', len(entries)), ('UpdateID', 1)]
+
+    # Events
+
+    def subscribe(self, service, callback):
+        """Add a subscription to service's events and queue its first event; returns its ID."""
+        with self.lock:
+            sid = 'uuid:%s_sub%010i' % (self.uid, len(self.subscribers) + 1)
+            self.subscribers[sid] = [service, callback, 0]
+            self.notify(service, sid)
+        return sid
+
+    def unsubscribe(self, sid):
+        with self.lock:
+            return self.subscribers.pop(sid, None) is not None
+
+    def event_body(self, service):
+        if service == 'AVTransport':
+            variable = ('LastChange', '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/AVT/"><InstanceID val="0">'
+                                      '<TransportState val="%s"/></InstanceID></Event>' % self.state)
+        elif service == 'RenderingControl':
+            variable = ('LastChange', '<Event xmlns="urn:schemas-upnp-org:metadata-1-0/RCS/"><InstanceID val="0">'
+                                      '<Volume channel="Master" val="%i"/></InstanceID></Event>' % self.volume)
+        else:
+            variable = ('ZoneGroupState', self.zone_group_state())
+        return ('<?xml version="1.0"?><e:propertyset xmlns:e="urn:schemas-upnp-org:event-1-0"><e:property>'
+                '<%s>%s</%s></e:property></e:propertyset>' % (variable[0], escape(variable[1]), variable[0]))
+
+    def notify(self, service, sid=None):
+        """Queue an event for service's subscribers, or for subscription sid alone; call holding the lock."""
+        body = self.event_body(service)
+        for subscription_id, subscription in sorted(self.subscribers.items()):
+            if subscription[0] == service and sid in (None, subscription_id):
+                self.events.put((subscription[1], subscription_id, subscription[2], body))
+                subscription[2] += 1
+
+    def device_description(self):
+        return ('<?xml version="1.0"?><root xmlns="urn:schemas-upnp-org:device-1-0"><device>'
+                '<roomName>%s</roomName><serialNum>00-00-00-00-00-01:0</serialNum>'
+                '<softwareVersion>1</softwareVersion><hardwareVersion>1</hardwareVersion>'
+                '<modelNumber>S1</modelNumber><modelName>Fake</modelName><displayVersion>1</displayVersion>'
+                '</device></root>' % escape(self.name))
+
+
+def service_description(actions):
+    """A UPnP service description listing actions, a dict of action name to out argument names."""
+    listed = []
+    variables = []
+    for action, outputs in sorted(actions.items()):
+        arguments = ''.join('<argument><name>%s</name><direction>out</direction>'
+                            '<relatedStateVariable>%s</relatedStateVariable></argument>' % (name, name)
+                            for name in outputs)
+        listed.append('<action><name>%s</name><argumentList>%s</argumentList></action>' % (action, arguments))
+        variables.extend('<stateVariable><name>%s</name><dataType>string</dataType></stateVariable>' % name
+                         for name in outputs)
+    return ('<?xml version="1.0"?><scpd xmlns="urn:schemas-upnp-org:service-1-0"><actionList>%s</actionList>'
+            '<serviceStateTable>%s</serviceStateTable></scpd>' % (''.join(listed), ''.join(variables)))
+
+
+class Control(BaseHTTPRequestHandler):
+    """Answers SoCo's requests for the server's speaker."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def reply(self, status, body, content_type='text/xml; charset="utf-8"', headers=()):
+        data = body.encode('utf-8')
+        time.sleep(self.server.latency)
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        speaker = self.server.speaker
+        speaker.requests['GET %s' % self.path] += 1
+        description = re.match(r'^/xml/(\w+)1\.xml$', self.path)
+        if self.path == '/xml/device_description.xml':
+            self.reply(200, speaker.device_description())
+        elif description and description.group(1) in described_actions:
+            self.reply(200, service_description(described_actions[description.group(1)]))
+        else:
+            self.reply(404, '')
+
+    def do_POST(self):
+        speaker = self.server.speaker
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        service = services.get(self.path)
+        action = (self.headers.get('SOAPACTION') or '').strip('"').rpartition('#')[2]
+        speaker.requests[action] += 1
+        try:
+            if service is None:
+                raise UPnPError(401)
+            call = ElementTree.fromstring(body).find('{http://schemas.xmlsoap.org/soap/envelope/}Body')[0]
+            args = dict((child.tag, child.text or '') for child in call)
+            result = speaker.act(service, action, args)
+        except UPnPError as e:
+            self.reply(500, '<?xml version="1.0"?><s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">'
+                            '<s:Body><s:Fault><faultcode>s:Client</faultcode><faultstring>UPnPError</faultstring>'
+                            '<detail><UPnPError xmlns="urn:schemas-upnp-org:control-1-0"><errorCode>%i</errorCode>'
+                            '</UPnPError></detail></s:Fault></s:Body></s:Envelope>' % e.code)
+            return
+        arguments = ''.join('<%s>%s</%s>' % (name, escape(str(value)), name) for name, value in result)
+        self.reply(200, '<?xml version="1.0"?><s:Envelope xmlns:s="http://schemas.xmlsoap.org/soap/envelope/" '
+                        's:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/"><s:Body>'
+                        '<u:%sResponse xmlns:u="urn:schemas-upnp-org:service:%s:1">%s</u:%sResponse>'
+                        '</s:Body></s:Envelope>' % (action, service, arguments, action))
+
+
+    def do_SUBSCRIBE(self):
+        speaker = self.server.speaker
+        speaker.requests['SUBSCRIBE'] += 1
+        service = event_services.get(self.path)
+        sid = self.headers.get('SID')
+        if service is None:
+            self.reply(404, '')
+            return
+        if sid is None:
+            sid = speaker.subscribe(service, (self.headers.get('CALLBACK') or '').strip('<>'))
+        elif sid not in speaker.subscribers:
+            self.reply(412, '')
+            return
+        self.reply(200, '', headers=[('SID', sid), ('TIMEOUT', self.headers.get('TIMEOUT') or 'Second-3600')])
+
+    def do_UNSUBSCRIBE(self):
+        speaker = self.server.speaker
+        speaker.requests['UNSUBSCRIBE'] += 1
+        self.reply(200 if speaker.unsubscribe(self.headers.get('SID')) else 412, '')
+
+
+class SpeakerServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, speaker, latency=0.0):
+        ThreadingHTTPServer.__init__(self, (speaker.host, port), Control)
+        self.speaker = speaker
+        self.latency = latency
+        threading.Thread(target=self.send_events, daemon=True).start()
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def send_events(self):
+        """Send the speaker's events in order, each after the latency, as a speaker does."""
+        while True:
+            callback, sid, number, body = self.speaker.events.get()
+            time.sleep(self.latency)
+            url = urlsplit(callback)
+            try:
+                connection = http.client.HTTPConnection(url.hostname, url.port, timeout=5)
+                connection.request('NOTIFY', url.path or '/', body.encode('utf-8'), {
+                    'Content-Type': 'text/xml; charset="utf-8"', 'NT': 'upnp:event', 'NTS': 'upnp:propchange',
+                    'SID': sid, 'SEQ': str(number)})
+                connection.getresponse().read()
+                connection.close()
+            except (OSError, http.client.HTTPException):
+                pass
+
+
+def bench(plugin, python, songs, latency, container=True):
+    """Play the Bench playlist on a fake speaker through plugin; returns (seconds, speaker, output)."""
+    speaker = Speaker('127.0.0.1', 'Bench Speaker', songs, container)
+    server = SpeakerServer(speaker, latency).start()
+    try:
+        with tempfile.TemporaryDirectory(prefix='bitbar-fakesonos-') as cache:
+            env = dict(os.environ, XDG_CACHE_HOME=cache)
+            started = time.perf_counter()
+            output = subprocess.run([python, plugin, '-i', '127.0.0.1', '-g', '-l', 'Bench', '-o'], env=env,
+                                    stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True).stdout
+            elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+    return elapsed, speaker, output
+
+
+def run_menu(python, plugin, env, *args):
+    """Draw the menu; returns (seconds, output)."""
+    started = time.perf_counter()
+    output = subprocess.run([python, plugin, '-i', '127.0.0.1'] + list(args), env=env, stdout=subprocess.PIPE,
+                            universal_newlines=True).stdout
+    return time.perf_counter() - started, output
+
+
+def menu_bench(plugin, python, latency, renders=5):
+    """Time drawing the menu from the speaker and from the daemon's snapshot, and click Play in between.
+
+    Returns a list of (what, seconds per run, requests per run, whether the menu showed what it should).
+    """
+    speaker = Speaker('127.0.0.1', 'Bench Speaker', 10)
+    server = SpeakerServer(speaker, latency).start()
+    rows = []
+    daemon = None
+
+    def measure(what, expected, *args):
+        speaker.requests.clear()
+        seconds = 0
+        correct = True
+        for _ in range(renders if not args else 1):
+            elapsed, output = run_menu(python, plugin, env, *(args or ['-b']))
+            seconds += elapsed
+            correct = correct and (args or expected in output)
+        runs = renders if not args else 1
+        rows.append((what, seconds / runs, sum(speaker.requests.values()) / float(runs), bool(correct)))
+
+    try:
+        with tempfile.TemporaryDirectory(prefix='bitbar-fakesonos-') as cache:
+            env = dict(os.environ, XDG_CACHE_HOME=cache)
+            snapshot = os.path.join(cache, 'bitbar-plugins', 'state', 'sonosBar.json')
+            measure('menu, asking the speaker', '├ Play')
+            daemon = subprocess.Popen([python, plugin, '--daemon', '-i', '127.0.0.1'], env=env)
+            deadline = time.time() + 10
+            while not os.path.exists(snapshot) and time.time() < deadline:
+                time.sleep(0.05)
+            # let the subscriptions' first events arrive
+            time.sleep(0.5)
+            measure('menu, from the snapshot', '├ Play')
+            measure('click Play', None, 'play', '-g')
+            measure('menu right after the click', '├ Pause')
+            time.sleep(0.5)
+            measure('menu once the event is in', '├ Pause')
+    finally:
+        if daemon is not None:
+            daemon.terminate()
+            daemon.wait()
+        server.shutdown()
+        server.server_close()
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='bitbarlib.fakesonos', description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command')
+    options = argparse.ArgumentParser(add_help=False)
+    options.add_argument('--latency', type=float, default=20, help='Milliseconds before each response')
+    options.add_argument('--songs', type=int, default=500, help='Songs in the Bench playlist')
+    options.add_argument('--no-container', dest='container', action='store_false',
+                         help='Refuse to queue a whole playlist in one request')
+    commands.add_parser('serve', parents=[options], help='Run a fake speaker until interrupted')
+    bench_parser = commands.add_parser('bench', parents=[options], help='Time playing a playlist through SonosBar')
+    bench_parser.add_argument('--plugin', default=default_plugin)
+    bench_parser.add_argument('--python', default=sys.executable, help='Interpreter that can import soco')
+    menu_parser = commands.add_parser('menu', parents=[options], help="Time drawing SonosBar's menu with --daemon")
+    menu_parser.add_argument('--plugin', default=default_plugin)
+    menu_parser.add_argument('--python', default=sys.executable, help='Interpreter that can import soco')
+    menu_parser.add_argument('--renders', type=int, default=5, help='Menus drawn for each timing')
+    args = parser.parse_args(argv)
+
+    if args.command == 'serve':
+        server = SpeakerServer(Speaker('127.0.0.1', 'Fake Speaker', args.songs, args.container), args.latency / 1000)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+    elif args.command == 'bench':
+        elapsed, speaker, output = bench(args.plugin, args.python, args.songs, args.latency / 1000, args.container)
+        sys.stdout.write(re.sub(r'(?m)^', '> ', output.rstrip('\n')) + '\n')
+        print('%.2f s, %i requests at %g ms, queue holds %i of %i songs' % (
+            elapsed, sum(speaker.requests.values()), args.latency, len(speaker.queue), args.songs))
+        for action, count in speaker.requests.most_common():
+            print('%6i  %s' % (count, action))
+        return 0 if speaker.queue == speaker.playlists[1][1] else 1
+    elif args.command == 'menu':
+        rows = menu_bench(args.plugin, args.python, args.latency / 1000, args.renders)
+        print('%9s %9s  %s' % ('ms/run', 'reqs/run', 'at %g ms' % args.latency))
+        for what, seconds, requests, correct in rows:
+            print('%9.1f %9.1f  %s%s' % (seconds * 1000, requests, what, '' if correct else ' (wrong menu)'))
+        return 0 if all(row[3] for row in rows) else 1
+    else:
+        parser.print_help()
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""A headless BitBar stand-in for running plugins on machines without BitBar.
+
+Plugins are found with the same conventions BitBar uses and each one is run
+at the interval in its file name on a bounded pool of workers.  Every run is
+recorded with its latency, CPU time, peak memory and output size:
+
+    PYTHONPATH=.lib python3 -m bitbarlib.host --duration 600 --log runs.jsonl Time Weather
+
+Runs longer than the plugin's timeout are killed, a plugin that is still
+running when it falls due again is skipped for that tick rather than started
+twice, and start times are jittered so plugins sharing an interval don't
+all start at once.  Each plugin keeps to a fixed grid of one run per
+interval; the jitter delays a run without moving the ones after it.
+"""
+import argparse
+import heapq
+import json
+import os
+import random
+import selectors
+import signal
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bitbarlib.plugins import default_interval, discover, parse_interval
+
+
+class Plugin(object):
+    """A plugin file and what the host has seen of it so far."""
+
+    def __init__(self, path, interval, timeout):
+        self.path = path
+        self.interval = interval
+        self.timeout = timeout
+        self.running = False
+        # the point on the plugin's grid of runs it is next due at
+        self.next_due = None
+        self.runs = []
+        self.skipped = 0
+
+
+def run_plugin(path, timeout, env=None):
+    """Run one plugin to completion or until timeout seconds pass.
+
+    Returns a record of the run.  The plugin gets its own process group so a
+    timeout also kills anything it started.
+    """
+    start = time.time()
+    started = time.perf_counter()
+    process = subprocess.Popen([os.path.abspath(path)], cwd=os.path.dirname(os.path.abspath(path)),
+                               stdin=subprocess.DEVNULL, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                               env=env, start_new_session=True)
+    sizes = {process.stdout: 0, process.stderr: 0}
+    timed_out = False
+    with selectors.DefaultSelector() as selector:
+        selector.register(process.stdout, selectors.EVENT_READ)
+        selector.register(process.stderr, selectors.EVENT_READ)
+        deadline = started + timeout
+        while selector.get_map():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                timed_out = True
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except OSError:
+                    pass
+                break
+            for key, _ in selector.select(remaining):
+                data = os.read(key.fileobj.fileno(), 65536)
+                if data:
+                    sizes[key.fileobj] += len(data)
+                else:
+                    selector.unregister(key.fileobj)
+    process.stdout.close()
+    process.stderr.close()
+    # wait4 rather than wait so the run's own resource usage comes back with its status
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status) if hasattr(os, 'waitstatus_to_exitcode') else status
+    return {
+        'plugin': path,
+        'pid': process.pid,
+        'start': start,
+        'wall': time.perf_counter() - started,
+        'cpu_user': usage.ru_utime,
+        'cpu_system': usage.ru_stime,
+        # ru_maxrss is in kilobytes on Linux and bytes on macOS
+        'max_rss_kb': usage.ru_maxrss // 1024 if sys.platform == 'darwin' else usage.ru_maxrss,
+        'stdout_bytes': sizes[process.stdout],
+        'stderr_bytes': sizes[process.stderr],
+        'exit_status': process.returncode,
+        'timed_out': timed_out,
+    }
+
+
+class Host(object):
+    """Schedules plugins at their intervals on a bounded worker pool."""
+
+    def __init__(self, plugins, workers=4, jitter=0.1, log=None, env=None):
+        self.plugins = plugins
+        self.workers = workers
+        self.jitter = jitter
+        self.log = log
+        self.env = env
+        self.lock = threading.Lock()
+        self.queue = []
+
+    def schedule(self, plugin):
+        # the jitter isn't carried forward, so lateness doesn't build up over the run
+        due = plugin.next_due + random.uniform(0, self.jitter * plugin.interval)
+        # a tie-breaking counter keeps heapq from ever comparing Plugin objects
+        heapq.heappush(self.queue, (due, id(plugin), plugin))
+
+    def execute(self, plugin):
+        try:
+            record = run_plugin(plugin.path, plugin.timeout, self.env)
+        except OSError as e:
+            record = {'plugin': plugin.path, 'start': time.time(), 'error': str(e)}
+        with self.lock:
+            plugin.runs.append(record)
+            plugin.running = False
+            if self.log is not None:
+                self.log.write(json.dumps(record, sort_keys=True) + '\n')
+                self.log.flush()
+
+    def run(self, duration=None):
+        """Run plugins until duration seconds pass, or forever."""
+        start = time.perf_counter()
+        stop = None if duration is None else start + duration
+        for plugin in self.plugins:
+            # spread first runs over the plugin's interval, or the first minute for slow ones
+            plugin.next_due = start + random.uniform(0, min(plugin.interval, 60))
+            self.schedule(plugin)
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while self.queue:
+                due, _, plugin = self.queue[0]
+                now = time.perf_counter()
+                if stop is not None and due >= stop:
+                    time.sleep(max(0, stop - now))
+                    break
+                if due > now:
+                    time.sleep(due - now)
+                heapq.heappop(self.queue)
+                with self.lock:
+                    overlapping = plugin.running
+                    if overlapping:
+                        plugin.skipped += 1
+                    else:
+                        plugin.running = True
+                if not overlapping:
+                    executor.submit(self.execute, plugin)
+                plugin.next_due += plugin.interval
+                self.schedule(plugin)
+
+    def summary(self):
+        """Return per-plugin statistics, busiest plugins first."""
+        rows = []
+        for plugin in self.plugins:
+            runs = [r for r in plugin.runs if 'wall' in r]
+            walls = sorted(r['wall'] for r in runs)
+            rows.append({
+                'plugin': plugin.path,
+                'interval': plugin.interval,
+                'runs': len(runs),
+                'errors': len(plugin.runs) - len(runs) + sum(1 for r in runs if r['exit_status'] != 0),
+                'timeouts': sum(1 for r in runs if r['timed_out']),
+                'skipped': plugin.skipped,
+                'wall_p50': percentile(walls, 50),
+                'wall_p95': percentile(walls, 95),
+                'cpu_mean': sum(r['cpu_user'] + r['cpu_system'] for r in runs) / len(runs) if runs else None,
+                'stdout_mean': sum(r['stdout_bytes'] for r in runs) / len(runs) if runs else None,
+            })
+        rows.sort(key=lambda row: (row['cpu_mean'] or 0) * row['runs'], reverse=True)
+        return rows
+
+
+def percentile(values, pct):
+    if not values:
+        return None
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+
+# BitBar never kills a plugin; the host gives up on runs after the plugin's
+# interval, but no sooner than min_timeout and no later than max_timeout
+min_timeout = 10
+max_timeout = 60
+
+
+def plugin_timeout(interval):
+    """How long a run of a plugin with this interval may take before it is killed."""
+    return min(max(interval, min_timeout), max_timeout)
+
+
+def load_plugins(paths, timeout=None, default=default_interval):
+    plugins = []
+    for path in discover(paths):
+        if not os.access(path, os.X_OK):
+            continue
+        interval = parse_interval(path)[1] or default
+        plugins.append(Plugin(path, interval, timeout or plugin_timeout(interval)))
+    return plugins
+
+
+def print_summary(rows, out=sys.stdout):
+    out.write('%-50s %8s %5s %4s %4s %4s %9s %9s %9s %9s\n' % (
+        'plugin', 'interval', 'runs', 'err', 'tout', 'skip', 'p50 ms', 'p95 ms', 'cpu ms', 'out B'))
+    for row in rows:
+        out.write('%-50s %7is %5i %4i %4i %4i %9s %9s %9s %9s\n' % (
+            row['plugin'][-50:], row['interval'], row['runs'], row['errors'], row['timeouts'], row['skipped'],
+            '-' if row['wall_p50'] is None else '%.1f' % (row['wall_p50'] * 1000),
+            '-' if row['wall_p95'] is None else '%.1f' % (row['wall_p95'] * 1000),
+            '-' if row['cpu_mean'] is None else '%.1f' % (row['cpu_mean'] * 1000),
+            '-' if row['stdout_mean'] is None else '%.0f' % row['stdout_mean']))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='bitbarlib.host', description=__doc__.split('\n\n')[0])
+    parser.add_argument('paths', nargs='*', default=['.'], help='Plugin files or directories (default: .)')
+    parser.add_argument('--workers', type=int, default=4, help='Run at most this many plugins at once (default: %(default)s)')
+    parser.add_argument('--duration', type=float, help='Stop after this many seconds (default: run until interrupted)')
+    parser.add_argument('--timeout', type=float,
+                        help='Kill runs after this many seconds (default: the plugin\'s interval, '
+                             'between %i and %i)' % (min_timeout, max_timeout))
+    parser.add_argument('--jitter', type=float, default=0.1,
+                        help='Delay each run by up to this fraction of its interval (default: %(default)s)')
+    parser.add_argument('--default-interval', type=int, default=default_interval,
+                        help='Interval for plugins without one in their name, in seconds (default: %(default)s)')
+    parser.add_argument('--log', help='Append a JSON record of every run to this file')
+    parser.add_argument('--json', action='store_true', help='Print the summary as JSON')
+    args = parser.parse_args(argv)
+
+    plugins = load_plugins(args.paths, args.timeout, args.default_interval)
+    if not plugins:
+        parser.error('no executable plugins found in %s' % ', '.join(args.paths))
+    # plugins check these to tell they are running under BitBar; streaming
+    # plugins render once and exit so every tick is measured the same way
+    env = dict(os.environ, BitBar='1', BitBarDarkMode=os.environ.get('BitBarDarkMode', ''),
+               BITBAR_STREAM='0')
+    log = open(args.log, 'a') if args.log else None
+    host = Host(plugins, args.workers, args.jitter, log, env)
+    try:
+        host.run(args.duration)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if log is not None:
+            log.close()
+
+    rows = host.summary()
+    if args.json:
+        json.dump(rows, sys.stdout, indent=1)
+        sys.stdout.write('\n')
+    else:
+        print_summary(rows)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
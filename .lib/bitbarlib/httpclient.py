@@ -0,0 +1,505 @@
+"""Fetch JSON for plugins over pooled connections, with an on-disk cache.
+
+Plugins that call urlopen or requests.get open a new TCP and TLS connection
+for every request and throw the response away when they exit.  A `Client`
+keeps one connection per host for the life of the process and keeps every
+response on disk, so the next run can:
+
+- skip the request while Cache-Control or Expires says the copy is fresh,
+  or for max_age seconds when the caller says so;
+- revalidate with If-None-Match / If-Modified-Since.  A 304 costs no body,
+  and on APIs like GitHub's it doesn't count against the rate limit;
+- serve the stored copy when the host is rate limited, unreachable or
+  failing with a 5xx.
+
+Responses to requests with an Authorization header are only kept when the
+caller passes cache_private=True.  The cache directory is readable by its
+owner alone.
+
+Entries unused for max_unused seconds, and the least recently used beyond
+max_entries, are pruned by whichever run saves a response once prune_interval
+has passed since the last pruning.
+
+Rate limits are (requests, seconds) per host.  They are kept on disk, so
+they hold across runs and across plugins.  A 429 or 503 with Retry-After
+holds off that host without any configuration.
+
+    from bitbarlib.httpclient import get_json
+    ids = get_json('https://hacker-news.firebaseio.com/v0/topstories.json')
+
+To see what a fetch costs and where the answer came from:
+
+    PYTHONPATH=.lib python3 -m bitbarlib.httpclient URL [URL ...]
+"""
+import hashlib
+import json
+import os
+import socket
+import time
+import zlib
+from email.utils import mktime_tz, parsedate_tz
+
+try:
+    import http.client as httplib
+    from urllib.parse import urljoin, urlsplit
+except ImportError:  # Python 2
+    import httplib
+    from urlparse import urljoin, urlsplit
+
+cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                         'bitbar-plugins', 'http')
+user_agent = 'bitbar-plugins'
+max_redirects = 5
+redirect_codes = (301, 302, 303, 307, 308)
+# statuses where an old copy beats an error
+stale_codes = (429, 500, 502, 503, 504)
+# the cache directory is swept at most this often
+prune_interval = 3600
+# request headers only sent on to the host that was asked
+credential_headers = ('authorization', 'cookie')
+# request headers that only hold for the URL that was asked
+conditional_headers = ('if-none-match', 'if-modified-since')
+
+
+class HTTPError(IOError):
+    """A response other than success, with nothing cached to fall back on."""
+
+    def __init__(self, url, status, reason):
+        IOError.__init__(self, '%s %s fetching %s' % (status, reason, url))
+        self.url = url
+        self.status = status
+        self.reason = reason
+
+
+class RateLimited(IOError):
+    """The host's rate limit is used up and nothing is cached for the URL."""
+
+
+class Response(object):
+    """A response body and headers, and whether it came from the network or the cache.
+
+    source is 'network', 'revalidated' (a 304 confirmed the cached copy),
+    'cache' (fresh, no request made) or 'stale' (served instead of an error).
+    """
+
+    def __init__(self, url, status, headers, body, source):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.source = source
+
+    def text(self):
+        charset = 'utf-8'
+        for param in self.headers.get('content-type', '').split(';')[1:]:
+            name, _, value = param.strip().partition('=')
+            if name.lower() == 'charset' and value:
+                charset = value.strip('"')
+        return self.body.decode(charset, 'replace')
+
+    def json(self):
+        return json.loads(self.text())
+
+
+def parse_cache_control(value):
+    """Split a Cache-Control header into a dict of directives."""
+    directives = {}
+    for part in value.split(','):
+        name, _, arg = part.strip().partition('=')
+        if name:
+            directives[name.lower()] = arg.strip('"')
+    return directives
+
+
+def parse_date(value):
+    """Seconds since the epoch for an HTTP date, or None."""
+    parsed = parsedate_tz(value) if value else None
+    return mktime_tz(parsed) if parsed else None
+
+
+def freshness(headers):
+    """How many seconds a response may be used without asking the server again."""
+    directives = parse_cache_control(headers.get('cache-control', ''))
+    if 'no-cache' in directives or 'no-store' in directives:
+        return 0
+    lifetime = 0
+    if 'max-age' in directives:
+        try:
+            lifetime = int(directives['max-age'])
+        except ValueError:
+            pass
+    else:
+        expires = parse_date(headers.get('expires'))
+        date = parse_date(headers.get('date'))
+        if expires is not None:
+            lifetime = expires - (date if date is not None else time.time())
+    try:
+        lifetime -= int(headers.get('age', 0))
+    except ValueError:
+        pass
+    return max(lifetime, 0)
+
+
+def retry_after(headers):
+    """When a Retry-After header allows the next request, or None."""
+    value = headers.get('retry-after')
+    if not value:
+        return None
+    if value.strip().isdigit():
+        return time.time() + int(value)
+    return parse_date(value)
+
+
+def redirect_headers(url, location, headers):
+    """The headers to send on to location when url redirects there.
+
+    Validators belong to url's cache entry, and credentials go no further
+    than url's scheme and host.
+    """
+    old, new = urlsplit(url), urlsplit(location)
+    dropped = conditional_headers
+    if (old.scheme, old.netloc) != (new.scheme, new.netloc):
+        dropped += credential_headers
+    return dict((name, value) for name, value in headers.items() if name.lower() not in dropped)
+
+
+def write_private(path, data):
+    """Replace the file at path with data, readable by its owner alone."""
+    tmp = '%s.%d.tmp' % (path, os.getpid())
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'wb') as fp:
+        fp.write(data)
+    os.rename(tmp, path)
+
+
+class Client(object):
+    """An HTTP client with one keep-alive connection per host and a shared response cache."""
+
+    def __init__(self, cache_dir=cache_dir, rate_limits=None, timeout=10, max_entries=1000,
+                 max_unused=7 * 86400):
+        self.cache_dir = cache_dir
+        self.rate_limits = dict(rate_limits or {})
+        self.timeout = timeout
+        self.max_entries = max_entries
+        self.max_unused = max_unused
+        self.connections = {}
+        self.stats = {'requests': 0, 'connections': 0, 'not_modified': 0, 'cached': 0, 'stale': 0,
+                      'bytes': 0}
+
+    # Connections
+
+    def connection(self, scheme, netloc):
+        key = (scheme, netloc)
+        conn = self.connections.get(key)
+        if conn is None:
+            factory = httplib.HTTPSConnection if scheme == 'https' else httplib.HTTPConnection
+            conn = self.connections[key] = factory(netloc, timeout=self.timeout)
+            self.stats['connections'] += 1
+        return conn
+
+    def drop(self, scheme, netloc):
+        conn = self.connections.pop((scheme, netloc), None)
+        if conn is not None:
+            conn.close()
+
+    def close(self):
+        for conn in self.connections.values():
+            conn.close()
+        self.connections.clear()
+
+    def send(self, url, headers):
+        """Make one GET request, returning (status, reason, headers, body)."""
+        parts = urlsplit(url)
+        path = (parts.path or '/') + ('?' + parts.query if parts.query else '')
+        headers = dict(headers)
+        headers.setdefault('User-Agent', user_agent)
+        headers.setdefault('Accept-Encoding', 'gzip, deflate')
+        for attempt in (1, 2):
+            reused = (parts.scheme, parts.netloc) in self.connections
+            conn = self.connection(parts.scheme, parts.netloc)
+            try:
+                conn.request('GET', path, headers=headers)
+                response = conn.getresponse()
+                body = response.read()
+                break
+            except (httplib.HTTPException, socket.error):
+                self.drop(parts.scheme, parts.netloc)
+                # the server may have closed an idle connection; that is worth one retry
+                if not reused or attempt == 2:
+                    raise
+        self.stats['requests'] += 1
+        self.stats['bytes'] += len(body)
+        if response.will_close:
+            self.drop(parts.scheme, parts.netloc)
+
+        received = dict((name.lower(), value) for name, value in response.getheaders())
+        encoding = received.pop('content-encoding', '').lower()
+        if encoding == 'gzip':
+            body = zlib.decompress(body, 16 + zlib.MAX_WBITS)
+        elif encoding == 'deflate':
+            body = zlib.decompress(body)
+        return response.status, response.reason, received, body
+
+    def fetch(self, url, headers):
+        """GET url, following redirects; returns (status, reason, headers, body)."""
+        for _ in range(max_redirects + 1):
+            status, reason, received, body = self.send(url, headers)
+            if status not in redirect_codes or 'location' not in received:
+                return status, reason, received, body
+            location = urljoin(url, received['location'])
+            headers = redirect_headers(url, location, headers)
+            url = location
+        return status, reason, received, body
+
+    # Cache
+
+    def entry_path(self, url, headers):
+        # credentials are part of the key, so one token's answers aren't served to another
+        key = json.dumps([url, sorted((k.lower(), v) for k, v in headers.items())])
+        return os.path.join(self.cache_dir, hashlib.sha1(key.encode('utf-8')).hexdigest() + '.entry')
+
+    def load(self, path):
+        """Return (meta, body) for a cache entry, or None."""
+        try:
+            with open(path, 'rb') as fp:
+                meta = json.loads(fp.readline().decode('utf-8'))
+                entry = meta, fp.read()
+        except (IOError, OSError, ValueError):
+            return None
+        try:
+            # the mtime is when the entry was last used, for prune()
+            os.utime(path, None)
+        except OSError:
+            pass
+        return entry
+
+    def save(self, path, meta, body):
+        try:
+            self.write(path, json.dumps(meta).encode('utf-8') + b'\n' + body)
+        except (IOError, OSError):
+            # an unwritable cache only costs speed
+            return
+        self.prune_if_due()
+
+    def write(self, path, data):
+        """Replace the file at path, in the cache directory, with data."""
+        for directory in (self.cache_dir, os.path.dirname(path)):
+            if not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+        write_private(path, data)
+
+    def prune_if_due(self):
+        """Prune the cache if no run has in the last prune_interval seconds."""
+        stamp = os.path.join(self.cache_dir, 'pruned')
+        try:
+            if time.time() - os.stat(stamp).st_mtime < prune_interval:
+                return
+        except OSError:
+            pass
+        try:
+            open(stamp, 'a').close()
+            os.utime(stamp, None)
+        except (IOError, OSError):
+            return
+        self.prune()
+
+    def prune(self):
+        """Delete entries unused for max_unused seconds and the least recently used beyond max_entries.
+
+        Returns how many entries were deleted.
+        """
+        now = time.time()
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            if not name.endswith(('.entry', '.tmp')):
+                continue
+            try:
+                used = os.stat(path).st_mtime
+            except OSError:
+                continue
+            if name.endswith('.tmp'):
+                # left behind by a run that died while saving
+                if now - used > prune_interval:
+                    self.remove(path)
+                continue
+            entries.append((used, path))
+        entries.sort(reverse=True)
+        removed = 0
+        for index, (used, path) in enumerate(entries):
+            if index >= self.max_entries or now - used > self.max_unused:
+                removed += self.remove(path)
+        return removed
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            return 0
+        return 1
+
+    # Rate limits
+
+    def host_path(self, host):
+        return os.path.join(self.cache_dir, 'hosts', host.replace(':', '_') + '.json')
+
+    def host_state(self, host):
+        try:
+            with open(self.host_path(host)) as fp:
+                return json.load(fp)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def throttled(self, host):
+        """Whether a request to host now would break its rate limit or Retry-After."""
+        state = self.host_state(host)
+        now = time.time()
+        if state.get('until', 0) > now:
+            return True
+        limit = self.rate_limits.get(host)
+        if limit:
+            count, per = limit
+            return len([t for t in state.get('times', []) if t > now - per]) >= count
+        return False
+
+    def note_request(self, host, until=None):
+        """Record a request to host, for hosts with a limit or a Retry-After to keep."""
+        limit = self.rate_limits.get(host)
+        if not limit and until is None:
+            return
+        state = self.host_state(host)
+        now = time.time()
+        if limit:
+            state['times'] = [t for t in state.get('times', []) if t > now - limit[1]] + [now]
+        if until is not None:
+            state['until'] = until
+        try:
+            self.write(self.host_path(host), json.dumps(state).encode('utf-8'))
+        except (IOError, OSError):
+            pass
+
+    # Requests
+
+    def get(self, url, headers=None, max_age=None, cache_private=False):
+        """GET url, from the cache when it may be, and return a Response.
+
+        max_age, in seconds, overrides how long the server says a response
+        stays fresh.  Requests with an Authorization header bypass the cache
+        unless cache_private is true.
+        """
+        headers = dict(headers or {})
+        path = self.entry_path(url, headers)
+        cacheable = cache_private or not any(name.lower() == 'authorization' for name in headers)
+        entry = self.load(path) if cacheable else None
+        now = time.time()
+
+        def cached(source):
+            self.stats[{'cache': 'cached', 'revalidated': 'not_modified'}.get(source, source)] += 1
+            meta, body = entry
+            return Response(url, meta['status'], meta['headers'], body, source)
+
+        if entry is not None:
+            meta = entry[0]
+            lifetime = max_age if max_age is not None else meta['lifetime']
+            if now - meta['stored'] < lifetime:
+                return cached('cache')
+
+        host = urlsplit(url).netloc
+        if self.throttled(host):
+            if entry is not None:
+                return cached('stale')
+            raise RateLimited('rate limit for %s used up fetching %s' % (host, url))
+
+        conditional = dict(headers)
+        if entry is not None:
+            if 'etag' in entry[0]['headers']:
+                conditional['If-None-Match'] = entry[0]['headers']['etag']
+            if 'last-modified' in entry[0]['headers']:
+                conditional['If-Modified-Since'] = entry[0]['headers']['last-modified']
+        try:
+            status, reason, received, body = self.fetch(url, conditional)
+        except (httplib.HTTPException, socket.error) as e:
+            if entry is not None:
+                return cached('stale')
+            if isinstance(e, httplib.HTTPException):
+                # so callers only need to catch IOError
+                raise IOError('%s fetching %s' % (e.__class__.__name__, url))
+            raise
+        self.note_request(host, retry_after(received) if status in (429, 503) else None)
+
+        if status == 304 and entry is not None:
+            meta = entry[0]
+            meta['headers'].update(received)
+            meta['stored'] = now
+            meta['lifetime'] = freshness(meta['headers'])
+            self.save(path, meta, entry[1])
+            return cached('revalidated')
+        if 200 <= status < 300:
+            if cacheable and 'no-store' not in parse_cache_control(received.get('cache-control', '')):
+                meta = {'url': url, 'status': status, 'headers': received, 'stored': now,
+                        'lifetime': freshness(received)}
+                self.save(path, meta, body)
+            return Response(url, status, received, body, 'network')
+        if status in stale_codes and entry is not None:
+            return cached('stale')
+        raise HTTPError(url, status, reason)
+
+    def get_json(self, url, headers=None, max_age=None, cache_private=False):
+        """GET url and decode its body as JSON."""
+        return self.get(url, headers, max_age, cache_private).json()
+
+
+_client = None
+
+
+def default_client():
+    """The client shared by the module-level helpers."""
+    global _client
+    if _client is None:
+        _client = Client()
+    return _client
+
+
+def get(url, headers=None, max_age=None, cache_private=False):
+    """GET url with the shared client; see Client.get."""
+    return default_client().get(url, headers, max_age, cache_private)
+
+
+def get_json(url, headers=None, max_age=None, cache_private=False):
+    """GET url with the shared client and decode its body as JSON."""
+    return default_client().get_json(url, headers, max_age, cache_private)
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog='bitbarlib.httpclient',
+                                     description='Fetch URLs through the shared plugin HTTP cache')
+    parser.add_argument('urls', nargs='+')
+    parser.add_argument('--max-age', type=float, help='Treat cached responses as fresh for this many seconds')
+    parser.add_argument('--cache-dir', default=cache_dir)
+    args = parser.parse_args(argv)
+
+    client = Client(args.cache_dir)
+    status = 0
+    for url in args.urls:
+        start = time.time()
+        try:
+            response = client.get(url, max_age=args.max_age)
+        except IOError as e:
+            print('%8.1f ms  error        %s (%s)' % ((time.time() - start) * 1000, url, e))
+            status = 1
+            continue
+        print('%8.1f ms  %-11s  %s (%i, %i bytes)' % ((time.time() - start) * 1000, response.source, url,
+                                                     response.status, len(response.body)))
+    client.close()
+    print(', '.join('%s %i' % item for item in sorted(client.stats.items())))
+    return status
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,225 @@
+"""Run Python plugins from cached bytecode.
+
+BitBar runs every plugin as a script, and Python never caches bytecode for
+the script it was started with, so a plugin is tokenized and compiled again
+on every refresh.  For plugins carrying large embedded icons, or refreshing
+every second, that is a large share of their run time.
+
+`run(path)` compiles a plugin once, keeps the code object in a cache file
+outside the plugin folder, and executes it as __main__ the way the
+interpreter would.  `install` writes a small shim into a BitBar plugin
+folder that does this for a plugin kept elsewhere:
+
+    PYTHONPATH=.lib python3 -m bitbarlib.launch install Time/fuzzyclock.1s.py --into Enabled
+    PYTHONPATH=.lib python3 -m bitbarlib.launch bench Time Weather
+
+Shims use the plugin's own shebang, so this module stays Python 2 compatible.
+"""
+import hashlib
+import marshal
+import os
+import stat
+import struct
+import sys
+
+try:
+    from importlib.util import MAGIC_NUMBER as magic
+except ImportError:  # Python 2
+    import imp
+    magic = imp.get_magic()
+
+cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                         'bitbar-plugins', 'bytecode')
+header = struct.Struct('<qq')
+
+
+def cache_path(path):
+    """The cache file for path's bytecode under the running interpreter."""
+    key = hashlib.sha1(os.path.abspath(path).encode('utf-8')).hexdigest()
+    return os.path.join(cache_dir, '%s-%s.bin' % (key, hashlib.sha1(magic).hexdigest()[:8]))
+
+
+def load_cached(path, st):
+    """Return the cached code object for path if it matches st, else None."""
+    try:
+        with open(cache_path(path), 'rb') as fp:
+            data = fp.read()
+    except (IOError, OSError):
+        return None
+    if len(data) < len(magic) + header.size or not data.startswith(magic):
+        return None
+    mtime_ns, size = header.unpack_from(data, len(magic))
+    if (mtime_ns, size) != (int(st.st_mtime * 1e9), st.st_size):
+        return None
+    try:
+        return marshal.loads(data[len(magic) + header.size:])
+    except (EOFError, ValueError, TypeError):
+        return None
+
+
+def compile_cached(path):
+    """Return the code object for the plugin at path, compiling and caching it if needed."""
+    # tracebacks name the file the code was compiled from, whoever compiled it first
+    path = os.path.abspath(path)
+    st = os.stat(path)
+    code = load_cached(path, st)
+    if code is not None:
+        return code
+
+    with open(path, 'rb') as fp:
+        source = fp.read()
+    code = compile(source, path, 'exec', 0, True)
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        target = cache_path(path)
+        tmp = '%s.%d.tmp' % (target, os.getpid())
+        with open(tmp, 'wb') as fp:
+            fp.write(magic + header.pack(int(st.st_mtime * 1e9), st.st_size) + marshal.dumps(code))
+        os.rename(tmp, target)
+    except (IOError, OSError):
+        # an unwritable cache only costs speed
+        pass
+    return code
+
+
+def run(path, argv=None):
+    """Execute the plugin at path as __main__, from cached bytecode when possible."""
+    path = os.path.abspath(path)
+    code = compile_cached(path)
+    main = type(sys)('__main__')
+    main.__file__ = path
+    main.__builtins__ = __builtins__
+    sys.modules['__main__'] = main
+    sys.argv = [path] + list(sys.argv[1:] if argv is None else argv)
+    sys.path[0] = os.path.dirname(path)
+    exec(code, main.__dict__)
+
+
+shim_template = '''%(shebang)s
+# Runs %(plugin)s from cached bytecode; see .lib/bitbarlib/launch.py
+import sys
+sys.path.insert(0, %(lib)r)
+from bitbarlib.launch import run
+run(%(plugin)r)
+'''
+
+
+def install(plugin, into):
+    """Write a launcher shim for plugin into the folder into, returning its path."""
+    plugin = os.path.abspath(plugin)
+    with open(plugin, 'r') as fp:
+        shebang = fp.readline().rstrip('\n')
+    if not shebang.startswith('#!') or 'python' not in shebang:
+        raise ValueError('%s is not a Python plugin' % plugin)
+    shim = os.path.join(into, os.path.basename(plugin))
+    with open(shim, 'w') as fp:
+        fp.write(shim_template % {
+            'shebang': shebang, 'plugin': plugin,
+            'lib': os.path.dirname(os.path.dirname(os.path.abspath(__file__)))})
+    os.chmod(shim, os.stat(shim).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return shim
+
+
+def bench(paths, root=None, repeat=5, timeout=10):
+    """Time launching each Python plugin directly against launching it through a shim.
+
+    Both are real interpreter launches, run the way the host runs plugins,
+    with the plugin's traffic answered by its cassette (or refused, if it has
+    none) so the network doesn't drown out the difference.  Returns a row per
+    plugin.
+    """
+    import shutil
+    import tempfile
+    from bitbarlib.cassette import CassetteServer, cassette_dir, cassette_root, plugin_env
+    from bitbarlib.host import percentile, run_plugin
+    from bitbarlib.plugins import discover
+
+    rows = []
+    shims = tempfile.mkdtemp(prefix='bitbar-launch-')
+    try:
+        for path in discover(paths):
+            try:
+                shim = install(path, shims)
+            except (ValueError, IOError, OSError, UnicodeDecodeError):
+                continue
+            server = CassetteServer(cassette_dir(path, root or cassette_root)).start()
+            try:
+                env = plugin_env(server)
+                # the first launch through the shim fills the cache
+                run_plugin(shim, timeout, env)
+                runs = {path: [], shim: []}
+                for _ in range(repeat):
+                    for launched in (path, shim):
+                        server.reset()
+                        runs[launched].append(run_plugin(launched, timeout, env))
+            except OSError:
+                # its interpreter isn't installed here
+                continue
+            finally:
+                server.stop()
+            if any(r['timed_out'] for r in runs[path] + runs[shim]):
+                rows.append({'plugin': path, 'timed_out': True})
+                continue
+            row = {'plugin': path, 'timed_out': False,
+                   'failed': sum(1 for r in runs[path] + runs[shim] if r['exit_status'])}
+            for name, launched in (('source', path), ('cached', shim)):
+                row[name + '_wall'] = percentile([r['wall'] for r in runs[launched]], 50)
+                row[name + '_cpu'] = sum(r['cpu_user'] + r['cpu_system'] for r in runs[launched]) / repeat
+            rows.append(row)
+    finally:
+        shutil.rmtree(shims, ignore_errors=True)
+    return rows
+
+
+def print_bench(rows, top=15, out=sys.stdout):
+    timed = sorted((r for r in rows if not r['timed_out']), key=lambda r: r['cached_wall'] - r['source_wall'])
+    out.write('%10s %10s %10s %10s %7s  %s\n' % ('source ms', 'cached ms', 'src cpu', 'cached cpu', 'failed',
+                                                 'plugin'))
+    for row in timed[:top]:
+        out.write('%10.1f %10.1f %10.1f %10.1f %7i  %s\n' % (
+            row['source_wall'] * 1000, row['cached_wall'] * 1000, row['source_cpu'] * 1000,
+            row['cached_cpu'] * 1000, row['failed'], row['plugin']))
+    if not timed:
+        return
+    totals = dict((key, sum(r[key] for r in timed) * 1000)
+                  for key in ('source_wall', 'cached_wall', 'source_cpu', 'cached_cpu'))
+    out.write('%i plugins (%i timed out), one launch of each: %.0f ms wall / %.0f ms CPU from source, '
+              '%.0f ms wall / %.0f ms CPU from cached bytecode\n' % (
+                  len(timed), len(rows) - len(timed), totals['source_wall'], totals['source_cpu'],
+                  totals['cached_wall'], totals['cached_cpu']))
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(prog='bitbarlib.launch', description='Run Python plugins from cached bytecode')
+    commands = parser.add_subparsers(dest='command')
+    run_parser = commands.add_parser('run', help='Run a plugin')
+    run_parser.add_argument('plugin')
+    run_parser.add_argument('args', nargs=argparse.REMAINDER)
+    install_parser = commands.add_parser('install', help='Write launcher shims into a plugin folder')
+    install_parser.add_argument('plugins', nargs='+')
+    install_parser.add_argument('--into', required=True, help='The BitBar plugin folder')
+    bench_parser = commands.add_parser('bench', help='Time launching plugins directly against through a shim')
+    bench_parser.add_argument('paths', nargs='*', default=['.'])
+    bench_parser.add_argument('--repeat', type=int, default=5, help='Launches each way per plugin')
+    bench_parser.add_argument('--timeout', type=float, default=10, help='Seconds before a launch is killed')
+    bench_parser.add_argument('--cassettes', help='Where recorded cassettes are kept (default: the cassette cache)')
+    bench_parser.add_argument('--top', type=int, default=15, help='Plugins to list, most improved first')
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        run(args.plugin, args.args)
+    elif args.command == 'install':
+        for plugin in args.plugins:
+            print(install(plugin, args.into))
+    elif args.command == 'bench':
+        print_bench(bench(args.paths, args.cassettes, args.repeat, args.timeout), args.top)
+    else:
+        parser.print_help()
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
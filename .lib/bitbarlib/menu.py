@@ -0,0 +1,140 @@
+"""Build a plugin's menu as a tree and write it out in one go.
+
+Printing a menu line by line costs a write per line, and the nesting lives
+in hand-counted "--" prefixes.  Here a menu is a tree of items and
+separators that renders to BitBar's line protocol and is written to
+stdout with a single write:
+
+    menu = Menu()
+    menu.item('Sonos')
+    menu.separator()
+    volume = menu.item('Volume')
+    for level in range(0, 110, 10):
+        volume.item(str(level), bash=script, params=['--vol', level], terminal=False, refresh=True)
+    menu.write()
+
+Parameters are written in a fixed order: bash, then param1..paramN, then
+the rest alphabetically.  So the same menu always renders to the same
+text, and two renders can be compared with a plain diff.  True and False
+become true and false; values containing spaces are quoted.  A | in a
+title would start the parameters, so it is shown as a broken bar.
+
+Stays compatible with Python 2: text may be unicode or UTF-8 encoded str.
+"""
+import sys
+
+separator_line = '---'
+
+try:
+    text_type = unicode
+except NameError:  # Python 3
+    text_type = str
+
+
+def to_text(value):
+    """value as unicode on Python 2 and str on Python 3, decoding UTF-8 bytes."""
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    if isinstance(value, bool):
+        return u'true' if value else u'false'
+    return text_type(value)
+
+
+def param_order(name):
+    if name == 'bash':
+        return (0, 0, name)
+    if name.startswith('param') and name[5:].isdigit():
+        return (1, int(name[5:]), name)
+    return (2, 0, name)
+
+
+def format_params(params):
+    """Render a dict of parameters as BitBar's key=value list."""
+    parts = []
+    for name in sorted(params, key=param_order):
+        value = params[name]
+        if value is None:
+            continue
+        value = to_text(value)
+        if ' ' in value or not value:
+            value = u'"%s"' % value.replace('"', '\\"')
+        parts.append(u'%s=%s' % (name, value))
+    return u' '.join(parts)
+
+
+class Node(object):
+    """Something that can hold menu lines: the menu itself or an item's submenu."""
+
+    def __init__(self):
+        self.children = []
+
+    def item(self, title, params=None, **kwargs):
+        """Add an item and return it, so a submenu can be built under it.
+
+        params is a list of arguments for bash=, written as param1..paramN.
+        """
+        if params:
+            for number, value in enumerate(params, 1):
+                kwargs['param%i' % number] = value
+        child = Item(title, kwargs)
+        self.children.append(child)
+        return child
+
+    def separator(self):
+        self.children.append(Separator())
+
+    def lines(self, depth):
+        for child in self.children:
+            for line in child.lines(depth):
+                yield line
+
+
+class Item(Node):
+    """A menu line with a title and parameters, and the submenu below it."""
+
+    def __init__(self, title, params):
+        Node.__init__(self)
+        self.title = title
+        self.params = params
+
+    def lines(self, depth):
+        line = u'--' * depth + to_text(self.title).replace(u'|', u'\u00a6')
+        params = format_params(self.params)
+        if params:
+            line += u' | ' + params
+        yield line
+        for line in Node.lines(self, depth + 1):
+            yield line
+
+
+class Separator(object):
+    """A separator line; at the top level it also ends the menu bar title lines."""
+
+    def lines(self, depth):
+        yield u'--' * depth + separator_line
+
+
+class Menu(Node):
+    """A whole plugin menu: the title lines, a separator, and the dropdown."""
+
+    def render(self):
+        """The menu in BitBar's line protocol, ending with a newline."""
+        return u''.join(line + u'\n' for line in self.lines(0))
+
+    def write(self, out=None):
+        """Write the menu to out, or to stdout as UTF-8 in a single write."""
+        text = self.render()
+        if out is not None:
+            out.write(text)
+            return
+        stream = getattr(sys.stdout, 'buffer', None)
+        if stream is not None:
+            # anything already printed goes first
+            sys.stdout.flush()
+            stream.write(text.encode('utf-8'))
+            stream.flush()
+        elif str is bytes:
+            sys.stdout.write(text.encode('utf-8'))
+        else:
+            # stdout has been swapped for a text stream, as bitbarlib.stream does
+            sys.stdout.write(text)
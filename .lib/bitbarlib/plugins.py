@@ -0,0 +1,36 @@
+"""The file naming conventions BitBar uses to find and schedule plugins."""
+import os
+import re
+
+# BitBar reads the refresh interval from the file name: name.<N><s|m|h|d>.ext
+interval_pattern = re.compile(r'\.(?P<count>\d+)(?P<unit>[smhd])\.[^.]+$')
+interval_units = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+# BitBar refreshes plugins without an interval in their name once a minute
+default_interval = 60
+
+
+def parse_interval(file_name):
+    """Return the refresh interval in a plugin file name as (text, seconds), or (None, None)."""
+    match = interval_pattern.search(os.path.basename(file_name))
+    if match is None:
+        return None, None
+    count = int(match.group('count'))
+    return '%i%s' % (count, match.group('unit')), count * interval_units[match.group('unit')]
+
+
+def discover(paths, ignore_exts=('.md',)):
+    """Return the plugin files in paths, searching directories recursively.
+
+    Hidden files and directories are skipped, like BitBar does.
+    """
+    found = []
+    for path in paths:
+        if os.path.isfile(path):
+            found.append(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+            for name in sorted(files):
+                if not name.startswith('.') and os.path.splitext(name)[1] not in ignore_exts:
+                    found.append(os.path.join(root, name))
+    return found
@@ -0,0 +1,251 @@
+"""A small key/value store for plugin state that survives concurrent runs.
+
+Plugins that pickle their state to a file rewrite the whole file on every
+run, and a click-triggered run racing the timer can leave it half
+written.  A `Store` is an append-only log instead:
+
+- each commit is one record carrying a CRC;
+- a commit is written with a single write while holding a lock file, so
+  concurrent writers take turns and readers never need the lock;
+- a torn record at the end of the log fails its CRC and is ignored, and
+  the next writer cuts it off;
+- the log is read through mmap into an index of where each key's latest
+  value lies, so get() reads only that value and set() appends only that
+  key;
+- once the log holds more than twice the live data it is rewritten to a
+  temporary file and renamed over the old one.
+
+The file header carries the plugin's schema version.  A file written under
+another version reads as empty, so a plugin that changes the shape of its
+state bumps the version rather than migrating old files:
+
+    state = open_store('battery_health')
+    alerted = state.get('alertMin', False)
+    state.update({'alertMin': True, 'alertMax': False})
+
+Values are anything pickle can store; protocol 2 keeps files readable by
+Python 2 and 3 alike.  Stays compatible with Python 2.
+"""
+import errno
+import fcntl
+import mmap
+import os
+import pickle
+import struct
+import zlib
+from contextlib import contextmanager
+
+state_dir = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')),
+                         'bitbar-plugins', 'state')
+magic = b'BBST'
+format_version = 1
+# magic, format version, plugin schema version
+file_header = struct.Struct('<4sHH')
+# CRC-32 of the body, body length
+record_header = struct.Struct('<II')
+# key length, value length, deleted
+entry_header = struct.Struct('<HIB')
+# logs smaller than this are never worth compacting
+compact_min = 4 * 1024
+
+
+class Store(object):
+    """The state log at path, read when opened and appended to on each commit."""
+
+    def __init__(self, path, schema=1):
+        self.path = path
+        self.schema = schema
+        self.index = {}
+        self.data = b''
+        self.end = 0
+        self.inode = None
+        self.load()
+
+    # Reading
+
+    def load(self):
+        """Read the whole log again, as after another process compacted it."""
+        self.index = {}
+        self.data = b''
+        self.end = 0
+        self.inode = None
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except OSError as e:
+            if e.errno == errno.ENOENT:
+                return
+            raise
+        try:
+            st = os.fstat(fd)
+            self.inode = st.st_ino
+            if st.st_size < file_header.size:
+                return
+            self.data = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+        tag, version, schema = file_header.unpack_from(self.data, 0)
+        if (tag, version, schema) != (magic, format_version, self.schema):
+            # another schema, or not a state file at all: start afresh on the next commit
+            return
+        self.end = self.scan(file_header.size)
+
+    def scan(self, offset):
+        """Index the records from offset on, returning where the last intact one ends."""
+        data = self.data
+        size = len(data)
+        while offset + record_header.size <= size:
+            crc, length = record_header.unpack_from(data, offset)
+            start = offset + record_header.size
+            end = start + length
+            if end > size or zlib.crc32(data[start:end]) & 0xffffffff != crc:
+                break
+            (count,) = struct.unpack_from('<I', data, start)
+            position = start + 4
+            for _ in range(count):
+                key_length, value_length, deleted = entry_header.unpack_from(data, position)
+                position += entry_header.size
+                key = data[position:position + key_length].decode('utf-8')
+                position += key_length
+                if deleted:
+                    self.index.pop(key, None)
+                else:
+                    self.index[key] = (position, value_length)
+                position += value_length
+            offset = end
+        return offset
+
+    def refresh(self):
+        """Catch up with commits other processes made since this store was read."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            st = None
+        if st is None or st.st_ino != self.inode or st.st_size < self.end:
+            self.load()
+        elif st.st_size > len(self.data):
+            self.remap()
+            if self.end:
+                self.end = self.scan(self.end)
+
+    def remap(self):
+        fd = os.open(self.path, os.O_RDONLY)
+        try:
+            self.data = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+        finally:
+            os.close(fd)
+
+    def get(self, key, default=None):
+        location = self.index.get(key)
+        if location is None:
+            return default
+        position, length = location
+        return pickle.loads(bytes(self.data[position:position + length]))
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def __getitem__(self, key):
+        if key not in self.index:
+            raise KeyError(key)
+        return self.get(key)
+
+    def keys(self):
+        return list(self.index)
+
+    def items(self):
+        return [(key, self.get(key)) for key in self.index]
+
+    # Writing
+
+    @contextmanager
+    def locked(self):
+        # a separate lock file, because compaction replaces the log itself
+        directory = os.path.dirname(self.path)
+        if directory and not os.path.isdir(directory):
+            try:
+                os.makedirs(directory)
+            except OSError as e:
+                if e.errno != errno.EEXIST:
+                    raise
+        fd = os.open(self.path + '.lock', os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def update(self, values=None, deleted=()):
+        """Set every key in values and delete every key in deleted, as one commit."""
+        entries = []
+        for key, value in (values or {}).items():
+            entries.append((key.encode('utf-8'), pickle.dumps(value, 2), 0))
+        for key in deleted:
+            entries.append((key.encode('utf-8'), b'', 1))
+        if not entries:
+            return
+        with self.locked():
+            self.refresh()
+            if not self.end:
+                merged = dict(entries_of(self.items()))
+                for key, value, gone in entries:
+                    if gone:
+                        merged.pop(key, None)
+                    else:
+                        merged[key] = value
+                self.rewrite(merged)
+                return
+            record = encode_record(entries)
+            fd = os.open(self.path, os.O_WRONLY)
+            try:
+                # cut off a record a crashed writer left half written
+                os.ftruncate(fd, self.end)
+                os.lseek(fd, self.end, os.SEEK_SET)
+                os.write(fd, record)
+            finally:
+                os.close(fd)
+            self.remap()
+            self.end = self.scan(self.end)
+            if self.end > compact_min and self.end > 2 * self.live_size():
+                self.rewrite(dict(entries_of(self.items())))
+
+    def set(self, key, value):
+        self.update({key: value})
+
+    def delete(self, key):
+        self.update(deleted=[key])
+
+    def live_size(self):
+        return sum(length + len(key) + entry_header.size for key, (_, length) in self.index.items())
+
+    def rewrite(self, entries):
+        """Replace the log with one holding just entries, a dict of encoded key to pickled value."""
+        tmp = '%s.%d.tmp' % (self.path, os.getpid())
+        with open(tmp, 'wb') as fp:
+            fp.write(file_header.pack(magic, format_version, self.schema))
+            fp.write(encode_record([(key, value, 0) for key, value in entries.items()]))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.rename(tmp, self.path)
+        self.load()
+
+
+def entries_of(items):
+    """(encoded key, pickled value) pairs for (key, value) pairs."""
+    for key, value in items:
+        yield key.encode('utf-8'), pickle.dumps(value, 2)
+
+
+def encode_record(entries):
+    """One commit record for a list of (encoded key, pickled value, deleted) entries."""
+    parts = [struct.pack('<I', len(entries))]
+    for key, value, deleted in entries:
+        parts.append(entry_header.pack(len(key), len(value), deleted))
+        parts.append(key)
+        parts.append(value)
+    body = b''.join(parts)
+    return record_header.pack(zlib.crc32(body) & 0xffffffff, len(body)) + body
+
+
+def open_store(name, schema=1, directory=None):
+    """The store a plugin keeps under name in the shared state directory."""
+    return Store(os.path.join(directory or state_dir, name + '.state'), schema)
@@ -0,0 +1,105 @@
+"""Keep a plugin resident and stream its menu to BitBar.
+
+A plugin tagged <bitbar.type>streamable</bitbar.type> is started once and
+left running; every time it writes a line reading ~~~ BitBar throws the
+menu away and shows what follows instead.  For plugins that refresh every
+second this saves starting an interpreter 86,400 times a day.
+
+A plugin keeps printing its menu from a render function and hands that to
+`stream`:
+
+    def render():
+        print(fuzzy_time(localtime()))
+
+    stream(render, interval=1)
+
+Each tick captures what render prints and writes it as one block, only
+when it differs from the block already showing.
+
+Streaming is opt-in: a BitBar without streamable support waits for a
+plugin to exit, so a plugin that never does leaves its menu blank.  stream
+only stays resident when the plugin was run with --stream, as from a
+wrapper marked streamable, or with BITBAR_STREAM=1.  Otherwise it renders
+once and returns.  BITBAR_STREAM=0 renders once even with --stream, as the
+plugin host does.
+"""
+import errno
+import os
+import sys
+import time
+
+separator = '~~~'
+
+
+class Capture(object):
+    """A stand-in for sys.stdout that keeps whatever is printed to it."""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text):
+        self.parts.append(text)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return ''.join(self.parts)
+
+
+def capture(render):
+    """Call render and return everything it printed."""
+    out = Capture()
+    stdout, sys.stdout = sys.stdout, out
+    try:
+        render()
+    finally:
+        sys.stdout = stdout
+    return out.getvalue()
+
+
+def enabled():
+    """Whether to stay resident, rather than render once for a caller that expects the plugin to exit."""
+    setting = os.environ.get('BITBAR_STREAM', '')
+    if setting:
+        return setting != '0'
+    return '--stream' in sys.argv[1:]
+
+
+def stream(render, interval=1, out=None, ticks=None):
+    """Re-render every interval seconds, writing a menu block only when it changed.
+
+    Ticks fall on multiples of interval on the wall clock, so clocks turn
+    over on the second.  Returns once BitBar stops reading, once BitBar has
+    gone away, or after ticks renders when given.
+    """
+    if not enabled():
+        render()
+        return
+
+    out = out or sys.stdout
+    parent = os.getppid()
+    shown = None
+    while ticks is None or ticks > 0:
+        block = capture(render)
+        if not block.endswith('\n'):
+            block += '\n'
+        if block != shown:
+            try:
+                if shown is not None:
+                    out.write(separator + '\n')
+                out.write(block)
+                out.flush()
+            except (IOError, OSError) as e:
+                if e.errno == errno.EPIPE:
+                    return
+                raise
+            shown = block
+        if ticks is not None:
+            ticks -= 1
+            if not ticks:
+                return
+        # reparented: BitBar quit without closing our stdout
+        if os.getppid() != parent:
+            return
+        time.sleep(interval - time.time() % interval)
@@ -0,0 +1,78 @@
+"""Helpers shared by the tests: loading scripts such as .test.py and serving HTTP locally.
+
+Run the tests from the top of the repository with:
+
+    python3 -m unittest discover -s .lib/tests
+"""
+
+import importlib.util
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(root, '.lib'))
+
+
+def load_script(name, path):
+    """Import a fresh copy of the script at path, relative to the top of the repository."""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(root, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_test_py():
+    """Import a fresh copy of .test.py, which isn't importable by name."""
+    return load_script('bitbar_test', '.test.py')
+
+
+class Routes(BaseHTTPRequestHandler):
+    """Answers from the server's routes: {path: (status, headers, body)}, or a function of the method."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def respond(self):
+        self.server.requests.append((self.command, self.path))
+        route = self.server.routes.get(self.path, (404, {}, b'not found'))
+        if callable(route):
+            route = route(self)
+        status, headers, body = route
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    do_GET = do_HEAD = do_POST = respond
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalServer(object):
+    """A threaded HTTP server on a free localhost port, for use as a context manager."""
+
+    def __init__(self, routes, handler=Routes):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.httpd.routes = routes
+        self.httpd.requests = []
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def url(self, path):
+        return 'http://127.0.0.1:%d%s' % (self.httpd.server_port, path)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.httpd.shutdown()
+        self.httpd.server_close()
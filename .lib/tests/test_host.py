@@ -0,0 +1,93 @@
+"""Tests for bitbarlib.host's scheduling, on a fake clock."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import support  # noqa: F401 puts .lib on sys.path
+
+from bitbarlib import host
+
+
+class Clock(object):
+    """Stands in for time.perf_counter and time.sleep."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def perf_counter(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class InlineExecutor(object):
+    """Runs submitted work at once, so the fake clock only moves when the host sleeps."""
+
+    def __init__(self, max_workers):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def submit(self, function, *args):
+        function(*args)
+
+
+class ScheduleTest(unittest.TestCase):
+
+    def run_host(self, plugins, duration, jitter, lateness=0):
+        """Run plugins for duration seconds on a fake clock; returns when each run started."""
+        clock = Clock()
+        started = []
+
+        def execute(plugin):
+            started.append((plugin.path, clock.now))
+            plugin.running = False
+
+        def sleep(seconds):
+            # dispatch is late by lateness on every tick
+            clock.sleep(seconds + lateness)
+
+        h = host.Host(plugins, jitter=jitter)
+        with mock.patch.object(host.time, 'perf_counter', clock.perf_counter), \
+                mock.patch.object(host.time, 'sleep', sleep), \
+                mock.patch.object(h, 'execute', execute), \
+                mock.patch.object(host, 'ThreadPoolExecutor', InlineExecutor):
+            h.run(duration)
+        return started
+
+    def test_runs_once_per_interval_despite_jitter_and_lateness(self):
+        plugins = [host.Plugin('a.1s.sh', 1, 10), host.Plugin('b.10s.sh', 10, 10)]
+        started = self.run_host(plugins, 3600, jitter=0.1, lateness=0.01)
+        runs = [path for path, _ in started]
+        self.assertIn(runs.count('a.1s.sh'), (3599, 3600))
+        self.assertIn(runs.count('b.10s.sh'), (359, 360))
+        # every run stays near its grid point rather than drifting later
+        first = min(t for path, t in started if path == 'a.1s.sh')
+        for n, t in enumerate(t for path, t in started if path == 'a.1s.sh'):
+            self.assertLess(t - (first + n), 0.2)
+
+
+class TimeoutTest(unittest.TestCase):
+
+    def test_default_timeouts_are_capped(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            for name in ('clock.1s.sh', 'mail.30s.sh', 'weather.1h.sh', 'backup.1d.sh'):
+                path = os.path.join(tmp, name)
+                with open(path, 'w') as fp:
+                    fp.write('#!/bin/sh\necho test\n')
+                os.chmod(path, 0o755)
+            timeouts = dict((os.path.basename(p.path), p.timeout) for p in host.load_plugins([tmp]))
+            self.assertEqual(timeouts, {'clock.1s.sh': 10, 'mail.30s.sh': 30, 'weather.1h.sh': 60,
+                                        'backup.1d.sh': 60})
+            self.assertEqual(set(p.timeout for p in host.load_plugins([tmp], timeout=5)), {5})
+
+
+if __name__ == '__main__':
+    unittest.main()
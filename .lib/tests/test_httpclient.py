@@ -0,0 +1,170 @@
+"""Tests for bitbarlib.httpclient against a local HTTP stand-in."""
+
+import gzip
+import json
+import os
+import stat
+import tempfile
+import time
+import unittest
+
+from support import LocalServer
+
+from bitbarlib import httpclient
+
+
+def etagged(handler):
+    if handler.headers.get('If-None-Match') == '"v1"':
+        return 304, {'ETag': '"v1"'}, b''
+    return 200, {'ETag': '"v1"', 'Content-Type': 'application/json'}, b'{"version": 1}'
+
+
+def compressed(handler):
+    return 200, {'Content-Type': 'application/json', 'Content-Encoding': 'gzip'}, gzip.compress(b'[1, 2, 3]')
+
+
+def echo_headers(handler):
+    sent = dict((name.lower(), value) for name, value in handler.headers.items())
+    return 200, {'ETag': '"echo"', 'Content-Type': 'application/json'}, json.dumps(sent).encode('utf-8')
+
+
+routes = {
+    '/fresh': (200, {'Cache-Control': 'max-age=60', 'Content-Type': 'application/json'}, b'{"fresh": true}'),
+    '/etag': etagged,
+    '/gzip': compressed,
+    '/private': (200, {'Cache-Control': 'no-store'}, b'{}'),
+    '/echo': echo_headers,
+}
+
+
+class ClientTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.server = LocalServer(dict(routes)).__enter__()
+        self.client = httpclient.Client(self.tmp.name)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def new_client(self, **options):
+        client = httpclient.Client(self.tmp.name, **options)
+        self.addCleanup(client.close)
+        return client
+
+    def entries(self):
+        return sorted(name for name in os.listdir(self.tmp.name) if name.endswith('.entry'))
+
+    def test_fresh_responses_skip_the_network(self):
+        self.assertEqual(self.client.get_json(self.server.url('/fresh')), {'fresh': True})
+        response = self.new_client().get(self.server.url('/fresh'))
+        self.assertEqual(response.source, 'cache')
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_revalidation_and_keep_alive(self):
+        self.assertEqual(self.client.get(self.server.url('/etag')).source, 'network')
+        response = self.client.get(self.server.url('/etag'))
+        self.assertEqual(response.source, 'revalidated')
+        self.assertEqual(response.json(), {'version': 1})
+        self.assertEqual(self.client.stats['connections'], 1)
+        self.assertEqual(self.client.stats['requests'], 2)
+
+    def test_stale_copy_on_server_errors(self):
+        self.client.get(self.server.url('/etag'))
+        self.server.httpd.routes['/etag'] = (503, {}, b'down')
+        self.assertEqual(self.client.get(self.server.url('/etag')).source, 'stale')
+        with self.assertRaises(httpclient.HTTPError):
+            self.client.get(self.server.url('/missing'))
+
+    def test_gzip_and_no_store(self):
+        self.assertEqual(self.client.get_json(self.server.url('/gzip')), [1, 2, 3])
+        self.client.get(self.server.url('/private'))
+        self.assertEqual(len(self.entries()), 1)
+
+    def test_cache_is_private_to_its_owner(self):
+        cache_dir = os.path.join(self.tmp.name, 'http')
+        client = httpclient.Client(cache_dir, rate_limits={'127.0.0.1:%d' % self.server.httpd.server_port: (5, 60)})
+        self.addCleanup(client.close)
+        client.get(self.server.url('/fresh'))
+        self.assertEqual(stat.S_IMODE(os.stat(cache_dir).st_mode), 0o700)
+        for directory, _, names in os.walk(cache_dir):
+            for name in names:
+                if name != 'pruned':
+                    self.assertEqual(stat.S_IMODE(os.stat(os.path.join(directory, name)).st_mode), 0o600, name)
+        self.assertTrue(os.listdir(os.path.join(cache_dir, 'hosts')))
+
+    def test_authorized_responses_are_only_cached_on_request(self):
+        auth = {'Authorization': 'token secret'}
+        self.client.get(self.server.url('/etag'), headers=auth)
+        self.assertEqual(self.entries(), [])
+        self.assertEqual(self.client.get(self.server.url('/etag'), headers=auth).source, 'network')
+
+        self.client.get(self.server.url('/etag'), headers=auth, cache_private=True)
+        self.assertEqual(len(self.entries()), 1)
+        response = self.client.get(self.server.url('/etag'), headers=auth, cache_private=True)
+        self.assertEqual(response.source, 'revalidated')
+
+    def test_redirects_drop_credentials_and_validators(self):
+        auth = {'Authorization': 'token secret', 'Cookie': 'session=1'}
+        with LocalServer(dict(routes)) as other:
+            self.server.httpd.routes['/here'] = (302, {'Location': '/echo'}, b'')
+            self.server.httpd.routes['/away'] = (302, {'Location': other.url('/echo')}, b'')
+            for path in ('/here', '/away'):
+                self.client.get(self.server.url(path), headers=auth, cache_private=True)
+            # the second requests revalidate, but /echo's answer isn't the cached one
+            here = self.client.get(self.server.url('/here'), headers=auth, cache_private=True).json()
+            away = self.client.get(self.server.url('/away'), headers=auth, cache_private=True).json()
+        self.assertEqual(self.server.requests.count(('GET', '/here')), 2)
+        self.assertEqual((here['authorization'], here['cookie']), ('token secret', 'session=1'))
+        self.assertNotIn('if-none-match', here)
+        for name in ('authorization', 'cookie', 'if-none-match'):
+            self.assertNotIn(name, away)
+
+    def test_prune_evicts_least_recently_used(self):
+        client = self.new_client(max_entries=3)
+        for n in range(5):
+            self.server.httpd.routes['/item/%d' % n] = (200, {'Content-Type': 'application/json'}, b'%d' % n)
+        paths = []
+        for n in range(5):
+            client.get(self.server.url('/item/%d' % n))
+            paths.append(client.entry_path(self.server.url('/item/%d' % n), {}))
+            os.utime(paths[-1], (time.time() - 100 + n, time.time() - 100 + n))
+        # using the oldest entry makes it the most recently used
+        client.load(paths[0])
+
+        self.assertEqual(client.prune(), 2)
+        self.assertEqual(self.entries(), sorted(os.path.basename(p) for p in (paths[0], paths[3], paths[4])))
+
+    def test_prune_evicts_unused_entries(self):
+        client = self.new_client(max_unused=3600)
+        client.get(self.server.url('/fresh'))
+        client.get(self.server.url('/etag'))
+        old = client.entry_path(self.server.url('/fresh'), {})
+        os.utime(old, (time.time() - 7200, time.time() - 7200))
+        leftover = os.path.join(self.tmp.name, 'dead.entry.123.tmp')
+        with open(leftover, 'w') as fp:
+            json.dump({}, fp)
+        os.utime(leftover, (time.time() - 7200, time.time() - 7200))
+
+        self.assertEqual(client.prune(), 1)
+        self.assertEqual(self.entries(), [os.path.basename(client.entry_path(self.server.url('/etag'), {}))])
+        self.assertFalse(os.path.exists(leftover))
+
+    def test_saving_prunes_once_an_interval(self):
+        client = self.new_client(max_entries=1)
+        client.get(self.server.url('/fresh'))
+        # the first save swept the cache; the next one is within prune_interval and doesn't
+        client.get(self.server.url('/etag'))
+        self.assertEqual(len(self.entries()), 2)
+
+        stamp = os.path.join(self.tmp.name, 'pruned')
+        then = time.time() - httpclient.prune_interval - 1
+        os.utime(stamp, (then, then))
+        client.get(self.server.url('/gzip'))
+        self.assertEqual(len(self.entries()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
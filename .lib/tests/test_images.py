@@ -0,0 +1,117 @@
+"""Tests for .test.py's bitbar.image checks, against a local HTTP server."""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import unittest
+
+from support import LocalServer, load_test_py, root
+
+
+def head_not_allowed(handler):
+    if handler.command == 'HEAD':
+        return 405, {}, b''
+    return 206, {'Content-Type': 'image/png', 'Content-Range': 'bytes 0-0/100'}, b'\x89'
+
+
+routes = {
+    '/icon.png': (200, {'Content-Type': 'image/png'}, b'\x89PNG'),
+    '/photo.jpg': (200, {'Content-Type': 'image/jpeg'}, b'\xff\xd8'),
+    '/page': (200, {'Content-Type': 'text/html'}, b'<html></html>'),
+    '/moved': (301, {'Location': '/photo.jpg'}, b''),
+    '/nohead.png': head_not_allowed,
+}
+
+plugin = '''#!/bin/bash
+# <bitbar.title>Test</bitbar.title>
+# <bitbar.image>%s</bitbar.image>
+echo test
+'''
+
+
+class ImageCheckerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.t = load_test_py()
+        self.t.args = argparse.Namespace(debug=False, verbose=False, warn=False)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self.tmp.name, 'images.json')
+        self.server = LocalServer(routes).__enter__()
+
+    def tearDown(self):
+        self.server.__exit__(None, None, None)
+        self.tmp.cleanup()
+
+    def test_content_types(self):
+        url = self.server.url
+        checker = self.t.ImageChecker(self.cache_path)
+        results = checker.check(
+            [url('/icon.png'), url('/photo.jpg'), url('/page'), url('/moved'), url('/nohead.png'), url('/gone')])
+        checker.pool.close()
+        self.assertEqual(results[url('/icon.png')], ('image/png', None))
+        self.assertEqual(results[url('/photo.jpg')], ('image/jpeg', None))
+        self.assertEqual(results[url('/page')], ('text/html', None))
+        self.assertEqual(results[url('/moved')], ('image/jpeg', None))
+        self.assertEqual(results[url('/nohead.png')], ('image/png', None))
+        self.assertEqual(results[url('/gone')], (None, 'HTTP 404'))
+
+        with open(self.cache_path) as fp:
+            saved = json.load(fp)
+        # failures are retried next run rather than saved
+        self.assertEqual(sorted(saved), sorted(u for u in results if u != url('/gone')))
+
+        requests = len(self.server.requests)
+        checker = self.t.ImageChecker(self.cache_path)
+        again = checker.check([url('/icon.png'), url('/page')])
+        self.assertEqual(again[url('/page')], ('text/html', None))
+        self.assertEqual(len(self.server.requests), requests)
+
+    def test_report_image(self):
+        url = self.server.url('/page')
+        output, errors = self.t.captured(self.t.report_image, 'plugin.sh', url, ('text/html', None))
+        self.assertIn('bad content type: text/html', output)
+        self.assertEqual(errors, 1)
+        self.assertEqual(self.t.captured(self.t.report_image, 'plugin.sh', url, ('image/jpeg', None))[1], 0)
+        self.assertEqual(self.t.captured(self.t.report_image, 'plugin.sh', url, (None, 'HTTP 404'))[1], 0)
+        self.assertEqual(self.t.error_count, 0)
+
+    def test_concurrent_saves(self):
+        def save(n):
+            checker = self.t.ImageChecker(self.cache_path)
+            for i in range(20):
+                checker._cache['http://example.com/%d/%d.png' % (n, i)] = {'content_type': 'image/png', 'checked': 0}
+                checker.save()
+
+        threads = [threading.Thread(target=save, args=(n,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        with open(self.cache_path) as fp:
+            self.assertEqual(len(json.load(fp)), 8 * 20)
+
+    def test_no_batch_checks_each_url_once(self):
+        names = {'a.sh': '/icon.png', 'b.sh': '/icon.png', 'c.sh': '/photo.jpg', 'd.sh': '/page'}
+        for name, path in names.items():
+            with open(os.path.join(self.tmp.name, name), 'w') as fp:
+                fp.write(plugin % self.server.url(path))
+            os.chmod(os.path.join(self.tmp.name, name), 0o755)
+
+        run = subprocess.run(
+            [sys.executable, os.path.join(root, '.test.py'), '--verbose', '--no-batch', '--jobs', '2',
+             '--cache-dir', os.path.join(self.tmp.name, 'cache')] + sorted(names),
+            cwd=self.tmp.name, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        self.assertEqual(run.stdout.count('image content type looks good: image/png'), 2, run.stdout)
+        self.assertEqual(run.stdout.count('image content type looks good: image/jpeg'), 1, run.stdout)
+        self.assertEqual(run.stdout.count('image metadata has bad content type: text/html'), 1, run.stdout)
+        self.assertEqual(sorted(self.server.requests), [('HEAD', '/icon.png'), ('HEAD', '/page'), ('HEAD', '/photo.jpg')])
+        with open(os.path.join(self.tmp.name, 'cache', 'images.json')) as fp:
+            self.assertEqual(len(json.load(fp)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
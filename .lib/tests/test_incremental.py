@@ -0,0 +1,157 @@
+"""Tests for .test.py --incremental's file selection, in a throwaway git repository."""
+
+import argparse
+import os
+import subprocess
+import tempfile
+import unittest
+
+from support import load_test_py
+
+plugin = '''#!/bin/bash
+# <bitbar.title>%s</bitbar.title>
+# <bitbar.author>Test</bitbar.author>
+# <bitbar.author.github>test</bitbar.author.github>
+echo %s
+'''
+
+
+def git(cwd, *git_args):
+    return subprocess.check_output(('git',) + git_args, cwd=cwd, universal_newlines=True)
+
+
+def write(cwd, name, content):
+    with open(os.path.join(cwd, name), 'w') as fp:
+        fp.write(content)
+
+
+def commit(cwd, message, files):
+    for name, content in files.items():
+        write(cwd, name, content)
+    git(cwd, 'add', '-A')
+    git(cwd, 'commit', '-q', '-m', message)
+
+
+class IncrementalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.t = load_test_py()
+        self.t.args = argparse.Namespace(debug=False, verbose=False, warn=False)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.origin = os.path.join(self.tmp.name, 'origin.git')
+        self.work = os.path.join(self.tmp.name, 'work')
+        self.manifests = os.path.join(self.tmp.name, 'manifests')
+        env = {'GIT_AUTHOR_NAME': 'Test', 'GIT_AUTHOR_EMAIL': 'test@example.com',
+               'GIT_COMMITTER_NAME': 'Test', 'GIT_COMMITTER_EMAIL': 'test@example.com'}
+        self.saved_environ = dict(os.environ)
+        os.environ.update(env)
+        os.environ.pop('TRAVIS_BRANCH', None)
+
+        git(self.tmp.name, 'init', '-q', '--bare', '-b', 'master', self.origin)
+        git(self.tmp.name, 'init', '-q', '-b', 'master', self.work)
+        git(self.work, 'remote', 'add', 'origin', self.origin)
+        commit(self.work, 'plugins', {'.test.py': '# lint rules\n', '.jshintrc': '{}\n', 'a.sh': plugin % ('A', 'a'),
+                                      'b.sh': plugin % ('B', 'b'), 'c.js': '#!/usr/bin/env node\n'})
+        git(self.work, 'push', '-q', 'origin', 'master')
+        self.cwd = os.getcwd()
+        os.chdir(self.work)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        os.environ.clear()
+        os.environ.update(self.saved_environ)
+        self.tmp.cleanup()
+
+    def green(self, pr, files):
+        """Save a manifest for HEAD as a green run over files would."""
+        store = self.t.ManifestStore(self.manifests, pr)
+        store.save(git(self.work, 'rev-parse', 'HEAD').strip(), {
+            'config': self.t.config_hashes(),
+            'files': dict((path, self.t.file_hash(path)) for path in files)})
+
+    def select(self, pr, files=()):
+        store = self.t.ManifestStore(self.manifests, pr)
+        return self.t.incremental_files(store, self.t.config_hashes(), pr, list(files))
+
+    def test_no_manifest(self):
+        self.assertIsNone(self.select(False))
+        self.assertIsNone(self.select(True))
+
+    def test_full_run_checks_changed_files(self):
+        self.green(False, ['a.sh', 'b.sh', 'c.js'])
+        commit(self.work, 'change b', {'b.sh': plugin % ('B', 'bb')})
+        commit(self.work, 'unrelated', {'README': 'readme\n'})
+        to_check, validated, considered = self.select(False)
+        self.assertEqual(to_check, ['README', 'b.sh'])
+        self.assertEqual(sorted(validated), ['a.sh', 'c.js'])
+        self.assertEqual(considered, 4)
+        # explicit files are checked as given
+        self.assertIsNone(self.select(False, ['a.sh']))
+
+    def test_full_run_drops_deleted_files(self):
+        self.green(False, ['a.sh', 'b.sh', 'c.js'])
+        git(self.work, 'rm', '-q', 'b.sh')
+        git(self.work, 'commit', '-q', '-m', 'remove b')
+        self.assertEqual(self.select(False)[:2], ([], {'a.sh': self.t.file_hash('a.sh'),
+                                                       'c.js': self.t.file_hash('c.js')}))
+
+    def test_pr_run_checks_changes_since_last_push(self):
+        git(self.work, 'checkout', '-q', '-b', 'feature')
+        commit(self.work, 'change a', {'a.sh': plugin % ('A', 'aa')})
+        self.green(True, ['a.sh'])
+        commit(self.work, 'change b', {'b.sh': plugin % ('B', 'bb')})
+        to_check, validated, considered = self.select(True)
+        self.assertEqual(to_check, ['b.sh'])
+        self.assertEqual(sorted(validated), ['a.sh'])
+        self.assertEqual(considered, 2)
+
+    def test_pr_run_follows_renames(self):
+        git(self.work, 'checkout', '-q', '-b', 'feature')
+        commit(self.work, 'change a', {'a.sh': plugin % ('A', 'aa')})
+        self.green(True, ['a.sh'])
+        git(self.work, 'mv', 'a.sh', 'a.10s.sh')
+        git(self.work, 'commit', '-q', '-m', 'rename a')
+        to_check, validated, considered = self.select(True)
+        self.assertEqual(to_check, [])
+        self.assertEqual(sorted(validated), ['a.10s.sh'])
+
+    def test_pr_run_ignores_changes_on_an_out_of_date_base(self):
+        self.green(True, [])
+        git(self.work, 'checkout', '-q', '-b', 'feature')
+        commit(self.work, 'change a', {'a.sh': plugin % ('A', 'aa')})
+
+        # master moves on after the branch forked, and the branch isn't rebased
+        other = os.path.join(self.tmp.name, 'other')
+        git(self.tmp.name, 'clone', '-q', self.origin, other)
+        commit(other, 'master moves on', {'c.js': '#!/usr/bin/env node\n// changed\n', 'd.sh': plugin % ('D', 'd')})
+        git(other, 'push', '-q', 'origin', 'master')
+        git(self.work, 'fetch', '-q', 'origin')
+
+        to_check, validated, considered = self.select(True)
+        self.assertEqual(to_check, ['a.sh'])
+        self.assertEqual(validated, {})
+        self.assertEqual(considered, 1)
+
+    def test_config_changes(self):
+        self.green(False, ['a.sh', 'b.sh', 'c.js'])
+        commit(self.work, 'jshint config', {'.jshintrc': '{"esversion": 6}\n'})
+        to_check, validated, considered = self.select(False)
+        self.assertEqual(to_check, ['c.js'])
+        self.assertEqual(sorted(validated), ['a.sh', 'b.sh'])
+
+        commit(self.work, 'lint rules', {'.test.py': '# stricter lint rules\n'})
+        to_check, validated, considered = self.select(False)
+        self.assertEqual(to_check, ['a.sh', 'b.sh', 'c.js'])
+        self.assertEqual(validated, {})
+
+    def test_pr_and_full_runs_keep_separate_manifests(self):
+        self.green(False, ['a.sh', 'b.sh', 'c.js'])
+        self.assertIsNone(self.select(True))
+        self.green(True, ['a.sh'])
+        head = git(self.work, 'rev-parse', 'HEAD').strip()
+        self.assertEqual(sorted(self.t.ManifestStore(self.manifests, True).load(head)['files']), ['a.sh'])
+        self.assertEqual(len(self.t.ManifestStore(self.manifests, False).load(head)['files']), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
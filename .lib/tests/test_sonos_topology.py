@@ -0,0 +1,142 @@
+"""Tests for SonosBar's stored topology, against a fake SoCo discovery backend."""
+
+import sys
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from support import load_script
+
+from bitbarlib.state import open_store
+
+
+class Speaker(object):
+    """A player as SoCo shows it, on a network of speakers."""
+
+    def __init__(self, network, name, ip, uid):
+        self.network = network
+        self.player_name = name
+        self.ip_address = ip
+        self.uid = uid
+
+    @property
+    def all_groups(self):
+        return [Group(speaker, [speaker]) for speaker in self.network.speakers.values()]
+
+    def answer(self, action):
+        if self.network.speakers.get(self.ip_address) is not self:
+            raise OSError('no route to %s' % self.ip_address)
+        self.network.actions.append((self.player_name, action))
+
+    def unjoin(self):
+        self.answer('unjoin')
+
+    def pause(self):
+        self.answer('pause')
+
+
+class Group(object):
+
+    def __init__(self, coordinator, members):
+        self.coordinator = coordinator
+        self.members = members
+
+
+class Network(object):
+    """Stands in for soco.discover and soco.SoCo, counting discoveries."""
+
+    def __init__(self):
+        self.speakers = {}
+        self.discoveries = 0
+        self.actions = []
+
+    def add(self, name, ip, uid):
+        self.speakers[ip] = Speaker(self, name, ip, uid)
+
+    def discover(self):
+        self.discoveries += 1
+        return set(self.speakers.values())
+
+    def make_player(self, ip):
+        return self.speakers.get(ip) or Speaker(self, None, ip, None)
+
+
+class TopologyTest(unittest.TestCase):
+
+    def setUp(self):
+        self.sonos = load_script('sonosBar', 'Music/sonosBar.py')
+        self.tmp = tempfile.TemporaryDirectory()
+        self.network = Network()
+        self.network.add('Kitchen', '10.0.0.2', 'RINCON_2')
+        popen = mock.patch.object(self.sonos.subprocess, 'Popen')
+        self.popen = popen.start()
+        self.addCleanup(popen.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def topology(self, **options):
+        """A topology as a new run of the plugin would have it"""
+        store = open_store('sonosBar', directory=self.tmp.name)
+        return self.sonos.Topology(store, self.network.discover, self.network.make_player, **options)
+
+    def run_plugin(self, *argv):
+        """Runs main() as the script does, with self.sonos.TOPOLOGY set"""
+        with mock.patch.object(sys, 'argv', ['sonosBar.py'] + list(argv)):
+            self.sonos.ARGUMENTS = self.sonos.parse_cli_arguments()
+        self.sonos.GROUP = self.sonos.ARGUMENTS.group
+        self.sonos.STORE = self.sonos.TOPOLOGY.store
+        self.sonos.main(self.sonos.ARGUMENTS)
+
+    def test_cache_hit_skips_discovery(self):
+        self.assertEqual(self.topology().player('Kitchen').ip_address, '10.0.0.2')
+        self.assertEqual(self.network.discoveries, 1)
+
+        topology = self.topology()
+        self.assertEqual(topology.player('Kitchen').ip_address, '10.0.0.2')
+        self.assertTrue(topology.cached)
+        self.assertEqual(self.network.discoveries, 1)
+        self.popen.assert_not_called()
+
+    def test_expired_topology_refreshes_in_background(self):
+        self.topology().load()
+        self.network.add('Bathroom', '10.0.0.3', 'RINCON_3')
+        with mock.patch.object(self.sonos.time, 'time', return_value=time.time() + 60):
+            # the stale players answer at once, and one copy rediscovers them
+            self.assertEqual(len(self.topology(ttl=30).load()), 1)
+            self.assertEqual(len(self.topology(ttl=30).load()), 1)
+        self.assertEqual(self.network.discoveries, 1)
+        self.popen.assert_called_once()
+        self.assertEqual(self.popen.call_args[0][0][1:], [self.sonos.PATH_TO_SCRIPT, '--refresh-topology'])
+        self.assertIn('refreshing', self.topology().store)
+
+        self.topology().refresh()
+        topology = self.topology()
+        self.assertEqual(sorted(p['name'] for p in topology.load()), ['Bathroom', 'Kitchen'])
+        self.assertNotIn('refreshing', topology.store)
+
+    def test_invalidate_after_a_stored_ip_stops_answering(self):
+        self.topology().load()
+        # the speaker comes back from a restart with another address
+        del self.network.speakers['10.0.0.2']
+        self.network.add('Kitchen', '10.0.0.9', 'RINCON_2')
+
+        self.sonos.TOPOLOGY = self.topology()
+        self.run_plugin('--player', 'Kitchen', 'pause')
+
+        self.assertEqual(self.network.discoveries, 2)
+        self.assertEqual(self.network.actions, [('Kitchen', 'unjoin'), ('Kitchen', 'pause')])
+        self.assertEqual(self.topology().find(name='Kitchen')['ip'], '10.0.0.9')
+
+    def test_fresh_topology_is_not_rediscovered(self):
+        # discovery reports an address the speaker doesn't answer on
+        self.network.speakers['10.0.0.2'].ip_address = '10.0.0.5'
+        self.sonos.TOPOLOGY = self.topology()
+        with self.assertRaises(OSError):
+            self.run_plugin('--player', 'Kitchen', 'pause')
+        self.assertEqual(self.network.discoveries, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
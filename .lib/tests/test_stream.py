@@ -0,0 +1,50 @@
+"""Tests for bitbarlib.stream's opt-in streaming."""
+
+import io
+import os
+import sys
+import unittest
+from unittest import mock
+
+import support  # noqa: F401 puts .lib on sys.path
+
+from bitbarlib import stream
+
+
+class StreamTest(unittest.TestCase):
+
+    def setUp(self):
+        environ = mock.patch.dict(os.environ)
+        environ.start()
+        self.addCleanup(environ.stop)
+        os.environ.pop('BITBAR_STREAM', None)
+        self.frames = iter(['one', 'one', 'two'])
+        self.out = io.StringIO()
+        sleep = mock.patch.object(stream.time, 'sleep')
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def render(self):
+        print(next(self.frames))
+
+    def run_stream(self, *argv):
+        with mock.patch.object(sys, 'argv', ['plugin.1s.py'] + list(argv)), \
+                mock.patch.object(sys, 'stdout', self.out):
+            stream.stream(self.render, out=self.out, ticks=3)
+        return self.out.getvalue()
+
+    def test_renders_once_unless_asked(self):
+        self.assertEqual(self.run_stream(), 'one\n')
+
+    def test_streams_with_the_flag(self):
+        self.assertEqual(self.run_stream('--stream'), 'one\n~~~\ntwo\n')
+
+    def test_environment_overrides_the_flag(self):
+        os.environ['BITBAR_STREAM'] = '0'
+        self.assertEqual(self.run_stream('--stream'), 'one\n')
+        os.environ['BITBAR_STREAM'] = '1'
+        self.assertTrue(stream.enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,19 +1,62 @@
 #!/usr/bin/env python3
+import io
 import re
+import sys
+import select
+import struct
+import ctypes
+import ctypes.util
+import fcntl
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import http.client
+import xml.etree.ElementTree as ElementTree
 import os
 import subprocess
 import argparse
-import warnings
+import multiprocessing
+import atexit
+import shlex
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stdout
 from distutils.spawn import find_executable
-from tempfile import NamedTemporaryFile
-from urllib.request import urlopen
+from urllib.parse import urljoin, urlsplit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '.lib'))
+from bitbarlib.plugins import parse_interval
+
+try:
+    import pyflakes.api
+    import pyflakes.reporter
+except ImportError:
+    pyflakes = None
 
 ignore_file_types = ['.md']
 ignore_file_names = ['package.json', 'package-lock.json']
 allowed_image_content_types = ['image/png', 'image/jpeg', 'image/gif']
 required_metadata = ['author', 'author.github', 'title']
 recommended_metadata = ['image', 'desc', 'version']
+default_cache_dir = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'bitbar-plugins')
+metadata_tag = re.compile("<bitbar.(?P<lho_tag>[^>]+)>(?P<value>[^<]+)</bitbar.(?P<rho_tag>[^>]+)>")
+# metadata lives in a block of comments near the top of each plugin; lines longer
+# than this (embedded icons) are never metadata and aren't worth a regex search
+max_metadata_line = 1000
+# the metadata block is over once this many lines pass without a tag...
+metadata_gap = 20
+# ...or if no tag at all turns up in this many lines
+metadata_header_lines = 100
+# files that change how other files are checked: a change to one of these means
+# every file with the listed extensions (or every file, for None) is re-checked
+lint_config_files = {'.test.py': None, '.rubocop.yml': ['.rb'], '.jshintrc': ['.js']}
 error_count = 0
+lint_cache = None
+image_checker = None
+profiler = None
 
 
 def debug(s):
@@ -42,14 +85,27 @@ def error(s):
 
 class Language(object):
     _languages = {}
+    _registered = []
+    _slots = {}
+
+    _scratch = None
 
-    def __init__(self, exts, shebang, linter, trim_shebang=False, full_options=[], pr_options=[]):
+    def __init__(self, exts, shebang, linter, trim_shebang=False, full_options=[], pr_options=[], version_cmd=None,
+                 batch_options=None, stdin_options=None):
         self.extensions = exts
         self.shebang = shebang
         self.cmd = linter
         self.trim = trim_shebang
         self.full = full_options
         self.pr = pr_options
+        self.version_cmd = version_cmd or [linter[0], '--version']
+        self._version = None
+        # linters that accept many files in one run and prefix every diagnostic with
+        # the path it refers to set this, even if only to [], to be run in batches
+        self.batch = batch_options
+        # linters that can read source from stdin set this to the options that make
+        # them do so, so trimmed sources never have to be written anywhere
+        self.stdin = stdin_options
 
         self.enabled = True
         if not find_executable(self.cmd[0]):
@@ -58,6 +114,8 @@ class Language(object):
 
     @staticmethod
     def registerLanguage(lang):
+        lang.index = len(Language._registered)
+        Language._registered.append(lang)
         for extension in lang.extensions:
             if extension in Language._languages:
                 Language._languages[extension].append(lang)
@@ -71,35 +129,120 @@ class Language(object):
         else:
             return None
 
+    @staticmethod
+    def limitConcurrency(jobs):
+        """Allow at most `jobs` copies of each linter executable to run at once."""
+        for langs in Language._languages.values():
+            for lang in langs:
+                if lang.cmd[0] not in Language._slots:
+                    Language._slots[lang.cmd[0]] = multiprocessing.BoundedSemaphore(jobs)
+
     def validShebang(self, bang):
         return re.search(self.shebang, bang) is not None
 
+    def version(self):
+        if self._version is None:
+            try:
+                self._version = subprocess.check_output(
+                    self.version_cmd, stderr=subprocess.STDOUT).decode('UTF-8', 'replace').strip()
+            except (OSError, subprocess.CalledProcessError):
+                self._version = ''
+        return self._version
+
+    def options(self, is_pr):
+        if is_pr and self.pr:
+            return self.pr
+        elif not is_pr and self.full:
+            return self.full
+        return []
+
+    @staticmethod
+    def scratchDirectory():
+        """A private directory, in RAM where possible, reused for every trimmed source this process lints."""
+        if Language._scratch is None:
+            parent = '/dev/shm' if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK) else None
+            Language._scratch = tempfile.mkdtemp(prefix='bitbar-lint-', dir=parent)
+            atexit.register(shutil.rmtree, Language._scratch, True)
+        return Language._scratch
+
+    def run(self, command, input=None):
+        slot = Language._slots.get(self.cmd[0])
+        if slot is None:
+            return subprocess.check_output(command, stderr=subprocess.STDOUT, input=input)
+        with slot:
+            return subprocess.check_output(command, stderr=subprocess.STDOUT, input=input)
+
+    def lintTrimmed(self, file, is_pr):
+        """Lint file without its shebang line, reporting problems against file's own path."""
+        with open(file, 'rb') as fp:
+            fp.readline()
+            source = fp.read()
+        command = list(self.cmd)
+        command.extend(self.options(is_pr))
+        if self.stdin is not None:
+            command.extend(self.stdin)
+            return self.run(command, input=source)
+
+        trimmed = os.path.join(Language.scratchDirectory(), os.path.basename(file))
+        with open(trimmed, 'wb') as fp:
+            fp.write(source)
+        command.append(trimmed)
+        try:
+            return self.run(command).replace(trimmed.encode('UTF-8'), file.encode('UTF-8'))
+        except subprocess.CalledProcessError as cpe:
+            cpe.output = (cpe.output or b'').replace(trimmed.encode('UTF-8'), file.encode('UTF-8'))
+            raise
+        finally:
+            os.remove(trimmed)
+
     def lint(self, file, is_pr):
         if not self.enabled:
             return None
         if self.trim:
-            with open(file, 'r') as fp:
-                lines = fp.readlines()[1:]
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                with NamedTemporaryFile(mode='w', delete=False) as t:
-                    file = t.name
-                    t.writelines(lines)
+            return self.lintTrimmed(file, is_pr)
         command = list(self.cmd)
-        if is_pr and self.pr:
-            command.extend(self.pr)
-        elif not is_pr and self.full:
-            command.extend(self.full)
+        command.extend(self.options(is_pr))
         command.append(file)
-        result = subprocess.check_output(command, stderr=subprocess.STDOUT)
-        if self.trim:
-            os.remove(file)
-        return result
+        return self.run(command)
+
+    def lintMany(self, files, is_pr):
+        """Lint several files, returning {file: (passed, output)}.
+
+        Batchable linters are run once for all of files and their output is split
+        up by the path each line starts with.  Everything else, or a failed batch
+        whose output can't be attributed to any file, is linted one file at a time.
+        """
+        results = {}
+        if self.enabled and self.batch is not None and not self.trim and len(files) > 1:
+            command = list(self.cmd)
+            command.extend(self.options(is_pr))
+            command.extend(self.batch)
+            command.extend(files)
+            try:
+                output = self.run(command)
+                failed = False
+            except subprocess.CalledProcessError as cpe:
+                output = cpe.output or b''
+                failed = True
+            by_file = split_output_by_file(output, files)
+            if not failed:
+                return {f: (True, b''.join(by_file.get(f, []))) for f in files}
+            if by_file:
+                return {f: (f not in by_file, b''.join(by_file.get(f, []))) for f in files}
+            debug('could not attribute output of "%s" to any file, linting one at a time' % " ".join(self.cmd))
+
+        for f in files:
+            try:
+                results[f] = (True, self.lint(f, is_pr) or b'')
+            except subprocess.CalledProcessError as cpe:
+                results[f] = (False, cpe.output or b'')
+        return results
 
 
 class Python2(Language):
     def __init__(self):
-        super().__init__(['.py', '.py2'], r'python(|2(\.\d+)?)$', ['python2', '-m', 'pyflakes'])
+        super().__init__(['.py', '.py2'], r'python(|2(\.\d+)?)$', ['python2', '-m', 'pyflakes'],
+                         version_cmd=['python2', '-m', 'pyflakes', '--version'], batch_options=[])
 
     def lint(self, file, pr):
         if pr:
@@ -109,6 +252,51 @@ class Python2(Language):
         else:
             return super(Python2, self).lint(file, pr)
 
+    def lintMany(self, files, pr):
+        if pr:
+            return {f: (False, b"python3 support required for all PRs") for f in files}
+        return super(Python2, self).lintMany(files, pr)
+
+
+class Pyflakes(Language):
+    """pyflakes for Python 3 files, run inside this interpreter instead of a subprocess per file.
+
+    Falls back to `python3 -m pyflakes` when pyflakes can't be imported here.
+    """
+
+    def __init__(self):
+        super().__init__(['.py', '.py3'], r'python(|3(\.\d+)?)$', ['python3', '-m', 'pyflakes'],
+                         version_cmd=['python3', '-m', 'pyflakes', '--version'], batch_options=[])
+        if pyflakes is not None:
+            self.enabled = True
+
+    def version(self):
+        if pyflakes is None:
+            return super().version()
+        return '%s Python %s' % (pyflakes.__version__, sys.version.split()[0])
+
+    def lint(self, file, pr):
+        if pyflakes is None:
+            return super().lint(file, pr)
+        buf = io.StringIO()
+        # pyflakes prints warnings to stdout and syntax errors to stderr; merge them like the subprocess does
+        warnings_found = pyflakes.api.checkPath(file, pyflakes.reporter.Reporter(buf, buf))
+        output = buf.getvalue().encode('UTF-8')
+        if warnings_found:
+            raise subprocess.CalledProcessError(cmd=self.cmd, returncode=1, output=output)
+        return output
+
+    def lintMany(self, files, pr):
+        if pyflakes is None:
+            return super().lintMany(files, pr)
+        results = {}
+        for f in files:
+            try:
+                results[f] = (True, self.lint(f, pr))
+            except subprocess.CalledProcessError as cpe:
+                results[f] = (False, cpe.output)
+        return results
+
 
 class Rscript(Language):
     def __init__(self):
@@ -117,51 +305,524 @@ class Rscript(Language):
     def lint(self, file, pr):
         if not self.enabled:
             return None
-        result = subprocess.check_output([
+        result = self.run([
             'Rscript',
             '-e',
             'library(lintr); l=lint("%s", with_defaults(line_length_linter = NULL));l; quit(status=if (length(l) > 0) { 1 } else { 0 })' % file
-        ], stderr=subprocess.STDOUT)
+        ])
         return result
 
 
-Language.registerLanguage(Language(['.sh'], '(bash|ksh|zsh|sh|fish)$', ['shellcheck'], full_options=['-e', 'SC1117,SC2164,SC2183,SC2196,SC2197,SC2206,SC2207,SC2215,SC2219,SC2230,SC2236']))
-Language.registerLanguage(Python2())
-Language.registerLanguage(Language(['.py', '.py3'], r'python(|3(\.\d+)?)$', ['python3', '-m', 'pyflakes']))
-Language.registerLanguage(Language(['.rb'], 'ruby$', ['rubocop', '-l'], full_options=['--except', 'Lint/RedundantStringCoercion,Lint/BigDecimalNew']))
-Language.registerLanguage(Language(['.js'], 'node$', ['jshint']))
-Language.registerLanguage(Language(['.php'], 'php$', ['php', '-l']))
-Language.registerLanguage(Language(['.pl'], 'perl( -[wW])?$', ['perl', '-MO=Lint']))
-Language.registerLanguage(Language(['.swift'], 'swift$', ['xcrun', '-sdk', 'macosx', 'swiftc', '-o', '/dev/null']))
-Language.registerLanguage(Language(['.lisp', '.clisp'], 'clisp$', ['clisp']))
-Language.registerLanguage(Language(['.rkt'], 'racket$', ['raco', 'make']))
-# go does not actually support shebang on line 1.  gorun works around this, so we need to strip it before we lint
-Language.registerLanguage(Language(['.go'], 'gorun$', ['golint', '-set_exit_status'], trim_shebang=True))
-Language.registerLanguage(Language(['.lua'], 'lua$', ['luacheck']))
-Language.registerLanguage(Rscript())
+class LintCache(object):
+    """On-disk lint results keyed by file path and content, linter command line and version, and lint config.
+
+    Each entry is a small JSON file; its mtime is refreshed on every hit so
+    prune() can evict the least recently used entries.
+    """
+
+    def __init__(self, path, max_entries=5000):
+        self.path = path
+        self.max_entries = max_entries
+        os.makedirs(self.path, exist_ok=True)
+
+    def key(self, linter, file, is_pr):
+        digest = hashlib.sha256()
+        command = list(linter.cmd) + list(linter.options(is_pr))
+        config = json.dumps(config_hashes(file), sort_keys=True)
+        # linter output names the file, so identical copies at different paths get separate entries
+        for part in [os.path.abspath(file), type(linter).__name__, str(is_pr), json.dumps(command), linter.version(),
+                     config]:
+            digest.update(part.encode('UTF-8'))
+            digest.update(b'\0')
+        with open(file, 'rb') as fp:
+            digest.update(fp.read())
+        return digest.hexdigest()
+
+    def get(self, key):
+        entry_path = os.path.join(self.path, key + '.json')
+        try:
+            with open(entry_path, 'r') as fp:
+                entry = json.load(fp)
+            os.utime(entry_path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key, ok, output):
+        entry_path = os.path.join(self.path, key + '.json')
+        tmp_path = '%s.%d.tmp' % (entry_path, os.getpid())
+        with open(tmp_path, 'w') as fp:
+            json.dump({'ok': ok, 'output': output.decode('UTF-8', 'replace')}, fp)
+        os.replace(tmp_path, entry_path)
+
+    def prune(self):
+        entries = []
+        for name in os.listdir(self.path):
+            entry_path = os.path.join(self.path, name)
+            try:
+                entries.append((os.stat(entry_path).st_mtime, entry_path))
+            except OSError:
+                pass
+        entries.sort(reverse=True)
+        for _, entry_path in entries[self.max_entries:]:
+            try:
+                os.remove(entry_path)
+            except OSError:
+                pass
+
+
+def split_output_by_file(output, files):
+    """Group the lines of a batched linter run by the file path each one starts with.
+
+    Lines that don't start with a path (source excerpts, carets) belong to the
+    last file named before them.
+    """
+    paths = set(f.encode('UTF-8') for f in files)
+    by_file = {}
+    current = None
+    for line in output.splitlines(True):
+        stripped = line.lstrip()
+        colon = stripped.find(b':')
+        while colon != -1:
+            if stripped[:colon] in paths:
+                current = stripped[:colon].decode('UTF-8')
+                break
+            colon = stripped.find(b':', colon + 1)
+        if current is not None:
+            by_file.setdefault(current, []).append(line)
+    return by_file
+
+
+def cache_lookup(linter, file, is_pr):
+    """Return the cache key for linting file with linter and its cached entry, if any."""
+    if lint_cache is None or not linter.enabled:
+        return None, None
+    key = lint_cache.key(linter, file, is_pr)
+    entry = lint_cache.get(key)
+    if entry is not None:
+        debug('cache hit for %s with "%s"' % (file, " ".join(linter.cmd)))
+    return key, entry
+
+
+class MemoryLintCache(LintCache):
+    """Lint results kept in memory for the life of the process, in front of an optional LintCache."""
+
+    def __init__(self, disk_cache=None):
+        self.disk_cache = disk_cache
+        self.entries = {}
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None and self.disk_cache is not None:
+            entry = self.disk_cache.get(key)
+            if entry is not None:
+                self.entries[key] = entry
+        return entry
+
+    def put(self, key, ok, output):
+        self.entries[key] = {'ok': ok, 'output': output.decode('UTF-8', 'replace')}
+        if self.disk_cache is not None:
+            self.disk_cache.put(key, ok, output)
+
+    def prune(self):
+        if self.disk_cache is not None:
+            self.disk_cache.prune()
+
+
+def lint_cached(linter, file, is_pr):
+    """Lint file with linter, replaying a cached outcome instead of running it when possible."""
+    key, entry = cache_lookup(linter, file, is_pr)
+    if key is None:
+        return linter.lint(file, is_pr)
+    if entry is not None:
+        output = entry['output'].encode('UTF-8')
+        if not entry['ok']:
+            raise subprocess.CalledProcessError(cmd=linter.cmd, returncode=1, output=output)
+        return output
+
+    try:
+        output = linter.lint(file, is_pr)
+    except subprocess.CalledProcessError as cpe:
+        lint_cache.put(key, False, cpe.output or b'')
+        raise
+    lint_cache.put(key, True, output or b'')
+    return output
+
+
+def lint_batch(linter_index, files, is_pr):
+    """Lint files with one registered linter.
+
+    Returns {file: (passed, output)} and the (wall, cpu) seconds it took,
+    counting the CPU time of linter subprocesses.
+    """
+    start = cpu_clock()
+    linter = Language._registered[linter_index]
+    results = {}
+    keys = {}
+    for f in files:
+        key, entry = cache_lookup(linter, f, is_pr)
+        if entry is not None:
+            results[f] = (entry['ok'], entry['output'].encode('UTF-8'))
+        else:
+            keys[f] = key
+
+    if keys:
+        debug('running %s on %i files' % (" ".join(linter.cmd), len(keys)))
+        for f, (ok, output) in linter.lintMany(list(keys), is_pr).items():
+            if keys[f] is not None:
+                lint_cache.put(keys[f], ok, output)
+            results[f] = (ok, output)
+    end = cpu_clock()
+    return results, (end[0] - start[0], end[1] - start[1])
+
+
+def cpu_clock():
+    """Return (wall, cpu) seconds, cpu including finished child processes."""
+    times = os.times()
+    return time.perf_counter(), time.process_time() + times.children_user + times.children_system
+
+
+class Profiler(object):
+    """Wall and CPU time spent in each phase of checking each file."""
+
+    phases = ['extension', 'shebang', 'metadata', 'image', 'lint']
+
+    def __init__(self):
+        self.files = {}
+        self.start = cpu_clock()
+
+    def record(self, file_full_path):
+        return self.files.setdefault(file_full_path, {'errors': 0, 'phases': {}})
+
+    def add(self, file_full_path, phase, wall, cpu):
+        times = self.record(file_full_path)['phases'].setdefault(phase, {'wall': 0.0, 'cpu': 0.0})
+        times['wall'] += wall
+        times['cpu'] += cpu
 
+    def add_errors(self, file_full_path, errors):
+        self.record(file_full_path)['errors'] += errors
 
-def check_file(file_full_path, pr=False):
+    def laps(self, file_full_path):
+        """Return a function charging the time since it was last called (or created) to a phase."""
+        last = [cpu_clock()]
 
+        def lap(phase):
+            now = cpu_clock()
+            self.add(file_full_path, phase, now[0] - last[0][0], now[1] - last[0][1])
+            last[0] = now
+        return lap
+
+    def take(self, file_full_path):
+        return self.files.pop(file_full_path, None)
+
+    def merge(self, file_full_path, record):
+        if record is None:
+            return
+        for phase, times in record['phases'].items():
+            self.add(file_full_path, phase, times['wall'], times['cpu'])
+        self.add_errors(file_full_path, record['errors'])
+
+    def totals(self, record):
+        return (sum(t['wall'] for t in record['phases'].values()),
+                sum(t['cpu'] for t in record['phases'].values()))
+
+    def report(self):
+        end = cpu_clock()
+        files = {}
+        phases = dict((phase, {'wall': 0.0, 'cpu': 0.0}) for phase in self.phases)
+        for file_full_path, record in self.files.items():
+            wall, cpu = self.totals(record)
+            files[os.path.relpath(file_full_path)] = dict(record, wall=wall, cpu=cpu)
+            for phase, times in record['phases'].items():
+                phases[phase]['wall'] += times['wall']
+                phases[phase]['cpu'] += times['cpu']
+        return {'wall': end[0] - self.start[0], 'cpu': end[1] - self.start[1], 'phases': phases, 'files': files}
+
+    def write_json(self, path):
+        with open(path, 'w') as fp:
+            json.dump(self.report(), fp, indent=1, sort_keys=True)
+
+    def write_junit(self, path):
+        report = self.report()
+        suite = ElementTree.Element('testsuite', {
+            'name': 'bitbar-plugins', 'tests': str(len(report['files'])),
+            'failures': str(sum(1 for r in report['files'].values() if r['errors'])),
+            'time': '%.3f' % report['wall']})
+        for rel_path in sorted(report['files']):
+            record = report['files'][rel_path]
+            case = ElementTree.SubElement(suite, 'testcase', {
+                'classname': os.path.dirname(rel_path).replace(os.sep, '.') or '.',
+                'name': os.path.basename(rel_path), 'time': '%.3f' % record['wall']})
+            properties = ElementTree.SubElement(case, 'properties')
+            for phase in self.phases:
+                if phase in record['phases']:
+                    for clock in ('wall', 'cpu'):
+                        ElementTree.SubElement(properties, 'property', {
+                            'name': '%s.%s' % (phase, clock), 'value': '%.6f' % record['phases'][phase][clock]})
+            if record['errors']:
+                ElementTree.SubElement(case, 'failure', {'message': '%i errors' % record['errors']})
+        ElementTree.ElementTree(suite).write(path, encoding='UTF-8', xml_declaration=True)
+
+    def summary(self, top):
+        report = self.report()
+        print('Checked %i files in %.2f s wall, %.2f s CPU' % (len(report['files']), report['wall'], report['cpu']))
+        print('  %-10s %10s %10s' % ('phase', 'wall ms', 'cpu ms'))
+        for phase in self.phases:
+            times = report['phases'][phase]
+            print('  %-10s %10.1f %10.1f' % (phase, times['wall'] * 1000, times['cpu'] * 1000))
+        slowest = sorted(report['files'].items(), key=lambda item: item[1]['wall'], reverse=True)[:top]
+        if slowest:
+            print('Slowest %i files:' % len(slowest))
+            print('  %10s %10s  %-10s %s' % ('wall ms', 'cpu ms', 'slowest', 'file'))
+        for rel_path, record in slowest:
+            phase = max(record['phases'], key=lambda p: record['phases'][p]['wall']) if record['phases'] else '-'
+            print('  %10.1f %10.1f  %-10s %s' % (record['wall'] * 1000, record['cpu'] * 1000, phase, rel_path))
+
+
+def profile_laps(file_full_path):
+    """Return a function charging time to phases of checking file_full_path, doing nothing unless profiling."""
+    if profiler is None:
+        return lambda phase: None
+    return profiler.laps(file_full_path)
+
+
+class ConnectionPool(object):
+    """Keep-alive HTTP(S) connections shared between threads, one idle list per host."""
+
+    def __init__(self, timeout=10):
+        self.timeout = timeout
+        self._idle = {}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, headers={}):
+        """Make a request, returning (status, headers) and discarding the body."""
+        parts = urlsplit(url)
+        host = (parts.scheme, parts.hostname, parts.port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        with self._lock:
+            idle = self._idle.setdefault(host, [])
+            conn = idle.pop() if idle else None
+        for attempt in range(2):
+            if conn is None:
+                if parts.scheme == 'https':
+                    conn = http.client.HTTPSConnection(parts.hostname, parts.port, timeout=self.timeout)
+                elif parts.scheme == 'http':
+                    conn = http.client.HTTPConnection(parts.hostname, parts.port, timeout=self.timeout)
+                else:
+                    raise ValueError('unsupported URL scheme: %s' % url)
+            try:
+                conn.request(method, path, headers=dict(headers, **{'User-Agent': 'bitbar-plugins-test'}))
+                response = conn.getresponse()
+                response.read()
+            except (http.client.HTTPException, OSError):
+                conn.close()
+                conn = None
+                # a kept-alive connection may have been closed by the server; retry once on a fresh one
+                if attempt:
+                    raise
+                continue
+            if response.will_close:
+                conn.close()
+            else:
+                with self._lock:
+                    self._idle[host].append(conn)
+            return response.status, response.headers
+
+    def close(self):
+        with self._lock:
+            for idle in self._idle.values():
+                for conn in idle:
+                    conn.close()
+            self._idle = {}
+
+
+class ImageChecker(object):
+    """Looks up the Content-Type of bitbar.image URLs concurrently.
+
+    Each URL gets a HEAD request, falling back to a one byte ranged GET for
+    servers that don't answer HEAD properly.  Content types found are kept in
+    a JSON file for ttl seconds.
+    """
+
+    def __init__(self, cache_path=None, ttl=86400, workers=16, timeout=10):
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self.workers = workers
+        self.pool = ConnectionPool(timeout)
+        self._cache = {}
+        # failures aren't saved, but a long running process shouldn't retry them on every check
+        self._failures = {}
+        self.timings = {}
+        if cache_path:
+            try:
+                with open(cache_path, 'r') as fp:
+                    self._cache = json.load(fp)
+            except (OSError, ValueError):
+                pass
+
+    def _fetch(self, url):
+        for redirect in range(5):
+            status, headers = self.pool.request('HEAD', url)
+            if status in (301, 302, 303, 307, 308) and headers.get('Location'):
+                url = urljoin(url, headers['Location'])
+                continue
+            if status >= 400 or not headers.get('Content-Type'):
+                status, headers = self.pool.request('GET', url, {'Range': 'bytes=0-0'})
+                if status in (301, 302, 303, 307, 308) and headers.get('Location'):
+                    url = urljoin(url, headers['Location'])
+                    continue
+            if status >= 400:
+                raise IOError('HTTP %i' % status)
+            return headers.get('Content-Type')
+        raise IOError('too many redirects')
+
+    def lookup(self, url):
+        """Return (content_type, None) or (None, reason) for one URL."""
+        start = time.perf_counter(), time.thread_time()
+        try:
+            return self._lookup(url)
+        finally:
+            self.timings[url] = (time.perf_counter() - start[0], time.thread_time() - start[1])
+
+    def _lookup(self, url):
+        cached = self._cache.get(url)
+        if cached and time.time() - cached['checked'] < self.ttl:
+            return cached['content_type'], None
+        if url in self._failures:
+            return None, self._failures[url]
+        try:
+            content_type = self._fetch(url)
+        except Exception as e:
+            self._failures[url] = str(e) or type(e).__name__
+            return None, self._failures[url]
+        self._cache[url] = {'content_type': content_type, 'checked': time.time()}
+        return content_type, None
+
+    def check(self, urls):
+        """Look up every URL in urls, returning {url: (content_type, reason)}."""
+        urls = sorted(set(urls))
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = dict(zip(urls, executor.map(self.lookup, urls)))
+        self.save()
+        return results
+
+    def save(self):
+        if not self.cache_path:
+            return
+        os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+        # other processes may be saving too: hold the lock from reading their entries to replacing the file
+        with open(self.cache_path + '.lock', 'a') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.cache_path, 'r') as fp:
+                    merged = json.load(fp)
+            except (OSError, ValueError):
+                merged = {}
+            merged.update(self._cache)
+            tmp_path = '%s.%d.tmp' % (self.cache_path, os.getpid())
+            with open(tmp_path, 'w') as fp:
+                json.dump(merged, fp)
+            os.replace(tmp_path, self.cache_path)
+
+
+def report_image(file_full_path, url, result):
+    content_type, reason = result
+    if reason is not None:
+        warn('%s cannot fetch image: %s (%s)' % (file_full_path, url, reason))
+    elif content_type not in allowed_image_content_types:
+        error('%s image metadata has bad content type: %s' % (file_full_path, content_type))
+    else:
+        passed('%s image content type looks good: %s' % (file_full_path, content_type))
+
+
+def register_languages():
+    Language.registerLanguage(Language(['.sh'], '(bash|ksh|zsh|sh|fish)$', ['shellcheck'], batch_options=['-f', 'gcc'], full_options=['-e', 'SC1117,SC2164,SC2183,SC2196,SC2197,SC2206,SC2207,SC2215,SC2219,SC2230,SC2236']))
+    Language.registerLanguage(Python2())
+    Language.registerLanguage(Pyflakes())
+    Language.registerLanguage(Language(['.rb'], 'ruby$', ['rubocop', '-l'], batch_options=['--format', 'emacs'], full_options=['--except', 'Lint/RedundantStringCoercion,Lint/BigDecimalNew']))
+    Language.registerLanguage(Language(['.js'], 'node$', ['jshint'], batch_options=[]))
+    Language.registerLanguage(Language(['.php'], 'php$', ['php', '-l']))
+    Language.registerLanguage(Language(['.pl'], 'perl( -[wW])?$', ['perl', '-MO=Lint']))
+    Language.registerLanguage(Language(['.swift'], 'swift$', ['xcrun', '-sdk', 'macosx', 'swiftc', '-o', '/dev/null']))
+    Language.registerLanguage(Language(['.lisp', '.clisp'], 'clisp$', ['clisp']))
+    Language.registerLanguage(Language(['.rkt'], 'racket$', ['raco', 'make']))
+    # go does not actually support shebang on line 1.  gorun works around this, so we need to strip it before we lint
+    Language.registerLanguage(Language(['.go'], 'gorun$', ['golint', '-set_exit_status'], trim_shebang=True))
+    Language.registerLanguage(Language(['.lua'], 'lua$', ['luacheck'], batch_options=['--formatter', 'plain']))
+    Language.registerLanguage(Rscript())
+
+
+def scan_metadata(fp, file_full_path):
+    """Collect <bitbar.*> tags from the header of an open plugin, stopping once the header is over."""
+    metadata = {}
+    lines_without_tag = 0
+    seen_tag = False
+    while True:
+        line = fp.readline(max_metadata_line + 1)
+        if not line:
+            break
+        if len(line) > max_metadata_line and not line.endswith('\n'):
+            # skip the rest of an overlong line without holding it in memory
+            while line and not line.endswith('\n'):
+                line = fp.readline(65536)
+            match = None
+        else:
+            match = metadata_tag.search(line) if '<bitbar.' in line else None
+        if match is None:
+            lines_without_tag += 1
+            if lines_without_tag >= (metadata_gap if seen_tag else metadata_header_lines):
+                break
+            continue
+        seen_tag = True
+        lines_without_tag = 0
+        if match.group('lho_tag') != match.group('rho_tag'):
+            error('%s includes mismatched metatags: %s' % (file_full_path, line))
+        else:
+            metadata[match.group('lho_tag')] = match.group('value')
+    return metadata
+
+
+def scan_metadata_full(fp, file_full_path):
+    """The original scanner: search every line of the file.  Kept as the benchmark baseline."""
+    metadata = {}
+    for line in fp:
+        match = re.search("<bitbar.(?P<lho_tag>[^>]+)>(?P<value>[^<]+)</bitbar.(?P<rho_tag>[^>]+)>", line)
+        if match is not None:
+            if match.group('lho_tag') != match.group('rho_tag'):
+                error('%s includes mismatched metatags: %s' % (file_full_path, line))
+            else:
+                metadata[match.group('lho_tag')] = match.group('value')
+    return metadata
+
+
+def inspect_file(file_full_path):
+    """Run every check except linting and the image fetch.
+
+    Returns the linters that match the shebang and the file's metadata, or
+    None if the file can't be checked any further.
+    """
+    lap = profile_laps(file_full_path)
     file_short_name, file_extension = os.path.splitext(file_full_path)
     candidates = Language.getLanguagesForFileExtension(file_extension)
 
     if not candidates:
         error("%s unrecognized file extension" % file_full_path)
-        return
+        return None
     else:
         passed("%s has a recognized file extension" % file_full_path)
 
     if not os.access(file_full_path, os.R_OK):
         error("%s not readable" % file_full_path)
-        return
+        return None
 
     if not os.access(file_full_path, os.X_OK):
         error("%s not executable" % file_full_path)
     else:
         passed("%s is executable" % file_full_path)
+    lap('extension')
 
-    metadata = {}
     linters = []
     with open(file_full_path, "r") as fp:
         first_line = fp.readline().strip()
@@ -179,14 +840,9 @@ def check_file(file_full_path, pr=False):
                   ' or '.join(["'%s'" % candidate.shebang for candidate in candidates])))
         else:
             passed("%s has a good shebang (%s)" % (file_full_path, first_line))
+        lap('shebang')
 
-        for line in fp:
-            match = re.search("<bitbar.(?P<lho_tag>[^>]+)>(?P<value>[^<]+)</bitbar.(?P<rho_tag>[^>]+)>", line)
-            if match is not None:
-                if match.group('lho_tag') != match.group('rho_tag'):
-                    error('%s includes mismatched metatags: %s' % (file_full_path, line))
-                else:
-                    metadata[match.group('lho_tag')] = match.group('value')
+        metadata = scan_metadata(fp, file_full_path)
 
     for key in required_metadata:
         if key not in metadata:
@@ -199,23 +855,38 @@ def check_file(file_full_path, pr=False):
             warn('%s missing recommended metadata for %s' % (file_full_path, key))
         else:
             passed('%s has recommended metadata for %s (%s)' % (file_full_path, key, metadata[key]))
+    lap('metadata')
+
+    return linters, metadata
 
+
+def report_lint_errors(file_full_path, errors):
+    for e in errors:
+        error('%s failed linting with "%s", please correct the following:' %
+              (file_full_path, " ".join(e['linter'].cmd)))
+        print(e['output'].decode('UTF-8'))
+
+
+def check_file(file_full_path, pr=False, image_results=None):
+    """Check one file, looking up its image unless image_results already has it."""
+    inspected = inspect_file(file_full_path)
+    if inspected is None:
+        return
+    linters, metadata = inspected
+
+    lap = profile_laps(file_full_path)
     if metadata.get('image', False):
-        try:
-            response = urlopen(metadata['image'])
-            response_content_type = response.info().get('Content-Type')
-            if response_content_type not in allowed_image_content_types:
-                error('%s image metadata has bad content type: %s' % (file_full_path, response_content_type))
-            else:
-                passed('%s image content type looks good: %s' % (file_full_path, response_content_type))
-        except Exception:
-            warn('%s cannot fetch image: %s' % (file_full_path, metadata['image']))
+        url = metadata['image']
+        if image_results is None or url not in image_results:
+            image_results = image_checker.check([url])
+        report_image(file_full_path, url, image_results[url])
+        lap('image')
 
     errors = []
     for linter in linters:
         try:
             debug('running %s' % " ".join(linter.cmd))
-            linter.lint(file_full_path, pr)
+            lint_cached(linter, file_full_path, pr)
         except subprocess.CalledProcessError as cpe:
             debug('%s failed linting with "%s"' % (file_full_path, " ".join(linter.cmd)))
             errors.append({'linter': linter, 'output': cpe.output})
@@ -224,11 +895,494 @@ def check_file(file_full_path, pr=False):
             passed('%s linted successfully with "%s"' %
                    (file_full_path, " ".join(list(linter.cmd))))
             break
+    lap('lint')
 
-    for e in errors:
-        error('%s failed linting with "%s", please correct the following:' %
-              (file_full_path, " ".join(e['linter'].cmd)))
-        print(e['output'].decode('UTF-8'))
+    report_lint_errors(file_full_path, errors)
+
+
+def captured(func, *func_args):
+    """Call func, returning what it printed and how many errors it reported.
+
+    The errors are left for the caller to add to error_count.
+    """
+    global error_count
+    errors_before = error_count
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        func(*func_args)
+    errors = error_count - errors_before
+    error_count = errors_before
+    return buf.getvalue(), errors
+
+
+def git(*git_args):
+    return subprocess.check_output(['git'] + list(git_args)).decode('UTF-8')
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        digest.update(fp.read())
+    return digest.hexdigest()
+
+
+class ManifestStore(object):
+    """Content hashes of the files a green run validated, saved per commit and kind of run.
+
+    A manifest is {'config': {lint config file: hash}, 'files': {path: hash}}
+    with paths relative to the repository root.  PR runs and full runs lint
+    with different options, so each only trusts manifests saved by its own kind.
+    """
+
+    def __init__(self, path, pr=False):
+        self.path = path
+        self.mode = 'pr' if pr else 'full'
+
+    def manifest_path(self, commit):
+        return os.path.join(self.path, '%s.%s.json' % (commit, self.mode))
+
+    def load(self, commit):
+        try:
+            with open(self.manifest_path(commit), 'r') as fp:
+                return json.load(fp)
+        except (OSError, ValueError):
+            return None
+
+    def latest(self, commits):
+        """Return (commit, manifest) for the first of commits that has a manifest, or (None, None)."""
+        for commit in commits:
+            manifest = self.load(commit)
+            if manifest is not None:
+                return commit, manifest
+        return None, None
+
+    def save(self, commit, manifest):
+        os.makedirs(self.path, exist_ok=True)
+        manifest_path = self.manifest_path(commit)
+        tmp_path = '%s.%d.tmp' % (manifest_path, os.getpid())
+        with open(tmp_path, 'w') as fp:
+            json.dump(manifest, fp, indent=1, sort_keys=True)
+        os.replace(tmp_path, manifest_path)
+
+
+config_hash_memo = {}
+
+
+def config_hash(name):
+    """Hash of lint config file name, or None if it doesn't exist; rehashed only when its stat changes."""
+    try:
+        st = os.stat(name)
+    except OSError:
+        return None
+    stamp = (st.st_mtime_ns, st.st_size)
+    memo = config_hash_memo.get(name)
+    if memo is None or memo[0] != stamp:
+        memo = config_hash_memo[name] = (stamp, file_hash(name))
+    return memo[1]
+
+
+def config_hashes(file=None):
+    """Hashes of the lint config files, or only of those that apply to file."""
+    ext = os.path.splitext(file)[1] if file is not None else None
+    return dict((name, config_hash(name)) for name, exts in lint_config_files.items()
+                if file is None or exts is None or ext in exts)
+
+
+def stale_extensions(manifest, config):
+    """Return the extensions whose lint config changed since manifest, or None if everything is stale."""
+    extensions = set()
+    for name, exts in lint_config_files.items():
+        if manifest['config'].get(name) != config[name]:
+            if exts is None:
+                return None
+            extensions.update(exts)
+    return extensions
+
+
+def changed_files(base):
+    """Return (changed, renames, deleted) since HEAD forked from base, renames being {new path: old path}.
+
+    Changes made on base after the fork aren't included, so a branch that is
+    behind its base isn't charged with files it never touched.
+    """
+    changed, renames, deleted = [], {}, []
+    output = git('diff', '--name-status', '-M', '--diff-filter=ACMRD', '%s...HEAD' % base)
+    for line in output.splitlines():
+        fields = line.split('\t')
+        if fields[0].startswith('R'):
+            renames[fields[2]] = fields[1]
+            changed.append(fields[2])
+        elif fields[0] == 'D':
+            deleted.append(fields[1])
+        else:
+            changed.append(fields[1])
+    return changed, renames, deleted
+
+
+def select_incremental(files, renames, deleted, manifest, config):
+    """Decide which of files need checking against the last green manifest.
+
+    Returns (to_check, validated): the files to check and the manifest file
+    entries that still hold without checking anything.
+    """
+    validated = dict(manifest['files'])
+    stale = stale_extensions(manifest, config)
+    for path in deleted:
+        validated.pop(path, None)
+    for new, old in renames.items():
+        if old in validated:
+            validated[new] = validated.pop(old)
+
+    if stale is None:
+        debug('lint configuration changed, checking every file')
+        return sorted(set(files) | set(validated)), {}
+
+    to_check = set()
+    for path in set(files) | set(p for p in validated if os.path.splitext(p)[1] in stale):
+        if not os.path.exists(path):
+            validated.pop(path, None)
+        elif os.path.splitext(path)[1] in stale:
+            debug('%s lint configuration changed, checking %s' % (os.path.splitext(path)[1], path))
+            validated.pop(path, None)
+            to_check.add(path)
+        elif validated.get(path) == file_hash(path):
+            if path in renames:
+                debug('%s was moved from %s unchanged, not checking it again' % (path, renames[path]))
+            else:
+                debug('%s unchanged since the last green run' % path)
+        else:
+            validated.pop(path, None)
+            to_check.add(path)
+    return sorted(to_check), validated
+
+
+def incremental_files(manifests, config, pr, files):
+    """Pick the files an --incremental run checks, from the last green manifest of its kind.
+
+    Returns (to_check, validated, considered): to_check and validated as for
+    select_incremental, and how many files were looked at.  Returns None if
+    there is no manifest to go on, or if a full run was given files to check.
+    """
+    manifest_commit, manifest = manifests.latest(git('rev-list', '--max-count=500', 'HEAD').split())
+    if manifest is None:
+        return None
+    debug('last green manifest is for %s' % manifest_commit)
+
+    if pr:
+        changed, renames, deleted = changed_files('origin/%s' % os.environ.get('TRAVIS_BRANCH', 'master'))
+        return select_incremental(changed, renames, deleted, manifest, config) + (len(changed),)
+    if files:
+        return None
+    # a full run still needs to check only what changed since the last green one
+    tracked = [os.path.relpath(f) for f in collect_files([])]
+    previous = set(manifest['files'])
+    return select_incremental(tracked, {}, [p for p in previous if not os.path.exists(p)],
+                              manifest, config) + (len(tracked),)
+
+
+class InotifyWatcher(object):
+    """Reports paths written, created, moved into or chmodded under a directory tree, using Linux inotify."""
+
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_ISDIR = 0x40000000
+    event_header = struct.Struct('iIII')
+
+    def __init__(self, root):
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.dirs = {}
+        self.add_tree(root)
+
+    @staticmethod
+    def available():
+        return sys.platform.startswith('linux') and ctypes.util.find_library('c') is not None
+
+    def add_tree(self, root):
+        for path, dirs, _ in os.walk(root):
+            dirs[:] = [d for d in dirs if not d.startswith('.')]
+            mask = self.IN_ATTRIB | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+            if wd >= 0:
+                self.dirs[wd] = path
+
+    def events(self, timeout):
+        """Return the paths touched within timeout seconds (None blocks until something happens)."""
+        touched = set()
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return touched
+        data = os.read(self.fd, 65536)
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = self.event_header.unpack_from(data, offset)
+            offset += self.event_header.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b'\0'))
+            offset += length
+            if wd not in self.dirs or not name:
+                continue
+            path = os.path.join(self.dirs[wd], name)
+            if mask & self.IN_ISDIR:
+                if not name.startswith('.'):
+                    self.add_tree(path)
+            else:
+                touched.add(path)
+        return touched
+
+
+class PollingWatcher(object):
+    """Reports changed plugins by comparing stat results, for systems without inotify."""
+
+    def __init__(self, root, interval=0.25):
+        self.root = root
+        self.interval = interval
+        self.state = self.snapshot()
+
+    def snapshot(self):
+        state = {}
+        with redirect_stdout(io.StringIO()):
+            for path in collect_files([]):
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                state[path] = (st.st_mtime_ns, st.st_size, st.st_mode)
+        return state
+
+    def events(self, timeout):
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            state = self.snapshot()
+            touched = set(path for path, st in state.items() if self.state.get(path) != st)
+            self.state = state
+            if touched or (deadline is not None and time.time() >= deadline):
+                return touched
+            time.sleep(self.interval if deadline is None else min(self.interval, max(0, deadline - time.time())))
+
+
+def watch(pr=False, debounce=0.1):
+    """Re-check plugins as they are saved, printing their results and a running summary."""
+    global error_count, lint_cache
+    lint_cache = MemoryLintCache(lint_cache)
+    watcher = InotifyWatcher('.') if InotifyWatcher.available() else PollingWatcher('.')
+    # path -> (content hash, mode, output, errors) of the last check, so saves that
+    # don't change a file are answered without checking it again
+    results = {}
+    print('watching %s for changes with %s, ctrl-c to stop' % (os.getcwd(), type(watcher).__name__), flush=True)
+    try:
+        while True:
+            touched = watcher.events(None)
+            # wait for a burst of saves to finish before checking anything
+            while True:
+                more = watcher.events(debounce)
+                if not more:
+                    break
+                touched |= more
+
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                files = collect_files([os.path.relpath(p) for p in sorted(touched) if os.path.isfile(p)])
+            for file_full_path in files:
+                try:
+                    key = (file_hash(file_full_path), os.stat(file_full_path).st_mode)
+                except OSError:
+                    continue
+                previous = results.get(file_full_path)
+                if previous is not None and previous[:2] == key:
+                    output, errors = previous[2:]
+                else:
+                    output, errors = captured(check_file, file_full_path, pr)
+                    results[file_full_path] = key + (output, errors)
+                print(output, end='')
+
+            if files:
+                failing = sum(1 for r in results.values() if r[3])
+                error_count = sum(r[3] for r in results.values())
+                print('%s  checked %i file%s in %.0f ms: %i passing, %i failing' % (
+                    time.strftime('%H:%M:%S'), len(files), '' if len(files) == 1 else 's',
+                    (time.perf_counter() - start) * 1000, len(results) - failing, failing), flush=True)
+    except KeyboardInterrupt:
+        print()
+
+
+def check_file_captured(file_full_path, pr=False, image_results=None):
+    """Run check_file, returning its output, error count and profile instead of printing them."""
+    output, errors = captured(check_file, file_full_path, pr, image_results)
+    if profiler is None:
+        return output, errors, None
+    profiler.add_errors(file_full_path, errors)
+    return output, errors, profiler.take(file_full_path)
+
+
+def open_lint_cache():
+    if args.no_cache:
+        return None
+    return LintCache(os.path.join(args.cache_dir, 'lint'), args.cache_size)
+
+
+def open_image_checker():
+    if args.no_cache:
+        return ImageChecker()
+    return ImageChecker(os.path.join(args.cache_dir, 'images.json'), args.image_ttl)
+
+
+def init_worker(worker_args, slots):
+    global args, lint_cache, image_checker, profiler
+    args = worker_args
+    lint_cache = open_lint_cache()
+    image_checker = open_image_checker()
+    profiler = Profiler() if args.profile or args.profile_junit else None
+    if not Language._languages:
+        # missing linters were already reported by the parent process
+        with redirect_stdout(io.StringIO()):
+            register_languages()
+    Language._slots = slots
+
+
+def image_urls(files):
+    """Return {file: bitbar.image URL} for the files that have one, reporting nothing."""
+    images = {}
+    for file_full_path in files:
+        found = []
+        try:
+            with open(file_full_path, 'r') as fp:
+                captured(lambda: found.append(scan_metadata(fp, file_full_path)))
+        except (OSError, UnicodeDecodeError):
+            continue
+        if found[0].get('image', False):
+            images[file_full_path] = found[0]['image']
+    return images
+
+
+def add_image_profile(file_full_path, images):
+    if profiler is not None and file_full_path in images:
+        # files sharing an image URL share the time it took to check
+        profiler.add(file_full_path, 'image', *image_checker.timings.get(images[file_full_path], (0.0, 0.0)))
+
+
+def check_files(files, pr=False, jobs=1, linter_jobs=None):
+    """Check files one at a time, or in a pool of jobs worker processes.
+
+    Every image URL is looked up up front, concurrently and in one go, so the
+    image cache is written once by this process instead of once per file.
+    """
+    global error_count
+    images = image_urls(files)
+    image_results = image_checker.check(images.values())
+    if jobs <= 1:
+        for file_full_path in files:
+            errors_before = error_count
+            check_file(file_full_path, pr, image_results)
+            if profiler is not None:
+                profiler.add_errors(file_full_path, error_count - errors_before)
+            add_image_profile(file_full_path, images)
+        return
+
+    Language.limitConcurrency(linter_jobs or jobs)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                             initargs=(args, Language._slots)) as executor:
+        for file_full_path, (output, errors, profile) in zip(
+                files, executor.map(check_file_captured, files, [pr] * len(files),
+                                    [image_results] * len(files))):
+            print(output, end='', flush=True)
+            error_count += errors
+            if profiler is not None:
+                profiler.merge(file_full_path, profile)
+            add_image_profile(file_full_path, images)
+
+
+def inspect_file_captured(file_full_path):
+    inspected = []
+    output, errors = captured(lambda: inspected.append(inspect_file(file_full_path)))
+    return output, errors, inspected[0]
+
+
+def check_files_batched(files, pr=False, jobs=1, linter_jobs=None, batch_size=50):
+    """Check files, running each linter once per chunk of files instead of once per file.
+
+    Output is still printed per file, in the order the files were given.
+    """
+    global error_count
+    outputs = {}
+    file_errors = {}
+    pending = {}
+    images = {}
+    for file_full_path in files:
+        output, errors, inspected = inspect_file_captured(file_full_path)
+        outputs[file_full_path] = [output]
+        file_errors[file_full_path] = errors
+        error_count += errors
+        if inspected is None:
+            continue
+        linters, metadata = inspected
+        if linters:
+            pending[file_full_path] = list(linters)
+        if metadata.get('image', False):
+            images[file_full_path] = metadata['image']
+
+    image_results = image_checker.check(images.values())
+    for file_full_path, url in images.items():
+        output, errors = captured(report_image, file_full_path, url, image_results[url])
+        outputs[file_full_path].append(output)
+        file_errors[file_full_path] += errors
+        error_count += errors
+        add_image_profile(file_full_path, images)
+
+    executor = None
+    if jobs > 1:
+        Language.limitConcurrency(linter_jobs or jobs)
+        executor = ProcessPoolExecutor(max_workers=jobs, initializer=init_worker,
+                                       initargs=(args, Language._slots))
+
+    failures = dict((f, []) for f in pending)
+    try:
+        # every round tries the next candidate linter for files that haven't passed yet
+        while pending:
+            by_linter = {}
+            for f, linters in pending.items():
+                by_linter.setdefault(linters.pop(0).index, []).append(f)
+
+            tasks = []
+            for index, linter_files in by_linter.items():
+                size = batch_size if Language._registered[index].batch is not None else 1
+                size = max(1, min(size, -(-len(linter_files) // jobs)))
+                for start in range(0, len(linter_files), size):
+                    tasks.append((index, linter_files[start:start + size]))
+
+            if executor is None:
+                results = [lint_batch(index, chunk, pr) for index, chunk in tasks]
+            else:
+                results = list(executor.map(lint_batch, *zip(*[(index, chunk, pr) for index, chunk in tasks])))
+
+            for (index, chunk), (result, (wall, cpu)) in zip(tasks, results):
+                linter = Language._registered[index]
+                for f in chunk:
+                    if profiler is not None:
+                        profiler.add(f, 'lint', wall / len(chunk), cpu / len(chunk))
+                    ok, output = result[f]
+                    if ok:
+                        failures[f] = []
+                        del pending[f]
+                        outputs[f].append(captured(passed, '%s linted successfully with "%s"' %
+                                                   (f, " ".join(list(linter.cmd))))[0])
+                    else:
+                        failures[f].append({'linter': linter, 'output': output})
+                        if not pending[f]:
+                            del pending[f]
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    for file_full_path in files:
+        print(''.join(outputs[file_full_path]), end='')
+        output, errors = captured(report_lint_errors, file_full_path, failures.get(file_full_path, []))
+        print(output, end='', flush=True)
+        error_count += errors
+        if profiler is not None:
+            profiler.add_errors(file_full_path, errors + file_errors[file_full_path])
 
 
 def boolean_string(string):
@@ -237,53 +1391,444 @@ def boolean_string(string):
     return True
 
 
-parser = argparse.ArgumentParser()
-parser.add_argument(
-    '--pr', action='store', nargs='?', const="True",
-    default=os.environ.get('TRAVIS_PULL_REQUEST', "False"),
-    type=boolean_string,
-    help='Run tests on changes from the root branch to HEAD.  verbose is implied!')
-parser.add_argument('--verbose', '-v', action='store_true', help='Turn on success and other non-critical messages')
-parser.add_argument('--debug', action='store_true', help='Turn on debug messages')
-parser.add_argument('--no-warn', action='store_false', dest='warn', help='Disable warnings', default=True)
-parser.add_argument('files', nargs=argparse.REMAINDER)
-args = parser.parse_args()
-
-if args.pr:
-    output = subprocess.check_output(['git', 'diff', '--name-only', '--diff-filter=ACMR',
-                                      'origin/%s..HEAD' %
-                                      os.environ.get('TRAVIS_BRANCH', 'master')]).strip()
-    if not output:
-        warn('No changed files in this PR... weird...')
-        exit(0)
+def job_count(string):
+    value = int(string)
+    if value < 0:
+        raise argparse.ArgumentTypeError("%s is not a valid job count" % string)
+    return value or os.cpu_count() or 1
+
+
+def collect_files(files):
+    """Return full paths of the plugins among files, or of every plugin in the tree if files is empty."""
+    files = list(files)
+    if not files:
+        for root, dirs, files_in_folder in os.walk("."):
+            for _file in files_in_folder:
+                files.append(os.path.join(root, _file).strip())
+
+            skip = [d for d in dirs if d.startswith(".")]
+            for d in skip:
+                debug('skipping directory %s' % d)
+                dirs.remove(d)
+
+    to_check = []
+    for _file in files:
+        file_name, file_ext = os.path.splitext(_file)
+        components = _file.split('/')
+        if components[0] == ".":
+            del components[0]
+        if any(s[0] == '.' for s in components):
+            debug('skipping file %s' % _file)
+        elif file_ext in ignore_file_types:
+            debug('ignoring file by type %s' % _file)
+        elif components[-1] in ignore_file_names:
+            debug('ignoring file by name %s' % _file)
+        else:
+            debug('checking file %s' % _file)
+            to_check.append(os.path.normpath(os.path.join(os.getcwd(), _file)))
+    return to_check
+
+
+def bench_scan(files, repeat):
+    """Time scan_metadata against scan_metadata_full over files, checking they agree."""
+    timings = {}
+    results = {}
+    for scanner in (scan_metadata_full, scan_metadata):
+        best = None
+        for _ in range(repeat):
+            found = {}
+            start = time.perf_counter()
+            with redirect_stdout(io.StringIO()):
+                for file_full_path in files:
+                    with open(file_full_path, "r", errors='replace') as fp:
+                        fp.readline()
+                        found[file_full_path] = scanner(fp, file_full_path)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        timings[scanner.__name__] = best
+        results[scanner.__name__] = found
+
+    differ = [f for f in files if results['scan_metadata'][f] != results['scan_metadata_full'][f]]
+    for f in differ:
+        print('metadata differs for %s' % f)
+    for name, elapsed in timings.items():
+        print('%-18s %8.1f ms for %i files (best of %i)' % (name, elapsed * 1000, len(files), repeat))
+    print('speedup: %.1fx' % (timings['scan_metadata_full'] / timings['scan_metadata']))
+    return 1 if differ else 0
+
+
+def lint_trimmed_legacy(language, file, is_pr):
+    """The original trimmed lint: a NamedTemporaryFile per file.  Kept as the benchmark baseline."""
+    with open(file, 'r') as fp:
+        lines = fp.readlines()[1:]
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as t:
+            file = t.name
+            t.writelines(lines)
+    command = list(language.cmd)
+    command.extend(language.options(is_pr))
+    command.append(file)
+    result = language.run(command)
+    os.remove(file)
+    return result
+
+
+def bench_trim(files, repeat, copies, linter):
+    """Time trimmed linting through the scratch directory against the original temp file round trip."""
+    sources = [f for f in files if os.path.splitext(f)[1] == '.go']
+    if not sources:
+        print('no .go plugins to benchmark with')
+        return 1
+    language = Language(['.go'], 'gorun$', linter, trim_shebang=True)
+    if not language.enabled:
+        return 1
+
+    workdir = tempfile.mkdtemp(prefix='bitbar-bench-')
+    try:
+        plugins = []
+        for i in range(copies):
+            source = sources[i % len(sources)]
+            plugins.append(os.path.join(workdir, '%i-%s' % (i, os.path.basename(source))))
+            shutil.copy(source, plugins[-1])
+
+        timings = {}
+        for name, lint in (('temp file', lambda f: lint_trimmed_legacy(language, f, False)),
+                           ('scratch dir', lambda f: language.lint(f, False))):
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                for plugin in plugins:
+                    try:
+                        lint(plugin)
+                    except subprocess.CalledProcessError:
+                        pass
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            timings[name] = best
+            print('%-12s %8.1f ms for %i files with "%s" (best of %i)' % (
+                name, best * 1000, len(plugins), " ".join(linter), repeat))
+        print('speedup: %.2fx' % (timings['temp file'] / timings['scratch dir']))
+    finally:
+        shutil.rmtree(workdir)
+    return 0
+
+
+def bench_main(argv):
+    global args
+    parser = argparse.ArgumentParser(prog='.test.py bench', description='Benchmark parts of the test harness')
+    parser.add_argument('what', choices=['scan', 'trim'],
+                        help='scan: compare the metadata scanners; trim: compare ways of linting without the shebang')
+    parser.add_argument('--repeat', type=job_count, default=5, help='Keep the best of this many runs (default: %(default)s)')
+    parser.add_argument('--copies', type=job_count, default=200,
+                        help='trim: lint this many copies of the .go plugins (default: %(default)s)')
+    parser.add_argument('--linter', default='golint -set_exit_status',
+                        help='trim: the linter command to run (default: %(default)s)')
+    parser.add_argument('--debug', action='store_true', help='Turn on debug messages')
+    parser.add_argument('files', nargs='*')
+    args = parser.parse_args(argv)
+    args.verbose = args.warn = False
+
+    files = collect_files(args.files)
+    if args.what == 'trim':
+        return bench_trim(files, args.repeat, args.copies, shlex.split(args.linter))
+    return bench_scan(files, args.repeat)
+
+
+def shebang_interpreter(shebang):
+    """Return the interpreter a shebang line runs, looking through /usr/bin/env and its options."""
+    words = shebang[2:].split() if shebang.startswith('#!') else []
+    if words and os.path.basename(words[0]) == 'env':
+        words = [w for w in words[1:] if not w.startswith('-') and '=' not in w]
+    return os.path.basename(words[0]) if words else None
+
+
+class Catalog(object):
+    """An index of plugin metadata kept as JSON, mirrored into SQLite for queries.
+
+    build() only rescans files whose mtime changed since the last build.
+    """
+
+    schema = '''
+        CREATE TABLE IF NOT EXISTS plugins (
+            path TEXT PRIMARY KEY, title TEXT, author TEXT, author_github TEXT, version TEXT,
+            description TEXT, extension TEXT, interval TEXT, interval_seconds INTEGER,
+            shebang TEXT, interpreter TEXT, mtime REAL);
+        CREATE TABLE IF NOT EXISTS dependencies (path TEXT, dependency TEXT);
+        CREATE INDEX IF NOT EXISTS dependencies_by_name ON dependencies (dependency);
+        CREATE INDEX IF NOT EXISTS dependencies_by_path ON dependencies (path);
+        CREATE INDEX IF NOT EXISTS plugins_by_interval ON plugins (interval_seconds);
+        CREATE INDEX IF NOT EXISTS plugins_by_interpreter ON plugins (interpreter);
+    '''
+
+    def __init__(self, json_path, db_path):
+        self.json_path = json_path
+        self.db_path = db_path
+        self.entries = {}
+        try:
+            with open(json_path, 'r') as fp:
+                self.entries = json.load(fp)
+        except (OSError, ValueError):
+            pass
+
+    @staticmethod
+    def scan(file_full_path, rel_path):
+        with open(file_full_path, 'r', errors='replace') as fp:
+            shebang = fp.readline().strip()
+            with redirect_stdout(io.StringIO()):
+                metadata = scan_metadata(fp, file_full_path)
+        interval, seconds = parse_interval(rel_path)
+        dependencies = []
+        for dependency in re.split(r'[,;()]', metadata.get('dependencies', '')):
+            dependency = dependency.strip().lower()
+            if dependency and dependency not in dependencies:
+                dependencies.append(dependency)
+        return {
+            'path': rel_path,
+            'title': metadata.get('title'),
+            'author': metadata.get('author'),
+            'author_github': metadata.get('author.github'),
+            'version': metadata.get('version'),
+            'description': metadata.get('desc'),
+            'dependencies': dependencies,
+            'extension': os.path.splitext(rel_path)[1],
+            'interval': interval,
+            'interval_seconds': seconds,
+            'shebang': shebang,
+            'interpreter': shebang_interpreter(shebang),
+            'mtime': os.stat(file_full_path).st_mtime,
+        }
+
+    def build(self, files):
+        """Bring the catalog up to date with files, returning (rescanned, removed) counts."""
+        root = os.getcwd()
+        seen = set()
+        changed = []
+        for file_full_path in files:
+            rel_path = os.path.relpath(file_full_path, root)
+            seen.add(rel_path)
+            entry = self.entries.get(rel_path)
+            if entry is None or entry['mtime'] != os.stat(file_full_path).st_mtime:
+                self.entries[rel_path] = self.scan(file_full_path, rel_path)
+                changed.append(rel_path)
+        # building from a few files leaves the rest of the catalog alone; only deleted plugins go
+        removed = [path for path in self.entries
+                   if path not in seen and not os.path.exists(os.path.join(root, path))]
+        for path in removed:
+            del self.entries[path]
+
+        db = sqlite3.connect(self.db_path)
+        with db:
+            db.executescript(self.schema)
+            if not db.execute('SELECT count(*) FROM plugins').fetchone()[0]:
+                # a new or deleted database needs every entry, not just the changed ones
+                changed = list(self.entries)
+            for path in changed + removed:
+                db.execute('DELETE FROM plugins WHERE path = ?', (path,))
+                db.execute('DELETE FROM dependencies WHERE path = ?', (path,))
+            for path in changed:
+                entry = self.entries[path]
+                db.execute('INSERT INTO plugins VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', (
+                    path, entry['title'], entry['author'], entry['author_github'], entry['version'],
+                    entry['description'], entry['extension'], entry['interval'], entry['interval_seconds'],
+                    entry['shebang'], entry['interpreter'], entry['mtime']))
+                db.executemany('INSERT INTO dependencies VALUES (?, ?)',
+                               [(path, dependency) for dependency in entry['dependencies']])
+        db.close()
+
+        tmp_path = '%s.%d.tmp' % (self.json_path, os.getpid())
+        with open(tmp_path, 'w') as fp:
+            json.dump(self.entries, fp, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.json_path)
+        return len(changed), len(removed)
+
+    def query(self, depends=None, interval=None, interpreter=None, shebang=None, extension=None, author=None):
+        """Return the catalog entries matching every given condition, sorted by path."""
+        clauses = []
+        params = []
+        if depends is not None:
+            clauses.append('path IN (SELECT path FROM dependencies WHERE dependency = ?)')
+            params.append(depends.lower())
+        if interval is not None:
+            clauses.append('interval_seconds = ?')
+            params.append(interval)
+        if interpreter is not None:
+            clauses.append('interpreter = ?')
+            params.append(interpreter)
+        if shebang is not None:
+            clauses.append('instr(shebang, ?) > 0')
+            params.append(shebang)
+        if extension is not None:
+            clauses.append('extension = ?')
+            params.append(extension)
+        if author is not None:
+            clauses.append('(author = ? OR author_github = ?)')
+            params.extend([author, author])
+        sql = 'SELECT path FROM plugins'
+        if clauses:
+            sql += ' WHERE ' + ' AND '.join(clauses)
+        db = sqlite3.connect(self.db_path)
+        try:
+            paths = [row[0] for row in db.execute(sql + ' ORDER BY path', params)]
+        finally:
+            db.close()
+        return [self.entries[path] for path in paths if path in self.entries]
+
+
+def interval_seconds(string):
+    text, seconds = parse_interval('plugin.%s.sh' % string)
+    if seconds is None:
+        raise argparse.ArgumentTypeError("%s is not an interval like 30s, 5m, 1h or 1d" % string)
+    return seconds
+
+
+def catalog_main(argv):
+    global args
+    parser = argparse.ArgumentParser(prog='.test.py catalog', description='Build and query an index of plugin metadata')
+    parser.add_argument('--json', dest='json_path', default=os.path.join('.catalog', 'plugins.json'),
+                        help='Catalog JSON file (default: %(default)s)')
+    parser.add_argument('--db', dest='db_path', default=os.path.join('.catalog', 'plugins.sqlite'),
+                        help='Catalog SQLite index (default: %(default)s)')
+    parser.add_argument('--debug', action='store_true', help='Turn on debug messages')
+    commands = parser.add_subparsers(dest='command')
+    commands.required = True
+    build = commands.add_parser('build', help='Scan plugins changed since the last build')
+    build.add_argument('files', nargs=argparse.REMAINDER)
+    query = commands.add_parser('query', help='List plugins matching every given condition')
+    query.add_argument('--depends', help='Plugins listing this in bitbar.dependencies, e.g. requests')
+    query.add_argument('--interval', type=interval_seconds, help='Plugins refreshing this often, e.g. 1s')
+    query.add_argument('--interpreter', help='Plugins whose shebang runs this, e.g. python2')
+    query.add_argument('--shebang', help='Plugins whose shebang contains this text')
+    query.add_argument('--extension', help='Plugins with this file extension, e.g. .py')
+    query.add_argument('--author', help='Plugins by this author or GitHub user')
+    query.add_argument('--full', action='store_true', help='Print whole catalog entries as JSON')
+    args = parser.parse_args(argv)
+    args.verbose = args.warn = False
+
+    for path in (args.json_path, args.db_path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+    catalog = Catalog(args.json_path, args.db_path)
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        rescanned, removed = catalog.build(collect_files(args.files))
+        print('%i plugins catalogued, %i rescanned, %i removed in %.0f ms' % (
+            len(catalog.entries), rescanned, removed, (time.perf_counter() - start) * 1000))
+        return 0
+
+    if not os.path.exists(args.db_path):
+        catalog.build(collect_files([]))
+    entries = catalog.query(args.depends, args.interval, args.interpreter, args.shebang, args.extension, args.author)
+    for entry in entries:
+        print(json.dumps(entry, sort_keys=True) if args.full else entry['path'])
+    return 0
+
+
+def main():
+    global args, lint_cache, image_checker, profiler
+    if sys.argv[1:2] == ['bench']:
+        exit(bench_main(sys.argv[2:]))
+    if sys.argv[1:2] == ['catalog']:
+        exit(catalog_main(sys.argv[2:]))
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--pr', action='store', nargs='?', const="True",
+        default=os.environ.get('TRAVIS_PULL_REQUEST', "False"),
+        type=boolean_string,
+        help='Run tests on changes from the root branch to HEAD.  verbose is implied!')
+    parser.add_argument('--verbose', '-v', action='store_true', help='Turn on success and other non-critical messages')
+    parser.add_argument('--debug', action='store_true', help='Turn on debug messages')
+    parser.add_argument('--no-warn', action='store_false', dest='warn', help='Disable warnings', default=True)
+    parser.add_argument('--jobs', '-j', type=job_count, default=1,
+                        help='Check this many files in parallel, 0 for one per CPU (default: 1)')
+    parser.add_argument('--linter-jobs', type=job_count, default=None,
+                        help='Run at most this many copies of any one linter at once (default: --jobs)')
+    parser.add_argument('--no-batch', action='store_true',
+                        help='Run linters once per file even if they can check many files at once')
+    parser.add_argument('--batch-size', type=job_count, default=50,
+                        help='Hand at most this many files to one linter run (default: %(default)s)')
+    parser.add_argument('--profile', metavar='FILE',
+                        help='Write per-file, per-phase wall and CPU times to FILE as JSON')
+    parser.add_argument('--profile-junit', metavar='FILE', help='Write the same timings to FILE as JUnit XML')
+    parser.add_argument('--profile-top', type=int, default=10, metavar='N',
+                        help='When profiling, print the N slowest files (default: %(default)s)')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running, re-checking plugins whenever they are saved')
+    parser.add_argument('--debounce', type=int, default=100,
+                        help='In --watch mode, wait for this many ms without changes before checking (default: %(default)s)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only check files that changed since the last green run, and record this run if green')
+    parser.add_argument('--no-cache', action='store_true', help='Always run linters, ignoring cached results')
+    parser.add_argument('--cache-dir', default=default_cache_dir,
+                        help='Where to keep cached lint and image check results (default: %(default)s)')
+    parser.add_argument('--image-ttl', type=int, default=86400,
+                        help='Trust cached image content types for this many seconds (default: %(default)s)')
+    parser.add_argument('--cache-size', type=int, default=5000,
+                        help='Keep at most this many cached lint results (default: %(default)s)')
+    parser.add_argument('files', nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+
+    if args.profile or args.profile_junit:
+        profiler = Profiler()
+    register_languages()
+    lint_cache = open_lint_cache()
+    image_checker = open_image_checker()
+
+    if args.watch:
+        watch(args.pr, args.debounce / 1000.0)
+        return
+
+    manifests = selected = None
+    validated = {}
+    if args.incremental:
+        manifests = ManifestStore(os.path.join(args.cache_dir, 'manifests'), args.pr)
+        head = git('rev-parse', 'HEAD').strip()
+        config = config_hashes()
+        selected = incremental_files(manifests, config, args.pr, args.files)
+
+    if selected is not None:
+        files, validated, considered = selected
+        if args.pr:
+            args.verbose = True
+        if not files:
+            passed('All %i %sfiles were validated by an earlier green run' % (considered, 'changed ' if args.pr else ''))
+        to_check = collect_files(files) if files else []
+    elif args.pr:
+        output = subprocess.check_output(['git', 'diff', '--name-only', '--diff-filter=ACMR',
+                                          'origin/%s..HEAD' %
+                                          os.environ.get('TRAVIS_BRANCH', 'master')]).strip()
+        if not output:
+            warn('No changed files in this PR... weird...')
+            exit(0)
+        else:
+            args.files = output.decode("UTF-8").split('\n')
+        args.verbose = True
+        to_check = collect_files(args.files)
     else:
-        args.files = output.decode("UTF-8").split('\n')
-    args.verbose = True
-elif not args.files:
-    for root, dirs, files_in_folder in os.walk("."):
-        for _file in files_in_folder:
-            args.files.append(os.path.join(root, _file).strip())
-
-        skip = [d for d in dirs if d.startswith(".")]
-        for d in skip:
-            debug('skipping directory %s' % d)
-            dirs.remove(d)
-
-for _file in args.files:
-    file_name, file_ext = os.path.splitext(_file)
-    components = _file.split('/')
-    if components[0] == ".":
-        del components[0]
-    if any(s[0] == '.' for s in components):
-        debug('skipping file %s' % _file)
-    elif file_ext in ignore_file_types:
-        debug('ignoring file by type %s' % _file)
-    elif components[-1] in ignore_file_names:
-        debug('ignoring file by name %s' % _file)
+        to_check = collect_files(args.files)
+    if args.no_batch:
+        check_files(to_check, args.pr, args.jobs, args.linter_jobs)
     else:
-        debug('checking file %s' % _file)
-        check_file(os.path.join(os.getcwd(), _file), args.pr)
+        check_files_batched(to_check, args.pr, args.jobs, args.linter_jobs, args.batch_size)
+    if lint_cache is not None:
+        lint_cache.prune()
+
+    if profiler is not None:
+        if args.profile:
+            profiler.write_json(args.profile)
+        if args.profile_junit:
+            profiler.write_junit(args.profile_junit)
+        profiler.summary(args.profile_top)
+
+    if error_count > 0:
+        error('failed with %i errors' % error_count)
+        exit(1)
+
+    if manifests is not None:
+        for file_full_path in to_check:
+            validated[os.path.relpath(file_full_path)] = file_hash(file_full_path)
+        manifests.save(head, {'config': config, 'files': validated})
+
 
-if error_count > 0:
-    error('failed with %i errors' % error_count)
-    exit(1)
+if __name__ == '__main__':
+    main()
@@ -10,6 +10,8 @@
 # <bitbar.abouturl>https://github.com/cchen408/bitbar-c20</bitbar.abouturl>
 
 import json
+import os
+import sys
 from urllib import urlopen
 
 # change this to the number of C20 tokens that you own
@@ -60,40 +62,15 @@ symbol_path_map = {
     'BTG': 'bitcoin-gold'
 }
 
-# symbol to icon map
-# To generate the images, grab the image (PNG) and increase the DPI from 72 to
-# 144. Then resize the image to 32x32. Finally encode the image into base 64.
-# i.e. base64 --input bitcoin.png
-# Then add the resulting encoded text to the correct map entry below.
-symbol_image_map = {
-    'C20': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAlCAYAAAAjt+tHAAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAADRGlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp4bXA9Imh0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8iCiAgICAgICAgICAgIHhtbG5zOnRpZmY9Imh0dHA6Ly9ucy5hZG9iZS5jb20vdGlmZi8xLjAvIgogICAgICAgICAgICB4bWxuczpleGlmPSJodHRwOi8vbnMuYWRvYmUuY29tL2V4aWYvMS4wLyI+CiAgICAgICAgIDx4bXA6TW9kaWZ5RGF0ZT4yMDE3LTExLTIwVDA3OjExOjYzPC94bXA6TW9kaWZ5RGF0ZT4KICAgICAgICAgPHhtcDpDcmVhdG9yVG9vbD5QaXhlbG1hdG9yIDMuNzwveG1wOkNyZWF0b3JUb29sPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICAgICA8dGlmZjpSZXNvbHV0aW9uVW5pdD4yPC90aWZmOlJlc29sdXRpb25Vbml0PgogICAgICAgICA8dGlmZjpDb21wcmVzc2lvbj41PC90aWZmOkNvbXByZXNzaW9uPgogICAgICAgICA8ZXhpZjpQaXhlbFhEaW1lbnNpb24+Mjg8L2V4aWY6UGl4ZWxYRGltZW5zaW9uPgogICAgICAgICA8ZXhpZjpDb2xvclNwYWNlPjE8L2V4aWY6Q29sb3JTcGFjZT4KICAgICAgICAgPGV4aWY6UGl4ZWxZRGltZW5zaW9uPjMyPC9leGlmOlBpeGVsWURpbWVuc2lvbj4KICAgICAgPC9yZGY6RGVzY3JpcHRpb24+CiAgIDwvcmRmOlJERj4KPC94OnhtcG1ldGE+Cl8ldHMAAAZoSURBVFgJxVhdbBRVFL73zuzO7rbbXeh/y6+tpbZoVMBQIXFTVEAgUqVCFIwxUcQXH9DEB2L6ZHwxxkQxmOAToqSYEK1SJGAVSBOoJj4UoUbaCF3Wli3d/52dmXs9Z9rCzu6sbKvBm8zOzJ3z891zzj33nJXIHEdXICD/Wr96jXvR8sVvN1QE+0ZG+FxE0bkw1bVvfzgaT7+a0I2NyO+WpeP+UtenwdNHfpmtvFkBqAnsWDKRTG3nXHQYXDQLwX2okFIWkSi95GGsp8LvOXLl5OHfiwVSFICGjl1VodHYOk3wTRoX7UKQWiLA4njhoAxBEBA25pSlPpfMerwV/lNXv/4sOEVQ+PcfATR3vFjuSOoPjURT6xMZbSsntJEIEMZ1e4lMAiCUMEZGSpyOYwvLy04QRTo/2H1wwp4BsNt9CAReco1psYYxmT0VVbVXNJ3fKzislht25PlzCARQKBIbdkmOj3SD9PoZGb7W353KJbYC6OyU6ifc/mgquTalZfYYgq8XqNP8yWVF31PTB0IIlv8VZsAtuEZZlk74FOcBByVnQ+taw6Sra9p3hEjZjAtqWleNx1P71Iy2zxCihRim9myS6Wcws8R0X0nJny6nM5IxdC/EhQ0I9JcgoK1R1fRNacEX1F2fGI0OXxydEWpaoLy9s15NGq+ldX2bzvk9EFxOAhLzxrSPwc2D85yOA21NDb1I0z/0x4abGW03sLSCNexdBUwQqBmZsWGHTI96JPf+G+e+DFL3ii2LMoS/zwUNAHMFIs5TTsFQkgTm4kFZkj9XmDg6XyFDI33HJhHAksBW/4RKmlROt+mG/oJBWJ1pvVzXIQgMO0rDTIgfnIztpb61zz4eTaiHBKXVedENDESSCeX8huJgJ32M9viI88eh/u5bJkQAM6OprbM+QjKPRbjYrGr8CcFYBTFgx+Rak4FMIkJlHmWXTCXmpYxyM8pnJE3dBRgjLhMxUOaUvnH5nd8Fe7sv/2WlsbxNAztct6Hz5/SkPhDVtS26ICuAqBSu2wEP+QN2iYBI8sp0atkWh2NS8SqO2MIyT3fYMA6ETh25YNF0hxcECiSXa9ZtP1MuSbuvRpOdMVUrg8yZzSmoxPX8yAVzgVVIpb/02rvvvfnObJVna0DeD0BG5bzSUZSZ5wogzgcAkxjJkOvTS8vLU/B823TZ0ot4Rt4akGEYAuXYctgCMDUCcyqZtP1uK6nAZCoJSwdZhVZRUAHiTSZYIb4C6vKnw+NjzH7tQEspbBQCeyJ3AAeYjKtu3RI1uWTFvKcVOD/h/DYPsRwG2AcOuCDDZG8R3KEwAS4TJeC8HJ5Zv1a6a0A7bHOT02JQiroZFbkJH8iBGJNWQpIsHLPWDgzjqRD4UUz70rIegboZz0t/qB0BUMbDquWwmgsAl+pgkHTMDJzLz6nQCgYh+sHtKbFAzhVQzHt5ZRUvaEbYHbYAUCt8EUr1vw9Ct8eAvEsLZIECiQjLKokx1/i46oLnOVsBeYOJhAtCyY0y7YbkXtKyTM0Ym2HbeSH2zejDm64bysC5C9XS4pbr8eHBOxaXdsLhLFh15vuzb12PJFarmqHcosEIpzTmcko9MhQymAcs8PDQiKZV72Ao85wss4b5qzvgNCz5Nth7CA+ZO466DTuXpScTm25EEltCulgBBU6pVYMpAjYBk2Vh8BjmbLN+s55WGLlenbAAVDvLlZvRldVtTxdVD0zcjN6uB6hNBY0BBjqhWItJrLIRIo23gBGq4PLkIcVqmDAPALk/zXlbjBJPyaLmSG1jc2Jy5FIa14IVEa9tfiDMxctx3dirCfYo4cKTt8NN02MPQbAi+glOvC9M00/VhPqetG5gTbi02JpwzX1NxxHAud+GNs62JnRT5ydhqKwsvl/Q3vnIWFx7XTeMZzgGZcE+AKtiqpd5PFcRQDSZXMgNAbFUYMNAMQv7PS7J7KvqUmX/tdPd55EPhyXTRVe2hqo15QwcngNwgsyDBAqdEKaKfMHgQ6bqWpmqaT7BUbnNwDQD9sa+wO927SuV5YPBKnKFXLx4S6DFAjMi/tvOiH2sG9A9F9UZzSCYvmNv6EwZDw5HktgbdsypN1ShNzwxy94wBwdpeBK648n/oTvOBVLb/vzicDyx467/P5ALpK59J/xDErv7/5BkA+kKdMkfapfacO4NR3N/V1+XTcrL5rB//huowCxyyA3vaAAAAABJRU5ErkJggg==',
-    'BTC': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAI4ElEQVRYCXVXfWxeVRl/zjn3vn3bdXau+6CwOqyrSFzDNkRGBCwdMAFNRNMlEjCiKMkSZ6IxhgTH3H/wh2bzH2NikCwxZMPNOYVNcNRBnAIbGy12uA8Z1I2Nduto14/3ng9/v3Pf277r5sn73nvPc57z/J7ve66S/zNCECXburVas82RJexe3SKTaZd3fpUyeoW3vtVZmcO1JFXnRakBCf5gMPqvxmZ71df3nI77tnYb6d7mlZLA+cyhZhI4D9hUAE/++d6OxOl1wYb7TUk3RzGZEwu1vM9laq0kMdiY4gKJvmKHdGJ2iDGb1X07e2fK5LwYlykQXu5M1B09NjzdWfZzGzeK8z/QJV1yY1acC040VAhKiwq0Kd/Pp6AwC168KGPwa0igiK/oVG+S8fonYNB4IbsA5/0SBQqGsOuudm/1Vp0myyojFfJZcNI8QNV4EtMoItKq9EgDIQhDl5RmlyRk7rBKXLf6yotHCwwK5ZhSoFgIz9+z3E24PUbU/MqEzUSrZMrSfM/0lcDBiug60DykJZgTd0pJKBJsqZykTsKHpmxWq3tfeLPAoiDNS4w53b7ry+0R3HmAZ5AsKQKdWw3vRrmUTWAPIA3A0lwRN5yvTb6P57F8PfJjL2RQloFMyiZGDDGTE0NBloqOfbmzHIaS/XheVplAfsN9ZJgekBUyTHFPkPwA04vul+T2H4rr2yXurZ9i/qCE4X4JE2dyvunNfIInTIK8PaRH7C3q4Z4JYmuWGlf9kNmoSmFZZSwDSoDbaXH1T9MDciGZhT/cPfY8gN4UtXB5pIVJWN24XJKuJ8Tc9CMo1wM9S9jDfVMyEsrWwPCz1UZixjLnPWy9vcN6ecNloYSYM4GmcoProutFRvfA2hfFfPLz4k/3iz/TJ+ZTnaKa26SyZb6oto2SfmGt2N6d4l7/qkj9l2AVFKsdrBZWSaqyRIcb1Zp9vdHNLqh1SUmVXAbXe1g/c3hEJGmCIrCo9DHRi2+O/8gGC5M79ohqvCqf/rcHIYADyowiw8akrNqTG2aTkk5dJuuw8F0Vfn9bi6tIb3C+2dH2mdZHsZSBSMEi1XidpKueFNW0CMKhUJRdBeD2C6fEHf+buN4NWKPSDVUlqoLgBaOQd0YPmZJ0aJf5LpNKc2wygVmLmF3pT0tUg4TzvxPJxnNpyFh3ZLdk+38t/oO3I001XSPJigckXb0d4FSaictRlQsM57xDGJoF2Bpl1hXdpJCfMWGYOFf401Q7iJh/S9THP5HLhFLu6J/EHXhUsj8ulezvvwIOktV70VctFdPxE5Hx/VCcCclkpFzcWXvc69wqdPFwY6iA6D2bLAYvM/7ciEYYKv1oTzfhkY0HXCNnJAy9Ak93ijTcLe7gWlTTf3LLsa6paK0oTjgHVqg4xCGsSIJ1rYg9RuztOQOnlw30DfaeBZ+dWglj50TVzUN7QLZP9Ihpf0x0zA2wwGFh9EOAkR0XhjDixDVlbUDBSWuCeDRV6UUmcceMgSV3EZndKnpua74Gr9DNpW+8JOGjD0QqWKfFhXfGBsW9/YxI3aeBz5wp0OMjAs58lyaUHG41azOQ86mC9faMqDm3wd1XV1m8uBP/EDWrGV5ZAounqzcMvyvZC4/AA31oxNdCAb7QrmAfSNpof4G9B1y40F81fyYMtVNoRPYkOt9K9IMyaKCOnhX7l1sl23G9VJ57QFz/blDJD/amVjFLUeaeLbmwrkYusIgZsVEp76caizxdIHsv+XMzm1CG/n4B2i5cGgF4CecHcqMa7sRan2S77xH3rz35OjxmOu6Dwt9DW/43mFmOl8gOxCR2Erw7oBJzA2qSKoKzGHh0oyLlayXt+i2620XRV08r4N57De8D6KBPYhebDX5Dx/LNrBq4V81aiJfmsKiU7i88EVnQPrVGARxIwLsXSN9GjZJremi4evywmBseF33Niml6fIL2rSjHlT+HJ/ph5QXRLXeDtzvnoyT02nD+GBr/fGDDi1RqeoADJwRgq7Dl+hab6T6Eb64LIBWtmInncNac24nXbCfqv130/DbEFy24drDTMX0M+LmHjoRv/XtvSLYTSjZ8DrSal1JsxTgBaDlngu3Q6qH+09r47TG3PIuVkcCf737dJGFwh9jXH5Fs+xfFvvqLCO0H30W/fwU8BEuRmOh0BOcAeBg6Ltm+9aiAeeCZBLEqk3dgEEsBU33nnVOxdqwPm7V33wQ3eya8EA922AglksWofzSbsE/Uok7Q4JhDz4o//piYR5G3Z46IO/ysqHnMDy/h3DHxJ54EE2o/+QxIVKAaXb6OcdawlVCBzpspKwlbBUfwI73umes2JbPUj8dHg1XKp1M5w/jZEfKKnrMAV4AO/EF0x28izQ+8Jfa1n4majRX4LzqiDGCe09mA+BaN/Z83Zesbdepd2KQefKeX2Il0R/+I9pPrrUvvqq9TyyYmgIqjfkSgJh4K1LVJ1vM4XkYdeAf8E31nLRw0Iv4UmtEccNbfLCq++aCwx4GA5csRewnuXmx9WaU+s4e0HFsf14AdfZN7QVx4uq0dh5NXjZcFE5VaJcgOVj8Ib6AhlJbAxcjw+pVI8I/wfLFqehR7+SWILZdwMDdyFq+0W9XDJ44WmLHu1RqAb8AHCRZMnV7tdDhbrsPJyFdTnFbQvxpJVQf3MixmiYTx4zk420fkIV/Nn+UBGZRFmfiyWh3BN0hCzKpZ0woX53V6At+A+DBBOEYhEHbDAUzzPJtY0jFPSYIc1jhXIh13PlU/TMqNKMlKOKQTvSaCV7+8Ihcu0QPFJJ7XqR08oY3cAr88laShUm5ASsVPMXwMBAYXxR5gHUs1xpiVwwesobWSt1wvCfci4Z7C5wOO4XA7ZeP7o8DjPbeoloLnIj4kwxsdOLp831n/tXiMonHARenGnkMelD46Kw56aAkU6WwYMkZvR3P6JYCrH6esttzt5CrGFRXgImzC5znODNVNYcviFjfuuhDWO9HHlsPeVsuzBHpGmsgwDpkDoB3EyfklU2/2qodOno5yUGqsNESMAbps/A9FzaQ9d7SWsgAAAABJRU5ErkJggg==',
-    'ETH': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAFtElEQVRYCbVWS0hcVxg+9zHjXJWQItVNwBAqKglOfERTJKlpF921llSEplAKVtw0NRsbNMKA81CyqI1ddBcIZKNtF6E2hpBGAqlCdYxTXzRpx5EK0YoaH6PzuPf0+49zZZpcdUbIgTvn3PP/5398/3f+O4wdcrhcLjnpaPI6afs1LU3nDQ0NxR/V1xcn3BwqiEMdMvN6Mze3Z2Nl5Tt6R1Dm9uude3t7FfLQ1dVV2+H28KqzZ3lxcXEt7dXV1QkZrVMdUqqKCT3S5y5XY6Y948RoLBYr6u//mW1tbc3Ybbby0dHRMORCJ1W7aZUAMIsMFVt+i91uL4pjSJIUVxSliHPeQk5ramrSQiFlBIh4eIyOjq5iWTFG4VCLRKL83r0BFg5vSjabbYtxXjE2NjaFOCgxgwI6aKSFABmTVcOnqqqGAJA9AwD0SISExhnzCYdpEDKlAIh4lL3b57uoKuqHkUhEhyNVOMMPglENw9ARxAelpaUfM+iiFLtyU89qTqUECeK5sm0ZDj9eCkA+Q8bAzKgEm5ubDDwwEAAl9DQWjZZNTk5uYC3OWjk29w5EAJkLUql2+9dgekE8FiO4xTlkjvR3TNEelQVxFYAPV2k3FULuiwCcC+K5PJ5TNkn+Xdd1B+zCDyfSMULg7t1fTASEAHJixTbX9TOBQGAC7xTsnoQ8EAEcZqok+xRFJec6oJZUVWFra2tsenqKLTx/zlB/UhNsJB1ZkhySLHeKzQN+9ryzyF7Fo7vd7jqbzd6mG7oOuJSVlRU2MzPDRkZG2NzcHFvFOwUDMZMVheGGwL+koxSFubm50wsLCxNEyNnZWUsULEtAEGNwsF8LhuYCqPtbMGQEg3/LwdkgnBksKyuLIGdzoRBDP2IcKBAdsrKzWXZ2tqFpGvH0GRw49+uQlggQoQYHB3lBYeGNF6ur7w8PD0UCgXEbZao5NJaRkSGAJehF9phRGtEUotEo21hfl7ZxV1VFyYVOzuLiYj8OULkTlBXHxY9lAHAuhFmZmdX+Mf85kE11OBw64KWsJcocQQoEzABMk9inK2ro8bhtfX2dgbj3MT8w5S/Pe5EQHxyXPDAw0Do5MVEE5w9hlIIl/TieVzJJ7JGMOKAg2F/xkSqan59vxR6dtTojDEL2ypAQgAECftbd3X3kt8eP392KROoBcwiGqcMRd8iZOWgNv5KKJwTY6wH7eyUlJUecTufnkFHntOSbJQIEMQ2Q68HWdvSW19t5Y9zv7x0eGjoO3L2KLEeBCAVChqkFk+MYznmXlpaOLy8v96Il98R1/Rb27pOttAcQEL0cKJz/pvtb3uHxzXd2Xv8kYSj/7erqO5VVVTwvL4/n5OTcwX4+ycrKyi45T5+eL6+o4AjiPO3RNaTZaljCYipSEHjiHp+vTXNkukFsZnD9UZamfdnc3Bw4UVBwEazn/4RCP5VWVjqNWKwHBDgHdJhuGNee+P0ecg5SJ5fLNC/mfQOABslFPdxe30NAX4P3nc7H2fe1tVe/OnlSkkrLy7vRB5pQBhLT7Xj0ZGzsHfGSZCPx/r/JkgNJGuI20DvXlUYYfhGLRYkbhkNzNP3wo/uvM5WVz+CxCTJwD80IOlh9kbBB9ncIldh4eTooAIYSGFSK9vaWp2h3VxxoRBhGOByOw+cxXIpj8bj4QhrUjNBDr4yPj/+ZqLtl+00O4sAASBkBxOlPSWtr60205dtos4JUus7x0dORoUSdUMX34DZuy036d7xf3dMOgA5MTU0JKKPRyGV0xtmdfkD3VaIPB5zzIPYvk25fX9++sJOOOVJCgJSBgigF5mX0WVFj1BusowdDlRvxL2g5VejFmcP8IAABv6/rutfr6+TUC06VlHjIVsL5YcymdWYnYxxpu9Y+UXPhwh9Jp3dlSXv7LlMuQZKV3au59O/ipTeOHv2UZECGbKVc+yR7h1smHIrDyet0rf0Haz+4/tFPw0cAAAAASUVORK5CYII=',
-    'BCH': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAINElEQVRYCZ1Xa4xdVRVea599zr13pkOnqe3M3BlJNQ0QCj9kRqgJGickFWKAiI4mVowyju1QYlAE/xA7RNNoMDaRTp8hEg0YwUQYQ7QYmcaqEKil/PBdy2DnYUttLZ3Hvfecs5ff2uee6Z2XIexpzz1nr7XXt/Z67bWZVhgixCAxMzllkR+Xr65epDtswL2Jkw+y0HtAEKUZ8AnTOWv41SSV0cJqGuG7J//m1z1NAfWRgxzPq3ONQ0GWDMEi/jSlSoiHy1sCax5IRT5iQy5SKlSLhVKg54tVcgAtohAzAVNSkwoHdDRg3sUD40dUTqNM/c5HLiP/Jhkiy0OUXHq0bX1Ta7jLiPQrsVIFjFACVP0zeF+4VncosJY+mWyxCEUSWCeUQyZOH+bBM2dz2fNgeFkgRA5QyNsorh3q6DapeTYIuWtuxnnzwYTQpc6fgamFdH3QKFDf1dzgdVDZlJoMJ7GM4/MT0fapYzKKDfZiI/UBw2XDawfweF/HxwB+BISuyqyLFRgcAaRBpsABJLAyF5uMLRZg6Hoc1MX4n7qigYF6KsMIdUHM75L95TsVXJXI+b0Fcv/U9nf0GOIXjXBLNRY1d84oxQiqWERkzSE4+Lwx8hR8XY5Ccxd4NVDnN5MLb/hNooCtY7kkVnqjgak/5piMnRv43E0Pr2sv2PCEcdxWSwBO8+CuYNnUUvmttfR9eOHzHEizHZi8tXqwfROn5vUkhozMmaqIvi2nTFIM2cZEp8NpuYG/PnlOLWXo2syvxbDwbWu5rRq7RnCVl3KIp6Ejdvvkc0D4iTD3XNjd2hpN21N4HyuVDAeW0mLJBNipgqsii4etxBKHIb83bjHf9cRnyBhNN/V7QNJfmREEHOdmRzjD7058kBlLfU/3UZAKv4Qt/rV1Tcta/tr4XNRCnwLbLYDtTWtua8oyVghXVCLUoA5Z7lFMxa6D8b1qBxQT/JsfEllGvSFoSOMc8KsfaN9omwZPTsiXqZcPEqwJy2ydODG/Ai/VPe2vpyb4PQJwtQausjTS8VXPJWASHebqY+VrTEjH4MdmT8zIKYIuSFL6pS2Yb1IS/oO3nbrYKEh+sLFApfj9FMSdNN10lL9ysio/3FDkL45VKsPlxwpFvq8yuyCWsuVZCrMNacbF1GNSptttaJqhV5Lr5jnhSRgy5f7Tx3JwDVilyRNXbkoKcydq1eQ1SfjXSTQ7Io+2NdObYzVPd3Rc945/C3fviX6biWJm2KjtWl4xfZkZSRvXfOLfXN1T/k5Y4F6E5j4enHhCZczElXMFZ9c5RwVBOULJ3ULNhTZ+kE4pHfGyBXmBAwJUXlqoPBYwQ2Cb1EmP1nZdpw8/4Aat9ZhtjSL+Bhf4RjH0OaVp/q4aOHsGQo4X1wYwEZ9G/f0s3/svDy4H1qwOLFeTivwXwRhhyXIZYbLzRHoYO0Sge9glD52GWbQaalz/u+r4uivum/iPMlaGO24NAr7OOvs4wC/oXL0CZqV4uGtjHLjnA6GraolX4vIGlRlDK6XNNqo4S0d9MtRojgy3lwLpBtcLiAXLO6Z+hXf9T7Knc63+MmfKydCmiHf86WRlf9dXrZHnVbPlEBR7PudVwEoDuZjiYLIovR8CzwsoXvLG0IZiV1v8AApQb1Kja+GGVcnB8sj5ON4O8GmVVZ2ll03kzqCHaEv0nFxGDaPBrsz/d2iAqp+YNnu+PpL3DY1V8P1xjvgWNCjtaUqrgoLZuiaKblQezZjzb9tZpNJZuMpP+bUND8XGuUNvqRYYquFKw2D3BJAb3oa5ERNZYKXyLCGANeBLV+DYnZWXL9Rqr2gs6PmyvkPWQOyGOPHKN25UFNNj48w85juZ5aM1V4hhwhSFe10pcD35ZBrScRSrORPwa1RzO6cr4W3rd7zlza88EcX3hxG3wHgptteogFNMxbYxejgbmdsQKAtZcpTsF1lIQdhqqHqRr8LUYU1HukB/QCxfT2dOv6ldVL7kyCM4M/Z1PoLYeWhuTs2xqBZoiYZb4pobtUiTXySx2wn9GktxLkv9IlFADJv/PZ2Wb6EH+Y0n+kZzchbv/9RvXyWvbF/rEnuPc+5uE9AmD67NW+PWtBQj+4A5o9jeLPG+8nM4iu+oVLSuLdIWZxH6uwAm+Jnpn+hTMB2Qomns5g6Ub7YBbQ6/NPm92qHOzaHll6giNJdICobLbVy2TJ9eXpLISDg4eWcWfiR7tadZwQms/XFaRUHZ03VTurfzfnegc8QdLD+o0gIy16Anf/iNL2wo7hqYeCWedX9JMkGoxAv8ruwew/dPwNRvo74MB6cOY9GTpWafD7ESGoZBI4EMkOvBfdREtJtL5nbI/qTynJtyT8HX01031bp3HijDVjyOvFeSmnrxiBVDsRRTsS39OWOM4+AhZNdHUb87fT94uSXzQiCNoUSYzqEPmEst7gFXx3s7PgylmhMca/j7EehNzsl6eEDH4m45gewQHfKEYnkOYGeqQhPtTrQdRwM2ir6wBT3gotYMS+pnuS7WHhD2giboG5Dn2hRqIiFdlxtZU2rokgRuYVOac2urjIM50dYZ5v0pWumC9oeNLVrO2/iLzaIt9L7NHe43pTy5TuisQsdUhYqf0b4yx/I8C4TVldD2HAH8c1zF5i8mkL7kNlQHmAecl5VZSruM4B1fTLw2emnASac3mMqlpBsNx+OlIht/AdGI1q4JCeHf8LIgypWqtHpnhdS1SEl24g5ZSbr9rUhP0YZbkcfUx+Kh0akxofPv6nKKIgPXvYgo3M3bJkZVTqNM/c7HUvPVKfXdvbvreQnX8/53dj3/H3P//4n/Q45RAAAAAElFTkSuQmCC',
-    'XRP': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAJM0lEQVRYCa1XCWxUxxn+5x17eL1gY2yogznCFXAJNqdAJOAWKEVJIVFtqQipNNAiFSKSFomGtmJDE0pQq6oJrVJaQUgoqLulcg5QLmpzFRocTJwYMAbb2GCMD9bHrvd4x/T7364pqaiUxh1pdvzmvZnv+7//mLGg/1cLSIUCwubt/nbt+mPV1/tLDjdFE1MyVG16viu2fOqIo7OGD/8nvw9IqQRE6lt+HnSrqJAab1LTF1v4izPNn8w48KmccKhRel6/Jt2v1cv8vRflygMfy52n6ndLKd38bSAQUHh0FvIfX7pho5ISYX4Qbi/+zcmGI/vaNB/F2boe2yttUtFv2zaVJy2tvDuywSOuzQWJpUKIMEYxKAK8AZrNVq1///L+fbd0X46ZMJLC1k3ILEiSDXAdJLJcQnb1x4xf1rpmRc3PfgqDN4tQSBkUgbIQsYzWrnNNq0736NPIiJoJErppW8Tg0jIJ5Bxx+0xbZGtSv93ZSWd1fW2tlC8XCtHs+OHLyh8KhZyllzrii2tjRH6AmZYFVgxupcCBLy14BCr0m5YgIa2bhp519PSlJbx4UAQoVGZJWaXHDDmJkgYpNmQHEIMzIHhgsOEGkGESmIA7xNVIgvacrMNH/4VAACm1qKJCo6BUufPfQf77vq1PqpJRJWTHADB7ABygTAATMByqYDTw4ILdfs0leLvPxQAHVUllpRpAVOMdU3ZaJX65wwIRCBD6QA4HFCFKzE1Haq6Sos5xzJQ2gi9tORMBAXYJIhWvOR6E0I0YFY3O7DqPp7sEOC85ojFnVve0T7zQmlxTHzaG2YZp3kla11Y/PKLp0RGiHARki5TeAiFipcFtIlQWoJHZyjuT261VdUlbyVAlWSbAAC7YegAzOMEtfsgQjlvK7FxX4unlRZf2DhAIpCsTFBjx0oWbW7aeiKxrE15/raHBAJMKpKCGU1208x+NJ1bPG/v9UUJc4TXbYB9b+5N5hUfr2i7U1/VoE122YUelpbDc7DPOAhuuyGRwA4Hi8bqm5GX+unjo0HqUI8RMKpdZG/pVVevJQ3cyF3x8qwtK2aaPpQOBBDbAIMibqW4cGW9+bsnopQ8IT12FlFpJCB+VCev35xr+9Mz5vrWyt89UydY0iGAg+lT2O5QwkpjO8Iqd031XtyybMQtq9zC2Jp7HxiAaONe0dXOzWECRzmSeKvWYLTUuIuxDDz7wqNgk1mPsbtBGjzrTGsLimdjEwCsnkwwps5IJkzIgChxpR6SikO7VyEpSJkLvkWyi+eP8B7csK3qGwVlBdrnGB0h9IjH1heOt2wnpMUKx9T64j6OZu8JuhBX96B5p6WQa5u46Oc2tNOwBie3YpDF4+ca3955pWU4Rg1BbRVRRlG/4zSahK8eK8jwen9vbUDgm7/CTk0d98gIYc7wNHEZOKmz/qHHNX9u8+2rCEcsvSLU4ldCdhsjlYOJ04p4BxcNJw37I71XmZ5kdlm03X+02Zp6+Y1CeSla7SepzUzI+27Fi5jKQu5naZOAXwHIbbB7IorR8Oy9FlKYkkU8IMuFsBmfLhZmOZDwLdD5Y+i2DhqpSudzbb+9tiOXubzEZXA7TbNket2jJcC8tnzPmFQYvDda6iEpRS4IqSw7b7XvBmZbjP5+iIM454Fh2IKNxGuEnbTnHKL9PzTnpzEkNwpxejpM4HwwopAvyeV0ozERcqH/wh8VKKUZkjBPoPH9vc+rAugmZ2lttFtWapmQVbN4UPgc6RqjhEEkdLDpWw9X2KLdbLfQZYbyNNUfV/CvhKA1z2/TmzV6aW9W0FvFRDhX69qTRHF8j7UhuY+J3yTjzpzs7Z+862XHmzXZbzVFJRi2Y41ibcgEHI5PhjxXLsqJCVQNTve9uWDp5k0bu9ndqGl/87bH6H1b1QWeQzdCEWDPeXz3Eo/69qqWrec64nMvffWzu2YlC9GILVNIAd0dqQaVBlQ+VrZX1f9xxw72O+rqT2YJcMRylqVMtZTn7youU7opa+sZC79VXVhQXw8JI2kDa+vZHb+240Pt4lp20ug0LSyGlrtMYTSElEaOv5oiuuQ+N3PWzZbN38RquAWggHCx1mLy4cMLmZ/PjNeTzu8KJpAmpcazbJmLCRFEx+03T6rJUffWDevyb04Z/h8ErUIgogEMLTbWUatJVPnLJLaTwowy54/3m9e5eszGSkG9fi+bsOdPx0uaDx18FuAfreRlBLCGDiFKMPbelfCLvTNNr79/wPXKqh0ufhzRIGkE2jBf9NH841Ty1cOyGkry8KlauRDiHFlujfe/AicUUS5ILpscQQwhRRVi2osF1Elnndwm7uT1sfajS+lcra9qAHeA9UjTwhE2cyoRRHGpqX/Fe9c3i2rboyKqYmdw4bohvXG5m5Y8WTPoLiCZaWlq8BQUFOIyCaqiszNp57Pyj+87dPl7XnSCXwtmC/fj8T2eNMyIJhiCQwlFTeXKSv/Xw5pXTsVenIx9LgQc7kCaBx/J051e02/kl+jFGvhcUFIhUmqUuRHT+Sue36hI6uUTchOUaLP83OBTg+OEU7rEQGwjy6luR/E1//mA6po/dJcAY6SIhgiBS9nyloKmLJF3EWNshS5HMwdJSFHqRLpFYECpz4iciXcW4D/LpJyyAO7UErnMqKEa+oKTqi5PadofpVT+sbR3NmJ8jwBNosuxekNQc8fXvrr9Sc/wIj0nXE3sqs7kgKXznc+pH+j7A3zE4K8IjyPBo4YDqCYedWuBUwtR+//Mvb8Bxk8zyUiuzg8yM7MjvFC+QGrCcDzQnFmxL5GoqLZkxMc6IgyFAiwIVzvqveOwjuYjnGIzku58jDXyeKmDpco55nSWwhZKtxjuXF42rHDSBim2LnHh4tvRrb3x9pKeBEqT5hWXywZWyHIqnA9JNFiUtnGS6i6aNHfZ62ZzCNk7DQSkA+SXfoPNQlNYuevDny8a4KBwzNAMFbBiiQYFPvLhZZEppJRLMSndteNh/+Y2nV25n67kI3i8I+d0XbijrNuGCsaRw/MHQp03x3OMXXy5v6n2gsx1V2uvCPyp8wSYqyvPR49PzTj+1asFqEO/BWeDUnf8I7C+Me78PWU3+PzHnd++dXd8bt0vfrbkRLRiSoRXm+7vyC/z718ybGXQWAhyknRT+F1Kea/CZJQtXAAAAAElFTkSuQmCC',
-    'DASH': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAEDUlEQVRYCe1WTWhUVxT+7n1vMvnTKFpBN4K0oLagghEXhdhWslFQkAwIdePG0m1NUwXp2wQNCkoXLV1046YwgUpBF0ZFFFwougltwYWKYFExmj8zk3lv3r39zn0zmRln1KQjdtHcJJN3/77znXO+c94Ai2MxAv9xBNQ87M/nzDxgao7Ymtl7n1irEFgtdv23Gv/5dgqP77+7KDzvVFCqQLsWQaAbA/dlPQxnYgxc2gXt/QAbzwDKMea9xnfe6okqh11DeY+IcwzHP7/55ggotR8t7euQnwSJlEz8S/tlgpY8fG8D4mI3+q9sbYAmHpLtkd9WIO4cRRyt4d2If1xfqPfiNXPtglcOgMDYCG1daRTz39ZHIDuskUEMLN2LjqVrkJ+iaS9VdmBB/8U9Q6hiSOtKZslQiuE0/C12VAhQEECPxuUlcjCmREaRmzrA0M/CJIot34dWBrE1KGdlbqPqITYans4RZzMxBhnyKg7Ek7mXvpWwkrJQcyKpQnkHjwMjR5FqHcTsS1pk1Vn++L7i5wMgv8mXUqBxg28uroev9zIsBViPhCR3kvfqwXPGtFORf+BU7zkEV338+ayc3MrBjz/gvR0Gk8Npuv0lU8A9iSKXFaObavVRjC7gxJ5pHxs3JkZSXj86Vx5EbqJK8RVM9yT5bF8GTI8NzO1IudYNKWOS7R/Zxq0NiKgBVSpjaz0a57L9Xa75yLh676JnX2D8bwELefgVz+W81I/yEYcvYKKzchnf74gRuKfaj74+YJhLnrcHfgsVFQmu6M1wrmnrLqLxG3IpEaG1+7Fk5VrMOsW3yUbdcN53AS+fX8fJXU8gzUqpBt5TTxmuHz7bwQrYjWhWoEpNjARSrRph4TxOZ/LIWi8hoPGUYR2ih3no8DXapuqnxph/m3Xklo9rkqjjiZ13NA6xb3irP2X9f0QCVeFn3QghT7nw4y/XWEqNpx6quZXvLv0EP/3VnPohZZsWYY/i3otutnpRJnMqXS/LcGYyBkcus0XqD3k2ZK3X68BRMoa82UUaDGsUa5/7Ns3esRshvbX0WpAs05IigYjhF+NSQcFnxSQFmT4BZKi8H5Fu6UGYk3k5b69YItprqLmWK0Up3A3Lnk6XBB1D6xSNT/PuLwngNedE0gcCenT04ies1+0ozMgtwsjtJoYLIIlY1r0Yb6G2i4WvcaL3vhNwkJQvI9AjnhoU9T60daYx84Y+sFA+QkJUH4UTiGl8qPdX90UkqFSPywNxNdvjFuSnx5h7vvulazUzXATlLTjFnj/CYj+Dwd6HiecV42Ihyaa049wW1m2rQW4yWWvGfnuXdTir2NQCp3aUhN6gbzRjaD53pcLcm7bx4SpvF/plozFg7aqDr39Z1R5anP3PI/APdUd3JccdEygAAAAASUVORK5CYII=',
-    'LTC': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAAAlwSFlzAAAWJQAAFiUBSVIk8AAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAACN5JREFUWAmVl3tsTmsWxt+9v90qWrdS6la3uldLMxhMUIlBQphJjbjFhEQIp01cIhEZhyBmEpf+Qfxh4vCHUDQkyDjnVBOXEZTWNe7q0lLqWlS/3e55fm/sxjExyexkf9++vO+71nqeZ631bsd85wiCwJk6daqbn59fx5AdO3YkX758Oevdu3djotFopu/7KXV1dfGO4xjXdatjY2PLYmJiips1a/Zrenp64fz58yuYl52dHdm/f3+9xgXcf3s43z7gnkmh4TVr1qTdu3fvh/fv30/R4okdO3Y0rVu3Nro2jRo1stM/f/5s3r59a168eGGePHliNLaqVatWBampqXkrVqy4+u2adtKXn/9yYNSoUV5RUZH/4MGDuA0bNvz46tWr3M6dO8empaWZbt261bVp0yaIj493FbEbiUSMkDJCwtTW1tZXV1fXywlHDkdKS0txprZdu3Zbli1b9reuXbvWhGt/14HVq1d7Ov21a9em3rp1Kz8uLi592LBhZuDAgb4MRxS1Q9QYDE8W8zzP4Ax0gIZoCp4/f14nyrxTp07hZKkCyF6+fPmd0EboRAMCoXfr1q3LuHbt2r86deqUNH78+Kii9lq2bGkNA3FZWZl5/PixefPmjfn06ZORFiwKiYmJpl+/fgaKBD+ImNevXwdCwz9y5EiM5lYqkD/KiZKvnbAOhJwT+Y0bN0736NEjadKkSb4W81hMC5kLFy5YfvG8vr7efPz4MYTeJCQkGEFs2rZta2pqaiwSffr0sTqpqqoyT58+9Q8cOOCJEpwYARKhzYjWc2S0/uTJk3EnTpwg8u6TJ0/2u3TpQuTm5s2b5syZMxZmxAf0V65csfdED/TQcv/+fZOUlGQGDBhgmjRpYoqLi42yxaSkpBj00qFDB19jEh49evSHLVu2/CQnotiO4IkcCJRC6zXwzzIeFQIxzZs3N+LQQs4iGOLAoZEjR5qJEycaolTKmcGDB1tj8K+UNNevX7fzjh8/blHp3r07DrtCM1pSUtJBjjQSoj9j2xpftWpVmuD5Z1ZWViQzM9NVpM7t27fNy5cvjZAwHz58sAaItLy83BqV4i0N6IDnoCTxWSQkQItU06ZNjfi3jgpZoyBdIegosN/NmTPncF5e3jOXqB4+fJgjQ7EZGRl+ixYtHASG0KR8axC+iQxjpB26ABGlo9F4qwnEyRgZsf+Mw+iSJUtsIKzJ2oMGDfLbt28fe/fu3R+w7W7cuLG9IpzSv39/DEaIBsERtfiyamYxUgxENBlOrQZIPwrSs2fPKD72Oe/IhnHjxhkhajUgSi0lrI0NaJM4p1BdPRWc0fKslRCo02IRjAgRI9HYyPAS40QsNZuhQ4fa68aNG9tI+YcWjGAY7SBC5pAtCJUxIEBGKGMcCprGJIrmLJfajjHxHuAhUBIxaidCUowocQBVM5aDsSzMuIKCAksPdQIaeMaBKFUHzLFjx8zhw4ctoipuoBCApKrsGI/GQnrJEAKxuY7qVUItpDwjCiCGX8Zyz0Lcc71w4UJDymIEJIgWVNARNSTUi6orVdVInC76kvAzPRlIIUJx5xAhL0RHQ1oRCbzeuXPHigp4KTah2FD6kCFDTFFRkdUN2QNVOAYNoISecJB7ngs9B5uqlimeeIrHgLx0vry00BM5cBKNctdcunTJLF261L4jeqLiPUXp0KFDdpy6n40YejgIiCxBdCAjyK2oscUYbHt25JcfuGdhJqJsPD937pxh4e3bt1skGIo2GAvH27ZtM71797Yn92ExgkJOEMXhLwa/NmevPcFSrUnNFX0gOB1EyAkCwIySSSmaC4Y5QIpreCZC+gDOMp57TsQbOsoarEcdIUDZC0Sjo+tqV4PKqGAyEDCBwWHhAQmKyfr16w1llfdEiDMcSmHLK2gQIQUKbqEGnTCONXD06NGjNgsYhwPYFPVlnh4UK30GsJlQN3PJABoJnS2MBO6ggchZECe5RmxohP7AgcgwTpT8EwjPOMmAefPm2XHYqqysdEVNsSeoCrXQX+WEQy/npM737du3od+jZPI/bMHAyfWECRPM2LFjrR5wCiQ4cI7sALWzZ8+anj172k6pAhTWC6eiooKqWujKUKH2c6/UoSKCJWBjwWQgJOVwBui5hkMQwAAOcEIJzznRAfWC/SEOoSXqBo4NHz7cIqr3gfpARPOq1E0L3cWLF5eLt4KrV68awVIHb4iKCqZCYQ4ePGijR2AhxMCLUzzjhFeUjpOcaIGqiCPaWRs1IFvCcVjP60hr7R0K5s6dW25lLU+2nj9/fpbaZKwmB8nJyQ7po0ZltUCe01YxxuIY4SDKr6GHGg7eY5w9A+/RE88UYKBG56nf1AqRPMY64dZowYIFf5eHy2bNmhVVXscA3cWLF82uXbusALUztkhADxSAFAahBPiJjgNDtGmyAfFSAakTlGRtfKJaL0YB/mPz5s3Lsc2ekDNgS7Zz585/SwMZ06dP95V+dj+oSVbt2itYdWMIozhABtA94R5KMAwVOIZ2MAydjJMe/N27d1P6S2bMmPH70aNH12Db7rPwhD3azJkzC8X9X5QVCVKor0Vd6gBooAnaKcapkto52/4QCg6j5DYipCWzTWOPSORqSv6+ffs8OVWpQMZPmzatEpvsRa0D7AlX65tg5cqVL2fPnv2LGsqfpNQEoRFVsXCpkKQn8GKAxiQ+rSjRBb0khBrB9erVy3IvhwPlv793794YoWS35bm5uTewpRJuBQP8DQcvdPpbt25NlSDzxXX6iBEjjPaJvqKJqGbYJsIExIUWSDEKDydZgh5INTIKwZ0+fRo9lGqzkp2Tk/P9D5PQi1FffZpJKD8qFXOlYvaLdLSGTzNFThm3DuCIqLGfZjLskOfsqCXCWlXWLYsWLbKfZmGAoS3+f4NA+CLMDO43bdqUJhhzJLbJyvdEdjKkKCon/zkoRmgBWqhwcqhKnbBAFTBPdeb/+zi1K+pH0P7m83zPnj3JKiBZEtUYZUCmKmWKaIhnPF1N6i9TyS5WnfhVcBcqnSt4RzD/6/P8P+LA8pCjJCHyAAAAAElFTkSuQmCC',
-    'MIOTA': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAFDUlEQVRYCa2Ve6zXYxzHfxKHSpRbHHNOnLTQWjXE1LHMci2TkEvOlkZrKTHDkqIt1diM+MNlLnObMJfSVjYRNs7MsDFas7mcrZrJZYlTvF7P9/n8+v7OJSfz3l6/5/l8nvvn83yfX6Xy/6pXnq6eshX+hjnZF23Z/PdiH7r0BsuO7ItPOsr+aim4+C7YDkeAcp4axYAaJ4YdnaC9Y0O2d+bSU9nXhewf2pYrtv0OO6KhJ2Xs8ig6z4JB4GlfgRfARafClVBWREtfP3gcPoFJoGKzMX/h7eI3OrxOm6d6CY7Lde2mXP+NcgQ8AkeCcmyMT47SjxsIVft0lwI7/pV7O3ATtMCvsBGmQRu4sRvgHbD/axDpGUz9NvgU3KRpMjJ/ZtxEOW2YRZhiUwOwp8BBNmQNoTwwjFyansnwE5i2ON2r1F1AxsDp8AuYlmNARd/OBh4nvheeA6NwKzjZAhgN38MFoOrgYHgPJoJ6E2IDp1J/tmTPo67isNWdnIjz4tRUqUygjAmMxLXZdvCFuX4d5UpYB2o4xCfXSN3Qe5HVDHA+IzUKVLoX6QdjGGwGOy2CvtAK5rwJlH1C5l8thvnwEHgfVIQ2Thh2I20NdkBGOPmtqMvBxeUjUPsXRc2vn+XQGk9hLKGYmf37Ub4BXrxLs8+0zYbynUpNsbs+WF6cH2Fsail+TqNYD1eBm90E3vgTYDm8DS5YlpcxDvNgbjCS+h7N9kmU1Qsdm7DNUzeD90GtBge2gRftS9gOpuVdMKfjwXdhEoSuofIyRKo+oO48pqsl19dQpjyYqzoNdCfYcSs0gK/eTngAlClwcXV4xn5vgdFSzTAu1Xb/DKR6UTafoXSNHdmuKTbkRjsYduXgcpSSs5ufo/G3g+MNs7obXoQI+SHUH4YUMQf4vc8CdR74Nfgdd7ow+PwP8IJ5Z1QvcHNGMbSOyucQG/+Duhs6B/xM50JEvPIhho1ig+pbFOnXi+fk88CQ3wTfQUzg4m5CjYDFUA/liF2CbRTU0+Ba92soDS+V5fOgXFSZx1XQH76GeKT0N4GKCFhfCM5zNaiJYJ6NasjNfAs+Zkl+Jg6y47nJs/uzGokdkznAC2j+7G+IQ0bmLpgA0+EwUG7Yvi2gVsBlqVb8VKN0Fvaw3FA+0Vp8y8HL40SLQD0G8eppnwK2X6GBjNg2mAmxiLm3zwZQrtNJ4YxBZ9JjdO41mTLCrstQ+qh4enU89Ib74HpYCeeDuh3mwHg4GVSskQxzHosnR/5ZQ+nXoDzdZxAP1A/UPdE0KMvHpyU7jGozvA/rs8+iurg7Vj40XakV59bc4CMzHHwplQ/WGbAKvBeG3A0ZqaFwDxwK3qOx4DgXll2wR8UOfQfugHhQjqU+BiLsVCs3gwsvhJD9l8FAiAtpW8xrfY+KyEyll5PHN+sN1jYtTmbqPgZ9X0B3Mr09XtxJorOhnQFDdCI/Uxd7QiPLi+XXYulpnwLT4yFik1S7vGP6u1X5UrqAfzZOWg/9YAHMh7Jc3A2KT3bISO21YgNevJjUb1lFKvT72oVWUIm+4X8S30aYDirmLawe/vrNnw2NYKh987dAGzSAl3IceOuXwI2gLGNDvrReYrVXmzCPykGexAk9TX8YBAPgG9Dv4mXdghEbaKc+ODf+pw242M95QvMfiovpQl+B33vk3E36MG0GX0IVByqsHv7GoGb6z4U+eZz+OlgNbqCc5xiDu3KAP13pH/XY/75hq8eAAAAAAElFTkSuQmCC',
-    'XMR': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAG+ElEQVRYCZ1XW2wVRRj+93LOaYFyKyooGjBEY9AYixFNeDilWrAWjcIhmigSSNAXYx9M0MSYrT4YMSRATEQuAXkwSnmREEoJLX3AGyEQH5AYDFbAWGgREEp7dvfs+H2zO9ueFigw6Z6Znfnn/77/NrO15AZNiVhSENtqkRJFelbJtEol8y0ldY4tc2wlD2QsGc+1QMkVZcuZsCRHsa+9KNJRvUXOck0VxJEWiSwM+T68YX5k4yYD/O9KebTSkXeztrxsO1INWqIpReiNSs7ZeBw8aFEgF30lu68GsuGubXKUc0N18t20EQQO5sWt7ZRwW14qXntYPFjZZLuSkwBbIikR07I0De7V+zUPBToWLOWLDSpZ8PTxF8kXv5yUD6HzqvLEtTwJIZG2MgJG4PxKmTXRlZ2ZrDwh8CcaN9G+Mnku3KCRBkPnSgVCVJTf/ivJkilb5ITBMPtShcbycyvk8eqstDmO3AOrabeLJ5UzG2+xJ5FQMpIpleTi5QFpqN4uPw8loRXvRMyXItlo+eSMHHIsgJc0eOYWgW4qBhah5YhbiuTS5UjmVW+W4yYnGDKEVNSGWZJ7a778lM3A7YFOL5KjBXdqvSE1qAO+DEI5cbhb5s7bjcqBbpulRskVtfJxNqfBIyT4eSyajezvtGkdCiYgibrxU8rk5JGaqfKpVsgy56B7uTw2JStHHIVEqxCnOCDrQeLPykpZJwPI/dgLt+sJgiupFLu/KKv9okycUCUfQF+A7HR7BuTpaTvksLZ+QkbecXIoHEvHnbTGjtks631fPsEsZWJlGNxii+VzYheLsnbMRllj2zCNs6gOB0gTc9LEF7vrdZmGQ+YV8fkaHyU0mS23UT7yQ/Fuk8QgeCifVWyU96gLyWY86NBMYDZ2vyEzbbh+Pg6aarBj3cZCVsxVrZIMSDRrErAG66N5YhDcB/iX8j51kEDEgypuOK6kZGekamxW6m2kYV0CawTirKTwvaJQszZJDATSPIonBsFp+VcAH7Q6NV9zoJmQxin7rI3YPKltj09zvZ7+HIeYF5Oo3CjegA8S1/dEOTgtN+AXdRKnKvVAwUb4GxdYjY3Mvz8RMTEqE8akasYMD47KTeL5Iz0xEhxek2bPwgGjZHa58Vo57xIkWlbJdFtfqVRh4q+Hyc9sUfl83vU8XDI4KQ9ijHDEnjDVoaCK2U63w/KdhYKDCyeyPC/iXqEXb9BQbcjFmzQqyuVy4xsaGtbOLhSytZ2d4UEv72pP+El18NxIwBXAl7a06GReuHDh51A9xVzrN4KxURFXhiehEWYce3t7rziOs2xmf/8uztd6IEFPbEJ1+LKmGMj61PIYXBobG7/JZDJv9/T0XE1zwSgd0iMKAT5s5AwJoKerdLGYc4CyVVVVjlLqAjyxCG0n5+gJz/NskFiNOm/ykMCJ5QKZbZB9NYqi3nHjxqUeHhIHDiOWGow/a+ML4xgrNTkonKQG040ERDa5RRxprusWYJ32BAhEjDcfENCcsfY1ZJZTFs3lj2mId/wZY74rsIqz4VcbB3NbhFMwVNIfRtLPE1GVknPR7EbPeg2CwIdrFxsStLrQ0pKCZ7PZZb7vB5Qd3oATUisxNA5uJ3wjtLo//CO7ZkySwznsQF3iT5y+klyiApZRPs9R2lwAhHCxJrFnz54ljB4tT8BDeCv5Moz36FLEsOuarOnxZSs+dEIrirPudFbOuA2t+qPrZAqRDDwkmodYIwfKzGE4SAKAixHv7Yj1QALO7Kfb03DDW5oMddW0dPZgjU9ZgwHYgYODJVe2MuQFFv4Otz4EMMoYQiVUhwYolfCtk8wjYRWmLYiehocexDyJjWgGE+eFZzOhFixY8BIS6E1IXoQOnUCwltY46F/EM57K8a5JJxoNaUOK0wqyJNAH8e8xDNDrPRiHGE8Ow/Db/fv3f0dsLvBROGymgvkRxPc+CDDzqUw3vsfYZmb0nvthUCrI/XQYwnehr69vTkdHx19YxF0I8AJKae/evd3I8joI9MKlFCzivcQHm9O4phpHGXCL2Y++mOi8gvk6ghOT2KmZeSRKJ5IOR+gzSKq9sGAiLA/Q04xUbhTcEcsADOCJDEJyDfoWtba2dhgsCqcl09XVpS+PAwcOnJ4xY8YeANeByN1x3ulEIolbJUKP6eSDDhfWn4JHn9+3b9+PQ8HLCPDFkGhvbz83adKkHciHCcj+p1BONiwhOJWaRBxOhvNMSvY2rNZ7YPVWhGBpW1vbqeHgkLu+RYxPS3Kx1NfXz4UVTfDIC1BaxdjSK4lnqEM3rOskYw9QVsA+9Otg9SEKDNUZ74h/h1tRtoZN9hAiM0GgHgLPwSs1AJgOMNwiMFkp/u/4N/pj6A/A5TC47Q+uJcDGM5wqa/8Dbl1fdjM9z5cAAAAASUVORK5CYII=',
-    'NEO': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAIn0lEQVRYCZ1Xf4xUVxW+v97bmdnZHdilsi4shRYoC8hPKS2kAq2mzVraqiyJxNSSSpvaSkhrVEwMg7ZNjDHGtKQh1lqMtXGJfxhsq8YGFBXtig0oRWFdZBfowrI7+2Nmdt68d+/1O/fN4C5FINzNnffefffe853vfOe8u5xdu/GOjnaxl+FvI9PV6a//4SvNo17ugcFy7+bQRLfWq8bnbzVLfnT/XdtzNKfdMrlgZ9Zms1lTXXOlK7/SII1hqWAHsiK7jkXVOX8++ZP6zv5f3V0yhYdHov61PFGYXCrnmY40S6XqmCilzmTUjB/Mq1v2Stvir56hde0dANKO3fiVgUwAALSCrZlotLf3T8lfnvnxyjEz8Nm8vnh/WQ41axGwcEwzo7mWTHLLGbfWGOlpWZNMMRVkcmm/cc8svuilT6/MnqgCARywuPcSizTuAFjLOOfM0kC1vXb4ieX9weCGQpR7sMhyrcwvsqAUMBsqw5nCCiMwd4IDeATdxlgRqWTKB5D6Qlo1vd6caH1h0/Lnj7q9s0x0zG/nGytAgDw2vvuvj3nNdTXz88Hwff1j5x8YKl+4wyYDkS9opsvMCq4IuWQM/l6zcXJGGx6qZFoxNlYfJvnkjpbELbs+v3LXIVqeBRB0OIO2/9T+hCgdausq/e7ZcuZ462hhlOUHJ5nI+lGkpTKWkbc30iziozULhUpKoWya+WbyOw2i+dmtd726j5yHR4xtery4bkD+7cU0m/VGIpj7ex3W1Ws12MT9UEZlwayBR1xch+dVjJhqKRwCuRApvxaxCRnzbKJHifSJWt4oNjxy+7+XzewcBj+M+Z4NteidORz9Y5snFp+Ylm799ZRoxr7eQs8aU9O9OlRFHoymEHCJMFgKQ9XShCu0aOCVhdPSSyJqEtQFk3IZ03RwUmLaYc+q6KLuu6XPHn0iyepPYfEeB0Bzw03ZN2HJs5F/dG6vPjKXh3NOTUsufKtJtb7dF/SuPq/+tYbXBCoskHdKc2FBjRMhMQmOtBQJI6QvGB9LldKsqbORt/xFJhJ9BTs0ry96b1PR5m7TvMhkDZwpJEuE3gFQSjERWSGltiZKmSjA3rJnVh/v+WKkZ56v91vfnOKt3XkxPH/7RdX9CZsYSYRFEaehZ6SfBDUlaVJs2t8b2PSD6Zr0mZIoTh8Iz90zEp3+CEsGSpctCyOERKtQcu5LLpyuYgCoNR6Fi6JsjRAIuY58Ww44Ur136kBNz2ZW+PDwJLHwN3NTq5/L6XML+3n3fWqSyZiif2GqnfNWuvamY6EuTx4Iupe/b448whKldITAYx/GRzwNksgidrZqfPI6AI4IGBeCqqZBrhG7GiGU0mrfhiMCQHKZC97B9qiYaasXN78BIN8ZjLpOzU597MjJcufXu8p//Jr18w1WRiwMsX5Uas4llEtlyjixk3+X66eSXpEzzpGWpHUJAdOVmBAC4RYG5KBkFKUOdb42n35vY0/w7sNPr3rzp7bMc7mod1PALjZAH1FYVAZVA8XFiTW26QxXfjCiXI/ryaX8VrhTCIOoGFdgQ7iwIDR07zyxsgaIwAgzNuDZjgW+1SFYkqNginJDgt5Le463O/EevKBC0JibDA1WDBMA0oIzGI85UDEwVH2UA8MViiKnKG08FukajxKvkppXTs8JxitTwJBjx2mA4oQBpw1HO16RMYVOQOmeahETBp8cuAjYHBiuw9wE2/EDgjlu1AGg7y3RrWRkjfXhP32Z4DUs4CMVhwLZDk9BPUKM9wgLD7LjdrrOWwJN3ZsQAgxQLCQsEhOxCOOrIjg0Ru8cUzEgAsay6NTGuxSPXPfvJcE46rFMkucwSDQ7ERIzVWC4SqFjMCI0WTjjG9IAAnKDzQFIQIWS7lBRY6OoBSREMlhh5H+sxIKs2LO2VvvSZ3XWhhAF0F2e6NcA5gAoZVEykIYSZwkyTHEnFlyn5wojBAbziB2ExOzevdzj4bzzGdn8aq1s0n6dwU4aqznJikJ9zeYA0Oy4BpAh8trgucoCZQR1POMdgaF7DwWqpWWVWP/R9cVnVv988+La9Ssm6zkv13k35RNpoYyISBnYGguu0hwAEhfNorQjyglEbIiuxACBqbISMwImyIBrdPDcsGL7u19e/YstS2s/uXSKbf1eRk3NJeoQWxXS3hHSvnI6nojHAagBSirWrgwL1CgCUenOMLFC1bAChNgCw6arKwawt50ZOkUTkAeXb+/admfH0ysy9yxq0LftqJPTz6bqPMX8kFZFnIO6eJn7dXUA32LfVyXGSyzCKUJSjlvkPBmivMen03FE5ZrGHaugreKS26h67M7iZD1/R5a38ewZvPjmb4+/uOt47uDnRvjQk0H6wpxiMMq0hlmUNFroGGBmwYDH5o40NHBPqbzgPIykkI4JpwUAiRkhHcR1AYXUfeGc9XE/AGA2cqYBlGf3M/Xx1qcGvrTqZ99/qPHRZU12yZYMn9FZn0lDoTJNyxQcQhl+7p2+oW8t6S/N2JIS3VvqG7un9A8Nssh4WohaHH4gi6o2iACnB2PHxhm+/NbVdlBOQHYeWCcXLNiYx5yXqb9y+PHHAsn/SWtcOGIQcdp0DXy3pRgd/cJQ1LWZJ062DBcvsLGxpNYmyXBwlBFOb9zD9zZsOP6h/fcubdv6Av5ZwD5Uva/SyMbOA2tldt0BSrq4YSzOAiwmEe1H2Gc3PtO7aOqeHYvT31hSrz+1rU6sPZmpnywTqUGcpIo4GODEGQeOVzRY3e6qV7BmK8Z5h22XBIhAjxek24AoO4Dj+jpOOQyt9B2p7TTffmhYn36qxM/dUSifZuXQA7k3Hxt6+97lW6+Tgf+HLs6CcW/Hxw4RgiAXF/D6NeqHzj663hdntwWp/9w9kh+bxGaPW3iDtx8AUN2nAgRqBlGsHUD2mjun/XAf3u/rfP/JNp8PfaaggzgTPsBjdZdrX/8L1Znwy7DBi/EAAAAASUVORK5CYII=',
-    'XEM': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAIfUlEQVRYCbVWCWxU1xU97/8/Mx6PB6+DN4yNNxbTspRAMOBMQ2gSUqoQYqctQkioRU2pVFQpiYoS4TZto1SNFEJKBCKhjVICmGD2hASo2aGmNotjsAFjjws2XvHYM/bMX17v+7anY4NjWqlXevP/f+++e8+59777BhhdGKnIbkAZXXWIxuAeacjssA9h/GEi5sVGTsMIV/jwVTgPV0S7PB4lvqULToPLlqgIGPGxvDc5Qe8YP1ZtcU7svl9cDC18n5sIlPXbGmJvOABGijIphjavfSEh+d090hwAcwE2m55ZhCuBhiUjHopF4fB2M9zzC6AS7YvyIimycXJUb6Wq4pwjc/K5S8f3VzPGBBkhMo0QsXAAgrGJ7s/FiHp7Y/xST7vyAukWzJvC4xbO1jEjW8XYeA0Oh45Im4EIhXOJLAR0Dk2PZAHDiXpPE0p3AtsqgWwy2ETLPqAyETiY9exLO85+vvMWTQsx/Q0CMD+enjsm7lqt5Seednl1ZhKy1ixTkf/tXuSkBo2YaMOQJQh9ycRPHDgHMwiybHXA7/fhRDl4uf819KY/yTHGZTBJZgGfV26tr0HN0RJUnDrijQF2Jc1csLGq4tQVgaLfIDGfNyUu72K1fHDCOJbx29W9KJju08fGGmASJEMF0/WB8AwEktFO4TwiwoabjQGsfA2I/dVXeGzmbIoMI8O0SLqSJHHOwIO+HqP5xhXl8sG/4OahHXBmT15Te/PaJtlNBOrJls/reHXGFLa49O2OvvzpfVKkhcuaSkkl58QUwmH4EOitVoZ/tcUjv8iH/Le+xNzH82EEqRhok2Fo5tA1ldE3kxWLFJeawbPzn1F1i1Wu/WpPzorNmzeHjlZHgGnTcgyMc+kKJU0a7kw4DBexrhkuvPPhPSSueB15xNzX00MRozzRWkgG3jk3EPD3MJtjjDI2Ow/tQF9K7HwKcEhYa0s7QyBAIRF1Gm4kpNP/IiJisQC1dxzYcAhY6HZDoziPJlQT4IYO/31yD9xfXzhFlcr6j4SYaGkmAH1B4iBsDeRaLAwXAQBk7E6z11yKinGRYcr5EOrDdw18G5z7O1vEWbwnjqaIgOkqfzL3nKwCb+5SJLI9utCuQJCckpjMRt9B+Bh0Q+NdTQ2IBBrElhCAeXP8tWSqq72TyoIOmslyJKNmhHT09MWZGl2tdyhtSn8URtgjDApmgZ4u1lZbCSdQLVRDAP64zXePvq+fr7KRd9G1Rs6pWNGI/HVPn7CBS3u3os/nhWKLMHNsTg7/EQAUC/e2Ncme6itawoKnLwsVAQBu6tMUHT4z0zj/ygcR+LqOGzaHBbpOk2aChBblit7FnNUKNHfIeG+7ikk5ubh+uARlW9+klueFxe4YMXwi5+0NN0CVUzdz4Q/NCJjZru+ny5NcDknz6ctPNWSiILuZJSXHEMKA6ViwFrVhjQD8QQUb96TgSLmK5I5G0IHA7aqLaL55GTFp2YhJTB1Ih0DfH0lGB87QVf3irk1Sz42r28+V7TtAi/JgnMWTo7DQPrWkpNLz01UTvZJi7IzaIs3Jj4Ur2kKNIYDeoIy6Zhs+Ku3Bpv3d+FZOCvx5MyHFRkMKaOjdvROeIPCjNz7AtEVF1IiofQrDdEIsNjsBvMq3rpzP0h978omr5cdP0hJVTr9wt7guS0p6e4Ad4y+cWY/i9cZLF1ySZdnv8fwEwO4CGql7/91Mewpm/G4teidNgs0ZRWYok0TWuXQJphw5jk/ffBmOmHjkzn0GasBPQaBUEoy6fxyTVLqY3njl2JmiIpM7JfQ/IurByFy8MJcdPlZp+UNxZPQT83nP7XpWc6sB2l3qeFYFqWlJpJSJYBydAHFBiDFYKNSdxKXR9/HfYN93CoW7z8JqjwKjztbdelf7ZOlUxZqRs/ZG/Y0NJmGqZeF0UMShlusOH6slVDuMA4fQ3XlfZ8nJyFswF9OKfoCxzy9GYNYsBKOjqZFSKLSBvw2iAYkRDIJTK458cRmqe5rQcusaVT5VLBH7+lip0krFl+p+7q9iooygi+fwlkNWwKOeeqpKOnl6Fc/NtrOMdG709tK1S0HUCaNwKhiTowc6nwBBEZApLX6rivS+MXzc9DmsqeayXrpuhZQ29Tvryr8sPe2mdNcTKPJFRT5UDDcteo4erTOSEt7h728Cb+/QYTNZ9Dt8mOMhNgQHuo4zMgmowbRAn37h0w2KDfhn0Yt/2ipUywbYi/fhAEKL9p/94i2j7X6Fvv+gQvex/gBbsfuhQtEhDD5FgjMxlVefPCCf+aKEj5u/eE1x8XdFzkTUxfk0ZXgKQvOtZWVafEFBOdXCKmRPUKTsTANBlagJht8gZNqgootvaoO9ql6vPLJNcmre9dU117a7+0Nv5n7QwkgAuFCuaGi4Gzsxp5Xt3vd9zJ5lSMnJDOooIAbqwzh5Vr27baPFiGD765q7XiaHrD6M+WgAQMrmqehs7yiPS060YednBSiYZ0iJLjZiJESR2uk+aGpWtdd/Y2HpaZeVtAlL2hsbqT2Z6Q6FfhDAAzUwuDDwFCDYzaZ764xI+/vG6p/L+vVaA3Y7HQmyNXj+hbL4P2Cni8zrVfUtH1no67qUMu65mjNnumlVRFrYekBGSkG4opn0TlX7PMYZFcM+25+PvMmQx6cJg5LZiERdEChiruvvbrTop89XqYsWLbp94sRd0hE+huQ93PijABD6ZqQ6A8EvYrMm+PiuPd/jTofE0sdrzOEQ7g294pKkr/mlZDTc2ceWL19Sv3dvG+37RufhQB7lXUTCBJI1a8azmYAnN382n7j+1zx35Y95FiUkMymhOMzQo5IL2/IIr246HUItu7DQRU630GikUZb1+Kx5YdtHq60w1f/tdfAWRUrxavp7FxLB2qyZ0Mz/8UWwDGcqnP/X8m/m3XSRMblV6wAAAABJRU5ErkJggg==',
-    'ETC': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAGyUlEQVRYCa1Xa2gUVxSex53ZzUtrYxRbC5b+8FGlRbQ1FUVUxP6QUsoqYn0U4ybRXR+4iVorTqRokxgfeZhdtbZSKq2pUNpSEEkNAVttsD9aDLUFFWtBrdEYzWNn5t7b74zZEDbZuAFvGPbOnXPPd853HvdGkVKq6T6WZWkkG4zFDAWjqKbkvfV1kSU0t85bjL4lZNLVqdLmYQ2pqPiTAWt9dm5u9lVFlY/+vJc1tcmyXOghfXI4+rThCJOsVWbp9Jubl72PMf0FnbGJk/K6dnrfrCffaJ7uGBYDgdOn9YalS/m66shCpuvnuO0K+KxpuhZXuXyjfvP+3ykEeMSzN6CX+iVWMPPF0SNbNFWb4jqukIqUps+nc8EboxsqFlLsMdIOQ9ohSFA/Pm9kmWGaU1zbpZhrSAjd7olzxtiCwprSIgIHA+yZMhA4HQD1Dby4umSO1NRm7rrkJqWbF0JiQdM0VdW0NgTl9eMbK26lG4p0GFAJPGAFTIDXAAaoqkiAk6d4VyWXLjNYLtOVClq7MuVKWvn1VAPgyZOsHz1ht2Ear/VSr5PXeHjvQ1wwuysudE1bXlQbeZeMnpdGKIa0MkH9htodb8LBnznn5L8gaB1lwHzoR0g3N+4ogguXAoJ1hqVrbY/bpzdsP/oQdnoEESuDDc+7wT5gTW1taBVkhL9zxBnEfLxEqjOfyQyfoUkhbsP/Oin5RchOMjN8WZQK3HHjhs/M8zHTf/nHC2ctVWVNTU0pyzJlCBLUj7o7YRsUzkSCKcw0mBC8xXacEDe0SfWhiu31GypLhCkmuj32TjDzNwzxCQE8KTYVV5fOgh6XnEjhJJE2cCSoLz5SOosZxi+guBOSP6DoP42FKs7RjjUHNz/nZ0YQSIYw9dqjheUPAabdzet+HxlaYPrMOU7cvnqv6fqrDQ0N3EtatPBktMEMoDWv148eM+KEIsS/0rEPR7ccukGbg7Ul01EJHyhCCTCTjSVhx3bvoCOc4tKJHgsd+IvkCg5G5ht+tktw3hgLVX5MxuEZEIqUBqw9sOX57niPPLWj/gFZv/5I6XvIvQIpxUIDnc/psRWkBFdxmKIVM8NvIhntbkVTvhNSHImFqprJkMLqrVPi93OufW5ZPfSePAYzgGToWFVvj3XGSTu+CgArNaZPJmEbwDAInUjqlN4kTCUJQziVInJAQSKSzU1YrBn3X+a3g3lO+2gMSEII05q8mf3gLUU4v+XkjtwLzyfb3XEH4ATi1XwCnJR4c4DTN8i53OEuGuO8rJysM3fyun8tqAy9THK9umnaN1IyAAlJ9Kmavh0OrsSxqzjxOAcc7RlgeK/G3sPJ1LnriX7lcr7/+Kaqy32ISZNUimSkMpIV21jVGg1VrBJCnY8m1Gj4fTrarUYhgJ6+hKIQ0BqakOaDDBeyGYfFIuxdTuCbUTFJuH2vg51a5KHs6OyQwcMRy/DpP9UVlZ/H2vn1dSXLhFR3+rL801BiinCfdD9cCNB2TObYzlV4vg/AJwkhHPvoFbunp+iR012L13YveEmlOGiDoFhVWVX2zHfmPtQU7fsZb+e/NH1+fkt08/6W/MXTT9hCeYD7wDRk/kgdjKAB3YMxe9u0x2tPhg61BGPBzBmLF0RA0ilw89mxLYeaqbe0Tm3tY40MpJEqByhhGB63sLpkVfaonJOd7Y/+EapSfjRUWUcbV1ZGxuRkariKqRk2l3voCKb1orrSFfB0G/ZMe3S/oyYWrtyYuEnR9+SR0gASTGwsri2NmX5fEBQj2uKiK7h1LFx1tr+ywtqtc3E7241wzNcNncr10v3mG7OH6oK0f0gDQC3OIFWuqA6PyNH8l5B2k+hMoDqQivgal6EPuSNdTZd7YNlqXQewbUsciF2o1/yj4fI/Em29v7H956mqwJMhcGLhy401HUAsIHNdF0WOyygzzGVS8EsAb8E9YTWOY4nEjPsz/Cra4zYCpzDSvaA/YPJ8SANImG7BpCgarryAk32XPzODElf0dHVzKeRoHMtjaI4118z0+xzH/YbyBHuo91O5DjmeagDthiJO4aBDBXnQaGSYDN0P6YBVgcJEUNADDNySb3Z2d2wYEjHpY1oGYI8sKyvz8sWVYp1weRsuodRD0JapsD0b8KYGvyiJ3oXBVEEDSi4J23tN1wBiQZDi4+H91+F0WDe9HoZcVDjCgn8ExCfRcPlZksHzVOoTxgxZBQmh/r/9SxO0B6nno9lcjLZVzFYsrz2TzgEXj/46+s/TZiCx6XQg4FF76177Ftd1rwKJ44xcQ+C9V6+0wRM6h/3bC6QEq0sWFVVHCkkBUT9sRdjwP9bZqr/FHzrfAAAAAElFTkSuQmCC',
-    'LSK': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAIGElEQVRYCbVXbWxbVxl+zrn32td2Ettx3CRNE5oPmqbuWrp2dEDE/GcDIQ0NQSo0sU0TrBN/Ko2BBAIJownQOk2iKkzb0EBookNJQaJlwOhKvK1bp67rVxKvbT7tpLUdx07sxPa9vh+Hc50EtetN6NB2o+Q495zzPs95zvO+5xj4P57+/n7BmjY4yMTV6Ywxsvr5E20jg4NV0F++Ffe/er105liq8ttVwE+cRGRlxf2Ts00vj85fOpll7DejCjt4af7XyyQYiUQidJXQx9ruf+GsZAX84eDk5l+8Mz16KJZnA1OL6oFXL2tP/muKHU1qz64AchLstknc1kBL9hcf36N9/cjQjg8SmbdTS5Wuawsl7Xyq6MgphvDGpTFjar7yvWcvlw5xEiwSIebtKvG/jEP6+xndt48Yh9+Z/NL5mcJRUUBNwCPpb757UfRwTe783F4UFY3NJa+btR1bBUkUfh/sDX4nQogJy5iEsBVlbJv1FLD2k1jgtY8ffvTYidP/bHCymg1mwTj5h5fFtwfPoq1tE0AY87sEMnnqNH3t76/rsZm5R4/95MhLFlo4Gq1miy3yysv1FLD62PYDz3+/YpJnMpqKDkM1kpmckL+WQmPLBggNG2B66yGbBgqZHGiwhZXHLjBnuUAb7u79xvmfP/RnwDJlxFyLhL0Cy05mD/zqr082tLQ8E+zZylqbG8zE9IzAljLwuw2UM3Fo8SEgMYml/AK0ujowByVOKkLaeTc8PaEj334j+UgVfJ0aYS9RNFolTCTvQVNdbHNQGL56P2VOmRQmJmGoRVCm87YCumUHXO2dcAd8qGsKgEgS0QpF01CKYnE0dr+vov0u/di3ClxMrujPbhHiv5Xspp5wWEA0qsfPnn6TD+gtJ0fQ+uWHiSZ5ILlkGPxHU0uQmj4FlYur5/Oo29gEh1uGo7Md144PkLlTY5hh4lyjS1SWY9vvtj2BYLDq3ECwbliTfKjt6qELk3EIsgumXAdHjQeutg4sXbsOcTQG3d+MAqXwcALF0RGUzp9hjo6txOdrWDQr6uJNi/vQP/YeGAhVCRDRe9XZuNGUOkOUOgRG3TUwlRL8mzbCIYvQUxMw80mQUgF0aQnZoWGk/vInCAE/I4SHFpypsX8crqxg2qajPQH8tDpY7r4r7m5uy3kbgqhtbIFRKsHtlqDm57GYngW1PCB7OI4ELXUdxTP/huiSwEBg6iq08tI1Ds6wTnleg8By8bj6SmTO3dJ+ubUxiK7wfSwQCqGyMIfiTBwOSULgaw/CtfseML4tLMuVcNWA1AUhepsZrd0AUutdqK5+ZJu9AXjnGgR4zwprdXF+5txb72LkzAVWmk3xtXEDFrJwNG2Cu60LmuAAy2VgFHNgmgHBU8/7OuDZG+a/X1iWPxT76ATC0WVyejY3JJoa9NkEU1Ip6NNTkHnqOeqDKM+mQYkMQgU4ar1wNrdB9DeCumQm+2rgq3O5LAXCuMdqbB/7LOBDo8GRqg8m49PnRb7y+kCN4OzqYpWgjwiBVpQTUzDdfiDoBRxOyHzVhs6gczNSSRdKw+9BMdn7Fmp0JGNrQKtvTQJ9fX0YGBhA7wNf9QiBJuSzc8yIXyH5OGFqsUjU5DR3eyN4XnIj1qA4dAq6zrm09xiMioJWLp5M/PGp5y0QDOwzqq3NnzU9EIrFqqy7QtsulpNT2cmjL9Irhw5iYWqKqDNXYM4noCeGYaTGIRmLYKUFCH5uPF+QKVwdZej961W8vj77artCZk0F+ElohiMR8YX7Okd5hNeCd33zQfedu0xWXhRYeZ6XYl4PSxqkSg5GnsKUanmh8sEU6yC19oBfSeIWRohXgxFw567xrMeOTkWjRt8TT7gyS9JDxNuwpbbns6ySHKdEV3g2VLMdZkXhpTgHOGusjIdAKMvn56icjU+81Dv6t+cGYnxjqoa29YEtAb79QiwGc++evV/JT12NemR5l5pOsJIoU37JgLHE01uQwA8pfsTwEIYKlTj43YBn29wU3SZlmaRkdp3Nb3ik94u9Z4aHY4k+PiNWpXizFHb5ab1jbXf0+r1G7pzTIWx2OJwmFUSaTM/DG2hAMODHhcQC0tkSqNuJZhdFTU0tRFOBzIpwOUVoFcWoqKrAdbrYurnj88ePHy/xuNXYN1KwM2H1nRfZ3YQYmxVFNUrlEuUB4fdyx1fymJkYwc6NMn7w8L0Ib2tFwMVw755OtPKM1JU8PynLnIAmmMw0KCU789n03RZoJFIlcCO+bRpW98o0zTLTDeZ08NpfqZiaplPZ6QRXgqsvI5dJIZNMwKnNgxXTOPfeaSjW2UAl5AuLECjlqgnM4NuTKRWrW21HwE6BKgFBcMb5h6RpMsHjdlPTNHSuBKtUVH4OiChzsBOvn8DMdByS041SWUFFq0BRFMbBdUIJn6OLumFOSK7asZVl33I1szUhH0zS6XTB56/vpwR5bq5tlJA6yvVkJuMXIdWKR/w+f7UMK0qZFyGdcdUMWZYF/lBVrcxywZ/maj02PDyctMbz31sywc6EVnDruXFCY093534Kup+T2MS/gsEwDcP6KsbPfT6O8c8QOS6/JGPBZOw51WCHxsfHZ5dD3RRr5dVyY7cFqwMstiQcDlvFKv3BlfGnDCJ8RtP1A4ZhjvIu/h1ApG6XzC/m3EuMpTnw09DNHbGrYz+2wFfm3riQ1dgfuV0lUp24e/f97u7unu+Guj89ccfW7vSWjo4fbW9v5wfD8nMD8Oqrj629iUgoFKrfu337h4HXU/UWIv8BScugxqmV+3AAAAAASUVORK5CYII=',
-    'QTUM': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAALJklEQVRYCZUXC3RUxXVm3ry3u8luviRLEkIkUjkaP1gR9KiVVD75AEFhNySAIiIcEVDOabHaims9bS3aHtpa5WORbzBZ/oQlBCSRioBK/dBY5RcIcZOQkN1Nsr/35tOZxeWQWHqO95zdeXPvnTt35n4Hgh8J81d/pp6+pZf3XzYWNBZCEsNxDgGEA+j9uX/cTAjk4vfUke4HFh/pzbjR4l996s+ff7hrjKRL/hvxDcT/X0ZHE9fcBVCfvudCcZ8pxQNC/s+SEHufcq5ChK6dEgEGepi6gCM8LEeLjFxXlP+lvKk1C0YZAzccOEcDEfH52AaO5eauhstWcbcLASMAIcXaEzXO+3Xe7A+TZl9Ev+CLkHO+MG0hlNiEUkIR0xIpQ24uZcTl3WjsdwMuF0dNtwHodoojAcgr6zrGGQg9TiLhRLPCjnLVkogobaoqzt5xvcDy+vbnEIcGJ9EsBMFwgs1RDPSVVROGfAFqahQHcICCrwF3uaCQ2x/6KXA9aUZ958ucsxHJiL7UFaW/5jp8qYIs9buT3qrFgP1ia1FWk+R31LaWAqQ86S7Jml5Ze/GeKEfl6Qna6m6D/8mCoWfTOPuaa3L/h4P2M8FTH3SNnnOw/T7ngbb1TFxC9UT7rG6d3A0hCOx8bMgVp9NNVVV5xWD8DSl06ceBNAOrSzVAn5fzqkl5JyFg9kDAb91WNHhqlMJbp3laV84TMhcevTwyFh0DHBQ5xBXJxdM9LRNaQ8aJ73r1oxjwdTUT7K9JPIDoUQr56ti3+Kt6ZNAnJgiqJu9pWXexu2d1KiTLt5QMaY3TLQrfwE0Jc+W8ZmLm0gQFnvISfKy5Sz/y9OG2AqmENHWcH8qJtM3sfd5RXp18BCk5nZZoOsIZOaEbfAyHMPmnSWzxuRAeEaIsz6A0E2tqbg+0LGOhHp6hQRfhsBsh1m5S0fksE/ee6cProgY5noxRO1TxvZ0hYzxWFMtIOx7z+v1ZF2SYCohFERRBG0scj+84ke7TcpswZPMGJ9GjbX60LmjNnEq7vd40FXo0jPwGYf6IwTosmLNehl9FWPElcP0NncFUBYI0jFAqAzT9SpiVqelZVlvEt2pbSc6zZXtaF0KMFu8uzRkRP3l8xA43QG4AaK9iL8Ikclqok/LOQ/m+6bvO/1kJXB6XbFYObSsd+nR8gRyddW0vJ1H6jAi7bE4UuHtq3l/jdHE6VLqnpQ4Eu+9Ix/xNcVI2c+95HtF54LHdZwt3lA1vcAkel8DLNcjtkCEHgKaiUSpW9jHG0+VcUfGTWYhMEp+hytqOfImTMHtf8xjG6B3VpUNq03p9VQwpjrn1ndmxmxT0mZ5LD1oQOpmGjAWdFC6OLUKqDWuaW8OWh+W8yQ2uRR+STjG71nsrYFChnH5tEW4374D3HsoBem/KsA+FdicMoD8REyT+whwvMgH4Fzl/21nQxxCu6iFkSczDBS5C+UzhD4c3T8rfgxWYM/dQR36QGAkq58cpoHlL6y6luZ2QyvUSYt7oj4Z+ZhD6VQLEzSaTYgsSMldBdJVkSMQ+tzDLXa6aJm2a57vJIip6tpTkHC32nDHN/4yr24sHbxUWvPnRHadvLfecuVlBSpq7NO+gXMs52OCPRBebFaAMT6RnKOEXL0TJaElz1PBY9KHXz/Fk1WwuJDBSnZPMvwtRNJtxfqa6ZNhxybhp4l1BjYONpxKTVkBFGZdmz/6lxO8v+Ul0zSgYy/WcGi+rZut8AyQ8BxFcKekStgkzYU51g6EprsJh7ZxGdiJFJEYBsVuQ0VCy68LFMFeGZijG70MMjQxrthKr3rMxSQXHDMqtwrvDUQpG+HHiYmyETgnHWs0AMnEujBQDBETksA6ivCisZrer5HfCbB2cAZMwQW9A58VBc0pZqt7jFtZuC2jJS1QS2eqZlF0p/QYjzrshozlRznyKgqNIpD1CeaTTMPxcugXhIZOGQkgUGsAB84f0gAEVk/i+qoAi1GGEAWwRdmWGL0KvEMp6xG1pSBRJqoCwImT2MdChcRZCGgAWEfxXlZcVR2gx40D7+uwkstSuJdKTbcHjCNB11ZNviqVbyVixr7mCAjQSYJPZxi2v/qMouTsuQI5z6ltHhplSATlDjINdNcJH4nRnbcubYo9C9+S8e+YcbL0vrMN51aU5867SubCYuBdCjONtV2jF5+19uSqkm8RV5s3cffEBybTso29sOkXlt32a96IoTvsDpO91iXcIpxzb0BArt0GCfsOiZG3QMN6mnC2UdAkz9nsfZUgVKLrPVd+S3Rslkyg1tkvaVSeEV3MyouRwhMHhgEVvJoSGk03o3RBg8yXjhZ7EGeL6/+VyAeYuyq5jnOLK2tZCt7NAbywsJNNqW58QNv/GXZZ7du+Um5qFSQPle89PkGsJ57NF/P1dRBE6bYDhhsEyoCXpY0mLhyICLhdyl+V/K0ysA6DeHhY7rBV1XEVYn13bPJECeHeqSVkvF0mAGK4UPcKz8nv+wXPJwpyOVCPyNylH4jRGN3IAHymvvfSYOPrZjeOzW1Sk9hLGH9AQanWPTwvEQ1DyI8dtr8Sykqhwp8R8KkKwSxI0yDd2M7yPEpa8RgiROAnbi3O/gkg5NtPTOr2HJ8wS+X/Tu2X5HUKBWEbNjLR9GQH4/iDj71pp8B25xiBGn/CrchWCmG8UOK5zwlgKFX7wrChGLabc/5gRWJBO6CcdCK7ts6QXI1+b16byAyLBBBUO/FHGu4Dwmj6GlyMFB0yQ/hFwlmJRUKq48jQR2TZfhE1ByRlJohi9d2cWXvSFl1YwRXlhud1bMGqU7BOFUYT/S+WwS3yJHw8kDhkRDJJUnRtvwASzxwz5erWv/VumInsa7FoUxRnDwoQNEcccrGL1FoasmTTcl24zgRRKYZcIpi/STEpLuA92UwvPVCLdH4htOr7thq+JJna8CFSP3LzYw037S2A0fnDc5HbHTGDo1CpqtogknqcBtmNzUW4jED3F9L0XNwTgoLzqojzZgsXasMr6tjlJeugdrgKzpignN0+K8Qqy8O46b5EG4L+rS7NWyHn5wY7HMcajVMgHVx7qLKwaBxuAbEhENZS9CHI7nSKBcFg9eWj90BTTHblWPJpA7QlnfcdvpQAEeDWB+Pu4FRvs9z4YNVjZ9klDF955pXlhBOIXKkXBkbwSODFmWYzIWvntqOt4W/jQmJ2l2Q8Py7Qt4pQumbnfOwuIBsjVdNkqG6FrZVEuuB6EAstElrrbZgYv+frIslST6hry0Ye+U/c9tMuqosUbHrGfk/wVnksPGxws3VaaO9Wx99JoiNi0JGvien+ErTABum3LxKwNcbmcu5DzwPy3gjofTRjJSTGpK/opILOi0+0WPYKDyfI669DlhyIUzINGOAVBdowpCRYQDR1zlw2riwuNKVHfPg9ixRYJhjKEs+ZzVQupKlqxtXDQNzLkZM/hcH+tytzh2HepMqClbOm97OUptkQYy2RxYd/3abFaLR8VmwvhP2ua+InNZy+9HzWn/AFFgqeTOLsgXkoLxYNN5F0GRTJlJBxEPUxZzjVLSiKLrto5IfMZKVPKcH//ZixwcSI6L9Hp4LMw1NNrG2S3oXCgIZY8JH4gyMemTLdO8TqyILCKGwaAotaIomXWKUOif8AiJBWdUlWOogB1AEoi6WYca8/k5tcerEJ47FEik15R1ieZFu3naSC04N7B1qkD9/3hXJhFmqa8ofv25z/3pfyQ4Sqm4niffdbhzqtNp+C/EV88Y8bpN2aMcwwYZQHK6Bx7rZxKcmdGI5R1IcYqNxf+M2BZv6lLNKWNjY2ocexY+l/jJpgL5O9QxQAAAABJRU5ErkJggg==',
-    'EOS': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAHDElEQVRYCbVXW0yUVxCef1kWdmHZBRSoIC4KrfEKAlZEA1GKVqBeozbxBe2Dj9YHeeiDGq0mJsb44psx0Zg2+lQpkahFsYmNEUVFQa0CooJcIpeF5bL8e/rNsD+6lbW1xUnYM/85c2bmzOU7B6L/QFevXjXztgcPHhy+e/duGfPGHPOflM6dOxfCBurqHmWVlpaq0tLt/Z2dnZ/znLHG/CchpZTGijGG7d27997ChelqwYIFat++fb8bBg0Z43uyRwn9qVOnjtlsESo3d5k3IyPDO3PmTHX27Nl9fmMiM9mGCacUxVVVVUXr169XMKDn5eWrnJwcH3jfxo2b1M2bN5ezYUOW+UkhKDSxIoR36q5d37cwazKZ9GXLlqvFixeDDxnluT179jyGTJRfVtLF/GSQFN7Ro0d/hjIVERHh5TE3N1dlZmZyNFRoqMVrtdrU8ePHT/oNyh4/H3SQkwVdxYI/nHpFRcV3Fy9e3IIpPTLSLulITU2lWbNmyfbY2Bjz4KBHr6ys3A65b1nuf6fCCH1HR0fajh07eqFUJSR8xjlX2dmL1bp169WGDRtUenq6RCE+PkHntZ07d3YNDg66wPMB/vGQLBeMJI9HjhypgoByOqO9kZGRYmzr1q0qMTFRzZ07VzHP61FRDmW3R0l6kK6LfqUfrIWg3vk9Vy9fvkz3eDz5rMxujzT39/dTQUEBud399OrVK3r48CENDw8TOoL6+nrJ4YiS9Ljd7oKurq7Z2MY4EdRO0AVslLUzZ84samtr01wul/7ixQuKj4+nuLg4qqr6jcLCwknTTHTjxh+UlJRENpuN4DBB1oc95tOnzy5ix+fMmRM0CkEdgNccVvJ6vdmslMGGv3NyluLkrYQcwwELRUVFUXv7a+rs7EBkvmIRSk1N87GzPT3dWfy9efPmj3aAN+jo6ZA3b95k1dbepSlTpphSUlLIarVSdfU1GHYg9CM0NDRE6Aq6dOkS5uyUkJBAMTExppqa23ByQByALsaJCWnCCMCwCDc1NSU1NjbObm19Rf39Axqgl+rrH8qarnPBB1JDQwOtWrWKPJ4BraOjnZ4+fTYfHZTAUtA5YRQmdOD8+fMyX1tbuwiGI7Hfl5Li0sLDw+nevXsUGzuFRkffHmpkZAQRmkq3b9+WlCAKbEyhEJ3QkQGeDJ3Mv0sTOmDkrK6uLrupqZHlfWy8u7tb9vp8gafXNI2MiLS3dyBNNpbTOXI1NTWShhMnTvz7CPBm0aDrWUgDlZR8oz158kTajTuAW5CNGsR8d/cbmjHDRQMDA/T8eTMVFRVp9fX15POROHDt2jUGsPfovQj4c8X9H9vQ8Ggh74iOdprKy8ul6gE+CL83wAFcTKI4Pj5OZC5cuMApkcnHjxsWQacdAr6J6uA9ByAoR0MbzUcI44qKilVLS4vMvX79Gv0+XYxZLBYZ+cfgExOTpEV5jsO/Zs0aROP5tPv378/lOdDbsI19j4GNn5dh//794tTly5ezuOUiImw6wkchIWYobZMTsiAXHhOHn9HR4XCS2Wwm7n+LJYywXwNG6KgdE1pU0mDolo3+n/ciAACSXKGosp1OJ6EGxGun0wFeCpLwDEOPe4hDz0jIKRm7FZWcnMGJCZHD/eFEW3rEAQPc/LZl+LsDbMzX2tpqAwBlDg0N061bt7To6BicmO8YAuJ1EdcBE4c+PDxM+OnTpxPgV3gGp+joaED0DRPrQNFmIv+cMy7ugDQEOAAPZRGepwLnkysqfmWFGle4293HPJ/KaDPq7e2V6uf50NBQam5uZhYpcRstq5WXX0D6TLPu3LmTzGtwhIdxCnhA5uXlsUM+u92ePzQ0GAp+GHd9GJ+Ic80h7+npBfRG0NKlSxHuVrSZIpdrhswxNM+bN08wgQ2hhjQA0QhAy4qI5EHfU9QTv5TGUSzAAbzvxT2Hw9Hjcrlo5cqCMKs1XGdFqAkTO+HxDAIJY1F0DkE9BiA8zwUZs7KycCNa5ZQhISE+5F4BNS1Izyh08IMGKRyzwXwwkjQ8e/Zs/sGDBytXrFjBTvEfFwEXqEpOTlZr16415tWmTZvUtGnTjG+WkUdJYeEqdfjw4V9g9AvMEVIckHKem5DeFbxy5cq23bt3t+C+FwPAeXkB8zMcyKdw14+/iPBck7W0tDRVVlb25/Xr1zcaBt7Vacx9cEQO2VvxGHzMyZOnjm3ZskUigPnR4uJiPTs7W3GEVq/+mqtbjG/btm0Yj5gfsYfRj8nk1zX29bG/8Hy8TvD8+vLAgQPVS5YsUTExsaq4uGQUqRi1WMJVfn6+OnToUCWub4FvtvPu3mB2A3oymBBOgPrTxqsX98JOPNP39/W545Ty8WPlRUlJyQ+FhYVn/DrM2KNjD6dt8sj/3684DdCZipb6qbq6+iSMOfxWPjrcfwF7MkJrLhVUDAAAAABJRU5ErkJggg==',
-    'ZEC': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAJj0lEQVRYCY1Xa4yU1Rl+vm8uuzOzs5dhZ2dZXRYUcblIF1AhBmgFixpSi62tGm1LhT+Ytok/SmqbXkhsvDRpkTb8sE0TTaNi0kov0gLWiAqWi1xEFkQulgX2yl5md5nZme/7Tp/nzA5dqSZ9k2fmfOc757zved/nfc/5HHy2OHwVIrzxIWn+30UsIVqJmUQNoXFDRDtxkniL2E50E5Iw4RNGD1eLJn+aSLEmST5HfIe413EwKR51ECMqiGjE1XsUPIOxokFuLMDlMQNj0M/uV4nNxEFCMnHNUs9n/GqgpJJ4ghgjTDrpmpZ0SN4oEjIuUP841FZfcerkiJeuDZX7NfZpIk5IymuXnvh7tQfkLimZQWwh2pIVDmoTjtfRH2iys3R+CvNvrEVzJoGmdGndiwNj6OjLYf8Hfdh94BKHwUxpjPiDWT+cvSzbcJR4gFCYyjrY/KQBZRfNZf8OItNU6xYvDgaa4HzvvhasWjIZc6bXIlEVQbyS3VEixDAYh2GQ+wMcPjWEV18/h00vfMhpME3psHex14uw3UesIA4RV4woe0DBlKnauUiUuTbleuf7g/DCWUk8ubYV81rrUFkRtoocKj18KotL2QIcx0VjOmHfh1wXoXgERRqz9/gAHntqLw4cGUAzw9LRWZRSGfF5Qp6wG7Zu5YNiVkGIvdPLyr+9IoNN352NG66NY6wQWARkWCQcwi9e/Ajrf9OOl3eeR00yjOW3ZlAsBvA4zuVq01qS+PIdU9EzlMfb+/pcGZEdCaq4vgx4nigQNP+/xPgx222N1W5RO//mHQ3YsPoGVFe6yI561tNifzTsgPrRWBfl8JLU11bCDTk0DIhE6QW2C/ROpiqMZx+/Bd/46nWQB5rqwyLlHGLD+FSOLIlSbV8i4kRHi8bcNC3mvPKjuUhxZ2OkZIJuff/sCP75Xi9qEhEEoRD+/q9uvHlo0M6+87Y0VizMwKF3xpiSzY0JfO3Oadav0VgYXcNFLF+9A+0nh0xVzHVGcoEyZiHxXtmA3/Jh7TW1rneBpPvLT2dj0cwaSyrtJpGIYtvePjz81DGrsPxTGXFs7FQDJsqqO5rw4hO3IczCYYhoMoo3afztD29HC0Px7xIfXuCcbykEqnCrUjEHVB56ZFkKc1tiGM0VmaMGvm8Q+IF1u5S0TY3guoYQMtVOacdUHmeqNk0KYWqjyA4WKhcmCOw8VSVvpIhFs1NY98B0UHmovkbUwz3EZBlwN91Qn6iwhcS5a0EKYfb6ZLIWKS9UIMEkhz/2cKbHR3eWlY/hkVJVv4uXfJQDentbGhFHxtMIruF5PipZNb+yokVLONVVIZ86a9leqdRYUkGDOgaNmdscxYymGNmuEDmcbCxN9bxgehK7Ny4g0bg7vgtTm9Lx6ZfP4OOubrSkwzjdWcTXl2Vw37Jr4I0bDKnShvJFtLGGzJ1RjfdPZo0InSuYxfLAjZVkNsW9eXoVqiodWszd0nWGOzA0QjuoibmY3liBaZkSWpvjOH52CFve6AYLFi4NqoCS3mtnIsZKXCx4dq48YLhWccxHdSKExQsUcbhx6qHMkgEzlVYUp76aDqFCTbK4YkTA4uIjl/cxPFrixttH+/HQk+2oI3diTFWGGX/6+QIaGMdlxWbCXOP7NpRauzGlIwZupLTpVoWgpmxAHS3UROt6jSIC14Hr25YqLiqjIXT25bFyQykjJpFQp7o8/PChqVjWlqKBBYS4oIgr0Uz9GidA1ARIs2ZIIiXCMEmvFms53U8Syf0So9JGWjiuCOVg09ZzjKlns0HK512fwJq7m0lcDqKVCp3IYwnM+TJC6aj15A0J1VjRu2yxFD7TM1iAp8l8KS/YMPBZ/+pX3r+2rw+/296D69Mhy3ytsvHRVtTGXeQZZ40V+2VEMJ7C6uMLlmpmz6WcVVxkwaLkZEA7+yWmd1gLaOeaoPxnm6YqJSsYs/Zzl7Fu8xk0JIDhfABSAi/9gAcVPSClMZYBRsjCEliG2HX0L4MCdDF8lGDcgA8VgpN53yxR564Tl911Ix7P/1IMXaaZT+9EuXCW5Fv/+zOazFrvojMb4P6l9ZjSEMPR01n6mVxxqZ2uDjPnm0lGLc4tsGC5TNsQ+gfyeG1Pl5YIWDu0+WMa8xbTfM011Y7T0VvAsY4cls6sQpHWOlyMKc9VHGx5uxcHz+ZxLVPu/CA9RHmHmbDlLZ2wn5Smugq8u3khwnHFndq4+zDvDwdPDOB89xgzJeyc7bZx3yMD/kH0Z3NI8d9sOzTk3Hxd3J5+muhyZzkenK+/nwVrhy3NjUkHgzmDCwMBqlmGE8xplWM6hgv5aJ1SYd1tecAdyGPDTM2X3rggSw3HKPF1kv1Vbughtg6zpk+ucvytB0a405w9dlWQxAERaJBXqwKbncOGp5sBk4CpxEsgedA5FOA0y/PJLh99l4E3jo7aeYq7ilgFQ7L7SB+27OxE86SQP0TjKX8jOuVgyTxiL8+QCO8TJkTG7fx+MzI1ERRIRHFh+5ERuwvtUheSHUcGsaud2ihfbEti+bxJlsAMHD0Swr2LGxBm2Y7xFtXJKjnnkb0c6RmRmUe2LFhE7FcIBN3TfkXl6+sqHW8g70U2/LELTz7YZEvwGD1xz4IkU9sV1xDlXfASS1/ZgEUzkli9rIGpauxlhD/2XqAzZoB3gcd+/QGX95Cucr3ekUBH5rPEfkL7sacg//Az4uhA3kQaeAvedTyHx1+6gK4hz34H5Jjjo/T7KC+eOd5S+rKl4qGJfSMq00X7fiTnI892goTp6B3Doxs/wM5DWZ0XZeUnOOUnmkcJyiEQKVQNZhG7iHoZ0TNqwnDDeG5NBreQmHHWfJ1TSo2Ofg/DNEZpV8erV0smZk9IfazkSZZ9p0bx4DMfcWxglY/frvXB8gVC13Srs2wAn69clcUHXcvrGY4iPaIQOV9qi2Pl/BrMakkgRYWxChKGDlRYZJO4MjAa4Nj5PP68pwdb9w+zF6a+yvH6RozcPkDoWn6A0JrWhRMNYN+VF/LEy8RNJCZSccfrGjGy2NEl9a62KujgSsbDtkwM0+2DuQCvvJu1Oc9xhvXC7xk2YRlGOU7cT2jnV5Sz/akiRRJ99jxDKDSG3yKGxUpW62Zr+9Q/AeorTqlzvWSUJ1npnZzzSyJJSKT8/5KyERp8M/E8IRcahthIQarSMel4CWpXs0/vNIZQkfkDcStRlolrlvusB688XNVQeCZmyWQ+300sJRSiGwl5SaIjTt9iuiS8Q2wjLhISKZYnZNj/yH8AjJ18sxGO5v4AAAAASUVORK5CYII=',
-    'OMG': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAGiElEQVRYCcVWfUxVZRj/nXO453IvFxQF5FMFJbDIciq6TF2GmpvWXLq15fqnLTO3Wm5WW2s2y/kxZ7jmSsuaH+VyomU2dU2w1cBCExQCBBHEIAFBvrmfp99z5BIXrqnk8tnOed/znvc8z+/5+D3vUeKfb/UBioIHJOoDsttv9oEDCOmH8i8TyY/G2+A8GVz3yG2AqNyk8Zl5hXfQuwHb+qd3BBBhAQwqqusFejj6QyYGdBob3adBDI/g3h4PUOMEoogiJhTo9nKN12DwfgRBAQhwUeigkvIaPtFaygQVDhqwEEEov/JxuZ2GbhCVjWte7ikt4WK0gkcTFFzsNNBYzOckID1SwU3XLZ1+w/4xKAAxHsqr4pqBTS/rWDrfisRYDSEE5GHMe6nMqtMzAlj+VgdO19K6VcGBjaGYPV1HVKTKdwbKqjzIPtCLg/lepCUqaAsCIigA8bziTwPfrbfh2XlWXL/hw2/naY1sTUsJQVy0ihs3fTh9xoW2bgPREQrytzowcayGiiseVFS5YbermJphwb4NFqTu6MKGw26kxSnoYIoGyhAAkseyagPZq3XT+ImfnVi0tgdo6vssBfhpox2zp+nIL/bg/H4ffjl3y/jWL7qxdh3dtHEva2baAhXfb3Lg7VfsOHmhAxeaDMSxLtxSQH2iDGxEEnpGEpe5sfbrcGjMbeKiDiQlK4iiUmlX5e0srE6g5UgErjd7MX9dN+r2ReAkgT4zpxvTV6hw0YDOKBaWGXhpoYY9H4Yj50Qvlr3Zi4wpClqI0S808Y8I1S53A3NSVSQw50V/MF5drGga/4seNTAQ6RHcz8K8WO5GfIyGVXNCTCoeL3ADWSw2Dk3MVj31pE1QsPdXLxqafZgwjohYk4MlAADtmyKey1zoJ5O+wXzXv8ZFiYgmejn3kmr+veZG/43vhDGKbBallL7BnAcAkKaSbAfyqgw0NPmQkc4S4Y4eeiWcjuXVzCgghpGYGIL6Ri8O5HtMai6cyeL50UCUlb2BV3zYLRYtm6IhgUVbc43R7Ms9zfRLAABBapOybDVwLM+J8fEacrJtqCgyUHTOwPlCA3UEd3yzDWNGq/jhtAvFu704W+LG4qeseG+7jjOHfbh4wUBhngGN/WDbGrtJ2+wcJv4hBZ2DWBBQhH5YYQxrZaOBU6z2eTN11NZ7UVLhMUP+2MMWJMSoOEqAz73fg/goFmi4gmOs9qRYFUVlbnrrRbhDwczHdYTZFGz+rAvv7HEjPUlBO6M5UIICkGKUxNe1ArtW6qxuHbH0WEJX3+jD0Vwn3vjcheQYxayBqg7SiyB2rgzFrKk6RrIvOOnwJfaET77pxc6THqSPDd4NgwKQQyScKXUR7VWGNO5FDSufDDHb7Qd5jOEhL1KXq/ASqDSWCKZNPGu6xA9Z+VkMfQOpWlrCpI8CJrE9txKQ0HywDAEgXtqYgmrSaJwD2LvGhllsOj4pICoQHbkFTizc1gudxuNZcE6+s/CFHFwtQkFS1kJQqSxoFxV2cV8Q2yYWKbkACeFOOdHAXp+7xYGUJA2nClzIK3SbjenpGRYsmGVFyRgNGa+zSXCfpEwYJA1GKDyeDBBqtjEq4tDtjIvhABbIgrTihgoDR161msY37epC1hPs5d+6sT7HjbmZXdjxVTceIQ33c08Nwy7f+EXSJ53QzVGM30kCUiCeyLFaT+TNbK/1172YPKMDmUtU8ziVXiIH1bkCA5V54QjlkZn0QjtSyAQJtdD4XiUgAgJA8pfFo3PUCAXVtcwFC0p+KIS/HQQmoZZfnlo2lmgeu5MT2WSYdy4NSwIAmA5QUwsL0E2DYXYiYpqtfdr5BIvMCcROfjvpdjWP40iuDcN5E3AAAA/DP4mV+3upD5U1HmSykWCygrP8MYnkdCSvs5cNTJytYkqGbp79neWG2aLv5v8vWIgCAIgXcqaA9Nud04uIMAVVH4dhbpqK0quGeS3O1JC3JQw6C+/Tg8xXHGnIj4YbgYAiFNuiaCSVl9UY2L5Kx2sr7FAJ80qd1xyTEzT0kG4ffdmFd/e6MUk6HFMi6RmODAEgSqSaJdzyQ7pkpobVS3WMTdRMbl+56sW2Q07kFvvM3n67n827BRMUgAmCN4lEeRvRVPIhnJeEhwWKVAXpfP6vxqkJQzqhLIpIcUh/T+ap5sgk/VigEmbpdEJHeRest8u39yK3BeBXIn3eSZ77cyxBuJ9yRwB+Y/fbsF9vAA39i//n+DcTCngbzsw0+QAAAABJRU5ErkJggg==',
-    'ADA': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAISUlEQVRYCZ1Xe3RUxRmfuXcf2ewj5MU7D149xaB4rBVtqSUSEI4Jj4Mb5NTaWjC1WFtSXkUJuQQUCOEhIqdgkKPHnpZdESFUQCqh/au+xdOl0JBsNtlsQiCE7CObfdw7nW/m3uwuBsvJnJPZud9z5vt93zcThIY38PDUhqHV2Eh0Q6kRQoRHpdb3H6nyvD0UH2hnXH1Zd9LXdARtkfxrdxARvktrPc9U/cPbsu7wZSvjE0JPDn8IXUKXdAZMJgiIjGQ8daIbY/xdZ3vyXmsIefZ/6VkILM1msiyshzyd044UYOaY9J+aDXj7p+2dYfhGmxE1jimP4CKMo9TZDylVwVsYFxyTzUwGkUA00mNJE1aNyzB+AVzNJpO8q0k9iSabCCU/oSSRwegl1irvW7Bxumbr7n/tHIpFdd6ND1e5W1ce9BaD8iypkUVuu6M54/AJDo9GW1bXMueBDc2++du8q0H2TqEHHozbIaBhJJSMYaJx41AEB8iPQ2l5BT1Bz/cptfGCVBxfXt89+fhF/4fUROz5I71P/OnZzFZQkWVlqmKbNCYcabsfvp1OJ/zAYBDxZWI9GEaVQR2rzoHAt4EKR+HnJpp75i3Jm3gIVRA9sLr74tP9QtaUAV3WPcFwmDlDFZ/rf/PQpAOTzd2Pz7rHtBbkkMPO8omuVGuMCmvYUOr4SbXnxMOb2g9xKsUNcJ7Fw50qyb/m1FxdN//VljVD8RiN6ibyA6GSrZ5Tj1S5TyfLAwQsNIRIQkmNnJ8uovRBAQkynsOAIB+cWH5qd+vy7r7ozByb6ZRjdV4tyNp3tS0NDcgLrOm6xqOVefUUeCpbLqMLxXHpAkjwIStYFnEq7GoYIEsxrSpipKJxjLEMKsv3e2d3BlGFqFPqGtbkf7Zoh3tVa8iypycQQDlWMyq0BMswFvXuoPn9631+lGuzoUJb+A/H1+TvqTzsm/tVh/z8aLPyxl9XF3zMt5Ays4OrOcBwp35xRHNOiENs7om/cTE8trw3SHaAaiCCy2/cuoksStDfHQwjRdGVEiyWXvMHkZWE/Df6etH1oFwGsp+0xaqa5LGLu4LoNYgu0GgaqAceOgkJorXPMKPYY1wuC6JQPyra0ptrFj4Adbq5s1ZbLgoqOluWNQMJWPnEqEP/yrKOQAFZZ7PZcpBFROdA1mxU3h0vu29kW/WHMZYUgEWSmGN2cpCBgRlekKkYosCh4Cw+Sw6XQSovij5z4Np940cg9EXrwJJwlJRmWPQnTq4eS3sgRgt2dlQFw/EFVhP+YOoYY0NrnyAe/W3ul42E6IoxjifbS/igvuzO5CrkYTp47ma+y0UMXIl3u7IdnoPT1jWR+9c3RZbu8a1KNZj4Kqttqyxa2xS7d30zWbhdu6S4jXfOdpnXvtc3RbWrQYFw6TbP34xpaM+xyoK/L651z/P58ekME373o5cLfg7Cy173PvbvDvljf+AWvf/0OMckysXTrZN2/WysRysxiVbL6npfwfkrgebeAVkkSkyxWUcI08aJs//y4vjzYOdRyX00EDeW5xqDZR9Vfe/Usn0dZR29SqXgjwomg6gzgVAoEtNFkB71xxQ1AkCFwXoITQza6RS65lcTZ2kztYApX+06FE+mo3FRml6IGlCU5oaeQRKV42GbQUm2xDMUwgTh4po8fBBOCCuEF8I8aPW2BcADMN277ipZXOt5k7NpT6ADYAV4OU2rCi0JndAuh05CLZGW7r/+QGGGIv+nM1IWCJNFFpPuZMO6cTW0d+AFu3xVfcHYQnMaPjVjsvVYS3cMvbNy1DcHPyf6Xz+IY9ypNquJDrdtuROCmjKgDLHkcmLoZEt2+yq9N/tfsqWLG8+9NOHgvFfcG9oHMl7t6+1CmVljUFFWsCISicab+7Pe6r3ZicwZo9EUc3BLw4b8TWW1nhe9vXEp06zfdn5jfh2ipS1RV1I1xYZVHPebXAawGUJrlYBzOFlPIPYrrzghJxQRngbxwAAuCfhvIKsY9/cEbqFYHP8IYd2MnkAfsghxf9B/HYVipARke/vR4m7DhCxFVlZAU0M0USFZVeeDB9c2wJyDIocCEgqTMTbx91NE3/EZ+Xr25hmZIZzKzshEfmy2jbZZkA7LH8pKvCHXnIZCgsWWMyIL2YyKA6xkWvD66SafY1K27gVoakCjhxLpH7R7tecANWnM3OQ+U1zTdiKJlFiqj5Ole9pXlL7i/vOSnZ5yjWmv8z75WPV/j8BFxWiqrMan/tiJ525tPTd7c8vXidbMOmNCDK5KuDI1Cqvz77iO6eUkLalz37Eq2FXOnm58A3DVw5Wv2U/+HcQkmQh3A3xLju7RT+67NtdBQ4jsLtYj5u3w/GLqJj+Z9nInWbav86dMjz5IHPRFvXDvtcdXvOkdz2iqDbYeYtJyALpG8ib4mpYJ6Fy4FN55NTTy7Hu1TS8gZ1EUaOOtwleZpNs7Qui/mGkVrwANHXowdqy9pcIdyj7juaa8xWjJVjkUKRRtAyCb3LrY2m63Mxsmo/i14G/ppIl5mRHoo7R+Zd43T8/Q3/e7pybOPPDsyC7t8ZltMV5OH2j3WNOEfzJZO0ryAb0mxQ8TucPEw68xpcGntkpn2HKudidoyZZ4wqva/wcGzUfiV1VYdaSz0L63a7nU4GPPtNsdNdGSgtLiitrGeJudJRHd0t0dK3/5ug9e0nRvqQfiOig5PBqJvvGcnN5+M/KD4ICy12owZgO3GrqY+mZwuVyG52paPpu12XOSa6rQVlcz+ObnXTF1+OU/3gjHHgK+ZpPL3uUMoYR/MFPF+UkIcRlKtrSdnrPVy5MtVYh9fQuKIWSGS0rJ5OEaAb3/AQq+qBPnprvHAAAAAElFTkSuQmCC',
-    'HSR': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAJW0lEQVRYCc1XCWwU1xn+31x72Ni7ro3NDcFGBqeEpi1BiRRcBQJp1FKR2KqiliNIJAIMJOWKaPA0iYCoaWhCG2IwkDYcrd0WRUBoKVHcNCIp4hCFRTSlqg14fWF7vdfMzryZ1/8fe40JoDZSpfatZt/M+//5z+//3xuA//Fg/06/EIJVVzdKd+JrbKx2suu6LqRIpPE2eQ2NVS4DJrJ8X3AWtwn8ggIG2O8uR7mbQF3XJV1nrr52/7TW5vg0ASzJmPAiwS1XLhqRZ7z61vcOM8YcitKGmoZHO6KdX9JUzRbCZa6L/wKCpmWePniYRXRAeaC7n9d3VwOmRKZ43quqfwp3EntTSQMkGfULjKZQARgcRWHv4YU2MPHCyoNV3FKXpFNpkCQJXNcFTfVBXr7/+8gTaaoECZrgNgNuyy15o+sfKpcqitiiyr3+jZufOOAPuq+R5TY3M/gDX9DpfHTWpIWkWNcb0BqQKh+fskrR7Ai3bY/P5QKGj/IfrNu/bF8p1PgqK2cCyaXIkqzsuCUCpJyEIpEPMHhzychQe7y3F1zbYsJhUFAUzMya/0A38eh6tUXznDn3pVYu3tOWjNsVAmxQVBViPclzRLsC2zO6vp1uvdGf3v50DIIsq/y3+z4dff5cS5XNM6gKZJ+qJhMpc/7Vf8TmusJ2HC7kgqKcjrHji36cMW1LkpnkcBCBXFlquxZb2d4anyArgjPQlGEFytay0lEX++LJEolJFhqlhYb533ten3cla8SgAQANMkC1s3xh3R4joS627BQmV6IEQ8Y0gTs25g8fQBAMWDCY49GyXtFsGGmkIfS8IbP8kO+XtiWqGah+FxxQJT/ImvWH+oZlc5GFUuF6+aiq6leur//1wzc6Uot7etp5Op3iyWScJxJ9LkcXJaZIaBDaIzNZliGVSopEInHLJVyvLZDNWHcMHAcc07D7UAYYqZQdi3dZibg9Z13NL54k5aTXwwA2FA+d15u7Nzu2wPwpVEaSIssM7cy4jpsE5qRQsERNxXGEJCssjPf9ESSfvdiADwMwCDK0QyiqZDguBhccVZYll0Da1ZZ4ORLp/H1FxfCkVFmpkxFiQ82+p5Mx+yHBONW1UJUAKyrJ31215KHwxPLitf6gel7zKx9JCvvLmAkFR6ZPnzR1wtiRk8aWFUweOSK//IGHJ04uKQmfBkHKgMuKCqZtXz34/nMTikcMe9XnCwK2Bg6MW0bCKd+57fAKYlSamnTeUH+y4PCR05tsx+rPMjqvam7r5HuLN1VXP2jU/mDfPeDkfssy+4BbMjor+ta+/J3VGGuThGTHioX1GcKNwCKiFGDkPPqShbO3/GzHsXmuk1PuYoWgIdB+vW+zvu5Xpheujz+OrLUMGIdh4tRnVMUHRcPzttasnxcl4ZgfmzsmCnZMFzI4s95YDPwYKBkvn4gIjWZN81LnKSewUkOi8bXZE/uEI+9wBD/FBDvOJHHCzoiPrjfHn1TefuN42Z//eGm1ZZuAOULnFDknXzn3ev3iHdt2X8X06GgU4YoyiiwKg872eOHWF9/9gIwlEAg0UVZk6O1NTKIoIwQ9bFA3pLF0aZ1aV/fMdlx901sY8qdcONtcZ6YdPyp38AVZVQWMGRNagyqdxx5703fs2GBTQkVeowIzbedevtB2/xA5ZBwagV4jbolvKO2zz9owaAKb1o8GAUr02tpaga+IJFYXPqIE5ELFjLvCTwyl9HeHQf75/b5sDXgc9Da3vaaIt/R066DqAf1WAjYjUKZ8eXRNX/eVmYZh52HKOMcuer0ltgVz+gFj3xjc70mcJwSd8weUmKKoRzIZ7lBnQF4qN1A1ba6RsorRwFssSCSi7OTJawFJMlWORUaywuEC0dnZBcqKNY+3LFuw6zXewV7ijoGhtLBO1Kmrl9RjmTT9hJizcSPBaCCEi3J6tu9ZuojSRPTsWLlo959aU7FiYNhMcCAuvFScObPTbtg74xXDsJYz4fYwRKdlcSUUyqP9FWDGrOmv+3OlK4DlhzRmmmm40ZXa8Kr+/miiO9h5UFl/s/GQKGm47AknenZgIJCN3PdSCWaSZ4j24aFzoZ6u1Pz2q4mcjmhiTLSlb1Q6aYVDBdo6qQr3gAUL7kuNHRuqVRXNq1EEkpNJi8K2aPsb0ebM5JxcLcx5P7oJZGaa8xNHI48c+c2ZOUd/d2YuXSeOXpgtmBjmYv+lnm1ZNoyfFK5o+Xui4tDh069kDLdU9bnYoJgdCAYAN7MXXtzy3b1ZL2gWzz61o+lGpzETu5V3ylFkVSosGWaMHJV/8fQn//y6hEXZn13mhMI5WJIypgz9Ja9xxu0X27TrBcs7DuX6IQevvt40ZDKWwM6Oe5Us5YV8F/e8tOKrrILZXgpwU/DmkeNC67GDohO4SaFJZiYjOtp60XmMLVXKILSE3NURc9uu33A7Wntw7vZmLGNML0IVDaLTUzJhQPRat5OxLAcjR8YJTdOgZHRoIyq3SG82Auga7Qk6X7Zg59uxG84zCEg62rFAjmKVlRdHzp5qnibJWAJohMD+QgcOz1V80xu4zrmbxEoiBBJi0BqWi5jSKBrUrFQ5AIFccai+Yfl81IVO6y4FdWDUIqJ1KLunaMNl3nGM237uclfJCwe6bct+yqf5vmI7JkejlFBhsDU3P1AT7zQyTEVXMe+BXIX5fIEHYz3pQknGhi/Ax23nvKyyy9gBfA4IJxhU/cNHFJwihULUImKxD2TVo9HkG3tOZzFco8Pm4Ni4+t0ZmHDgLuDZAPCg6XN+umvJoUGGgZtVT7+zKpWwHmEyT8kYu3CxsuHn7zx7/PN8Ax0V9d0s8QGefiPooEAXHSKJ0H0jeb+JpyI8IwAewHAni4f0NQemEq2iQqeShG1bDo1vb+sus7kBtmVphpkkf74ZjUaDRKdtn2R6peo5S6t3qGVaHKhncWDXieJPP7l6ors9fS9InsFERTqDQECBCaWFy3+4teqtTc8feKKrM7W/r8f04U43IBb58JuosCSvpXzyqG8vWzvrr9lzIOnIjiEpyC4RgigSAGf/Fk3ioXTzuNKCwY5HSEeEOcJxc0FmF4kvmbAv5OUFl4bCgTS2AK+iaB0bGGi4SQeCcic91+q1Qkec/VcHefUfChxScTffuOPiTTIA5W3oc/a+Cm8uVVzCDxMdDziCNeIHbGOWOGQmvmr8QO0H+RDC/8vtvwBO/LJ+/tIqbwAAAABJRU5ErkJggg==',
-    'XLM': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAGP0lEQVRYCcVWfUwURxR/s7twch/yJR93YCriF1wV6lVBqBargWiwxpbDWm1jjRajtRpLk9qm5UhMGmvaVJtoQ9BiNS1CK/KhgopcrfzTalqN0GKBYNETVOAODs67293pzMLx4d2BRExfspnZefPe7zdv3nu7AP+zoAnGRwaDgfpkTCYT0mg0AnkXJxjD3R0BYfRFRay7RlqZ6EOOhNHr9YPAKQDK5SteS1yRuXHTu7s+Mnx+8PALdDclONJq6O1p2LlscXp6+sywWXO3xsTGrI58blqUWqNhFCoFnD1VcumzXduWYYwRETwEOzTjhqbjmlFwyeGGrF3ZCS8l5y5e9oo8ICAAACFgGcSTgQsKCZm3LmFZGAFv90bCa2hGo0PCLtnt2JPz5dtZm/e//maGXDVZxYuiIAJB6uuzsYIAEDwlxL/VYQ+nvnJzc10RG+F63BEg98mRh9ev37Lm5dS03TFarVBZXoXs3V2cQI4dvzARIiIjCQjGCoXCZ2qcVg1/XLleFxv71ASkEqPg2dlvKeTquC8WJi0CY/UlmBcZwuh0adDV1QUnKypBrkyFsNBg6Y4YkfEI7ArDmFdA7y4lxUAjhQm4VNPtPVM+SFu1agYvCLz1QTur080HgcQ8MDAQXtTGwu2WZuzDAeq2WPgbV367Q8G09fUek3BUAnp9EUuz12g08IQIV1eHfTdu3BKvS07M1pAwY1FkRZaDzs5OYNn+arxjMkFQUDAm2QBt90z3ojuvtVICOTk5Hgl4zYEi0lgyMzOFq1evyk9fuLx956d71/b29YU6JikDkpcsVtFkYxCD4hMWQWHZOVgwNxbu3msDC3CQMHO6cL+9k2lpaq44bQbzwEFIWrqLRwK0q1HwQ8eLZn9/+txJa68tTsQiOVE76NdmQFi4GtvtduluIyIiYPLKdNzc3IgCZ8yG+dOiRLtD8Kmuquy2tLZ+RSG12npcXOwOTlfcCJB7ZgwEfO+BvKSGhluXbA5e5iT367Q/Ao0mXFyYlIR4XpDAyfWA0+kApVKJdDodyQNMw4xqf7kM12trt544caSRdkri0+PpKQG3HCCbpbvyYSBewKLBj2O3TJ+q/hpE8c7KV9MZf9JseN5J+k1/ctOR5CJYrTbag3DDX/XobElZ7rH8Qz8CAS8uLvYKTgl4FBqFxxUf7/umsqmXx62PRP6W2YYbu+2DD31vtWOhtqEFb/vwk+8GbCnDfpaPOxv27gZEdYQALTda9xx5fOlaAN9x6mJJCXRaepHfJBkJSP9Xlo4y2STc3tbGFOTnw4ypkYfpfpLE1LfHzKd6lwx+yVwLw0ej0SjWpBhxrhHw+UzuDXXvvqTyGyQdFVEoQh0KpPNijuPA1mfFR7/NE7rMFkYml5t/ra668OCBlm1pMfazHO70sbnHCLj2kM7DIAOI1sKsuJ6e1t3+c56Dd57fh/qqN8DZC+exiABhLKDCEz8wjU3NWKlUwP2OTjW1DwmpG/P0dJ9bFdDFIZFyQYSHd9eqAsxMB8PwLERzKxJv4r+Naaji7lELq1R2325sckwJDop2OJygkvtJSeel6oZcD8xGjQAYQHLmI+Pm2swWYJycKPA9Tvm//mh++JpCk2Cb0/N77YLUlCWrfX18uhmGISUp/4f6TtFqx0xAum/0COhJmRaDIHLsQz9GBvyf3b4qPzk42Liya9tPbdqPkI06gQMH2nfsMRTwGN5XhwWW0qUUANFIJ2OIVwL0I0REigAKi9nrsJvVvo96FU5V5DHZpp/y4T1EMl3PXuxazuRlZTknT/avE7FQsXPz5ptAm9nT/IxScEq8pqYmAHv52XTtcY1HSNs+WFAQTe1ca3Q+bqEfIWr0c2lpcnl5+Xo6r6kxcCSlJVK4CNxKdzjg8Dm1HUtGXAE1pmGvqKgIdDqFZBHEG1VVtaFLlybflxyTXosy+xNzuGNiQ9QY0d8uImPW/nDbEQRcCp7n1wGDTcTnrNTUpCq6TkFcek/jgH7UPZ7sBsuQhp46OXPmzGoyMixiI3o57jhdk07vyXoC1qQIUAAiQllZWRQ5/TTS30vJL5ZifUZGF9ExRDeusI6Hl0SAnpIakb7eYbVa88jPiFTfpJSeKbhXohT4WYbdK/CA4ola6FhOnlT/Hxh0tLJyBDVNAAAAAElFTkSuQmCC',
-    'WAVES': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAAAlwSFlzAAAWJQAAFiUBSVIk8AAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAAB6dJREFUWAmtV2tsXMUVnrn37sO762e8PBw7tURDf5QGqhjJpapE0gJFcX9FKaIRVehDDVULojzkKKQEAT/aCip+WZVSQVuaIFsVVMFSIxHs4NhBKIX0kQhIBLbrXWftfd5933vnDt+53tnsGtsyUke6nrkzZ873ne+cmbtm7As0KaWmzP9jlh4bm11895WP5j6YiqVPYm0HrY1KqSub/2uvwNHrZ3O5kacvL8h7py/Ku6b+K++e+Vi+dGk+lpJykED3jY5umoSxGZYA5Wgu2U6ls8dOJs0DH8SSTqdmaLbLWaladY9X3J6yPf+3gpQ/jHB+ejN+yaYu6UYbXpmdDdD66URyZDxZOHAhnnG6NN0ou0yrCK65rjRaLMv582Kl56UL8b8uS7lTSqjQkLL1/G9IQMl+oL+fzaRzf3o9kT3471hStHNuFBG5IzizJWMWtLGlZnQIIQ5/mrr+jxfik2m2bzeDakcn5IYqr7tI4Er2mUz22BtL5v5PUnkR0TS9CEApNCZcyRw8ArVpY04IqQ/ohhi+YkaKJXE8I+W+Ts4n941Kfez7XKylwpoEVM6pn0ybvx+LJfd/lMyLMHJeclzmugBE5AKgTg2c1BCYs11Xv4Vr4tn/Vbp903NvgsQQkSAlju7izmoSaxJ4ZnJSB3hoKpl94R/p/E8IHIWll4FAkTuSIkcKFLhHhBSgVICIYPp26Ypff2KFS+7C2FVpfe8Gzt9FTXCkBTSvNX5tCFlXqh2dDP4rWxh/eSGx+8NkQbRpXCsJJJRy7snu5RwEoABicuDXBjmPlFcbK3N+VxOzFtcP9wcLw7tv/G2E+Z7jnDURaCrCSUROhN7P5H45djWz+8NU3m5DzkuCcZLbIkAAoOAYeLCKw9y8DV5CulTwNqWG7MgGT85lep8uxfOXq5Fj5xJPIMSvk38EWMetD2hBtbIj5lv8PlaFxhasBUVFMgPVJiNkYq4iWWswon25PayZWlC76kihw6YKWxeKOF66GCtRvjjB8DT+ZGk7Wl2Feg0Ahy4br0i+Ge06xXXzaDYaPXo2kZQd3JCWkChjOBKamLaE/uSNEbarr/1Y0NAuXEoUHzwRD+w8m8w7X9I0I4ta0F1cA67jpHjYOHSzsfDQN3oeAnDRg8cyeg/LU4DAMeHVQ7VaPVwqVubuCAf+eXdf+/Dt0ev5XNVhBlwKwUXM1fVDN7Q6P77lup/eFfXbt4e1n/381s6RH/X7X/9WZ5cxZzHRRoUmpJPlEWP4Ju3K8J09B/OJxC+WlpanC4XCbRTo+fPnfR6ZxnzYtv2M4ziyWCjKYrEoEfbBM5niU4+8vyi3v3lJ7jz1qXx8ZnYh5sj7zFz+78VSWeZyORlPJKp2uXzk5Fx2/Gtjc5L94WPJXp6XR6YWr5SkszcRj0+nMxkZi8VkPB5PLy8v7yLwiYkJo34KLMsa8fl8B1OpFOXCRaXoHVs6Ibr23Kkl8/Lxi4u/6W8NLzw80HvIWE4/HmwP3wNbB9nE0dL0UEuIhVt8j5xOya+8eDb24L3bwpcfHez5XXJ56Qjj+s2mmbMpWB3NMAzoqO/t6el5gxOLwcHBV4PB4H1wKDQ0Sgke6eKSb+/o0KRtj9iaNqpr8jqrZB32B3070hnT5tL1wYyyh/TYWqS1nQUM9pcC84+FdXdH0cz/CrdlV7lScRCpsWKL5CA4BMv8fv9eXi6XdwH87XQ6bSNyzyEZ1owlrnfW1tbGoVAVhAKwYaVSGWUm6bKiM0WHwutgy0OhMIpP4CCJFtqLlOJsMHywqCNzz7cAAVJinpum2Y3BDBxvL5Xo0EiPaY1AfQPedXJC6cGYVPLWGpyu2AJe4ivpurg8Vm49UlP58Xr4cbq6ugzU3POq8r8KphNgHK1UKvTRWInuGuO1wdYg0UiocaxIAEOBn+jr6/sBRWIEAoGLYDuE9OdJGswRiSbWje80pkZOVb96TO+kGD00rr03gdNe+uR6ZzIUCr0HAvfgKSAlHgm1sRFEzTU6pnVqao36xkbvJHtHRwfJ7kVes9e8i2hgYMCmiwEkzoHAHhCoKBI1wybnBK5aI6gCXj1H4J2dnQb610h2BU715BGgCUWitbX1HRyP7+KcFunMwhkdmzqB1cA1Z946jRU5tYdyTuCosde2bt16f82+/mOnToAWFImWlpYzUGAI9VAlEljyaqK2uYmMAlJrqqd5ipyqncB7e3s/B062TQRoQpGAEpNIxxDwq+jXVEKBr9Ur2TcCJ7z6VUwvjQ1ODSrQbDb7bXygxlE8ATirH9HVoLRXzW0WnPZ8TgGapKZOByr3NFQYQkqs1UqQHYGqnsYKHLk/vp7s3oban3UJ0LpKR3d391sgsAdELBCr1wTA6lE3gtcKbj/5wHy94Oh9dduQABk3ksCFtYcKk0jAcVNhqsjxzTixmcgVEe/Lp17W64kEAA1SAiS800H3BEDxK9zFd0cIqnaSfdu2bd45H8X/hyB67cJYx7lXhCQT1ul3QPMV1rAJNrC94sc3q5pIJL5DMoPEFoAyOqko0lcR+QMNWzY15CmZakuzdHU7HK+3A+D086kdj4WnDKI2vpy9mUxmP4jgAg29F41Gx9V+U8ot9Gu9i/Ocmluv/wzCxwuJXKQp/AAAAABJRU5ErkJggg==',
-    'PPT': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAEDWlDQ1BJQ0MgUHJvZmlsZQAAOI2NVV1oHFUUPrtzZyMkzlNsNIV0qD8NJQ2TVjShtLp/3d02bpZJNtoi6GT27s6Yyc44M7v9oU9FUHwx6psUxL+3gCAo9Q/bPrQvlQol2tQgKD60+INQ6Ium65k7M5lpurHeZe58853vnnvuuWfvBei5qliWkRQBFpquLRcy4nOHj4g9K5CEh6AXBqFXUR0rXalMAjZPC3e1W99Dwntf2dXd/p+tt0YdFSBxH2Kz5qgLiI8B8KdVy3YBevqRHz/qWh72Yui3MUDEL3q44WPXw3M+fo1pZuQs4tOIBVVTaoiXEI/MxfhGDPsxsNZfoE1q66ro5aJim3XdoLFw72H+n23BaIXzbcOnz5mfPoTvYVz7KzUl5+FRxEuqkp9G/Ajia219thzg25abkRE/BpDc3pqvphHvRFys2weqvp+krbWKIX7nhDbzLOItiM8358pTwdirqpPFnMF2xLc1WvLyOwTAibpbmvHHcvttU57y5+XqNZrLe3lE/Pq8eUj2fXKfOe3pfOjzhJYtB/yll5SDFcSDiH+hRkH25+L+sdxKEAMZahrlSX8ukqMOWy/jXW2m6M9LDBc31B9LFuv6gVKg/0Szi3KAr1kGq1GMjU/aLbnq6/lRxc4XfJ98hTargX++DbMJBSiYMIe9Ck1YAxFkKEAG3xbYaKmDDgYyFK0UGYpfoWYXG+fAPPI6tJnNwb7ClP7IyF+D+bjOtCpkhz6CFrIa/I6sFtNl8auFXGMTP34sNwI/JhkgEtmDz14ySfaRcTIBInmKPE32kxyyE2Tv+thKbEVePDfW/byMM1Kmm0XdObS7oGD/MypMXFPXrCwOtoYjyyn7BV29/MZfsVzpLDdRtuIZnbpXzvlf+ev8MvYr/Gqk4H/kV/G3csdazLuyTMPsbFhzd1UabQbjFvDRmcWJxR3zcfHkVw9GfpbJmeev9F08WW8uDkaslwX6avlWGU6NRKz0g/SHtCy9J30o/ca9zX3Kfc19zn3BXQKRO8ud477hLnAfc1/G9mrzGlrfexZ5GLdn6ZZrrEohI2wVHhZywjbhUWEy8icMCGNCUdiBlq3r+xafL549HQ5jH+an+1y+LlYBifuxAvRN/lVVVOlwlCkdVm9NOL5BE4wkQ2SMlDZU97hX86EilU/lUmkQUztTE6mx1EEPh7OmdqBtAvv8HdWpbrJS6tJj3n0CWdM6busNzRV3S9KTYhqvNiqWmuroiKgYhshMjmhTh9ptWhsF7970j/SbMrsPE1suR5z7DMC+P/Hs+y7ijrQAlhyAgccjbhjPygfeBTjzhNqy28EdkUh8C+DU9+z2v/oyeH791OncxHOs5y2AtTc7nb/f73TWPkD/qwBnjX8BoJ98VVBg/m8AAAAgY0hSTQAAeiYAAICEAAD6AAAAgOgAAHUwAADqYAAAOpgAABdwnLpRPAAAAAlwSFlzAAAWJQAAFiUBSVIk8AAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAABi1JREFUWAntVltsVFUUXffOnTuvPqYt0wKlDNTQlgJCKBKURMAfPjBqghrjA/1BEz9MTPzwkRgNfkmMAWMCEU00MZEICiFNEBSKxBAKioZHC1JsUaHvB21n7tx5HNc+t9NphQ9/hB9OMz377LP32a+1z7lG6bwVCndwmHfQtjZ91wGdAUUU+ElF/AYszrK+XcMSY2K0f4jEUA6oNFEeMZDJKRjG/++GafsMDI4qPLLGxgfvlWHtEj8Gk4Dw/T5T/8QNn+nRPnolfllcm6RlNiZmkROe7fNpvqynyuXXsi9ykOAl9ehXWL86iDVNfiQSQMsPDkINYfx5dZSemJhREUH/DQdIpGFFgyyViYFhehmwwFTBb/uQTqYRLQkgyyQO/THMTAZRFglgYGRCzslwP4iBsRTQ66AkXgzTNOCzo9XvlMeIAcvPg6I4ecFG2g7gyrUBPLS6AbNixbh4qRvLGmehoW42Mq4Dx81iWUM1imwgPjNKHxXq5sXQMzTOaLJYt3YxioMGOvtGsLJxDsKWgQXxGDr7R7B0fiWWLq/F3z39cDJMQe2SVWr3zpVq+/a31F/dgyqZSqjfzv6qduz6RI0nRlXfQJ/atPkldfR4i3KcUdXWfkFtfuVV1dnVqXZ8ukudPnNavb1lC9cdPK1GffnVbpVyk6rzaqd64tkXVEfHJbV1+0eqi+tNL76s+SnXUbv37qV8hTKDTGfQD4RDFmbGyhC0QwgEQ7ivqQlnz7Wjp68P969sQihQhJOnTiMSCeOe2vkI2EHKBREKhWH7LeqHgWIDixc34mTrSabXxKLGetgBG7ZtIxgIYWH9AoEBWk+1YtHCRlIWzBzbIMe65Yj6dDqjBXLZLDKZDJIO0+2koCigVA6JpIMEeUrr5KjDH4uuz1BZItCHLHVFz02nNV/Wnjz3iTrXTSOZcJDOpLUtwoBo1O1GSpApQ1ikJQoBSn6YNGAagloO7k+oebP+77Wu6OXPys8iz5zrs8MRZjkQ4EIxB8LWO7J7iyF7eb8mfSkoTLImVQucAiWbSgfk81k439aGqqoR8krAcOiZ9qFwqJRj2uBSIkmlUro0XlT/kpmmcPNCsnLteg/ic+YiHCnCYw8/h7J5ZeKAQijo40VT8DccCk6c4BkRg5lMVoOvMhYjVqR+BfmbzU3lCMaYasvCidZf8Nobb+LJjRux78AXGOq8APNGUuHr7wcwOGIyEy72fLsH2z7eSSPZyTp6xynEZlSi+eBhdHR0we/3a3BNNXVrmlhhcALqNatXob6+HkdbWlBXV0/xkHSBgc8+7+WNJRHl8Pq7H2Lb1vennSURCGhajh3D8888DTeV1uAUdP+XQuiT2TGxWDke3bCel57FbuCNCAG1NhUAr2cOA3XzazRHDp5EMGkxJX0vw+QbIbgxWFcZWlYI3geywYrpAuWdk/oLJ8ssjI7JbZnvOAJT9PTxlM6x16VP88N1Xd2vcqBiFuR+0ENkGVEykdRlkCAkxei/rC2nUi4ylJUARG5sfFzP4ohkTUevvTOlDWVkYTEFcrvlo5LXqqa6mjeZn5dKhjdegLT0rgSpUFQUxpJFDR4WmIPyihnY8PhTNGQgPjeOaGkUaQYT4q26/N5FiITDcOhYWbQMuXicj5a47cDM6pYrQXdvH1p/PoMbY3wOUYH9B5qRYp2uXe/FvuZDaLt0mY/SFbHPK/oifjpxgr1cjYPfHUU7+b9f6cK6Bx/AN/sOwGcFcO58O/Y3H8WhIz9i3txaHDl2nMg/jLMX2pklCweaD/KkCIyS+AolLTjkuMD1YYRqKlDMqHsv91CAd7RUuLQUGCFoQj7EZpeib5x09zXukQ/qVXHu6eMySjk+2xoBnMsrgMEhrkP8sfbRcmB4kLRkMoeK2ioY8lkugBIn/CyDy37PkhGxLWLCOypLbExcvHxCs/x8MxAg4NKkLQLS5TeBbVGXdZePGOka+YBJy5p8kZN9WVvyXhAXYi/hZjwH6I4eYmRqYwkOxDnheQ4UdqWCGmQiIDT/PEnvq6ig58nlW1bkBNTygMmYAKGmpxkXTl5I6IJpWenCaDB6q+n70/W4N2HM0+NJnm2tOtGG+WNu/3zXgbsZuOMZ+AdzD7UgxmuFlwAAAABJRU5ErkJggg==',
-    'STRAT': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAAAlwSFlzAAAWJQAAFiUBSVIk8AAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAACMVJREFUWAmtVwlYU1cWfi8JBBKIGKe0tVJAVHTUkY5Vq0YWQbSKFe0HU1qcrypLW0ZxozhaNXSGr07HXSAkEKKsGqVUrQuOFlvFikJWEpawSgwUhABRwAC5c+8LL/Pq50J17vcldznn/Pecc8859z4M+50tTAropEhKmX5K+u32yeRcSqGRa/+3HgCA+/NLGCTg5sLK3UGiSrAE/rYXaviQTiNokAfxknwv6kfFiCwLD8eHEZi4rGFWkbJH1EXnzHUFpoOYxYJ1M1y2sgd7qoKmcaO3+LqXIj5+SQmDHxAwhMYv3QhLKFbHndbsXJSuBqtEMmNycc37JPDhm7VLwsUKg29mNfg0T5VSDYCzlcanQddYPUMyj7YPk0ptZ52nMsz+OEumCpA0gjVixdE20MYmcMJgPKAfbFBZZlxhVXKwuAr4p5a3HyhpiCT3oh4dufbMnmo1GsfkV34ZINKA5UJl55GfdatsghQFqYEpKW+ZuUJYcSMouxmsy1afL9R3ThiRwalG2XCoAyqDRKP3iTyu1PpLGsCG/MoMIwAuBC+0mFCSKgjHxBolCzYVamKCBOUgIE0Gdl2o3WRjf1qQPmG13Y4iDT8goxrwjpbfP/ZzXSgpPBpXWo3gE+d+zWB0X5utOMPLqgehmfLbOeVNfyaxbClrG0CK6E7r9LXHlVVBJ5rB+pxKoQEYWIRAmPSpVpNgT+upyvIv6T5YKqh4sFRSAz4/pf0HNNiazhCXkIULdlvPaP65UKAGfqlyQ3Jxky3CUTo9bYPRrBEZMLJJJwCcDTmKY4GZtWCFUNa851J9IMLApRoD78zd9gPGx/S5ro6W9LhV3F0Lxrh1YRiyOsyC4zgYzWbP40HeuM631oQj/6nhXdD17e+3WOb5vM5MxcLEFb3YYR2IzlXIoSccCSC+xv6l8/cZmsQIy+1I0omyptUzDt4BKzOVAOel3AVuLPz6/UeYD4NOc/R9mxXFD5maa1UEltW9/sOv4gUUlKfDwy0QDxTXmVzzShsPGyxOEexh052V0122YiESLYg8oYgtbWtzjRArbizMagRhmcpzUkXLW6TG1Dwn117UQ2/iGBlkkPmLk5rYwFTFoH+qzPLFSXU8pFtjC1WuCIliIwJEQptPaz5ZcLTC5JcqA4nfV20ngBDR/3dcMpTyDW/M+aESpXyOqAbE5qt+uKrvnYLgbG25oGJ43Ql5KdzIWl4hpbTN5BpxXJXrJ6kHsFdJ5K1zSIHneWOkkBEXnNxodIFWZwaIa8EygaxpZ3GdLbMQVsLZ6vVJl6rDsCMlNXE8QSVMDbl+1wWtL7kR6g/8WP9hiFDeEQhBthdpD0ElnQg6rIZ8vrXYoDnhJYrV31zRRQULynt5aWoQU0Bc1dbghrwFmvZ3PsmuvD1LVAdWpJcNEdoevloz52bzQPavGGvqW/Q+8ZY1nonzOJzOEXAnWJT4LUOO27j4w445bs4fJwR5XUU0lF7+fvDqHbl2c2WtfzynbBe0Yhxf18GuK0tnvb4xZt6E2hEce3gEO5vNrL0OZtN9J6ZF3tZPC4EKoMcDDo0AeOI57Z6KNoxPGxroXzyF87e/L5mchYRRSynVzz+v7kh7SGP5eDqYxRtD3alKsqMheE0PYycTe9zl/Qe7qNTwmUVWSQwTljWGnpN3H+hlsCf+yXngREr4zGhYjCLpDk5ZuPC8gVVv7l3+rzXeRTDdhrMrDNOK1e2p97CxAeMtxuLIha6bV3qPrybBdpzV7lY+wL/uH+gzLZ/MirWzc+gvru4S0Nlj3/Bi9YviF7/5pReX24P4L+paXztd1nWwDXOOdOg3Vi2a7By71X/iDUTbkCvbo+tzSMKPlajfvaZn3TX1GmWhs8bGbuR5lSOG5Mu6qCt1pkMOTHsnHy6WuG/N9MNQQTOi5asMU4vKO0TdNPYiGo5jlr7u2xGzx21bP9fjFqKjFn9KHVnR8TiNQWM4+4yjJR4Kn3kUyg9ATzN2n9ds+1E/vG8aB1xDvse/udKwQqY35XRZmC4T2UPJGREz9kBmy+Wmjjdzrrd+q7c4RXKHu9U8L/babYu9ldYtoBV52o/6HpsZBet9rIULEjJ+aZp2Ud0laGe4+LnhpstLfbib1r3jpkMyolv3FxRXPRAaGWNmTLI3fZcQ4vEZEYSI2AMAd3Oudk+z2T6eOfiwdqEXZ8NXS7xuIlrS5foVt5t60/tpjhM8Odi3WX/xToIK9iEa2aAhDrHSyh26Htpex6GB3nfdnGK+Xul9CtFVoHvsv/Na+L8OOW5yNJta504aG71rsccFUhaj3nj7S+p5y9Ll1TxhNfi8QJ2mB73jECPcYAxMxbRlkjrgnyZv/OqiLpgEOPZTwwerMpX3FsFi81m+OkPz8OEbJC3pB13Y8nRZ1/w0FYgv1OyHOFwrTUqkss0D6CjwpOt0mFNDcEyPzq/cfc/M3GtnftT6nicnanew10UkmF7aNL+k2ijuoHOncS2dQiadhnXg3Fj7/geaQE9W7JbgqcSr+KT6ntc1VY9AO+i8ZJy582bQVE7sJt/JWoTx3Bcz9YGSqWiZuzJTruCJdQDW71ylyeSKAKCCzG1nNDtgyR7kpVQMbSms2gnX7EdotDipMiEgXQkWHSt/lPC9NgqtEw3WDWQoOX1mTzBRKlv8aW2iH3RhSLrMtO9q3UekYEppg/uhXxo9yLnoVqNfsKBC8V4GvN5z1AUljY3kUbz4QUqCUPvfeONWy6TVIsWNORl1ICZHefamwfA2yYvOPO6kOiswqw4sTZM1JJ5V/a+kUwwh+an9aNyBYyOxgQSTLtRsuaV/fNBiGTIv9GBuwID9wJ17puOAyWaPZ/bvzYyYlQwzBH5FoSDTAnhnWKAY2ufVXlZ86xcOoXChtsE9TKy45A8zYnGWDqwWyn4qqjLMRgqi9rwb08rxKv+UR0bCd9q/JhRqPrXBwe+CJ4MMzmmXNS1c6u1p43/ZAZ+Pvvd+E83PDDKoAF0qa33tScXIvf8LymmVzZNtoKUAAAAASUVORK5CYII=',
-    'BTS': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAHjElEQVRYCbVXe3BU1Rn/zn3t7t1XEpK1UXmGJBBpRGFa+7BDFFuwSGFoEkC0ZRDqP4gVUoo6sDudzjCdapWZMk5sbYrgY4NNYFAYHmYpYiVMTAg0KSEkWEJiQh5Lkn3cvY/T79xsZgx3Vyul32T3Zs85+32/7/e9zgKkFo5b/txWeGzTFHN7gV9Ifex/X+UsKigluGZwdnkpON0fORY+OQVCfg02bBAtZ2/DghXAuFJq9IPDNTnmm3ZKXPrL+VBZqcL/gYn0AICIkIgzOFNUp/uUtKJihclEaZDHNcbSbZH0AAihwKEtw0igJbtqk/fDiopNUF2mA6UAfn/6734NaOmVUGYF/wB4oIZBDR3A4X6FK3/+d8DA+f3G7QCRHoDpBWPaBMGh1xS0hGHYnBVQ/uI+3OBuB4ivKC/TuAkFvR6LuxLTwOZYDStf+AYMXV+DIHoQJO4hK7cg/wUDE7QSTD8BlKgCsvchcGdsMHcXBFhi3pKkB0DBMJMtpVrCg6rgDsXEAJhX0H3LVZEWAE9ABo5jxKamNhkRBuCxVatokFI+GPz6JWoFEAiY3tydGKp2aApGlxNwwWCGbhYO85CJv6SEKyNELyvDEkVakkDMva96S02dn2KGE2PqD1ev68vJ+1MM1RKsRaRizCLWg1OWhcilq5sP7Nr0d2Kzv2aoarMSj+0vf6D4CBpNCTgVGCsD7JSfkEeqjm//8R9eeTfznw2PywJWIRDui0wILATDqqYZxh1ZvjvmuTIy12Zk57x/qOWzs+9+3PQjpqaujrIqS+0kO4BiBTA2jHTJnfHolbau+u6mD96a1Hl+pZOBIEkQqNJMDBE7kp7QIsM3IDIynFBicV2QpPvvnDHzyOvHTv+kpIRowSCy+SWSftOgvXJO7uzF1fWNDz+18cCk9k/LXSwjCcfhwzDdwtAIgoAdm0c3sTIIpZJkg67OjqqjNbVn3vlH08aWSNWXTtH0AACkxI1BEN3uub1uV9O3/7yzNrOlfrkLv4FMCDgjGLkGNkjs0jgeCOiezGyht/vaG6u+U7x2zfqnXp1eOHvXrKL56xkByETKXpEWAIaYEkEELRpVJLenMHIx3vyDLc9+6Gk8tcwJGqV2J2sDdjQsyS43uDxeqeffV15f9cA31x1svlSDOVHW23UVHA7Htl/v3pdZVkZ0xGrJh7QAzCBj+0cgghoZVUXZWRh25TYtqgx+6Om6WCoN9TQCrxw5cyz0WduF5q7r3dd2o+cbDjS1HXJ7M5eNhIdUquuaLDtz586d8yRjIRAKWViwIMLuh+EkdMn+sx/wbu9iLTqiYwHwiF4VZKdoRKMdme3Hi9+sqIgwpUlBOiD2XkNrTbbPt3RooF/lCN4nsFwdLrcQGR2tXTY3fznqwGUyoUTTMoATWMJ8Y+nOszmESEWCcadUj31aXz8GHO8ESVoZGDrQ15etxLFFU8DE4zBBQDDwOwbVZ+A+1oxpfILTEz4kvTEfM35ekS/bJC+vcTrldaLpBhVFu3jutbc6ANr6zbsAuxOg+BEIvtj/k55+wZ8n6pxqcDzyhvgUhSeyK7prx+ZWBGBp69ZxnAzBdxcvuY8TpHupriqUIAmMP46XikoWXnq7/Pt/9e/YwQwz+1BUVGQ6srvu7H2GTh4iHMSQKtY4DGTRYehaExpvYWzdDMICAFUSfLGeszYrb9aieHgQKxxzBxOSw6pQRkdg8a69J7BZdjGFAZwdyRnA4djYN3Vmvm/0RtjsD5qmgTcrG7o7Lx9EnMHqscZnTlD8bIoFQCgQYnlhRHuunXRk5SzSzKCaHdPASrDFw/0vH35mzecV75zIQ28u41m67Y1gzgi1iedPn3xREMRKSZK0GDZprCGqa5pNjccPMWstoZAl5JYkDMFJM66fnzhUo4wMxzCQNkaIze21xQb6Xt1b9uDmrSfOv2yfMr39mfdOPfH0Fr8va+achumzZzcauVOPnXn/wBOYLgIviiL2TDQeG+htv1jDAOxYsGCC92zNAgADa/gxfqcP7r2YGOz7m+R0gehwCqM9XS/t+en3nt16rLnS5nBtFEQJeLvtLs6Xc6cg2SbzvOArKLynQbzn3o8/qqlek1AUkpHjg0QsVuX/xep+1glvjn9qALjqDwTYHlxYt2Q7Gh6ODfb//s3yB7dUHG36i8ObuR7zIM7KCwd0wsCBqCUU/AmBd0XCZeVPL2iQCuedbgwd/1nX5fZ/dX7yyW+ZrtLS1CPakgPsMGMBk46cJ6RDqnrp/vjh2t5tda17Rbvj8Wh4QEVPcBqzfkWIBBI+2bg2BFWJa4IoZuQXzDgX9jqXbnzkW8WoTU2V/aYdfLOGYHwHC68Ur1gNh2svF/zqN5Mjg/2PosvAixJrMro5gFAzQAKxsrsK1XgmGBpc9mDDmsWM++vqGFhL/Y+bSc1Acrcar1gMBD5bcal47R/fDnjumrZS9nhl2ZsBIwPX7UQSOdmTQXRNFaI3wvrwQH/oStPZ5/f4n6tnuYTlqo0bS/W0lEWqQ1+kcKZ3ct78zVse9tw9bSHlhT1qZ9uF3KI5O5Vw+NzVjtaj1Tu3NzAdSeNmRaXSOb72HzqKQLNZi4mSAAAAAElFTkSuQmCC',
-    'ARK': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAAFFUlEQVRYCdWW22/VRRDHZ3d71VrAhAQ11gvIgw/aqiEtKtgAWouS1Bjig5AID7zoA/4BUtAnMTyZKCaYmGhijEoUiloKtJRLjaRSQzQq8qDxhhGxFDm9nB0/8+tZUqWXU2MlbrLn7G92Zr7fmdmd30/k/zxaRbzNyxLDWOCx6/+EjBai3i2yeB/TQJNsugRKpmtQ0AcPFt6/WK3qRLWOx0xW2C/6b9r1OyBS4gB73/unMK6rFKn9TORJk9le0cj/RLG1kPpdIjUQOPNeCPqJc9rn3K/HkJnPpGPrYsa0MnCrCIGKlHr/fLlzc6LIiM0ykaud91ttL+nYupiROSxG0dLbCNgHIbSUqL7b71yEvb82RruH+QqRMKT6yJ0iO5NuMX6LIqBEjqLuEakm0l6inj8IAWQZgSASmT4vcuo0B7JZpD/ZTEWiqBJ0Ep054tRvItL5w2TCwAGBSzb9IDIO5M1z0THdzoKNrScbU2bgLRytJsV7RerV+yM5vFl0eefyAAYrwRD7MAlMtYgo0WJK0ZNsJyMwVQacgePAuRC2kQYjHCEwMgvAYdXXnXNvzGZtMtvjHroR57YZaLK19URjUgIHcGyG+73fWK7acGE09fEqgszF2LYqxjW3xfg48jYIWQ+IplMu0nBY5GmzTT5sPd6YsARE5NmMtNr5dvCoezWpHrpSpCynurdStblxNGrZzs1c5Fwb13HFWXTIF0vph+Qdy0S+Sb7GIzBpBswgOLeViKqpQ65qFPzgz6qrErjpbBAZPouM83HQdEzXbMqwtf3JxrgESJu123gohNU0nJaBUfCKIed6BlRXPsGzOf1U5Ll93j9rawjl+tlj42NKVGE2EGjp4iiYL/Npen8f7P11kK7szneLzGF1nPteY/kk/b0hxmUAkWWR4yLPVDu3+Xu0z4lsao5xi8nNjqztY9ad5zmofntOtfYhkd+Sb9NL45IMdBYOXon3W0oBL0WT430C8AcS+FGRhyG35nd4EHWfU137kckY9wI0qHr/iOoJIw6RmirvN9teZ8G3rccddm9tgxO85DD3/Kj32uXcFx+KXDOuwSRCUj6vG9tufHR4P8JhXmLqCSOZji2BrdUUbnCuu9K5hn6Rr/IxLl8q8p0Z7Be5m0LeRGQXOGSexuN/wYYMKc+RWUmnPLVI5Ijpd4lcT/vsQL5wgPNzJp+/Z0xvoCJjDgaMQyPZrhHZOBvwM6on86pNCXxXCI/y/CbgWZb4CBErD40oE1gtLQJ08j2qj9WLvG22XTE25Zxrr6aTDtFPJMYXEhbqo69XLdx5aC+g7l8i/4kut5RvrZOmtDuEdbNUdyQQIpIyCNjzDxCwAbGMCNdQrmDvD9X1tSKv2h6AC2jdXXTIeTHGhc30hlYwmfZCI38FAnxcdBBeA6/VWiL4Gnl4hb3rQlirqlUA50ixL6X/W/QMd5oaUwrHnpqsBATKVMHzefrBa7wTDCTfLnILDa2Pw3nkQdXlCdPAs/vZK7KeL5vBnuybIiM17r3NYKf5c6CAsQff7d7n+KZYby5MnmXgczvl3F3Svu523mLHaK130d0Sjh3MuYVyJdlU//cRg0We9LbjcwM+IVFPc9sB1vImkR+z/V7vX+LDktKIGHgy+rf/k28y0Mw35cvm35HyFeS6jIjbrBywttfqjA1LeyMY74Swkhs0JEdFbjQ0wC/pijPFImHtLGBnXzgzBTaRX0iQbMbFxUSaMyi/nNgXw/oTI2nUU2lVib8AAAAASUVORK5CYII=',
-    'BTG': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAACBjSFJNAAB6JgAAgIQAAPoAAACA6AAAdTAAAOpgAAA6mAAAF3CculE8AAAACXBIWXMAABYlAAAWJQFJUiTwAAABWWlUWHRYTUw6Y29tLmFkb2JlLnhtcAAAAAAAPHg6eG1wbWV0YSB4bWxuczp4PSJhZG9iZTpuczptZXRhLyIgeDp4bXB0az0iWE1QIENvcmUgNS40LjAiPgogICA8cmRmOlJERiB4bWxuczpyZGY9Imh0dHA6Ly93d3cudzMub3JnLzE5OTkvMDIvMjItcmRmLXN5bnRheC1ucyMiPgogICAgICA8cmRmOkRlc2NyaXB0aW9uIHJkZjphYm91dD0iIgogICAgICAgICAgICB4bWxuczp0aWZmPSJodHRwOi8vbnMuYWRvYmUuY29tL3RpZmYvMS4wLyI+CiAgICAgICAgIDx0aWZmOk9yaWVudGF0aW9uPjE8L3RpZmY6T3JpZW50YXRpb24+CiAgICAgIDwvcmRmOkRlc2NyaXB0aW9uPgogICA8L3JkZjpSREY+CjwveDp4bXBtZXRhPgpMwidZAAALmklEQVRYCZ1Xd3hUVRb/vfemp00qJGACMQUQkRqqBBIgQiJNAqyABRZRyqqgux+sS1FQaaKIrGJHWJWqhBAQkAQhogKyoYUkQHofSCaZ8mZe2XPfJMDHuv/s/b4388q953fK75x7Lof/PThk7uKxe6qsTTENiYlIGJgeFx83pnNUh57hYX6dzGaDkX1zuTxiQ6OjqrK67lJJcckP9cWnsuD6rUJbl7lLIBkK3ava830/3H3PvseVK3msXMkWAUFpffsOS12cPKzvuNRB0cE9YzwI15fDKJWDV1q0KQofAFEXjQZvNC6VGXDk1I1befn/zirI/3Ezmo+c1ybdK1N74fv5AwUyBWA3Wd3L78GhGW9lTh61YO7kOD5WfwRy5S7FWXsWrpYmXpFVqG02cTwg6DiY/KyKpWN/CJ2n8iXesfho9zV157c5m2rO/bAcKHAA7bLvanCfAm0T/Ed1T8mYuPfN16Z3HxiSDWfBKrmp5obAk2q83giON9yVcM+dqnigeEUopL41Mla29Foh/NyYgaVrdl7Myz4wDa3Hrt6vBIlsH23g5PLMZ545sWPTxOjYhrnemtNvCbKniReMAeB1BM75ljAwVaZLkUiAqr1n39gcgZQUHTbefm0fenS44R0/a1nkzdsB069ccxyDeKDap8QVzX8+aSw+uVsVkOWZTz2d+9W6kaHcz6NkW8lJnd4vAOB0dHEE5oHscmrAOoMJlsAw1WDyhyJ5OFlshezxgBO4O8oINKe54oLg13JInjx7uV9RXWDmlUL3d/B830gcI8xclSSjLQy9/Jjbt735WIh0aoTcUnNJMBA4s5BZJrlbYPQPQkSvp1Q1ZBxnV2NQVKtw/hYDIgIlBMrF0NuPqbcLd3FiazN0pJiqSmAy7FWXhMDTY+QP1+SF1Dfe2pP3bd0grLwsMmyBUk3A1gVKlwFPrv/nO/Mz4mzPexuLcjXLfeAcvE4HOvaehdb4j/D1+X7chp11eO29MzD7B+Ptj/KxecdVVLjicFMcxnUbPJsUcsJecRaCwUBKKBCMZjgbK/kI0w1vYvKyyONny/ybqj/NYdgszzXXT5/++KKBEUfU6t/36JnbNXBSUXI7EZn2IQ63voG/vncVHYJ5hAXKKL1YghUvpqFrtBXVDTYsnZcEk+DGkk0F2tzI0R9oa4m2miwmk8keHJWrTsnM+AsCxiUwbEogqD0GDnvlucyevPP8PxTBSFEhrZnbvS4XOo7+ENvPpmJ/1gmsXjIGj4/qDYu/HziLETcrGuBoccPPbECINQDPZA7D5+tm4lDOKWw/PwYdU0kJl0OTxWQy2c6zryrzpz/M9UgatIRhU/zjwhe9saVw8zxbcHX2DE5vIdLRkCnmHR6ZhePiWuz8Jge/FlShrLyRwE1wuDxwOkTiJlnnoZzjOcR1CUdi13AsmpOCtOE9sOi1nZgwPgWphpdRV/CtjxNEN6+zBVHpO9XnNgc0fLx6cU8hIO6J6Yvnj5+eIG5UnY1FHEsjKCIMZn+ID32CTV9cwNqlGbhYVEuW6lFMSogurwbePbYDOkVaIVNFqrxWg+LiWuz4Oh/9+sdg7ozhWPvBYYx4bAq4qp3kAOIcyyZKXYvRqyqRs/wP5VcV8vGJ8Sl9urrhqv1F5fV6zXrJ7UFwt6nq3pMKRiR1QlhwELZvfAq5u5dgUlovgKw3G/U4vH0Bfs9ZhsITy7FwQSoMlBEcufn9L0+SsiYkJz2A705zCO0+mfjg0WQzDIb1cIyiMmy+U1Rkr1BjHVz2er69wlH44Q0cxV0pqUdacnet5IoeCYqiwmikKkj/946QID88PW0ovF4ZKl1ssDI9NrkHLpJnZGsKVU/fCobBsDqYKziGrYsIt3YxK1VoJa8KJppFuWs0G1HvioSOb9WsZ8J0lDA8xfreUWezU9XToeRGLZZvyNI++YX6Y8ncUaSAivBwK8mQUC/GwESklWSqmhQGibCMci1Cw4I66YICqMZKdgL2iWbpp/ezoslthL/Zrb1UFN/GeC+4V5IxYOxacPSv2p0A80yACTHRYQgN9m9TlqN482h2mehTILwtTWQlyzLirXwbAZawQFYJ/+/x7JNDEOBnRAtx4pfzpbh6qQJXCquRNHo1cr9/BY8mJUD6b93b8HzQuuYWsUURggPaCzKlAbxuO0IsbrS62EZD2vI8xV/R4tq2GnqdgA1/nwwWfzYcLjemPf8Jso9f1njwxd5fMHxgApwuGVazU5PJZGuDIqnogtHSKjbz9Q1NpaLQETo9OYaKBYuR6BQRYSyDwhnVuvpbvkX0S/sRceEuD5qZ62kwcjLWD+jTldoj2pD0vj3O3uoi7fUIN1bA3dqWhsQxvYFX3HwUbLeaq/myyurzda4HVHNghMJ2OzaYHrztKB5JjOAO/nhRA3a4RDCBt5uoryAycrKCZmLurWYHyqoa8eWefHyw/ST0IX4aJ1KHxOPIyUL06REJvjH7ThYoshemwEiu2tFBZdi661cLj5wvlp/OjBwqNDfsh95igs5shu3aXkxKeREL19VhyrgWzPnb18g6+Ds8jKxUep1EvqGT18NA1rLK6K1rpraILBc9SE7vgxGD4rFycy7eXdwFtuMHtA2JGadQOluihnEF12UwbN5Ruj/n6OniesTMZHXZN1iqiE7oSlZg3qzheGnlbrLejS7E8LjYCFiZlcQutgcwcIm80XtoItLH98XWrXOQTQVqzebDmPOnoZoMyUOhIJntg3tgqsowGTap7Hbb+fguY9IykyKVHMnVVMnzgp56PCNaay6jW0Ig+KgpqK2pwbb1M7H8pXSIohe5xy6h7NxqFN9sQIOtFdd/eh1PTkpCYlxHvLxqN9LHjURK+CeoP7eNPEr7C8VV9rQiJKafVGJaJqzZtOez2xVH9zO1uJIzuRu37Bg8Z8uL6/TKvnHQGan7UWXozX6ozVuBx5OBiBmz8fr7J5A8IAql5XVENpGKlC8DnOSdktIqZB29goLi25g3IwUDAz9DDa01WCwky1eAWK9o7PMGt+W9c+7r53I3MmxfQ1Kw4Va5LYTrPTQz9ZFYu9p08wynoyaCei+tqbCXHEWstQhj0saivCkMlbUiZKqWNyrtKLphgzUoCM1unZIYG8ItmWJEZMNSNJDlPnDqF1lqO2gXHPKC91jVNN3qtz9f5ajem8UaEhZ2ujK1Sp00od/p/R+/MDC0KEOyFf+ku9OSkQDWkgl6A8IT0oEO4yDqE1F9S4CFNiCryQWj9yJQdwwNRdnUGXsgmNqaGlrraW1BaMKjki3hoG7Cs1tOnc2+MIJwaexWfLxrPzSEZnQaO35i/r/enRhtvjhJshUxJVhvR9Rnuwm5UhZdlPegXOZgpN5BJhESFS6J0kM7HzDPMcJpNYXXLA9NHCk5Htqjm/ny/vKcA98Nge1gldaU0uHHVzGoO9Ve5Gyzl1yXDhWUcxNGTl0d3Dms2dt8M19QVa/WbjOE9rab3UsS7ZC0wXBUbHiD+c4cZhsjnEJdctSQhd7qqG362a/uK8/Zs280mrJL28HZPJ8C7I4pwU4u1DKXXKvZe/qyu2+nvgtj+wxOgUG8JjltpTwTCI61a+Q4spK1bezSTCfvKDJxw+3W2vbg6H5S0NCP+azSJ4SFS7/Myzt2JF0DZxjsCNA27iqgvWCHBZogHW2qLrJ+dfy3C97r9rj+XQYtNj/Y81H4BxjoPGiXVc9tslDk2ClIlaj0Kl7o9apiCY5WguMzeP++b+ISv5hf9Wmtff0721cXper/DPKu70DCjn13h48Dd599d+2cYE+m4V27DRo1f9CgXpnJSQ/G9O9GLPe3gRIUeq5Fm+9VA0CNO2paQ3G2UETer9fLzpwp2F145vAWuPPLtEn3ytRe+H7+WIE7E8gb2kGVvbBag7pNT43p3DWlc3RE/7DQ4GizSWdhX1xuydlgaymrKq8+V1Z588fmwm+OA01N7NsfWe177/v9D6pHUppudLymAAAAAElFTkSuQmCC',
-    'MARKET': 'iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAAXNSR0IArs4c6QAAAAlwSFlzAAAWJQAAFiUBSVIk8AAAAVlpVFh0WE1MOmNvbS5hZG9iZS54bXAAAAAAADx4OnhtcG1ldGEgeG1sbnM6eD0iYWRvYmU6bnM6bWV0YS8iIHg6eG1wdGs9IlhNUCBDb3JlIDUuNC4wIj4KICAgPHJkZjpSREYgeG1sbnM6cmRmPSJodHRwOi8vd3d3LnczLm9yZy8xOTk5LzAyLzIyLXJkZi1zeW50YXgtbnMjIj4KICAgICAgPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9IiIKICAgICAgICAgICAgeG1sbnM6dGlmZj0iaHR0cDovL25zLmFkb2JlLmNvbS90aWZmLzEuMC8iPgogICAgICAgICA8dGlmZjpPcmllbnRhdGlvbj4xPC90aWZmOk9yaWVudGF0aW9uPgogICAgICA8L3JkZjpEZXNjcmlwdGlvbj4KICAgPC9yZGY6UkRGPgo8L3g6eG1wbWV0YT4KTMInWQAABp9JREFUWAnlV3tsU2UU/777bLuu21jGI2gi0aBxUYMBZChzHRgMM5ooW/yDGBhbMTFLmOxJQnYRwx4GQ8QE6RpQ/IdsIRHJCMyOFnkLYoiZLpqgCQjIeIxtbe/785x27TY6YGoW//Ak6/3ud8/5/c53XveOkP+lMEaT5xaSi6m8KkzhwmHCFSHJMWIrlNq4nHJRFIWbiOSdYGNuKevg8dmURYBBmEHiJ10baniCp2Qe7C2E2C9lxI7spWVLpsyB0o5SHsityqP171NKaoE4R8yQZcIIETMkEukf2ofkSkgRJgwRPvw3kv9TPlARQil3CBYWL/GyHlENPaqpRlQHP9jZJP6UONDU1MTwdH5vcx+wdfAiZjqeDt42LcJRchEd6O3vZZOtAWyb+KnQ8EGCFT+Se7MyVP+RIIvVekSzRZckU2CG9RDlhT7EwEg9NAIjlcxGrqn+ncgJzL1ClXjh+cL1uyW3o8bUDMLLPGfGjEp9WN8Pdjf9hVuvoT1gPrgdSzsSrTKGjEIcJnQCQ57UqwzVHXzvXBOrCNXZ645vZJVHG95KPvN9W/t8co3XlNHYTVwjoOItM8tP1GXyJg0TmxxoL279oLSzlO9kHTZUWColvl0+UfEqhu+g4rLd0aCU4SjQh9V4HzLDeg3suhAzTwm5/YXeC7hOSnwYJG+SVwTctnKbufZw9TSBiifkTMdznMB5561azH9Z4j8Kk4wrKiqi4XCY+c77RP/rfqMiuHEGceinJac8Dysd4sSYRZe1L23tRlz3hp5CZlrbG08+vi+8OZxyPi2cccD5fuPdkzXTLYM/IzqkOUZMjwGGCI4I+pC63e9trUbQqkNV8o4VO7TKYONcIrAwL/KzbMOCLDEdev/lgLftDOplbQi+QiWpm1n6j3fblj0LrtFkBMcVYYo81PCYpfMXBEmYY6oGEZ2SEypY0IZUTfY410Nu2xEYyWG9iPD2BY6ns5hlAzYbohZfkCTPrO1ZTQS+m/Ai9tEw2o2tolQNJMnxNBazj3MiP50TeGKo1iEjpu4khOuElnKog7GYK8ddURmu52yLfAUhPADOwYUS6PHbhEiF/qVbepEnqybYSGXXVqZFLALhhK0UHz5HiW9g+/gh7DA68ynHTlGO88D0IlpEDweKW0pQsfzwpkWE6F2SS54duxNReUkoF2RaDu1lg7PU0sw/mSEWBJZv+Q31PbU9n1CHu4qpg9BqULB0XLBRJS4cDo7Osk6r4lhDMRwCc+bhZQEGhtkT8LZ4yYt9mbM3Hvls96tbLgrC4DN6VD8HteCwdFOD9KgwYDgg/53F2PzA8g8T5DU9ezlXFpAPG0COdZZWawl6iCu+p/GG2szrynW7AZAYEfPrQHHzMtzPfenyd0MGX4zrnUt23mk/5likDWn7JbcsSxmyAwq0z4g6CwIr2q4wnBG+8y7o0BVMHQILG8N+X3LE5MJexUSldm/rptityBfasLm3vbj5DUJCQm5d91nLlfcUR+gNVPbt2iXC+LLbvS0rYap9CmO11xiYWfB5iXI9v61rJpyVPZJxCVtsOBHyB3Ij5EhRoAno+r0tq3GTFIWEaQvN06bonk9iA7DBJNz2r1tnzG7smvtHc8kv4ERV0Z49jvCaNeqMxiNrL/cLb4JKicFnYUQnTjiC3CMJRfA8OXYLPu5wZi8wT9lS5nyiR1XKjS/cYUPenFP7zYEiRRGQPLc+WKfJeQGOMQ9i227p4cce48QIOqOdZdTKVzqkn69OCxJn5gLIIYyzxMnH6GOkoiTn0bd/uLPkRHZt8FdLcK0iRozA3NXG6U3yJhEBJVEoV+/mPMkEYTGQW2APYR+d90k8yBbHIrfgl3uByBmrmB4BR0EYm3CsJ+3udx2XK5MTDGKZUJQUwbAyJhYOHtumDm2GcxduIOr4nvwHMs4BBq894IW9yWDBZKFxRxO0Y771/44f4xygloDM2JapPwbzFhzCn7hAq1kkvjeiQ+GK95SiDSHxhr1HB/DuxYnrws+4EheoLjDZIyV6GHzBySJnEHvwRk7SAILjoS68pQ4ST4UlUKeHsIHrcR3mFiEZVi51ZQOtlsBitpCGMwKYcEBJxNyy2FVOi6zHkoYkE5tCXPVhCV6vV1IOEDtg3732PbNZjIN02Ry1qR51AMIl1Lk54FCzPGo1id7Ohj0TX73pOOnFjbaT6N/R/+nQIF0e9jzdYmwKMP8UvsXS2+npfkbKyjDRjJTCd2J+XrqzvaDTSRO1ooTG4o6ypnBGt/7z1V9/r/WnUhxl8wAAAABJRU5ErkJggg=='
-}
+# symbol to icon, read from .assets/c20/<symbol>.png only for the symbols shown
+# To add an image, grab the image (PNG) and increase the DPI from 72 to
+# 144. Then resize the image to 32x32 and save it there as <symbol>.png.
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '.lib'))
+    from bitbarlib.assets import Assets
+    icons = Assets(__file__)
+except ImportError:
+    icons = {}
 
 # calculate btg nav
 btg_val = int(float(btg_result[0]['price_usd']) * 458)
@@ -114,28 +91,28 @@ nav_btc = net_asset_value / btc_price
 usd_value = net_asset_value * number_of_c20
 
 # menu bar icon
-print '${:.4f}| templateImage={}'.format(net_asset_value, symbol_image_map['C20'])
+print '${:.4f}| templateImage={}'.format(net_asset_value, icons.get('C20', ''))
 print '---'
 
 # print nav, value of your coins, and total fund value
-print 'NAV:\t${:.4f} USD | href=https://crypto20.com/en/portal/performance/ image={}'.format(net_asset_value, symbol_image_map['C20'])
+print 'NAV:\t${:.4f} USD | href=https://crypto20.com/en/portal/performance/ image={}'.format(net_asset_value, icons.get('C20', ''))
 
 # print nav in ETH and BTC with separator
-print 'NAV:\t{:.8f} ETH | href=https://crypto20.com/en/portal/performance/ image={}'.format(nav_eth, symbol_image_map['ETH'])
-print 'NAV:\t{:.8f} BTC | href=https://crypto20.com/en/portal/performance/ image={}'.format(nav_btc, symbol_image_map['BTC'])
+print 'NAV:\t{:.8f} ETH | href=https://crypto20.com/en/portal/performance/ image={}'.format(nav_eth, icons.get('ETH', ''))
+print 'NAV:\t{:.8f} BTC | href=https://crypto20.com/en/portal/performance/ image={}'.format(nav_btc, icons.get('BTC', ''))
 print '---'
 
 # print number of c20 you have and their value
-print 'My Tokens:\t\t{:,.4f} | href=https://crypto20.com/users/ image={}'.format(number_of_c20, symbol_image_map['C20'])
-print 'My Value:\t\t${:,.2f} | href=https://crypto20.com/users/ image={}'.format(usd_value, symbol_image_map['C20'])
+print 'My Tokens:\t\t{:,.4f} | href=https://crypto20.com/users/ image={}'.format(number_of_c20, icons.get('C20', ''))
+print 'My Value:\t\t${:,.2f} | href=https://crypto20.com/users/ image={}'.format(usd_value, icons.get('C20', ''))
 print '---'
 
 # tokens issues
-print 'Tokens Issued:\t{:,} | href=https://crypto20.com/portal/performance/ image={}'.format(int(result['presale']), symbol_image_map['C20'])
-print 'Fund Cap:\t\t${:,} | href=https://crypto20.com/portal/insights/ image={}'.format(btg_val + int(result['usd_value']), symbol_image_map['C20'])
+print 'Tokens Issued:\t{:,} | href=https://crypto20.com/portal/performance/ image={}'.format(int(result['presale']), icons.get('C20', ''))
+print 'Fund Cap:\t\t${:,} | href=https://crypto20.com/portal/insights/ image={}'.format(btg_val + int(result['usd_value']), icons.get('C20', ''))
 
 # print total crypto market cap
-print 'Market Cap:\t\t${:,} | href=https://livecoinwatch.com image={}'.format(int(crypto_global_result['total_market_cap_usd']), symbol_image_map['MARKET'])
+print 'Market Cap:\t\t${:,} | href=https://livecoinwatch.com image={}'.format(int(crypto_global_result['total_market_cap_usd']), icons.get('MARKET', ''))
 
 # separator bitbar recognizes and puts everything under it into a menu
 print '---'
@@ -150,7 +127,7 @@ for holding in holdings:
     crypto_percentage = crypto_value / float(result['usd_value']) * 100
     c20_value = holding['value']
     crypto_name = symbol_path_map[crypto_symbol]
-    crypto_img = symbol_image_map[crypto_symbol]
+    crypto_img = icons.get(crypto_symbol, '')
     crypto_price = float(symbol_price[crypto_name])
 
     print '{:s} \t{:.2f}%\t${:,}\t${:,.2f} | href=https://coinmarketcap.com/currencies/{:s} image={}'.format(
@@ -16,6 +16,13 @@ import sys
 import re
 from itertools import groupby
 
+try:
+    # GET requests revalidate with ETags; GitHub doesn't count a 304 against the rate limit
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '.lib'))
+    from bitbarlib.httpclient import get_json
+except ImportError:
+    get_json = None
+
 # GitHub.com
 github_api_key = os.getenv( 'GITHUB_TOKEN', 'Enter your GitHub.com Personal Access Token here...' )
 
@@ -44,6 +51,11 @@ def make_github_request( url, method='GET', data=None, enterprise = False ):
             'Authorization': 'token ' + api_key,
             'Accept': 'application/json',
         }
+        if method == 'GET' and data is None and get_json is not None:
+            # max_age=0: read-state changes must show on the next refresh.
+            # cache_private keeps the responses, readable by this user only,
+            # so they can be revalidated
+            return get_json( url, headers=headers, max_age=0, cache_private=True )
         if data is not None:
             data = json.dumps(data)
             headers['Content-Type'] = 'application/json'
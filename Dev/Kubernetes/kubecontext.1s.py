@@ -7,16 +7,34 @@
 # <bitbar.author.github>copland</bitbar.author.github>
 # <bitbar.desc>Displays active kubeconfig context and allows you to easily change contexts.</bitbar.desc>
 # <bitbar.dependencies>python,kubectl</bitbar.dependencies>
+#
+# The menu follows context changes within a second when this stays running
+# with --stream.  That needs a BitBar that supports streamable plugins, and a
+# wrapper in the plugin folder marked streamable with a bitbar.type metadata
+# line:
+#
+#   exec /path/to/kubecontext.1s.py --stream
+#
+# Without --stream it prints the menu once and exits.
 
 from collections import namedtuple
 from distutils import spawn
 import os
 import subprocess
+import sys
+
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '.lib'))
+    from bitbarlib.stream import stream
+except ImportError:
+    # without bitbarlib, render once and exit like any other plugin
+    stream = None
 
 Context = namedtuple('Context', ['name', 'active'])
 
 os.environ['PATH'] = '/usr/local/bin:/usr/bin:%s' % os.getenv('PATH')
 KUBECTL_PATH = spawn.find_executable('kubectl')
+KUBECONFIG = os.getenv('KUBECONFIG') or os.path.expanduser('~/.kube/config')
 
 
 def get_active(contexts):
@@ -56,6 +74,31 @@ def display(contexts):
         print("{context} | bash={kubectl} param1=config param2=use-context param3={context} terminal=false".format(**vardict))
 
 
+def config_stamp():
+    stamp = []
+    for path in KUBECONFIG.split(os.pathsep):
+        try:
+            st = os.stat(path)
+            stamp.append((path, st.st_mtime, st.st_size))
+        except OSError:
+            stamp.append((path, None, None))
+    return stamp
+
+
+loaded = {}
+
+
+def render():
+    # kubectl only needs asking again once a kubeconfig file has changed
+    stamp = config_stamp()
+    if loaded.get('stamp') != stamp:
+        loaded['contexts'] = load_contexts()
+        loaded['stamp'] = stamp
+    display(loaded['contexts'])
+
+
 if __name__ == '__main__':
-    CONTEXTS = load_contexts()
-    display(CONTEXTS)
+    if stream is None:
+        render()
+    else:
+        stream(render, interval=1)
@@ -9,10 +9,18 @@
 # <bitbar.image>https://programadorwebvalencia.com/wp-content/uploads/2016/07/Screen-Shot-2016-07-06-at-18.42.35.jpg</bitbar.image>
 import os
 import pickle
+import sys
 import tempfile
 import re
 from os.path import expanduser
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.state import open_store
+    store = open_store('offlineimap-notification')
+except ImportError:
+    store = None
+
 # Location
 PATH_MAIL = os.path.join(expanduser("~"), 'Mail')
 DIR_NEW = 'INBOX/new'
@@ -26,11 +34,14 @@ data_save = False
 num_news = 0
 data_temp = {}
 
-try:
-    dateFile = open(SAVE_LOCATION)
-    data_temp = pickle.load(dateFile)
-except:
-    pass
+if store is not None:
+    data_temp = store.get('new_emails', [])
+else:
+    try:
+        dateFile = open(SAVE_LOCATION)
+        data_temp = pickle.load(dateFile)
+    except:
+        pass
 
 
 def send_alert_osx(mail_from, mail_subject):
@@ -92,8 +103,12 @@ if data_news_emails != data_temp:
             send_alert_osx(item['mail_from'], item['mail_subject'])
 
 # Save
-data_save = open(SAVE_LOCATION, 'w+')
-pickle.dump(data_news_emails, data_save)
+if store is not None:
+    if data_news_emails != data_temp:
+        store.set('new_emails', data_news_emails)
+else:
+    data_save = open(SAVE_LOCATION, 'w+')
+    pickle.dump(data_news_emails, data_save)
 
 # Print
 icon = ICON_EMPTY
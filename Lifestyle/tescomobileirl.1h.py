@@ -55,10 +55,22 @@ except ImportError:
 import pickle
 import os
 import subprocess
+import sys
+
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.state import open_store
+except ImportError:
+    open_store = None
 
 class StateMgmt:
     
     def __init__(self):
+        self.store = None
+        if open_store is not None:
+            # no need to find the plugins directory; the store lives in the shared cache
+            self.store = open_store('tescomobileirl')
+            return
         os.chdir(self.get_bitbar_plugins_dir())
         self.relative_state_dir = "./.tescomobileirl_state/"
         self.state_dump_file = self.relative_state_dir+"tescomobileirl_last_state.pickle"
@@ -76,6 +88,13 @@ class StateMgmt:
             os.mkdir(state_dir)
     
     def load_state(self):
+        if self.store is not None:
+            try:
+                return self.store.get('last_state')
+            except Exception:
+                # saved by a version of the library whose classes have changed
+                return None
+
         self.check_state_dir_exists(self.relative_state_dir)
 
         if os.path.exists(self.state_dump_file) is False:
@@ -88,6 +107,10 @@ class StateMgmt:
                 return None
     
     def dump_state(self, current_state):
+        if self.store is not None:
+            self.store.set('last_state', current_state)
+            return
+
         self.check_state_dir_exists(self.relative_state_dir)
 
         with open(self.state_dump_file,"w") as f_write:
@@ -2,6 +2,10 @@
 # -*- coding: utf-8 -*-
 """
 Control you Sonos system from you Mac Menu Bar
+
+Run `sonosBar.py --daemon` in the background, for example from a launchd
+agent, to have the menu drawn from the speakers' events instead of asking
+every speaker on each refresh.
 """
 
 # <bitbar.title>SonosBar</bitbar.title>
@@ -14,20 +18,106 @@ Control you Sonos system from you Mac Menu Bar
 # <bitbar.abouturl>https://github.com/anergictcell/SonosBar/</bitbar.abouturl>
 
 import argparse
+import json
 import socket
 import os
+import signal
+import subprocess
 import sys
+import time
 import warnings
+from multiprocessing.pool import ThreadPool
+
+try:
+    from queue import Empty, Queue
+except ImportError:  # Python 2
+    from Queue import Empty, Queue
 
 try:
-    import soco
-    from soco.music_services import MusicService
-    from soco.data_structures import DidlItem, to_didl_string
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.menu import Menu
+    from bitbarlib.state import open_store, state_dir
 except ImportError:
-    print("Error")
-    print("---")
-    print("You need to install >>soco<< | href=https://github.com/SoCo/SoCo")
-    sys.exit(0)
+    # Without the .lib folder, as when this file is copied on its own, the
+    # menu is printed plainly and nothing is kept between runs
+    state_dir = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "bitbar-plugins", "state")
+
+    class Menu(object):
+        """Prints a menu built the way bitbarlib's Menu is built"""
+
+        def __init__(self, line=None):
+            self.line = line
+            self.children = []
+
+        def item(self, title, params=None, **options):
+            for number, value in enumerate(params or [], 1):
+                options["param{0}".format(number)] = value
+            line = title.replace(u"|", u"\u00a6")
+            parts = []
+            for name in sorted(options):
+                value = options[name]
+                if isinstance(value, bool):
+                    value = u"true" if value else u"false"
+                value = u"{0}".format(value)
+                if " " in value or not value:
+                    value = u'"{0}"'.format(value.replace('"', '\\"'))
+                parts.append(u"{0}={1}".format(name, value))
+            if parts:
+                line += u" | " + u" ".join(parts)
+            child = Menu(line)
+            self.children.append(child)
+            return child
+
+        def separator(self):
+            self.children.append(Menu("---"))
+
+        def lines(self, depth):
+            for child in self.children:
+                yield u"--" * depth + child.line
+                for line in child.lines(depth + 1):
+                    yield line
+
+        def write(self):
+            text = u"".join(line + u"\n" for line in self.lines(0))
+            sys.stdout.write(text.encode("utf-8") if str is bytes else text)
+
+    class MemoryStore(dict):
+        """Holds what bitbarlib's store would, for this run only"""
+
+        def set(self, key, value):
+            self[key] = value
+
+        def update(self, values=None, deleted=()):
+            dict.update(self, values or {})
+            for key in deleted:
+                self.pop(key, None)
+
+        def delete(self, key):
+            self.pop(key, None)
+
+    def open_store(name):
+        """Returns an empty store, whatever the name"""
+        return MemoryStore()
+
+# Imported by import_soco(), since drawing the menu from the daemon's
+# snapshot doesn't need SoCo and importing it takes most of such a run
+soco = None
+
+def import_soco():
+    """Imports SoCo and the modules of it used here"""
+    global soco
+    try:
+        import soco
+        import soco.data_structures
+        import soco.exceptions
+        import soco.music_services
+    except ImportError:
+        print("Error")
+        print("---")
+        print("You need to install >>soco<< | href=https://github.com/SoCo/SoCo")
+        sys.exit(0)
 
 def parse_ip(ip_string):
     """Parsing the user supplied IP address to use on the local subnet"""
@@ -108,6 +198,18 @@ def parse_cli_arguments():
         const=True,
         help="Apply the action to the whole group")
 
+    parser.add_argument(
+        "--daemon",
+        action='store_const',
+        const=True,
+        help="Stay running and keep the menu up to date from speaker events")
+
+    parser.add_argument(
+        "--refresh-topology",
+        action='store_const',
+        const=True,
+        help=argparse.SUPPRESS)
+
     output = parser.add_mutually_exclusive_group()
     output.add_argument(
         "-o", "--verbose",
@@ -131,103 +233,138 @@ def parse_cli_arguments():
 
     return args
 
-def output_for_bitbar(zones):
-    """Prints the topology display"""
-    print("🔊Sonos")
-    print("---")
+def gather_state(zones):
+    """Fetches everything the menu shows before any of it is drawn.
+    Each value is read once, and all speakers are asked at the same
+    time, so the menu waits about one round trip rather than one per
+    value. Playlists and radio favorites belong to the household, so
+    any speaker can answer for all of them.
+
+    Speakers are given by IP address, so the state can be saved as the
+    daemon's JSON snapshot and drawn later."""
+    players = [player for zone in zones for player in zone["members"]]
+    household = zones[0]["master"]
+    calls = [household.get_sonos_playlists,
+             household.get_favorite_radio_stations]
     for zone in zones:
-        print_zone(zone)
-
-def print_zone(zone):
-    """Prints basic info about the zone and calls functions to
-    print more detailed info"""
-    print("---")
-    print("Zone:")
-    print("{0}: {1}".format(zone["kind"], zone["master"].player_name))
+        calls.append(zone["master"].get_current_transport_info)
+    for player in players:
+        calls.append(lambda player=player: player.volume)
+
+    pool = ThreadPool(min(len(calls), MAX_FETCHES))
+    try:
+        results = pool.map(lambda call: call(), calls)
+    finally:
+        pool.close()
+
+    transport = results[2:2 + len(zones)]
+    volumes = results[2 + len(zones):]
+    return {
+        "zones": [
+            {"kind": zone["kind"],
+             "master": zone["master"].ip_address,
+             "members": [player.ip_address for player in zone["members"]]}
+            for zone in zones],
+        "players": [player.ip_address for player in players],
+        "names": dict(
+            (player.ip_address, player.player_name) for player in players),
+        "playlists": [playlist.title for playlist in results[0]],
+        "radios": [
+            {"title": station["title"], "uri": station["uri"]}
+            for station in results[1]["favorites"]],
+        "playing": dict(
+            (zone["master"].ip_address, info["current_transport_state"])
+            for zone, info in zip(zones, transport)),
+        "volume": dict(
+            (player.ip_address, volume)
+            for player, volume in zip(players, volumes)),
+    }
+
+def output_for_bitbar(state):
+    """Prints the topology display"""
+    menu = Menu()
+    menu.item(u"🔊Sonos")
+    menu.separator()
+    for zone in state["zones"]:
+        add_zone(menu, zone, state)
+    menu.write()
+
+def add_zone(menu, zone, state):
+    """Adds basic info about the zone and calls functions to
+    add more detailed info"""
+    menu.separator()
+    menu.item("Zone:")
+    title = menu.item(u"{0}: {1}".format(zone["kind"], state["names"][zone["master"]]))
     if zone["kind"] == "P":
-        print_single_player(zone["master"])
+        add_single_player(menu, title, zone["master"], state)
     else:
-        print_group(zone["master"])
-
-def print_single_player(player):
-    """Controls printing of control elements for a single-player zone"""
-    print_music_controls(player, "--")
-    print_player_controls(player, "--")
-    print_top_level_controls(player, "")
-
-def print_group(master):
-    """Controls printing of control elements for a multi-player zone"""
-    print_music_controls(master, "--")
-    print_top_level_controls(master, "")
-    for player in master.group.members:
-        print("➤ {0}".format(player.player_name))
-        print_player_controls(player, "--")
-        print("--Volume")
-        print_volume_controls(player, "--")
-
-def create_command(player, *params):
-    """Creates the Bitbar specific command"""
-    string = "bash={0} param1=-i param2={1}"
-    i = 3
-    for param in params:
-        string += " param{0}={1}".format(i, param)
-        i += 1
-    string += " terminal=false refresh=true"
-    return string.format(PATH_TO_SCRIPT, player.ip_address)
-
-def print_player_controls(player, indent):
-    """Prints Player controls for Bitbar"""
-
-    print("{0}Join".format(indent))
-    for single_player in player.all_zones:
-        if single_player != player:
-            print("{0}--{1} | ".format(indent, single_player.player_name) +
-                  create_command(player, "--ipjoin", single_player.ip_address)
-                 )
-    print("{0}Unjoin | ".format(indent) +
-          create_command(player, "--unjoin")
-         )
-
-def print_music_controls(player, indent):
-    """Prints Music controls for Bitbar"""
-    print("{0}Playlists".format(indent))
-    for playlist in player.get_sonos_playlists():
-        print("{0}--{1} | ".format(indent, playlist.title) +
-              create_command(player, "-gl", '"' + playlist.title + '"')
-             )
-
-    print("{0}Radios".format(indent))
-    for station in player.get_favorite_radio_stations()["favorites"]:
-        print("{0}--{1} | ".format(indent, station["title"]) +
-              create_command(player, "-gr", '"' + station["uri"] + '"')
-            )
-
-def print_top_level_controls(player, indent):
-    """Prints the controls that are displayed on the base level for each
+        add_group(menu, title, zone, state)
+
+def add_single_player(menu, title, ip, state):
+    """Controls the control elements for a single-player zone"""
+    add_music_controls(title, ip, state)
+    add_player_controls(title, ip, state)
+    add_top_level_controls(menu, ip, state)
+
+def add_group(menu, title, zone, state):
+    """Controls the control elements for a multi-player zone"""
+    master = zone["master"]
+    add_music_controls(title, master, state)
+    add_top_level_controls(menu, master, state)
+    for ip in zone["members"]:
+        member = menu.item(u"➤ {0}".format(state["names"][ip]))
+        add_player_controls(member, ip, state)
+        add_volume_controls(member.item("Volume"), ip, state)
+
+def create_command(ip, *params):
+    """Creates the Bitbar specific command parameters"""
+    return {
+        "bash": PATH_TO_SCRIPT,
+        "params": ["-i", ip] + list(params),
+        "terminal": False,
+        "refresh": True,
+    }
+
+def add_player_controls(node, ip, state):
+    """Adds Player controls below node"""
+
+    join = node.item("Join")
+    for single_player in state["players"]:
+        if single_player != ip:
+            join.item(state["names"][single_player],
+                      **create_command(ip, "--ipjoin", single_player))
+    node.item("Unjoin", **create_command(ip, "--unjoin"))
+
+def add_music_controls(node, ip, state):
+    """Adds Music controls below node"""
+    playlists = node.item("Playlists")
+    for title in state["playlists"]:
+        playlists.item(title, **create_command(ip, "-gl", title))
+
+    radios = node.item("Radios")
+    for station in state["radios"]:
+        radios.item(station["title"], **create_command(ip, "-gr", station["uri"]))
+
+def add_top_level_controls(menu, ip, state):
+    """Adds the controls that are displayed on the base level for each
     player / group"""
-    playing = player.get_current_transport_info()["current_transport_state"]
-    if playing == "PLAYING":
-        print("{0}├ Pause | ".format(indent) +
-              create_command(player, "pause", "-g"))
-        print("{0}├ Next | ".format(indent) +
-              create_command(player, "next", "-g"))
+    if state["playing"][ip] == "PLAYING":
+        menu.item(u"├ Pause", **create_command(ip, "pause", "-g"))
+        menu.item(u"├ Next", **create_command(ip, "next", "-g"))
     else:
-        print("{0}├ Play | ".format(indent) +
-              create_command(player, "play", "-g"))
+        menu.item(u"├ Play", **create_command(ip, "play", "-g"))
 
-    print("{0}└ Volume | ".format(indent))
-    print_volume_controls(player, indent)
+    add_volume_controls(menu.item(u"└ Volume"), ip, state)
 
-def print_volume_controls(player, indent):
-    """Prints controls to adjust the volume"""
+def add_volume_controls(node, ip, state):
+    """Adds controls to adjust the volume below node"""
+    volume = state["volume"][ip]
     for vol in range(0, 11):
-        if (vol-1) * 10 < player.volume and vol*10 >= player.volume:
-            # print checkmark
-            print(("{0}--{1}{2}").format(indent, u'\u2713'.encode("utf-8"), vol))
+        if (vol-1) * 10 < volume and vol*10 >= volume:
+            # checkmark
+            node.item(u"\u2713{0}".format(vol))
         else:
-            print("{0}--{1} | ".format(indent, vol) +
-                  create_command(player, "--vol", vol*10)
-                 )
+            node.item(str(vol), **create_command(ip, "--vol", vol*10))
 
 # soco prints some usage warnings about functions where the output
 # will change in the future
@@ -235,14 +372,123 @@ def print_volume_controls(player, indent):
 warnings.filterwarnings("ignore")
 
 PATH_TO_SCRIPT = os.path.realpath(__file__)
-ARGUMENTS = parse_cli_arguments()
-GROUP = ARGUMENTS.group
-
-def get_player_by_name(name):
-    """Returns a SoCo object for the given name (if it exists)"""
-    for device in soco.discover():
-        if device.player_name == name:
-            return device
+# The most speakers asked for the menu at the same time
+MAX_FETCHES = 16
+# Songs per AddMultipleURIsToQueue request, the most a speaker accepts
+QUEUE_CHUNK = 16
+# Songs per Browse request when reading a playlist
+BROWSE_PAGE = 100
+# How long the zone topology is used before it is rediscovered in the background
+TOPOLOGY_TTL = 10 * 60
+# Where the daemon keeps the menu's state for the menu to be drawn from
+SNAPSHOT = os.path.join(state_dir, "sonosBar.json")
+# How often the daemon rewrites the snapshot while nothing happens
+SNAPSHOT_HEARTBEAT = 30
+# How old a snapshot may be before the menu asks the speakers itself
+SNAPSHOT_TTL = 3 * SNAPSHOT_HEARTBEAT
+# How often the daemon reads everything again, for playlists and missed events
+RESYNC_INTERVAL = 5 * 60
+# How long each event subscription lasts before SoCo renews it
+SUBSCRIPTION_TIMEOUT = 2 * 60
+
+class Topology(object):
+    """Player names, IPs, UIDs and group coordinators, kept between runs
+    so that finding a player doesn't wait seconds for SSDP discovery.
+
+    discover and make_player stand in for soco.discover and soco.SoCo,
+    so a fake backend can be passed in."""
+
+    def __init__(self, store, discover=None, make_player=None, ttl=TOPOLOGY_TTL):
+        self.store = store
+        self.discover = discover or soco.discover
+        self.make_player = make_player or soco.SoCo
+        self.ttl = ttl
+        self.players = None
+        # whether the players came from an earlier run, so may have moved
+        self.cached = False
+
+    def load(self):
+        """Returns the known players, discovering them if nothing is stored"""
+        if self.players is None:
+            topology = self.store.get("topology")
+            if topology is None:
+                return self.refresh()
+            self.players = topology["players"]
+            self.cached = True
+            if not 0 <= time.time() - topology["updated"] < self.ttl:
+                self.refresh_in_background()
+        return self.players
+
+    def refresh(self, via=None):
+        """Reads the groups from via, or from any player discovery finds,
+        and stores them"""
+        self.players = []
+        self.cached = False
+        if via is None:
+            devices = self.discover()
+            via = next(iter(devices)) if devices else None
+        if via is None:
+            return self.players
+        for group in via.all_groups:
+            for member in group.members:
+                self.players.append({
+                    "name": member.player_name,
+                    "ip": member.ip_address,
+                    "uid": member.uid,
+                    "coordinator": group.coordinator.uid})
+        self.store.update(
+            {"topology": {"updated": time.time(), "players": self.players}},
+            deleted=["refreshing"])
+        return self.players
+
+    def refresh_in_background(self):
+        """Starts a copy of this script to rediscover the topology,
+        unless one started within the last minute"""
+        started = self.store.get("refreshing")
+        if started is not None and 0 <= time.time() - started < 60:
+            return
+        self.store.set("refreshing", time.time())
+        with open(os.devnull, "wb") as devnull:
+            subprocess.Popen(
+                [sys.executable, PATH_TO_SCRIPT, "--refresh-topology"],
+                stdin=devnull, stdout=devnull, stderr=devnull,
+                close_fds=True, preexec_fn=os.setsid)
+
+    def invalidate(self):
+        """Forgets the stored topology, as when a stored IP stops answering"""
+        self.store.delete("topology")
+        self.players = None
+        self.cached = False
+
+    def find(self, **fields):
+        """Returns the first player whose fields match, or None"""
+        for player in self.load():
+            if all(player[key] == value for key, value in fields.items()):
+                return player
+        return None
+
+    def player(self, name):
+        """Returns a SoCo object for the named player, if known"""
+        found = self.find(name=name)
+        return self.make_player(found["ip"]) if found else None
+
+    def coordinator(self, player):
+        """Returns a SoCo object for the coordinator of player's group.
+        Asks the player rather than discovering when nothing is stored"""
+        found = None
+        if self.players is not None or "topology" in self.store:
+            found = self.find(ip=player.ip_address)
+        if found is None:
+            return player.group.coordinator
+        coordinator = self.find(uid=found["coordinator"])
+        return self.make_player(coordinator["ip"]) if coordinator else player
+
+    def any_player(self):
+        """Returns a SoCo object for a group coordinator, or None"""
+        for player in self.load():
+            if player["uid"] == player["coordinator"]:
+                return self.make_player(player["ip"])
+        return None
 
 def define_player(ip_address, name):
     """Returning a SoCo object of the chosen player"""
@@ -250,38 +496,151 @@ def define_player(ip_address, name):
     if ip_address:
         player = soco.SoCo(ip_address)
     if name:
-        player = get_player_by_name(name)
+        player = TOPOLOGY.player(name)
 
     if player and GROUP:
         # Change player to be the coordinator of the group
-        player = player.group.coordinator
+        player = TOPOLOGY.coordinator(player)
 
     return player
 
 def find_random_player():
-    """Searches the network for Sonos zones and picks one randomly"""
-    zones = soco.discover()
-
-    if zones:
-        # picking a random player
-        player = next(iter(zones))
-        return player
-
-    return None
+    """Picks a player from the known zones"""
+    return TOPOLOGY.any_player()
 
 def parse_zone_groups(player):
     """Creates a list of all Zones with attrbute
     whether they are a group or a single player"""
     all_zones = []
     for group in player.all_groups:
-        if len(group.members) > 1:
-            all_zones.append({"kind":"G", "master":group.coordinator})
+        members = list(group.members)
+        if len(members) > 1:
+            all_zones.append({"kind":"G", "master":group.coordinator, "members":members})
         else:
-            all_zones.append({"kind":"P", "master":group.coordinator})
+            all_zones.append({"kind":"P", "master":group.coordinator, "members":members})
     return all_zones
 
 
 
+def write_snapshot(state):
+    """Replaces the snapshot with state, stamped with the time"""
+    state["updated"] = time.time()
+    directory = os.path.dirname(SNAPSHOT)
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    temporary = "{0}.{1}.tmp".format(SNAPSHOT, os.getpid())
+    with open(temporary, "w") as snapshot:
+        json.dump(state, snapshot)
+    os.rename(temporary, SNAPSHOT)
+
+def read_snapshot():
+    """Returns the state the daemon last wrote, or None if there is none,
+    it is older than SNAPSHOT_TTL, or a command has been run from the
+    menu since"""
+    try:
+        with open(SNAPSHOT) as snapshot:
+            state = json.load(snapshot)
+    except (IOError, ValueError):
+        return None
+    updated = state.get("updated", 0)
+    if not 0 <= time.time() - updated < SNAPSHOT_TTL:
+        return None
+    if updated < STORE.get("changed", 0):
+        return None
+    return state
+
+def subscribe_all(player, state, events, subscriptions):
+    """Subscribes to the transport of each zone, the volume of each
+    player and the zone topology, adding each subscription to
+    subscriptions as it is made"""
+    services = [player.zoneGroupTopology]
+    services.extend(
+        soco.SoCo(zone["master"]).avTransport for zone in state["zones"])
+    services.extend(
+        soco.SoCo(ip).renderingControl for ip in state["players"])
+    for service in services:
+        subscription = service.subscribe(
+            requested_timeout=SUBSCRIPTION_TIMEOUT, auto_renew=True,
+            event_queue=events)
+        # SoCo calls this with the error when a renewal fails
+        subscription.auto_renew_fail = events.put
+        subscriptions.append(subscription)
+
+def apply_event(state, event):
+    """Updates state from a transport or volume event"""
+    ip = event.service.soco.ip_address
+    variables = event.variables
+    if "transport_state" in variables:
+        state["playing"][ip] = variables["transport_state"]
+    if "volume" in variables:
+        state["volume"][ip] = int(variables["volume"]["Master"])
+
+def follow_events(player):
+    """Keeps the snapshot up to date from the speakers' events. Returns
+    when the zones change or a subscription lapses, so that the caller
+    can read everything again and subscribe afresh"""
+    events = Queue()
+    subscriptions = []
+    state = gather_state(parse_zone_groups(player))
+    gathered = time.time()
+    topology = None
+    try:
+        subscribe_all(player, state, events, subscriptions)
+        while True:
+            write_snapshot(state)
+            try:
+                event = events.get(timeout=SNAPSHOT_HEARTBEAT)
+            except Empty:
+                event = None
+            if isinstance(event, Exception):
+                return
+            if event is not None and "zone_group_state" in event.variables:
+                # the first topology event describes the zones as they are
+                if topology not in (None, event.variables["zone_group_state"]):
+                    TOPOLOGY.refresh(via=player)
+                    return
+                topology = event.variables["zone_group_state"]
+            elif event is not None:
+                apply_event(state, event)
+            if time.time() - gathered > RESYNC_INTERVAL:
+                fresh = gather_state(parse_zone_groups(player))
+                gathered = time.time()
+                if fresh["zones"] != state["zones"]:
+                    return
+                state = fresh
+    finally:
+        for subscription in subscriptions:
+            try:
+                subscription.unsubscribe()
+            except (IOError, OSError, soco.exceptions.SoCoException):
+                pass
+
+def run_daemon(player):
+    """Follows the speakers' events until stopped, starting over when the
+    zones change or the speakers stop answering"""
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    chosen = player
+    try:
+        while True:
+            player = chosen or find_random_player()
+            if player is None:
+                time.sleep(SNAPSHOT_HEARTBEAT)
+                continue
+            try:
+                follow_events(player)
+            except (IOError, OSError, soco.exceptions.SoCoException):
+                if chosen is None:
+                    TOPOLOGY.invalidate()
+                time.sleep(SNAPSHOT_HEARTBEAT)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # the menu goes back to asking the speakers
+        try:
+            os.remove(SNAPSHOT)
+        except OSError:
+            pass
+
 def verbose_output(string):
     """Printing the passed commands to stdout"""
     if ARGUMENTS.verbose:
@@ -300,21 +659,54 @@ def group_coordinate(function):
             function(*arguments)
     return inner_function
 
-def get_songs_from_playlist(player, playlist_name):
-    """Returns a list of songs from the given playlist"""
-    lists = player.get_sonos_playlists()
-    for playlist in lists:
+def find_playlist(player, playlist_name):
+    """Returns the Sonos playlist with the given name, or None"""
+    for playlist in player.get_sonos_playlists():
         if playlist.title == playlist_name:
-            return player.music_library.browse(playlist)
+            return playlist
+    return None
+
+def get_songs_from_playlist(player, playlist):
+    """Returns every song in the playlist, a page at a time"""
+    songs = []
+    while True:
+        page = player.music_library.browse(
+            playlist, start=len(songs), max_items=BROWSE_PAGE)
+        songs.extend(page)
+        if not len(page) or len(songs) >= page.total_matches:
+            return songs
+
+def queue_playlist(player, playlist):
+    """Adds the playlist to the queue in one request, or QUEUE_CHUNK songs
+    per request if the speaker won't take the playlist itself"""
+    try:
+        player.add_to_queue(playlist)
+        verbose_output("Queued the whole playlist")
+        return
+    except soco.exceptions.SoCoUPnPException:
+        verbose_output("Queueing the playlist song by song")
+    songs = get_songs_from_playlist(player, playlist)
+    add_multiple = getattr(player, "add_multiple_to_queue", None)
+    for start in range(0, len(songs), QUEUE_CHUNK):
+        chunk = songs[start:start + QUEUE_CHUNK]
+        if add_multiple is not None:
+            add_multiple(chunk, playlist)
+        else:
+            # SoCo before 0.12 adds one song per request
+            for song in chunk:
+                player.add_to_queue(song)
+        verbose_output("Queued {0} of {1} songs".format(
+            start + len(chunk), len(songs)))
 
 @group_coordinate
 def play_playlist(player, playlist_name):
     """Replaces the queue with the selected playlist"""
     verbose_output("Play playlist {0}".format(playlist_name))
-    songs = get_songs_from_playlist(player, playlist_name)
+    playlist = find_playlist(player, playlist_name)
+    if playlist is None:
+        return invalid_command("No playlist called {0}".format(playlist_name))
     player.clear_queue()
-    for song in songs:
-        player.add_to_queue(song)
+    queue_playlist(player, playlist)
     player.play_from_queue(0)
 
 @group_coordinate
@@ -324,10 +716,10 @@ def play_radio_station(player, uri):
         x-sonosapi-stream:s25111?sid=254&flags=32
     """
     verbose_output("Switching to radio station {0}".format(uri))
-    service = MusicService('TuneIn')
-    didl = DidlItem(
+    service = soco.music_services.MusicService('TuneIn')
+    didl = soco.data_structures.DidlItem(
         title="DUMMY", parent_id="DUMMY", item_id="DUMMY", desc=service.desc)
-    meta = to_didl_string(didl)
+    meta = soco.data_structures.to_didl_string(didl)
     player.avTransport.SetAVTransportURI(
         [('InstanceID', 0), ('CurrentURI', uri), ('CurrentURIMetaData', meta)])
     player.play()
@@ -389,17 +781,37 @@ def invalid_command(err):
     return
 
 def main(args):
-    """Main function"""
+    """Main function, run again with fresh discovery if a player
+    found in the stored topology doesn't answer"""
+    if args.refresh_topology:
+        TOPOLOGY.refresh()
+        return
+    if args.daemon:
+        run_daemon(define_player(args.ip, args.player))
+        return
+    try:
+        run(args)
+    except (IOError, OSError):
+        if not TOPOLOGY.cached:
+            raise
+        TOPOLOGY.invalidate()
+        run(args)
+    if (args.ip or args.player) and not args.bitbar:
+        # the menu asks the speakers itself until the daemon has heard
+        # what this command changed
+        STORE.set("changed", time.time())
+
+def run(args):
+    """Carries out the command line"""
     player = define_player(args.ip, args.player)
 
     if player is None or args.bitbar:
-        player = player or find_random_player()
         print_bitbar_controls(player)
         return
 
     if GROUP:
         # Change player to the coordinator of the group
-        player = player.group.coordinator
+        player = TOPOLOGY.coordinator(player)
 
     if args.playlist:
         return play_playlist(player, args.playlist)
@@ -413,16 +825,21 @@ def main(args):
     if args.join:
         verbose_output("Joining {0}".format(args.join))
         to_join = define_player(None, args.join)
-        return join(player, to_join)
+        join(player, to_join)
+        TOPOLOGY.refresh(via=player)
+        return
 
     if args.ipjoin:
         verbose_output("Joining {0}".format(args.ipjoin))
         to_join = define_player(args.ipjoin, None)
-        return join(player, to_join)
+        join(player, to_join)
+        TOPOLOGY.refresh(via=player)
+        return
 
     if args.unjoin:
         verbose_output("Unjoin")
         player.unjoin()
+        TOPOLOGY.refresh(via=player)
         return
 
     if args.action is None:
@@ -452,14 +869,38 @@ def main(args):
         turn_off_shuffle(player)
         return
 
+def draw_from_snapshot():
+    """Draws the menu from the daemon's snapshot if it is fresh, and
+    returns whether it did"""
+    state = read_snapshot()
+    if state is None:
+        return False
+    output_for_bitbar(state)
+    return True
+
 def print_bitbar_controls(player):
-    """Prints the lines used for Bitbar to stdout"""
+    """Prints the lines used for Bitbar to stdout, from the daemon's
+    snapshot if it is fresh and from the speakers otherwise"""
+    if draw_from_snapshot():
+        return
+    player = player or find_random_player()
     if player is None:
-        print("🔇 Sonos")
-        print("---")
-        print("No Sonos Zone present")
+        menu = Menu()
+        menu.item(u"🔇 Sonos")
+        menu.separator()
+        menu.item("No Sonos Zone present")
+        menu.write()
     else:
-        output_for_bitbar(parse_zone_groups(player))
+        output_for_bitbar(gather_state(parse_zone_groups(player)))
 
 if __name__ == "__main__":
-    main(ARGUMENTS)
+    ARGUMENTS = parse_cli_arguments()
+    GROUP = ARGUMENTS.group
+    STORE = open_store("sonosBar")
+    MENU_ONLY = ARGUMENTS.bitbar or not (
+        ARGUMENTS.ip or ARGUMENTS.player or ARGUMENTS.daemon
+        or ARGUMENTS.refresh_topology)
+    if not (MENU_ONLY and draw_from_snapshot()):
+        import_soco()
+        TOPOLOGY = Topology(STORE)
+        main(ARGUMENTS)
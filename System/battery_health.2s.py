@@ -7,7 +7,14 @@
 # <bitbar.author.github>tanrax</bitbar.author.github>
 # <bitbar.desc>Shows power percentaje and notice when you load</bitbar.desc>
 
-import os, math, subprocess, pickle, tempfile
+import os, sys, math, subprocess, pickle, tempfile
+
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.state import open_store
+    store = open_store('battery_health')
+except ImportError:
+    store = None
 
 # Get info battery
 SAVE_LOCATION = os.path.join(tempfile.gettempdir(), 'batteryHealth2.pkl')
@@ -22,13 +29,18 @@ dateSave = False
 alertMin = False
 alertMax = False
 
-try:
-    dateFile = open(SAVE_LOCATION)
-    dateSave = pickle.load(dateFile)
-    alertMin = dateSave['alertMin']
-    alertMax = dateSave['alertMax']
-except:
-    pass
+if store is not None:
+    alertMin = store.get('alertMin', False)
+    alertMax = store.get('alertMax', False)
+else:
+    try:
+        dateFile = open(SAVE_LOCATION)
+        dateSave = pickle.load(dateFile)
+        alertMin = dateSave['alertMin']
+        alertMax = dateSave['alertMax']
+    except:
+        pass
+savedAlerts = (alertMin, alertMax)
 
 # Get variables
 for l in output.splitlines():
@@ -69,8 +81,13 @@ if LIM_UPPER > charge_porcent > LIM_LOWER:
     
 # Save
 dateTemp = {'alertMax': alertMax, 'alertMin': alertMin}
-dateSave = open(SAVE_LOCATION, 'w+')
-pickle.dump(dateTemp, dateSave)
+if store is not None:
+    # the alerts change a few times a day; there's no need to write every 2 seconds
+    if (alertMin, alertMax) != savedAlerts:
+        store.update(dateTemp)
+else:
+    dateSave = open(SAVE_LOCATION, 'w+')
+    pickle.dump(dateTemp, dateSave)
 
 # Print
 final = ''
@@ -9,8 +9,23 @@
 # <bitbar.image>https://github.com/garythung/bitbar-age-ticker/blob/master/bitbar-age-ticker.gif?raw=true</bitbar.image>
 # <bitbar.dependencies>python</bitbar.dependencies>
 # <bitbar.abouturl>https://github.com/garythung/bitbar-age-ticker</bitbar.abouturl>
+#
+# Pass --stream to keep ticking from one running copy rather than a new one
+# every second.  Only do so from a wrapper marked streamable with a
+# bitbar.type metadata line, on a BitBar that supports streamable plugins:
+#
+#   exec /path/to/age-ticker.1s.py --stream
 
 import datetime
+import os
+import sys
+
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.stream import stream
+except ImportError:
+    # without bitbarlib, render once and exit like any other plugin
+    stream = None
 
 # Your Birthday
 birthday_year = 1970
@@ -18,8 +33,16 @@ birthday_month = 1
 birthday_day = 1
 
 birthday = datetime.datetime(birthday_year, birthday_month, birthday_day)
-now = datetime.datetime.now()
-seconds = (now - birthday).total_seconds()
-years = seconds / 31536000
 
-print "%.12f" % years # change the number to change precision
+
+def render():
+    now = datetime.datetime.now()
+    seconds = (now - birthday).total_seconds()
+    years = seconds / 31536000
+
+    print "%.12f" % years # change the number to change precision
+
+if stream is None:
+    render()
+else:
+    stream(render, interval=1)
@@ -7,12 +7,31 @@
 # <bitbar.desc>Shows countdown of established date.</bitbar.desc>
 # <bitbar.image>https://cloud.githubusercontent.com/assets/7404532/12356787/ae62636c-bba4-11e5-8ff8-6a1eaffcbfc2.png</bitbar.image>
 # <bitbar.dependencies>python</bitbar.dependencies>
+#
+# Give it the dates to count down to from a wrapper script in your plugin
+# folder, which BitBar runs on the wrapper's own schedule, e.g. countdown.1m.sh:
+#
+#   #!/bin/bash
+#   exec /path/to/countdown.1s.py "Time #1" "17-07-2017 09:00"
+#
+# To keep one copy running and counting every second instead, mark the wrapper
+# streamable with a bitbar.type metadata line and add --stream to the arguments.
+# Without --stream the countdown prints once and exits, as BitBar expects of
+# wrappers that aren't streamable.
 
 
 from datetime import datetime
+import os
 import sys
 from exceptions import ValueError
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.stream import stream
+except ImportError:
+    # without bitbarlib, render once and exit like any other plugin
+    stream = None
+
 
 def dateDiffInSeconds(date1, date2):
     timedelta = date2 - date1
@@ -37,6 +56,7 @@ Available Args:
     --bar-title: This will appear as the first line in the output. The default is 'Countdown Timer'.
     --date-format: You can provide a custom date format. The default is '%d-%m-%Y %H:%M'
     --no-cycle: If this is present in the arguments, the times will not cycle.
+    --stream: Keep running and update every second. Only for wrappers marked streamable.
     --help: Prints this message and exits.
 
 Example:
@@ -47,13 +67,19 @@ Script Example:
         )
         return
 
+    if "--stream" in sys.argv and stream is not None:
+        stream(render, interval=1)
+    else:
+        render()
+
+
+def render():
     arg_count = len(sys.argv)
     now = datetime.now()
     date_format = '%d-%m-%Y %H:%M'
     bar_title = "Countdown Timer"
 
     label = ""
-    time = None
 
     if "--bar-title" in sys.argv:
         found_index = sys.argv.index("--bar-title")
@@ -79,7 +105,7 @@ Script Example:
 
     for index in range(1, arg_count):
         arg = sys.argv[index].strip()
-        if arg == "--no-cycle":
+        if arg in ("--no-cycle", "--stream"):
             continue
 
         if arg == "--bar-title":
@@ -89,8 +115,8 @@ Script Example:
             continue
 
         try:
-            time = datetime.strptime(arg, date_format)
-            print(label + ": %d d, %d h, %d m | font=\'Monospace\'" % daysHoursMinutesSecondsFromSeconds(dateDiffInSeconds(now, time)))
+            target = datetime.strptime(arg, date_format)
+            print(label + ": %d d, %d h, %d m | font=\'Monospace\'" % daysHoursMinutesSecondsFromSeconds(dateDiffInSeconds(now, target)))
         except ValueError:
             label = arg
 
@@ -8,10 +8,27 @@
 #
 # 1 second refresh rate may be overkill. Wording & formatting of the time may
 # also be easily altered below.
+#
+# On a BitBar with streamable plugins, one copy can stay running instead of
+# starting every second: put a wrapper in your plugin folder, marked
+# streamable with a bitbar.type metadata line, that runs
+#
+#   exec /path/to/fuzzyclock.1s.py --stream
+#
+# Without --stream the clock prints once and exits.
 
 from __future__ import absolute_import, division, print_function, unicode_literals
+import os
+import sys
 from time import localtime
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.stream import stream
+except ImportError:
+    # without bitbarlib, render once and exit like any other plugin
+    stream = None
+
 
 def round_to_nearest_five(n):
     '''Round the float n to the nearest 5.'''
@@ -56,5 +73,13 @@ def fuzzy_time(struct_time):
         return "{min} to {hr}".format(min=num_word[60-rounded_min],
                                       hr=num_word[next_hour(hour)])
 
-if __name__ == '__main__':
+
+def render():
     print(fuzzy_time(localtime()))
+
+
+if __name__ == '__main__':
+    if stream is None:
+        render()
+    else:
+        stream(render, interval=1)
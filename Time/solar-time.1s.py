@@ -9,27 +9,50 @@
 # <bitbar.image>ttps://github.com/XanderLeaDaren/bitbar-solar-time/blob/master/bitbar_solar-time.jpg?raw=true</bitbar.image>
 # <bitbar.dependencies>python</bitbar.dependencies>
 # <bitbar.abouturl>https://github.com/XanderLeaDaren/bitbar-solar-time</bitbar.abouturl>
+#
+# With --stream the plugin stays running and updates the time every second.
+# BitBar only reads a plugin like that if it supports streamable plugins and
+# the plugin is marked streamable, so run it from a wrapper carrying the
+# bitbar.type metadata line:
+#
+#   exec /path/to/solar-time.1s.py --stream
 
 import datetime
 from math import sin
+import os
+import sys
 import time
 
-# Local time and day of the year
-today = datetime.datetime.now()
-day = today.timetuple().tm_yday
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.stream import stream
+except ImportError:
+    # without bitbarlib, render once and exit like any other plugin
+    stream = None
 
 # Longitude on Earth (easily find it on http://ipinfo.io/json)
 lg = 5.1413
 pos = lg/360*24*60
 
-# Time zone and Equation of time
-tz = time.timezone
-eq_time = 7.655*sin(2*(day-4))+9.873*sin(4*(day-172))
-
-# Local solar time
-sun = today - datetime.timedelta(minutes=-pos+eq_time,seconds=-tz)
-print "☀️ "+sun.strftime('%H:%M:%S')
-print "---"
-print "Time Zone Offset: "+str(tz/3600)+" h"
-print "Position Offset: %.3f" % pos+" min"
-print "Equation of Time: %.3f" % -eq_time+" min"
\ No newline at end of file
+
+def render():
+    # Local time and day of the year
+    today = datetime.datetime.now()
+    day = today.timetuple().tm_yday
+
+    # Time zone and Equation of time
+    tz = time.timezone
+    eq_time = 7.655*sin(2*(day-4))+9.873*sin(4*(day-172))
+
+    # Local solar time
+    sun = today - datetime.timedelta(minutes=-pos+eq_time,seconds=-tz)
+    print "☀️ "+sun.strftime('%H:%M:%S')
+    print "---"
+    print "Time Zone Offset: "+str(tz/3600)+" h"
+    print "Position Offset: %.3f" % pos+" min"
+    print "Equation of Time: %.3f" % -eq_time+" min"
+
+if stream is None:
+    render()
+else:
+    stream(render, interval=1)
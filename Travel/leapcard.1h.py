@@ -53,9 +53,20 @@ import os
 import subprocess
 import sys
 
+try:
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '.lib'))
+    from bitbarlib.state import open_store
+except ImportError:
+    open_store = None
+
 class StateMgmt:
     
     def __init__(self):
+        self.store = None
+        if open_store is not None:
+            # no need to find the plugins directory; the store lives in the shared cache
+            self.store = open_store('leapcard')
+            return
         os.chdir(self.get_bitbar_plugins_dir())
         self.relative_state_dir = "./.leapcard_state/"
         self.state_dump_file = self.relative_state_dir+"leapcard_last_state.pickle"
@@ -73,6 +84,13 @@ class StateMgmt:
             os.mkdir(state_dir)
     
     def load_state(self):
+        if self.store is not None:
+            try:
+                return self.store.get('last_state')
+            except Exception:
+                # saved by a version of the library whose classes have changed
+                return None
+
         self.check_state_dir_exists(self.relative_state_dir)
 
         if os.path.exists(self.state_dump_file) is False:
@@ -85,6 +103,10 @@ class StateMgmt:
                 return None
     
     def dump_state(self, card_state,events_state):
+        if self.store is not None:
+            self.store.set('last_state', [card_state,events_state])
+            return
+
         self.check_state_dir_exists(self.relative_state_dir)
 
         current_state = [card_state,events_state]
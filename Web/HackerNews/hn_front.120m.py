@@ -10,21 +10,31 @@
 # <bitbar.abouturl>https://github.com/amrrs/hn_headlines_bitbar/blob/master/hn_front.120m.py</bitbar.abouturl>
 
 
-from requests import get, exceptions
+import os
+import sys
 from sys import exit
+
+try:
+    # one kept-alive connection for all eleven requests, and stories cached between runs
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), '..', '..', '.lib'))
+    from bitbarlib.httpclient import get_json
+except ImportError:
+    from requests import get
+
+    def get_json(url, max_age=None):
+        return get(url).json()
+
 print("HN")
 try:
-    content = get("https://hacker-news.firebaseio.com/v0/topstories.json?print=pretty")
-except exceptions.RequestException:    
+    ids = get_json("https://hacker-news.firebaseio.com/v0/topstories.json?print=pretty")
+except IOError:
     print('---')
     print("Internet Connection Not available")
     print("Manually refresh | refresh = true")
     exit(1)
-ids = content.json()
 story_base = "https://hacker-news.firebaseio.com/v0/item/"
 hn_link = "https://news.ycombinator.com/item?id="
 print('---')
 for id in ids[:10]:
-    story = get(story_base + str(id) + ".json")
-    story_json = story.json()
+    story_json = get_json(story_base + str(id) + ".json", max_age=24 * 3600)
     print(story_json["title"] + "| href = https://news.ycombinator.com/item?id=" + str(id))